@@ -19,6 +19,7 @@ from __future__ import absolute_import
 
 import math
 
+from numpy import nonzero, column_stack
 from traits.api import Instance, Bool, Enum, Float, Color
 
 from pychron.canvas.canvas2D.scene.primitives.calibration import CalibrationObject
@@ -71,7 +72,7 @@ class MapCanvas(SceneCanvas):
                 aff.translate(-cpos[0], -cpos[1])
                 aff.translate(*cpos)
 
-                mpos = self.mp.get_hole_pos(self.current_hole)
+                mpos = self._map.get_hole_pos(self.current_hole)
                 #                dpos = aff.transformPt(mpos)
                 dpos = aff.transform(*mpos)
                 spos = self.map_data((event.x, event.y))
@@ -88,11 +89,10 @@ class MapCanvas(SceneCanvas):
     def normal_mouse_move(self, event):
         # over a hole
         ca = self.calibration_item
-        if ca:
-            for obj in self.mp.sample_holes:
-                hole = obj.id
-                pos = obj.x, obj.y
-
+        mp = self._map
+        if ca and mp is not None:
+            pos = mp.get_hole_positions()
+            if len(pos):
                 rot = ca.rotation
                 cpos = ca.center
 
@@ -101,14 +101,17 @@ class MapCanvas(SceneCanvas):
                 aff.rotate(rot)
                 aff.translate(-cpos[0], -cpos[1])
                 aff.translate(*cpos)
-                dpos = aff.transformPt(pos)
-
-                pos = self.map_screen([dpos])[0]
-                if abs(pos[0] - event.x) <= 10 and abs(pos[1] - event.y) <= 10:
+                dxs, dys = aff.transforms(pos[:, 0], pos[:, 1])
+
+                spos = self.map_screen(column_stack((dxs, dys)))
+                hits = nonzero(
+                    (abs(spos[:, 0] - event.x) <= 10)
+                    & (abs(spos[:, 1] - event.y) <= 10)
+                )[0]
+                if hits.size:
                     event.window.set_pointer(self.select_pointer)
                     event.handled = True
-                    self.current_hole = hole
-                    break
+                    self.current_hole = mp.sample_holes[hits[0]].id
 
         if not event.handled:
             self.current_hole = None
@@ -167,7 +170,9 @@ class MapCanvas(SceneCanvas):
 
                 gc.set_fill_color(self._convert_color(self.hole_color))
 
-                for hole in mp.sample_holes:
+                # map all the holes to screen space at once
+                spos = map_screen(mp.get_hole_positions())
+                for hole, (x, y) in zip(mp.sample_holes, spos):
                     with gc:
                         tweaked = False
                         if ca:
@@ -180,8 +185,6 @@ class MapCanvas(SceneCanvas):
                         ):
                             tweak = None
 
-                            x, y = map_screen([(hole.x, hole.y)])[0]
-
                             if hole.shape != gshape:
                                 func = get_draw_func(hole.shape)
                             if float(hole.dimension) != mp.g_dimension:
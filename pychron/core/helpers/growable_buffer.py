@@ -0,0 +1,160 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from collections import deque
+
+from numpy import empty, asarray, Inf
+
+# ============= local library imports  ==========================
+
+MIN_CAPACITY = 256
+
+
+class GrowableBuffer(object):
+    """
+    a 1D float array with amortized O(1) appends.
+
+    values are written into a preallocated array that is reallocated at twice the size
+    when full. if max_size is set only the last max_size values are kept, i.e. it is a
+    ring buffer that is compacted into a new array every max_size appends.
+
+    data is a view of the buffer. the values of a view are never modified, appended values
+    are written past its end, so a view handed to a plot stays valid.
+
+    min and max are updated on every append. they are the extrema of all the appended
+    values or, if max_size is set, of the retained values
+    """
+
+    def __init__(self, data=None, max_size=None, capacity=MIN_CAPACITY):
+        self.max_size = max_size
+        self._buf = empty(max(capacity, MIN_CAPACITY))
+        self._start = 0
+        self._n = 0
+        # number of values ever appended. used to expire the window extrema
+        self._count = 0
+
+        self._min = Inf
+        self._max = -Inf
+        if max_size:
+            # (count, value) monotonic queues of the window extrema
+            self._minq = deque()
+            self._maxq = deque()
+
+        if data is not None and len(data):
+            self.extend(data)
+
+    def __len__(self):
+        return self._n - self._start
+
+    @property
+    def data(self):
+        return self._buf[self._start : self._n]
+
+    @property
+    def min(self):
+        if self.max_size:
+            return self._minq[0][1] if self._minq else Inf
+        return self._min
+
+    @property
+    def max(self):
+        if self.max_size:
+            return self._maxq[0][1] if self._maxq else -Inf
+        return self._max
+
+    def append(self, v):
+        if self._n == self._buf.size:
+            self._reallocate()
+
+        self._buf[self._n] = v
+        self._n += 1
+        if self.max_size:
+            self._count += 1
+            if self._n - self._start > self.max_size:
+                self._start += 1
+            self._push_extrema(self._buf[self._n - 1])
+        else:
+            v = self._buf[self._n - 1]
+            if v < self._min:
+                self._min = v
+            if v > self._max:
+                self._max = v
+
+    def extend(self, vs):
+        vs = asarray(vs, dtype=float).ravel()
+        if not vs.size:
+            return
+
+        if self.max_size:
+            for v in vs[-self.max_size :]:
+                self.append(v)
+            return
+
+        n = vs.size
+        if self._n + n > self._buf.size:
+            self._reallocate(n)
+
+        self._buf[self._n : self._n + n] = vs
+        self._n += n
+        self._min = min(self._min, vs.min())
+        self._max = max(self._max, vs.max())
+
+    def truncate(self, n):
+        """
+        keep the first n values. the values after n are overwritten by the next appends so
+        a view that includes them changes. the extrema are not updated
+        """
+        self._n = self._start + n
+
+    def clear(self):
+        # start a new array so existing views are not modified
+        self._buf = empty(MIN_CAPACITY)
+        self._start = self._n = self._count = 0
+        self._min = Inf
+        self._max = -Inf
+        if self.max_size:
+            self._minq.clear()
+            self._maxq.clear()
+
+    # private
+    def _reallocate(self, extra=1):
+        size = len(self)
+        buf = empty(max(2 * (size + extra), MIN_CAPACITY))
+        buf[:size] = self.data
+        self._buf = buf
+        self._start = 0
+        self._n = size
+
+    def _push_extrema(self, v):
+        c = self._count
+        minq, maxq = self._minq, self._maxq
+        while minq and minq[-1][1] >= v:
+            minq.pop()
+        minq.append((c, v))
+        while maxq and maxq[-1][1] <= v:
+            maxq.pop()
+        maxq.append((c, v))
+
+        expired = c - self.max_size
+        while minq[0][0] <= expired:
+            minq.popleft()
+        while maxq[0][0] <= expired:
+            maxq.popleft()
+
+
+# ============= EOF =============================================
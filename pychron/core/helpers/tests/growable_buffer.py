@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from numpy import arange
+
+from pychron.core.helpers.growable_buffer import GrowableBuffer
+
+
+class GrowableBufferTestCase(unittest.TestCase):
+    def test_append(self):
+        b = GrowableBuffer()
+        vs = [random.random() for _ in range(2000)]
+        views = []
+        for i, v in enumerate(vs):
+            b.append(v)
+            if i % 100 == 0:
+                views.append((i + 1, b.data))
+
+        self.assertEqual(len(b), 2000)
+        self.assertEqual(list(b.data), vs)
+        self.assertEqual(b.min, min(vs))
+        self.assertEqual(b.max, max(vs))
+
+        # earlier views are not modified by appends
+        for n, v in views:
+            self.assertEqual(list(v), vs[:n])
+
+    def test_extend(self):
+        b = GrowableBuffer([1, 2, 3])
+        b.extend(arange(1000))
+        self.assertEqual(len(b), 1003)
+        self.assertEqual(b.data[-1], 999)
+        self.assertEqual(b.min, 0)
+        self.assertEqual(b.max, 999)
+
+    def test_ring(self):
+        b = GrowableBuffer(max_size=50)
+        vs = [random.random() for _ in range(1000)]
+        for i, v in enumerate(vs):
+            b.append(v)
+            window = vs[max(0, i - 49) : i + 1]
+            self.assertEqual(b.min, min(window))
+            self.assertEqual(b.max, max(window))
+
+        self.assertEqual(list(b.data), vs[-50:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,7 +18,7 @@ import logging
 import math
 import re
 
-from numpy import where, delete, polyfit, percentile
+from numpy import where, delete, polyfit, percentile, array
 
 # ============= enthought library imports =======================
 from traits.api import (
@@ -44,6 +44,35 @@ from pychron.pychron_constants import PLUSMINUS, format_mswd
 logger = logging.getLogger("BaseRegressor")
 
 
+def format_percent_error(s, e):
+    try:
+        return "{:0.2}%".format(abs(e / s * 100))
+    except ZeroDivisionError:
+        return "Inf"
+
+
+def coefficients_tostring(coefficients, coefficient_errors, sig_figs=5):
+    """
+    coefficients, coefficient_errors: ordered constant first e.g. [c,b,a] where y=ax**2+bx+c
+    """
+    cs = coefficients[::-1]
+    ce = coefficient_errors[::-1]
+
+    coeffs = []
+    for i, (ci, ei) in enumerate(zip(cs, ce)):
+        pp = "({})".format(format_percent_error(ci, ei))
+        fmt = "{{:0.{}e}}" if abs(ci) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
+        ci = fmt.format(sig_figs).format(ci)
+
+        fmt = "{{:0.{}e}}" if abs(ei) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
+        ei = fmt.format(sig_figs).format(ei)
+
+        vfmt = "{{}}= {{}} {} {{}} {{}}".format(PLUSMINUS)
+        coeffs.append(vfmt.format(alphas(i), ci, ei, pp))
+
+    return ", ".join(coeffs)
+
+
 class BaseRegressor(HasTraits):
     ddof = 1
     xs = Array
@@ -264,14 +293,24 @@ class BaseRegressor(HasTraits):
         pass
 
     def format_percent_error(self, s, e):
-        try:
-            return "{:0.2}%".format(abs(e / s * 100))
-        except ZeroDivisionError:
-            return "Inf"
+        return format_percent_error(s, e)
 
     def predict(self, x):
         raise NotImplementedError
 
+    def batch_predict(self, endogs, exog):
+        """
+        predict for many sets of ys at once. used by the monte carlo estimators
+
+        endogs: (m, n) array, one set of ys per trial
+        exog: exog of the prediction points or a (m, npts, k) array, one exog per trial
+
+        return (m, npts) array
+        """
+        if exog.ndim == 3:
+            return array([self.fast_predict2(e, x) for e, x in zip(endogs, exog)])
+        return array([self.fast_predict2(e, exog) for e in endogs])
+
     def predict_error(self, x, error_calc=None):
         raise NotImplementedError
 
@@ -400,23 +439,9 @@ class BaseRegressor(HasTraits):
         return ((x - xm) ** 2).sum()
 
     def tostring(self, sig_figs=5):
-        cs = self.coefficients[::-1]
-        ce = self.coefficient_errors[::-1]
-
-        coeffs = []
-        for i, (ci, ei) in enumerate(zip(cs, ce)):
-            pp = "({})".format(self.format_percent_error(ci, ei))
-            fmt = "{{:0.{}e}}" if abs(ci) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
-            ci = fmt.format(sig_figs).format(ci)
-
-            fmt = "{{:0.{}e}}" if abs(ei) < math.pow(10, -sig_figs) else "{{:0.{}f}}"
-            ei = fmt.format(sig_figs).format(ei)
-
-            vfmt = "{{}}= {{}} {} {{}} {{}}".format(PLUSMINUS)
-            coeffs.append(vfmt.format(alphas(i), ci, ei, pp))
-
-        s = ", ".join(coeffs)
-        return s
+        return coefficients_tostring(
+            self.coefficients, self.coefficient_errors, sig_figs=sig_figs
+        )
 
     def make_equation(self):
         """
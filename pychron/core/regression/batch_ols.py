@@ -0,0 +1,322 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import (
+    arange,
+    asarray,
+    zeros,
+    ones,
+    eye,
+    where,
+    linalg,
+    einsum,
+    errstate,
+    finfo,
+    polyval,
+)
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.fits import fit_to_degree, FITS
+from pychron.core.regression.base_regressor import coefficients_tostring
+from pychron.core.regression.tinv import tinv
+from pychron.pychron_constants import AUTO_LINEAR_PARABOLIC
+
+# Batched ordinary least squares for isotope evolutions.
+#
+# OLSRegressor fits one series at a time with statsmodels. Here all series that share a fit degree
+# and a length are stacked and solved with one batched QR decomposition. The outlier filtering
+# loop, the standard error of the fit, the SEM/SD/CI intercept errors and rsquared_adj follow
+# BaseRegressor/OLSRegressor exactly.
+#
+# Series the batch engine does not handle return None and should be fit with the scalar
+# regressors. That includes non polynomial fits, MSEM and MC errors, IQR filtering and any
+# series that is rank deficient or has too few points at any stage of the fit.
+
+BATCH_FITS = ("linear", "parabolic", "cubic", AUTO_LINEAR_PARABOLIC.lower())
+
+EPS = finfo(float).eps
+
+
+class BatchSeries(object):
+    """
+    one series to fit.
+
+    excluded: indices excluded before fitting, i.e. the user and truncate excluded points
+    """
+
+    __slots__ = ("xs", "ys", "fit", "error_type", "filter_outliers_dict", "excluded")
+
+    def __init__(
+        self, xs, ys, fit, error_type="SEM", filter_outliers_dict=None, excluded=None
+    ):
+        self.xs = asarray(xs, dtype=float)
+        self.ys = asarray(ys, dtype=float)
+        self.fit = fit
+        self.error_type = error_type
+        self.filter_outliers_dict = filter_outliers_dict or {}
+        self.excluded = excluded or []
+
+
+class BatchFitResult(object):
+    __slots__ = (
+        "fit",
+        "coefficients",
+        "coefficient_errors",
+        "value",
+        "error",
+        "rsquared",
+        "rsquared_adj",
+        "outlier_excluded",
+        "n",
+    )
+
+    def __init__(self, **kw):
+        for k in self.__slots__:
+            setattr(self, k, kw.get(k))
+
+    def predict(self, x):
+        return polyval(self.coefficients[::-1], x)
+
+    def tostring(self, sig_figs=5):
+        return coefficients_tostring(
+            self.coefficients, self.coefficient_errors, sig_figs=sig_figs
+        )
+
+
+def is_batchable(series):
+    fit = (series.fit or "").lower()
+    if fit not in BATCH_FITS:
+        return False
+
+    et = series.error_type
+    if et and et.lower() in ("msem", "mc"):
+        return False
+
+    fod = series.filter_outliers_dict
+    if fod.get("filter_outliers", False) and fod.get("use_iqr_filtering"):
+        return False
+
+    return True
+
+
+def batch_regress(series):
+    """
+    fit a list of BatchSeries
+
+    return a list of BatchFitResult. None for the series that must be fit with the scalar
+    regressors
+    """
+    jobs = {}
+    for i, s in enumerate(series):
+        if is_batchable(s):
+            for d in _degrees(s.fit):
+                jobs.setdefault((d, s.ys.shape[0]), []).append(i)
+
+    fits = {}
+    for (degree, n), idxs in jobs.items():
+        for i, r in zip(idxs, _regress_group([series[i] for i in idxs], degree, n)):
+            fits[(i, degree)] = r
+
+    results = []
+    for i, s in enumerate(series):
+        r = None
+        if is_batchable(s):
+            ds = _degrees(s.fit)
+            if len(ds) == 2:
+                lr, pr = fits[(i, 1)], fits[(i, 2)]
+                if lr is not None and pr is not None:
+                    # same comparison as OLSRegressor.determine_fit
+                    r = lr if lr.rsquared_adj > pr.rsquared_adj else pr
+            else:
+                r = fits[(i, ds[0])]
+                if r is not None and s.fit.lower() in FITS:
+                    r.fit = s.fit
+        results.append(r)
+    return results
+
+
+def _degrees(fit):
+    if fit == AUTO_LINEAR_PARABOLIC.lower():
+        return 1, 2
+
+    try:
+        return (fit_to_degree(fit),)
+    except ValueError:
+        # OLSRegressor.set_degree falls back to linear, e.g. for AUTO_LINEAR_PARABOLIC that
+        # was not lower cased
+        return (1,)
+
+
+def _base_mask(s, n):
+    mask = ones(n, dtype=bool)
+    ex = list(s.excluded)
+    # mirror BaseRegressor._clean_array. negative indices count from the end and an out of
+    # bounds index disables all exclusions
+    if ex and all(-n <= e < n for e in ex):
+        mask[ex] = False
+    return mask
+
+
+def _lstsq(X, ys, mask):
+    """
+    X: (m, n, p) design matrices, ys: (m, n), mask: (m, n) points to fit
+
+    return dict of stacked fit statistics. ok is False for the rank deficient series
+    """
+    m, n, p = X.shape
+    w = mask.astype(float)
+    nobs = w.sum(axis=1)
+
+    Xw = X * w[..., None]
+    yw = ys * w
+
+    q, r = linalg.qr(Xw)
+    diag = abs(r.diagonal(axis1=1, axis2=2))
+    ok = (diag.min(axis=1) > diag.max(axis=1) * n * EPS) & (nobs > p) & (nobs > 1)
+
+    # keep inv from failing on the rank deficient series
+    r = where(ok[:, None, None], r, eye(p))
+    rinv = linalg.inv(r)
+
+    beta = einsum("mij,mnj,mn->mi", rinv, q, yw)
+    cov = einsum("mij,mkj->mik", rinv, rinv)
+
+    pred = einsum("mnj,mj->mn", X, beta)
+    resid = (ys - pred) * w
+    ssr = (resid**2).sum(axis=1)
+
+    with errstate(divide="ignore", invalid="ignore"):
+        df = nobs - p
+        sef = (ssr / df) ** 0.5
+
+        ybar = yw.sum(axis=1) / nobs
+        tss = (((ys - ybar[:, None]) * w) ** 2).sum(axis=1)
+        rsquared = 1 - ssr / tss
+        rsquared_adj = 1 - (nobs - 1) / df * (1 - rsquared)
+
+        ystd = (tss / (nobs - 1)) ** 0.5
+
+    return dict(
+        ok=ok,
+        nobs=nobs,
+        beta=beta,
+        cov=cov,
+        pred=pred,
+        ssr=ssr,
+        sef=sef,
+        ystd=where(nobs > 1, ystd, 0),
+        rsquared=rsquared,
+        rsquared_adj=rsquared_adj,
+    )
+
+
+def _regress_group(series, degree, n):
+    m = len(series)
+    p = degree + 1
+    if n <= p:
+        return [None] * m
+
+    xs = zeros((m, n))
+    ys = zeros((m, n))
+    base = zeros((m, n), dtype=bool)
+    iterations = zeros(m, dtype=int)
+    nsigma = zeros(m)
+    use_std = zeros(m, dtype=bool)
+
+    for i, s in enumerate(series):
+        xs[i] = s.xs
+        ys[i] = s.ys
+        base[i] = _base_mask(s, n)
+
+        fod = s.filter_outliers_dict
+        if fod.get("filter_outliers", False):
+            iterations[i] = fod.get("iterations", 1)
+        nsigma[i] = fod.get("std_devs", 2)
+        use_std[i] = bool(fod.get("use_standard_deviation_filtering"))
+
+    X = xs[..., None] ** arange(p)
+
+    valid = ones(m, dtype=bool)
+    outliers = zeros((m, n), dtype=bool)
+    for it in range(iterations.max() if m else 0):
+        active = iterations > it
+        r = _lstsq(X, ys, base & ~outliers)
+        valid &= ~active | r["ok"]
+
+        # see BaseRegressor.calculate_outliers. residuals for every point not just the
+        # cleaned arrays
+        s = where(use_std, r["ystd"], r["sef"])
+        with errstate(invalid="ignore"):
+            new = abs(ys - r["pred"]) >= (s * nsigma)[:, None]
+        outliers |= active[:, None] & new
+
+    r = _lstsq(X, ys, base & ~outliers)
+    valid &= r["ok"]
+
+    clean = base & ~outliers
+    results = []
+    for i, s in enumerate(series):
+        if not valid[i]:
+            results.append(None)
+            continue
+
+        cov = r["cov"][i]
+        sef = r["sef"][i]
+        nobs = int(r["nobs"][i])
+        beta = r["beta"][i]
+
+        et = (s.error_type or "").lower()
+        if not et or et == "ci":
+            err = _ci_error(xs[i][clean[i]], r["ssr"][i], nobs)
+        elif et == "sem":
+            err = sef * cov[0, 0] ** 0.5
+        else:
+            err = (sef**2 + sef**2 * cov[0, 0]) ** 0.5
+
+        results.append(
+            BatchFitResult(
+                fit=FITS[degree - 1],
+                coefficients=beta,
+                coefficient_errors=sef * cov.diagonal() ** 0.5,
+                value=beta[0],
+                error=err,
+                rsquared=r["rsquared"][i],
+                rsquared_adj=r["rsquared_adj"][i],
+                outlier_excluded=[int(j) for j in outliers[i].nonzero()[0]],
+                n=nobs,
+            )
+        )
+    return results
+
+
+def _ci_error(x, ssr, n, confidence=95):
+    """
+    see BaseRegressor._calculate_confidence_interval evaluated at x=0
+    """
+    if n > 2:
+        alpha = 1.0 - confidence / 100.0
+        xm = x.mean()
+        ti = tinv(alpha, n - 1)
+        syx = (1.0 / (n - 2) * ssr) ** 0.5
+        ssx = ((x - xm) ** 2).sum()
+        d = n**-1 + xm**2 / ssx
+        return ti * syx * d**0.5 / 2.0
+    return 0
+
+
+# ============= EOF =============================================
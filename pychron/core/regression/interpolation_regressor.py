@@ -15,16 +15,33 @@
 # ===============================================================================
 
 # ============= standard library imports ========================
-from numpy import where, polyval, polyfit
+from numpy import (
+    where,
+    polyval,
+    polyfit,
+    asarray,
+    ones,
+    arange,
+    searchsorted,
+    minimum,
+    maximum,
+    errstate,
+)
 
 # ============= enthought library imports =======================
 from traits.api import Str
 
 from pychron.core.regression.base_regressor import BaseRegressor
 
-
 # ============= local library imports  ==========================
 
+VECTORIZED_KINDS = (
+    "preceding",
+    "succeeding",
+    "bracketing_average",
+    "bracketing_interpolate",
+)
+
 
 class InterpolationRegressor(BaseRegressor):
     kind = Str
@@ -39,6 +56,18 @@ class InterpolationRegressor(BaseRegressor):
         return self._predict(xs, "error")
 
     def _predict(self, xs, attr):
+        if not hasattr(xs, "__iter__"):
+            xs = (xs,)
+
+        if self._can_vectorize():
+            return self._predict_vectorized(xs, attr)
+
+        return self._predict_iter(xs, attr)
+
+    def _predict_iter(self, xs, attr):
+        """
+        evaluate the predictor for one timestamp at a time
+        """
         kind = self.kind.replace(" ", "_")
         func = getattr(self, "{}_predictors".format(kind))
         if not hasattr(xs, "__iter__"):
@@ -51,6 +80,93 @@ class InterpolationRegressor(BaseRegressor):
         # if preceding and no value found use the first following value e.g index 0
         return [xi for xi in xs if xi is not None]
 
+    def _can_vectorize(self):
+        xs, ys, es = self.xs, self.ys, self.yserr
+        return (
+            self.kind.replace(" ", "_") in VECTORIZED_KINDS
+            and self._check_integrity(xs, ys)
+            and self._check_integrity(ys, es)
+            and bool((xs[1:] >= xs[:-1]).all())
+        )
+
+    def _predict_vectorized(self, tms, attr):
+        """
+        evaluate the predictor for all the timestamps at once. the references need to be
+        sorted by x.
+
+        same results as the *_predictors methods. the indices of the adjacent
+        non-excluded references are precomputed for every reference and the timestamps
+        are located with searchsorted, O((n+m) log n) instead of O(n*m)
+        """
+        xs, ys, es = self.xs, self.ys, self.yserr
+        vs = es if attr == "error" else ys
+        tms = asarray(tms, dtype=float)
+        n = len(xs)
+
+        valid = ones(n, dtype=bool)
+        exc = self.get_excluded()
+        if exc:
+            valid[[e for e in exc if 0 <= e < n]] = False
+
+        idx = arange(n)
+        # index of the last non-excluded reference at or before i. 0 if there is none
+        prev_valid = maximum.accumulate(where(valid, idx, -1))
+        prev_valid[prev_valid < 0] = 0
+        # index of the first non-excluded reference at or after i. n if there is none
+        next_valid = minimum.accumulate(where(valid, idx, n)[::-1])[::-1]
+
+        kind = self.kind.replace(" ", "_")
+        if kind == "preceding":
+            # last reference with x <= t
+            ti = searchsorted(xs, tms, "right") - 1
+            ti[ti < 0] = 0
+            return list(vs[prev_valid[ti]])
+
+        if kind == "succeeding":
+            # first reference with x >= t
+            ti = searchsorted(xs, tms, "left")
+            ti[ti == n] = n - 1
+            ti = next_valid[ti]
+            if (ti == n).any():
+                raise IndexError("index {} is out of bounds".format(n))
+            return list(vs[ti])
+
+        # last reference with x < t
+        ti = searchsorted(xs, tms, "left") - 1
+        li = prev_valid[maximum(ti, 0)]
+
+        # the search for the next reference stops at the number of non-excluded
+        # references
+        nc = self.n
+        hi = ti + 1
+        lo = hi < nc
+        hi[lo] = minimum(next_valid[hi[lo]], nc)
+
+        # no reference before t or none after it
+        invalid = (ti < 0) | (hi >= n)
+        li[invalid] = 0
+        hi[invalid] = 0
+
+        pb, ab = vs[li], vs[hi]
+        if kind == "bracketing_average":
+            if attr == "value":
+                v = (pb + ab) / 2.0
+            else:
+                v = ((pb**2 + ab**2) ** 0.5) / 2.0
+            return list(v)
+
+        x0, x1 = xs[li], xs[hi]
+        with errstate(divide="ignore", invalid="ignore"):
+            f = (tms - x0) / (x1 - x0)
+            if attr == "error":
+                v = (((1 - f) * pb) ** 2 + (f * ab) ** 2) ** 0.5
+            else:
+                v = pb + f * (ab - pb)
+
+        v = where(tms <= x0, vs[0], v)
+        v = where(tms >= x1, vs[-1], v)
+        return list(v)
+
     def succeeding_predictors(self, *args, **kw):
         return self._adjacent_predictors("after", *args, **kw)
 
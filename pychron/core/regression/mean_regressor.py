@@ -17,7 +17,7 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import average, where, full
+from numpy import average, where, full, repeat
 
 from pychron.core.helpers.formatting import floatfmt
 from pychron.pychron_constants import SEM, MSEM
@@ -33,6 +33,13 @@ class MeanRegressor(BaseRegressor):
     def fast_predict2(self, endog, exog):
         return full(exog.shape[0], endog.mean())
 
+    def batch_predict(self, endogs, exog):
+        return self._repeat_means(endogs.mean(axis=1), exog)
+
+    def _repeat_means(self, means, exog):
+        npts = exog.shape[1] if exog.ndim == 3 else exog.shape[0]
+        return repeat(means[:, None], npts, axis=1)
+
     def calculate(self, filtering=False, **kw):
         # cxs, cys = self.pre_clean_ys, self.pre_clean_ys
         if not filtering:
@@ -163,6 +170,10 @@ class WeightedMeanRegressor(MeanRegressor):
         mean = average(endog, weights=ws)
         return full(exog.shape[0], mean)
 
+    def batch_predict(self, endogs, exog):
+        ws = self._get_weights()
+        return self._repeat_means(average(endogs, axis=1, weights=ws), exog)
+
     @property
     def se(self):
         """
@@ -22,6 +22,7 @@ from numpy import (
     sqrt,
     dot,
     linalg,
+    einsum,
     zeros_like,
     hstack,
     ones_like,
@@ -90,6 +91,17 @@ class OLSRegressor(BaseRegressor):
 
         return dot(exog, beta)
 
+    def batch_predict(self, endogs, exog):
+        """
+        vectorized fast_predict2. the betas for all endogs are solved with one pseudo-inverse
+        product
+        """
+        pinv_wexog = linalg.pinv(self._ols.wexog)
+        betas = dot(endogs, pinv_wexog.T)
+        if exog.ndim == 3:
+            return einsum("mij,mj->mi", exog, betas)
+        return dot(betas, exog.T)
+
     def determine_fit(self):
         if self._fit == AUTO_LINEAR_PARABOLIC.lower():
             self.set_degree("linear", refresh=False)
@@ -411,6 +423,11 @@ class MultipleLinearRegressor(OLSRegressor):
         # use fast_predict instead
         return self.fast_predict(endog, pexog, **kw)
 
+    def batch_predict(self, endogs, exog):
+        # whiten the endogs like fast_predict
+        endogs = self._ols.whiten(endogs.T).T
+        return super(MultipleLinearRegressor, self).batch_predict(endogs, exog)
+
     def _get_X(self, xs=None):
         if xs is None:
             xs = self.clean_xs
@@ -0,0 +1,214 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from math import hypot
+
+from numpy import array, linalg
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.fits import fit_to_degree, FITS
+from pychron.core.regression.batch_ols import BatchFitResult, EPS
+from pychron.core.regression.tinv import tinv
+from pychron.pychron_constants import AUTO_LINEAR_PARABOLIC
+
+STREAMING_FITS = ("linear", "parabolic", AUTO_LINEAR_PARABOLIC.lower())
+
+
+def is_streamable(fit, error_type):
+    """
+    return True if StreamingOLS.fit gives the same result as the regressor for this fit
+    and error type, ignoring outlier filtering
+    """
+    fit = (fit or "").lower()
+    if not (fit in STREAMING_FITS or "average" in fit):
+        return False
+
+    return (error_type or "SEM").lower() in ("sem", "sd", "ci")
+
+
+class StreamingOLS(object):
+    """
+    running least squares fits of a series that grows one point at a time.
+
+    the R factor and Q'y of the QR decomposition of the design matrix [1, x, x**2] are
+    updated with Givens rotations, so adding a point is O(1) and the average, linear and
+    parabolic fits and their errors are available at any time without refitting. the
+    leading blocks of R are the R factors of the lower degree fits.
+
+    points can not be removed. outlier filtering and exclusions need a full refit
+    """
+
+    def __init__(self, degree=2):
+        self.p = degree + 1
+        self.reset()
+
+    def reset(self):
+        p = self.p
+        self.n = 0
+        self._r = [[0.0] * p for _ in range(p)]
+        self._z = [0.0] * p
+        self._ssr = 0.0
+
+    def add(self, x, y):
+        p = self.p
+        r, z = self._r, self._z
+        a = [1.0] * p
+        for i in range(1, p):
+            a[i] = a[i - 1] * x
+        b = float(y)
+
+        self.n += 1
+        for i in range(p):
+            ai = a[i]
+            if not ai:
+                continue
+
+            ri = r[i]
+            rii = ri[i]
+            if not rii:
+                # first point with a nonzero component in this direction
+                for j in range(i, p):
+                    ri[j] = a[j]
+                z[i] = b
+                return
+
+            h = hypot(rii, ai)
+            c, s = rii / h, ai / h
+            for j in range(i, p):
+                rj, aj = ri[j], a[j]
+                ri[j] = c * rj + s * aj
+                a[j] = c * aj - s * rj
+            zi = z[i]
+            z[i] = c * zi + s * b
+            b = c * b - s * zi
+
+        self._ssr += b * b
+
+    def extend(self, xs, ys):
+        for x, y in zip(xs, ys):
+            self.add(x, y)
+
+    def ssr(self, degree):
+        """
+        sum of the squared residuals of the fit of degree
+        """
+        return self._ssr + sum(zi * zi for zi in self._z[degree + 1 :])
+
+    def fit(self, fit, error_type="SEM", x=0):
+        """
+        return a BatchFitResult with the value and error predicted at x or None if there
+        are not enough points
+        """
+        lfit = fit.lower()
+        if "average" in lfit:
+            return self._mean(error_type)
+
+        if lfit == AUTO_LINEAR_PARABOLIC.lower():
+            lr = self._fit(1, error_type, x)
+            pr = self._fit(2, error_type, x)
+            if lr is None or pr is None:
+                return
+            # same comparison as OLSRegressor.determine_fit
+            return lr if lr.rsquared_adj > pr.rsquared_adj else pr
+
+        return self._fit(fit_to_degree(lfit), error_type, x)
+
+    # private
+    def _mean(self, error_type):
+        n = self.n
+        if not n:
+            return
+
+        m = self._z[0] / self._r[0][0]
+        std = (self.ssr(0) / (n - 1)) ** 0.5 if n > 1 else 0
+        err = std * n**-0.5 if (error_type or "SEM").lower() == "sem" else std
+
+        return BatchFitResult(
+            fit="average",
+            coefficients=[m],
+            coefficient_errors=[std],
+            value=m,
+            error=err,
+            rsquared=0,
+            rsquared_adj=0,
+            outlier_excluded=[],
+            n=n,
+        )
+
+    def _fit(self, degree, error_type, x):
+        n = self.n
+        k = degree + 1
+        if degree >= self.p or n <= k:
+            return
+
+        r = array(self._r)[:k, :k]
+        diag = abs(r.diagonal())
+        if diag.min() <= diag.max() * n * EPS:
+            return
+
+        rinv = linalg.inv(r)
+        beta = rinv.dot(self._z[:k])
+        cov = rinv.dot(rinv.T)
+
+        ssr = self.ssr(degree)
+        tss = self.ssr(0)
+        sef = (ssr / (n - k)) ** 0.5
+        rsquared = 1 - ssr / tss if tss else 0
+        rsquared_adj = 1 - (n - 1.0) / (n - k) * (1 - rsquared)
+
+        xk = array([x**i for i in range(k)])
+        var = xk.dot(cov).dot(xk)
+        et = (error_type or "").lower()
+        if not et or et == "ci":
+            err = self._ci_error(ssr, x)
+        elif et == "sem":
+            err = sef * var**0.5
+        else:
+            err = (sef**2 + sef**2 * var) ** 0.5
+
+        return BatchFitResult(
+            fit=FITS[degree - 1],
+            coefficients=beta,
+            coefficient_errors=sef * cov.diagonal() ** 0.5,
+            value=xk.dot(beta),
+            error=err,
+            rsquared=rsquared,
+            rsquared_adj=rsquared_adj,
+            outlier_excluded=[],
+            n=n,
+        )
+
+    def _ci_error(self, ssr, x, confidence=95):
+        """
+        see batch_ols._ci_error. the mean of the xs is R[0,1]/R[0,0] and the sum of the
+        squared deviations of the xs is R[1,1]**2
+        """
+        n = self.n
+        if n > 2:
+            r = self._r
+            xm = r[0][1] / r[0][0]
+            ssx = r[1][1] ** 2
+            alpha = 1.0 - confidence / 100.0
+            ti = tinv(alpha, n - 1)
+            syx = (1.0 / (n - 2) * ssr) ** 0.5
+            d = n**-1 + (xm - x) ** 2 / ssx
+            return ti * syx * d**0.5 / 2.0
+        return 0
+
+
+# ============= EOF =============================================
@@ -0,0 +1,149 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import unittest
+
+from numpy import random, linspace, allclose
+
+from pychron.core.regression.batch_ols import BatchSeries, batch_regress
+from pychron.dvc.dvc_analysis import DVCAnalysis
+from pychron.processing.isotope import Isotope, batch_fit_isotopes
+from pychron.pychron_constants import AUTO_LINEAR_PARABOLIC
+
+RTOL = 1e-9
+
+
+def make_isotope(seed, n, fit, error_type, fod=None):
+    rng = random.RandomState(seed)
+    xs = linspace(5, 200, n)
+    a, b, c = rng.uniform(-1e-4, 1e-4), rng.uniform(-0.05, 0.05), rng.uniform(10, 100)
+    ys = a * xs**2 + b * xs + c + rng.normal(0, 0.05, n)
+    # a few outliers
+    idx = rng.randint(0, n, 3)
+    ys[idx] += rng.choice((-1, 1), 3) * rng.uniform(0.3, 1, 3)
+
+    iso = Isotope("Ar40", "H1")
+    iso.xs, iso.ys = xs, ys
+    iso.fit = fit
+    iso.error_type = error_type
+    if fod:
+        iso.set_filter_outliers_dict(**fod)
+    return iso
+
+
+class BatchOLSTestCase(unittest.TestCase):
+    def _compare(self, fit, error_type, fod=None, n=40):
+        args = [(i, n + i % 3, fit, error_type, fod) for i in range(30)]
+
+        scalar = [make_isotope(*a) for a in args]
+        batch = [make_isotope(*a) for a in args]
+
+        self.assertEqual(batch_fit_isotopes(batch), len(batch))
+
+        for s, b in zip(scalar, batch):
+            self.assertIsNotNone(b.batch_fit)
+            self.assertTrue(allclose(b.value, s.value, rtol=RTOL, atol=0))
+            self.assertTrue(allclose(b.error, s.error, rtol=RTOL, atol=0))
+            self.assertTrue(allclose(b.rsquared_adj, s.rsquared_adj, rtol=RTOL, atol=0))
+            self.assertEqual(b.fit, s.fit)
+            self.assertEqual(sorted(b.outlier_excluded), sorted(s.outlier_excluded))
+            self.assertEqual(b.fn, s.fn)
+            self.assertEqual(b.noutliers(), s.noutliers())
+
+    def test_linear_sem(self):
+        self._compare("linear", "SEM")
+
+    def test_parabolic_sd(self):
+        self._compare("parabolic", "SD")
+
+    def test_linear_ci(self):
+        self._compare("linear", "CI")
+
+    def test_auto(self):
+        self._compare(AUTO_LINEAR_PARABOLIC.lower(), "SEM")
+        self._compare(AUTO_LINEAR_PARABOLIC, "SEM")
+
+    def test_filter(self):
+        self._compare("linear", "SEM", fod=dict(iterations=2, std_devs=2))
+
+    def test_filter_std(self):
+        self._compare(
+            "parabolic",
+            "SEM",
+            fod=dict(iterations=1, std_devs=2, use_standard_deviation_filtering=True),
+        )
+
+    def test_unsupported(self):
+        rs = batch_regress(
+            [
+                BatchSeries([1, 2, 3], [1, 2, 3], "average"),
+                BatchSeries([1, 2, 3], [1, 2, 3], "linear", error_type="MSEM"),
+                # rank deficient
+                BatchSeries([1, 1, 1], [1, 2, 3], "linear"),
+                # too few points
+                BatchSeries([1, 2], [1, 2], "parabolic"),
+            ]
+        )
+        self.assertEqual(rs, [None, None, None, None])
+
+    def test_invalidate(self):
+        iso = make_isotope(0, 40, "linear", "SEM")
+        batch_fit_isotopes([iso])
+        self.assertIsNotNone(iso.batch_fit)
+
+        iso.set_filter_outliers_dict(iterations=1)
+        self.assertIsNone(iso.batch_fit)
+
+    def test_dump_user_excluded(self):
+        class Analysis(object):
+            """
+            the parts of DVCAnalysis used by dump_fits
+            """
+
+            def __init__(self, isotopes, intercepts):
+                self.isotopes = isotopes
+                self.intercepts = intercepts
+
+            def _get_json(self, modifier):
+                return self.intercepts, None
+
+            def _dump(self, obj, path):
+                self.intercepts = obj
+
+        # loaded with saved exclusions. the regressor is made to hold them
+        loaded = make_isotope(0, 40, "linear", "SEM")
+        loaded.set_user_excluded([1, 2])
+        loaded.regressor.user_excluded = [1, 2]
+
+        # no regressor
+        batch = make_isotope(1, 40, "linear", "SEM")
+        batch.name = "Ar39"
+
+        batch_fit_isotopes([loaded, batch])
+        self.assertIsNone(batch.user_excluded)
+        self.assertIsNotNone(batch.batch_fit)
+
+        an = Analysis(
+            {"Ar40": loaded, "Ar39": batch},
+            {"Ar40": {"user_excluded": [1, 2]}, "Ar39": {"user_excluded": [3]}},
+        )
+        DVCAnalysis.dump_fits(an, ["Ar40", "Ar39"])
+        self.assertEqual(an.intercepts["Ar40"]["user_excluded"], [1, 2])
+        self.assertEqual(an.intercepts["Ar39"]["user_excluded"], [3])
+        self.assertEqual(an.intercepts["Ar39"]["fit"], "linear")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from numpy import random, allclose, sort
+
+from pychron.core.regression.interpolation_regressor import (
+    InterpolationRegressor,
+    VECTORIZED_KINDS,
+)
+
+RTOL = 1e-9
+
+
+def make_regressor(seed, n, kind, nexcluded=0):
+    rng = random.RandomState(seed)
+    xs = sort(rng.uniform(0, 1000, n))
+    # a few duplicated timestamps
+    xs[rng.randint(1, n, 2)] = xs[0]
+    xs = sort(xs)
+    ys = rng.uniform(1, 10, n)
+    es = rng.uniform(0.01, 0.1, n)
+
+    reg = InterpolationRegressor(xs=xs, ys=ys, yserr=es, kind=kind.replace("_", " "))
+    if nexcluded:
+        reg.user_excluded = sorted(set(rng.randint(0, n, nexcluded).tolist()))
+    return reg, rng
+
+
+class InterpolationRegressorTestCase(unittest.TestCase):
+    def _compare(self, reg, tms):
+        self.assertTrue(reg._can_vectorize())
+        for attr in ("value", "error"):
+            try:
+                a = reg._predict_iter(tms, attr)
+            except IndexError:
+                with self.assertRaises(IndexError):
+                    reg._predict_vectorized(tms, attr)
+                continue
+
+            b = reg._predict_vectorized(tms, attr)
+            self.assertEqual(len(a), len(b))
+            self.assertTrue(allclose(a, b, rtol=RTOL, atol=0), (reg.kind, attr))
+
+    def test_random(self):
+        for kind in VECTORIZED_KINDS:
+            for seed in range(20):
+                n = 2 + (seed * 7) % 40
+                reg, rng = make_regressor(seed, n, kind, nexcluded=seed % 5)
+                tms = rng.uniform(-100, 1100, 50)
+                # timestamps equal to the references
+                tms[:5] = reg.xs[rng.randint(0, len(reg.xs), 5)]
+                self._compare(reg, tms)
+
+    def test_excluded_ends(self):
+        for kind in VECTORIZED_KINDS:
+            reg, rng = make_regressor(1, 10, kind)
+            for exc in ([0, 1, 8], [0, 8, 9]):
+                reg.user_excluded = exc
+                self._compare(reg, rng.uniform(-100, 1100, 50))
+
+    def test_scalar(self):
+        reg, rng = make_regressor(2, 10, "bracketing_interpolate")
+        t = reg.xs[3] + 1
+        self.assertEqual(len(reg.predict(t)), 1)
+        self.assertAlmostEqual(reg.predict(t)[0], reg._predict_iter(t, "value")[0])
+
+    def test_single_reference(self):
+        reg = InterpolationRegressor(xs=[1], ys=[2], yserr=[0.1], kind="preceding")
+        self.assertFalse(reg._can_vectorize())
+        self.assertEqual(reg.predict([0, 2]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
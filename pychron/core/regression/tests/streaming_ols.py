@@ -0,0 +1,143 @@
+import unittest
+
+from numpy import random, linspace, allclose, array
+
+from pychron.core.regression.streaming_ols import StreamingOLS, is_streamable
+from pychron.processing.isotope import Isotope
+from pychron.pychron_constants import AUTO_LINEAR_PARABOLIC
+
+RTOL = 1e-7
+
+
+def make_data(seed, n):
+    rng = random.RandomState(seed)
+    xs = linspace(5, 200, n)
+    a, b, c = rng.uniform(-1e-4, 1e-4), rng.uniform(-0.05, 0.05), rng.uniform(10, 100)
+    ys = a * xs**2 + b * xs + c + rng.normal(0, 0.05, n)
+    return xs, ys
+
+
+def make_isotope(fit, error_type, time_zero_offset=0):
+    iso = Isotope("Ar40", "H1")
+    iso.fit = fit
+    iso.error_type = error_type
+    iso.time_zero_offset = time_zero_offset
+    return iso
+
+
+class StreamingOLSTestCase(unittest.TestCase):
+    def _compare(self, fit, error_type, time_zero_offset=0, n=40):
+        for seed in range(10):
+            xs, ys = make_data(seed, n)
+
+            live = make_isotope(fit, error_type, time_zero_offset)
+            live.set_live_fit(True)
+            for i, (x, y) in enumerate(zip(xs, ys)):
+                live.append(x, y)
+                if i in (5, n // 2, n - 1):
+                    scalar = make_isotope(fit, error_type, time_zero_offset)
+                    scalar.xs, scalar.ys = xs[: i + 1], ys[: i + 1]
+
+                    self.assertIsNotNone(live.live_fit_result)
+                    self.assertTrue(allclose(live.value, scalar.value, rtol=RTOL))
+                    self.assertTrue(allclose(live.error, scalar.error, rtol=RTOL))
+                    self.assertEqual(live.fn, i + 1)
+
+            if fit != "average":
+                self.assertEqual(live.fit_result.fit, scalar.fit)
+                self.assertTrue(
+                    allclose(live.rsquared_adj, scalar.rsquared_adj, rtol=RTOL)
+                )
+
+    def test_linear_sem(self):
+        self._compare("linear", "SEM")
+
+    def test_linear_time_zero(self):
+        self._compare("linear", "SEM", time_zero_offset=3.5)
+
+    def test_parabolic_sd(self):
+        self._compare("parabolic", "SD")
+
+    def test_linear_ci(self):
+        self._compare("linear", "CI")
+
+    def test_auto(self):
+        self._compare(AUTO_LINEAR_PARABOLIC.lower(), "SEM")
+
+    def test_average(self):
+        self._compare("average", "SEM")
+        self._compare("average", "SD")
+
+    def test_not_enough_points(self):
+        s = StreamingOLS()
+        s.add(1, 2)
+        s.add(2, 3)
+        self.assertIsNone(s.fit("linear"))
+        self.assertIsNotNone(s.fit("average"))
+
+        s = StreamingOLS()
+        s.extend([1, 1, 1, 1], [1, 2, 3, 4])
+        self.assertIsNone(s.fit("linear"))
+
+    def test_streamable(self):
+        self.assertTrue(is_streamable("linear", None))
+        self.assertTrue(is_streamable("average", "SD"))
+        self.assertFalse(is_streamable("linear", "MSEM"))
+        self.assertFalse(is_streamable("cubic", "SEM"))
+        self.assertFalse(is_streamable("exponential", "SEM"))
+
+    def test_filtering_after_live(self):
+        xs, ys = make_data(0, 40)
+        ys[10] += 5
+
+        iso = make_isotope("linear", "SEM")
+        iso.set_filter_outliers_dict(iterations=1, std_devs=2)
+        iso.set_live_fit(True)
+        for x, y in zip(xs, ys):
+            iso.append(x, y)
+        self.assertEqual(iso.fn, 40)
+        v = iso.value
+
+        iso.set_live_fit(False)
+        self.assertIsNone(iso.fit_result)
+        self.assertNotAlmostEqual(iso.value, v)
+        self.assertEqual(iso.fn, 39)
+
+
+class MeasurementAppendTestCase(unittest.TestCase):
+    def test_append(self):
+        iso = Isotope("Ar40", "H1")
+        xs, ys = make_data(0, 1000)
+        for x, y in zip(xs, ys):
+            iso.append(x, y)
+
+        self.assertTrue(allclose(iso.xs, xs))
+        self.assertTrue(allclose(iso.ys, ys))
+        self.assertEqual(iso.n, 1000)
+
+    def test_views_unchanged(self):
+        iso = Isotope("Ar40", "H1")
+        iso.append(1, 2)
+        view = iso.ys
+        for i in range(1000):
+            iso.append(i, i)
+        self.assertEqual(list(view), [2])
+
+    def test_replaced(self):
+        iso = Isotope("Ar40", "H1")
+        iso.set_live_fit(True)
+        iso.fit = "linear"
+        for x in range(10):
+            iso.append(x, 2 * x + 1)
+        self.assertAlmostEqual(iso.value, 1)
+
+        iso.xs, iso.ys = array([0, 1, 2.0]), array([3, 4, 5.0])
+        self.assertAlmostEqual(iso.value, 3)
+
+        iso.append(3, 6)
+        self.assertEqual(list(iso.xs), [0, 1, 2, 3])
+        self.assertAlmostEqual(iso.value, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
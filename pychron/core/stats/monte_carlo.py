@@ -17,39 +17,44 @@
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
 
-from numpy import zeros, percentile, array, random, abs as nabs, column_stack
-from scipy.stats import norm
-
+from numpy import empty, percentile, random, abs as nabs, column_stack
 
 # ============= local library imports  ==========================
 
+# upper bound on the number of floats allocated per chunk of trials
+MAX_CHUNK_ELEMENTS = 2**22
+
 
 class MonteCarloEstimator(object):
-    def __init__(self, ntrials, regressor, seed=None):
+    """
+    trials are evaluated in chunks. each chunk is predicted with one call to
+    regressor.batch_predict instead of one fast_predict2 call per trial
+    """
+
+    def __init__(self, ntrials, regressor, seed=None, chunk_size=None):
         self.regressor = regressor
         self.ntrials = ntrials
         self.seed = seed
+        self.chunk_size = chunk_size
 
     def _calculate(self, nominal_ys, ps):
         res = nominal_ys - ps
         pct = (15.87, 84.13)
 
-        a, b = array([percentile(ri, pct) for ri in res.T]).T
+        a, b = percentile(res, pct, axis=0)
         a, b = nabs(a), nabs(b)
         return (a + b) * 0.5
 
-    def _get_dist(self, n, npts):
-        if self.seed:
-            random.seed(self.seed)
-
-        ndist = norm()
-        ntrials = self.ntrials
-
-        ga = ndist.rvs((ntrials, n))
-        ps = zeros((ntrials, npts))
-        return ndist, ga, ps
+    def _get_chunk_size(self, width):
+        if self.chunk_size:
+            return self.chunk_size
+        return max(1, MAX_CHUNK_ELEMENTS // max(1, width))
 
-    def _estimate(self, pts, pexog, ys=None, yserr=None):
+    def _estimate(self, pts, pexog, ys=None, yserr=None, width=None):
+        """
+        pexog: exog for pts or a callable pexog(rng, m) that returns a (m, npts, k) array of
+            exogs, one per trial
+        """
         reg = self.regressor
         nominal_ys = reg.predict(pts)
 
@@ -61,16 +66,15 @@ class MonteCarloEstimator(object):
         n, npts = len(ys), len(pts)
 
         ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-        pred = reg.fast_predict2
-        yp = ys + yserr * ga
+        rng = random.default_rng(self.seed)
+        ps = empty((ntrials, npts))
 
-        if hasattr(pexog, "__call__"):
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog(i))
-        else:
-            for i in range(ntrials):
-                ps[i] = pred(yp[i], pexog)
+        chunk = self._get_chunk_size(width or n + npts)
+        for i in range(0, ntrials, chunk):
+            m = min(chunk, ntrials - i)
+            yp = ys + yserr * rng.standard_normal((m, n))
+            exog = pexog(rng, m) if callable(pexog) else pexog
+            ps[i : i + m] = reg.batch_predict(yp, exog)
 
         return nominal_ys, self._calculate(nominal_ys, ps)
 
@@ -87,22 +91,17 @@ class FluxEstimator(MonteCarloEstimator):
     def estimate_position_err(self, pts, error):
         reg = self.regressor
         ox, oy = pts.T
+        npts = len(pts)
 
-        n, npts = len(reg.ys), len(pts)
-
-        ntrials = self.ntrials
-        ndist, ga, ps = self._get_dist(n, npts)
-
-        pgax = ndist.rvs((ntrials, npts))
-        pgay = ndist.rvs((ntrials, npts))
-
-        pgax *= error
-        pgay *= error
-
-        def get_pexog(i):
-            return reg.get_exog(column_stack((ox + pgax[i], oy + pgay[i])))
+        def get_pexog(rng, m):
+            px = ox + rng.standard_normal((m, npts)) * error
+            py = oy + rng.standard_normal((m, npts)) * error
+            exog = reg.get_exog(column_stack((px.ravel(), py.ravel())))
+            return exog.reshape(m, npts, -1)
 
-        return self._estimate(pts, get_pexog, yserr=0)
+        # per trial exogs dominate the memory use
+        width = len(reg.ys) + npts * (reg.get_exog(pts[:1]).size + 2)
+        return self._estimate(pts, get_pexog, yserr=0, width=width)
 
     def estimate(self, pts):
         reg = self.regressor
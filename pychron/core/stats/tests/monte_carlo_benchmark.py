@@ -0,0 +1,122 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+compare the chunked monte carlo estimators with the original one trial at a time loop
+
+    python -m pychron.core.stats.tests.monte_carlo_benchmark
+"""
+
+# ============= standard library imports ========================
+import time
+
+from numpy import random, ones, column_stack, zeros, array
+
+# ============= local library imports  ==========================
+from pychron.core.regression.flux_regressor import BowlFluxRegressor
+from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.core.stats.monte_carlo import (
+    RegressionEstimator,
+    FluxEstimator,
+    MonteCarloEstimator,
+)
+
+
+def loop_estimate(estimator, pts, pexog, ys, yserr):
+    """
+    the original MonteCarloEstimator._estimate. one fast_predict2 call per trial
+    """
+    reg = estimator.regressor
+    nominal_ys = reg.predict(pts)
+    n, npts, ntrials = len(ys), len(pts), estimator.ntrials
+
+    ga = random.standard_normal((ntrials, n))
+    ps = zeros((ntrials, npts))
+    yp = ys + yserr * ga
+    if callable(pexog):
+        for i in range(ntrials):
+            ps[i] = reg.fast_predict2(yp[i], pexog(i))
+    else:
+        for i in range(ntrials):
+            ps[i] = reg.fast_predict2(yp[i], pexog)
+
+    return nominal_ys, MonteCarloEstimator._calculate(estimator, nominal_ys, ps)
+
+
+def loop_position_err(estimator, pts, error):
+    reg = estimator.regressor
+    ox, oy = pts.T
+    npts = len(pts)
+    pgax = random.standard_normal((estimator.ntrials, npts)) * error
+    pgay = random.standard_normal((estimator.ntrials, npts)) * error
+
+    def get_pexog(i):
+        return reg.get_exog(column_stack((ox + pgax[i], oy + pgay[i])))
+
+    return loop_estimate(estimator, pts, get_pexog, reg.ys, 0)
+
+
+def timeit(func, *args):
+    st = time.time()
+    func(*args)
+    return time.time() - st
+
+
+def report(name, old, new):
+    print(
+        "{:<28s} loop={:8.3f}s batch={:8.3f}s x{:0.1f}".format(
+            name, old, new, old / new
+        )
+    )
+
+
+def bench_regression(ntrials=10000):
+    xs = random.uniform(0, 100, 200)
+    ys = 10 + 0.1 * xs + random.normal(0, 0.1, 200)
+    reg = PolynomialRegressor(xs=xs, ys=ys, yserr=ones(200) * 0.1, fit="parabolic")
+    reg.calculate()
+
+    pts = array([0.0])
+    est = RegressionEstimator(ntrials, reg)
+    old = timeit(
+        loop_estimate, est, pts, reg.get_exog(pts), reg.clean_ys, reg.clean_yserr
+    )
+    new = timeit(est.estimate, pts)
+    report("intercept mc error", old, new)
+
+
+def bench_flux(ntrials=10000):
+    xy = random.uniform(-1, 1, (60, 2))
+    x, y = xy.T
+    j = 0.001 + 1e-5 * x**2 - 2e-5 * y + random.normal(0, 1e-7, 60)
+    reg = BowlFluxRegressor(xs=xy, ys=j, yserr=ones(60) * 1e-7)
+    reg.calculate()
+
+    pts = random.uniform(-1, 1, (120, 2))
+    est = FluxEstimator(ntrials, reg)
+
+    old = timeit(loop_estimate, est, pts, reg.get_exog(pts), reg.ys, reg.yserr)
+    new = timeit(est.estimate, pts)
+    report("flux surface", old, new)
+
+    old = timeit(loop_position_err, est, pts, 0.01)
+    new = timeit(est.estimate_position_err, pts, 0.01)
+    report("flux position error", old, new)
+
+
+if __name__ == "__main__":
+    bench_regression()
+    bench_flux()
+# ============= EOF =============================================
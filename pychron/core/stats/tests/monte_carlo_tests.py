@@ -0,0 +1,89 @@
+import unittest
+
+from numpy import linspace, random, array, allclose, column_stack, ones
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor
+from pychron.core.regression.mean_regressor import (
+    MeanRegressor,
+    WeightedMeanRegressor,
+)
+from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.core.stats.monte_carlo import RegressionEstimator, FluxEstimator
+
+
+def make_flux_regressor(use_weighted_fit=False):
+    rng = random.RandomState(1)
+    xy = rng.uniform(-1, 1, (20, 2))
+    x, y = xy.T
+    j = 0.001 + 1e-5 * x - 2e-5 * y + rng.normal(0, 1e-7, 20)
+    reg = PlaneFluxRegressor(
+        xs=xy, ys=j, yserr=ones(20) * 1e-7, use_weighted_fit=use_weighted_fit
+    )
+    reg.calculate()
+    return reg
+
+
+class MonteCarloTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.RandomState(0)
+        xs = linspace(0, 10, 25)
+        ys = 1.5 + 0.3 * xs + rng.normal(0, 0.1, 25)
+        self.reg = OLSRegressor(xs=xs, ys=ys, yserr=ones(25) * 0.1, fit="linear")
+        self.reg.calculate()
+
+    def _compare_batch(self, reg, pts, fast_predict):
+        rng = random.RandomState(2)
+        endogs = reg.ys + rng.normal(0, 1e-3, (50, reg.ys.shape[0])) * reg.ys.mean()
+        exog = reg.get_exog(pts)
+
+        a = reg.batch_predict(endogs, exog)
+        b = array([fast_predict(e, exog) for e in endogs])
+        self.assertTrue(allclose(a, b, rtol=1e-10, atol=0))
+
+    def test_batch_ols(self):
+        self._compare_batch(self.reg, array([0, 1.5, 3]), self.reg.fast_predict2)
+
+    def test_batch_plane(self):
+        pts = array([[0, 0], [0.5, 0.2]])
+        for w in (False, True):
+            reg = make_flux_regressor(w)
+            self._compare_batch(reg, pts, reg.fast_predict)
+
+    def test_batch_mean(self):
+        ys = array([1.0, 1.2, 0.9, 1.1])
+        for klass in (MeanRegressor, WeightedMeanRegressor):
+            reg = klass(ys=ys, yserr=array([0.1, 0.2, 0.1, 0.3]))
+            reg.calculate()
+            self._compare_batch(reg, array([[0, 0], [1, 1]]), reg.fast_predict2)
+
+    def test_seed(self):
+        pts = array([0, 5])
+        a = RegressionEstimator(500, self.reg, seed=7).estimate(pts)[1]
+        b = RegressionEstimator(500, self.reg, seed=7).estimate(pts)[1]
+        self.assertTrue(allclose(a, b, rtol=0, atol=0))
+
+    def test_chunks(self):
+        pts = array([0, 5])
+        a = RegressionEstimator(500, self.reg, seed=7).estimate(pts)[1]
+        b = RegressionEstimator(500, self.reg, seed=7, chunk_size=33).estimate(pts)[1]
+        self.assertTrue(allclose(a, b, rtol=1e-12, atol=0))
+
+    def test_regression_error(self):
+        # monte carlo error of the intercept converges on the analytical error
+        e = RegressionEstimator(20000, self.reg, seed=1).estimate(array([0.0]))[1][0]
+        se = self.reg.predict_error_matrix([0], error_calc="SEM")[0]
+        sef = self.reg.calculate_standard_error_fit()
+        # yserr=0.1 instead of the standard error of the fit
+        self.assertAlmostEqual(e, se / sef * 0.1, delta=0.05 * e)
+
+    def test_position_err(self):
+        reg = make_flux_regressor()
+        pts = array([[0, 0], [0.5, 0.2]])
+        fe = FluxEstimator(2000, reg, seed=3, chunk_size=100)
+        noms, es = fe.estimate_position_err(pts, 0.01)
+        self.assertEqual(es.shape, (2,))
+        self.assertTrue(all(es > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,6 +38,9 @@ from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.loggable import Loggable
 from pychron.paths import paths
 
+# seconds between checks of the on_change values for a timeout
+ON_CHANGE_PERIOD = 1
+
 
 class DashboardDevice(Loggable):
     name = Str
@@ -63,6 +66,26 @@ class DashboardDevice(Loggable):
     def current_values(self):
         return [pv.last_value for pv in self.values]
 
+    @property
+    def poll_period(self):
+        """
+        seconds between triggers. the shortest period of the enabled values.
+        return None if no value needs to be triggered
+        """
+        ps = []
+        for value in self.values:
+            if not value.enabled:
+                continue
+
+            if value.period == "on_change":
+                if value.timeout:
+                    ps.append(ON_CHANGE_PERIOD)
+            else:
+                ps.append(value.period)
+
+        if ps:
+            return min(ps)
+
     def setup_graph(self):
         self.graph = g = StreamStackedGraph()
         for i, vi in enumerate(self.values):
@@ -77,9 +100,13 @@ class DashboardDevice(Loggable):
             g.set_scan_width(24 * 60 * 60, plotid=i)
             g.set_data_limits(24 * 60 * 60, plotid=i)
 
-    def trigger(self):
+    def trigger(self, tolerance=0):
         """
         trigger a new value if appropriate
+
+        tolerance: seconds. trigger a value that is due within tolerance seconds. used when
+        the device is triggered every poll_period seconds so that a value is not skipped
+        because last_time was set at the end of the previous trigger
         """
         for value in self.values:
             if not value.enabled:
@@ -91,7 +118,7 @@ class DashboardDevice(Loggable):
                 if value.timeout and dt > value.timeout:
                     self.debug("Force trigger. timeout={}".format(value.timeout))
                     self._trigger(value, force=True)
-            elif dt > value.period:
+            elif dt + tolerance > value.period:
                 self._trigger(value)
 
     def _trigger(self, value, **kw):
@@ -16,10 +16,11 @@
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Instance, on_trait_change, List, Button, Bool
+from traits.api import Instance, on_trait_change, List, Button, Bool, Int, Float
 
 # ============= standard library imports ========================
-from threading import Thread
+from functools import partial
+from threading import Thread, Lock
 import os
 import pickle
 import time
@@ -31,6 +32,7 @@ from pychron.globals import globalv
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.core.helpers.filetools import add_extension
 from pychron.core.helpers.strtools import to_bool
+from pychron.hardware.core.scan_scheduler import ScanScheduler
 from pychron.hardware.dummy_device import DummyDevice
 from pychron.loggable import Loggable
 from pychron.messaging.notify.notifier import Notifier
@@ -77,13 +79,29 @@ class DashboardServer(Loggable):
     emailer = Instance("pychron.social.emailer.Emailer")
     labspy_client = Instance("pychron.labspy.client.LabspyClient")
 
+    # trigger each device on its own period from a pool of workers
+    use_concurrent_poll = Bool(True)
+    max_poll_workers = Int(8)
+    # seconds between sends of the pushed values to the notifier and labspy
+    publish_period = Float(1)
+
     use_db = False
     _alive = False
+    _scheduler = None
+    _publish_lock = None
+    # values pushed since the last publish. None if values are published immediately
+    _publish_buffer = None
 
     def bind_preferences(self):
         bind_preference(
             self.notifier, "enabled", "pychron.dashboard.server.notifier_enabled"
         )
+        bind_preference(
+            self, "use_concurrent_poll", "pychron.dashboard.server.concurrent_poll"
+        )
+        bind_preference(
+            self, "publish_period", "pychron.dashboard.server.publish_period"
+        )
 
     def activate(self):
         emailer = self.application.get_service("pychron.social.emailer.Emailer")
@@ -103,7 +121,7 @@ class DashboardServer(Loggable):
             self.labspy_client.start()
 
     def deactivate(self):
-        pass
+        self.stop_poll()
 
     # def deactivate(self):
     # if self.use_db:
@@ -134,10 +152,23 @@ class DashboardServer(Loggable):
     def start_poll(self):
         self.info("starting dashboard poll")
         self._alive = True
-        t = Thread(name="poll", target=self._poll)
+        if self.use_concurrent_poll:
+            self._start_concurrent_poll()
+        else:
+            t = Thread(name="poll", target=self._poll)
+
+            t.setDaemon(1)
+            t.start()
 
-        t.setDaemon(1)
-        t.start()
+    def stop_poll(self):
+        self._alive = False
+        if self._scheduler is not None:
+            self._scheduler.stop()
+            self._scheduler = None
+
+            self._publish()
+            with self._publish_lock:
+                self._publish_buffer = None
 
     def load_devices(self):
         dd = self._assemble_dev_dicts()
@@ -262,6 +293,69 @@ class DashboardServer(Loggable):
 
         return pickle.dumps(config)
 
+    def _start_concurrent_poll(self):
+        """
+        add a task for each device to a ScanScheduler. a device is triggered every
+        poll_period seconds. devices that use the same hardware device are triggered one
+        after another. a device that is slow to respond, e.g. a gauge waiting for a socket
+        timeout, only delays its own values.
+
+        the values pushed by the devices are buffered and published every publish_period
+        seconds
+        """
+        groups = {}
+        for dev in self.devices:
+            period = dev.poll_period
+            if period is None:
+                self.debug("{} has no periodic values".format(dev.name))
+                continue
+
+            groups.setdefault(self._get_poll_group(dev), []).append((dev, period))
+
+        self._publish_lock = Lock()
+        self._publish_buffer = []
+
+        # one worker for each group and one for publishing
+        nworkers = max(1, min(len(groups), self.max_poll_workers)) + 1
+        self._scheduler = scheduler = ScanScheduler(
+            name="DashboardPoll", nworkers=nworkers
+        )
+        for group, devs in groups.items():
+            for dev, period in devs:
+                self.debug("poll {} every {}s".format(dev.name, period))
+                scheduler.add(
+                    dev.name,
+                    partial(self._trigger_device, dev, period),
+                    period,
+                    group=group,
+                )
+
+        scheduler.add("publish", self._publish, self.publish_period, group="publish")
+
+    def _get_poll_group(self, dev):
+        return "device:{}".format(id(dev.hardware_device))
+
+    def _trigger_device(self, dev, period):
+        if dev.use:
+            dev.trigger(tolerance=period / 2.0)
+
+    def _publish(self):
+        """
+        send the values pushed since the last publish to the notifier and add them to
+        labspy in one session
+        """
+        with self._publish_lock:
+            items = self._publish_buffer
+            if not items:
+                return
+            self._publish_buffer = []
+
+        for dev, tag, val, units in items:
+            self.notifier.send_message("{} {}".format(tag, val), verbose=False)
+
+        if self.labspy_client:
+            self.labspy_client.add_measurements(items)
+
     def _poll(self):
         if any((v.period == "on_change" for dev in self.devices for v in dev.values)):
             mperiod = 1
@@ -366,6 +460,12 @@ class DashboardServer(Loggable):
 
     @on_trait_change("devices:update_value_event")
     def _handle_publish(self, obj, name, old, new):
+        if self._publish_lock is not None:
+            with self._publish_lock:
+                if self._publish_buffer is not None:
+                    self._publish_buffer.append((obj.name,) + tuple(new))
+                    return
+
         self.notifier.send_message("{} {}".format(*new))
         self._update_labspy_device(obj.name, *new)
         # self._update_labspy_devices()
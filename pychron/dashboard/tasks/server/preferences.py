@@ -14,8 +14,8 @@
 # limitations under the License.
 # ===============================================================================
 
-from traits.api import Bool
-from traitsui.api import View, Item
+from traits.api import Bool, Float
+from traitsui.api import View, Item, VGroup
 from apptools.preferences.preferences_helper import PreferencesHelper
 from envisage.ui.tasks.preferences_pane import PreferencesPane
 
@@ -25,6 +25,8 @@ class DashboardServerPreferences(PreferencesHelper):
     preferences_path = "pychron.dashboard.server"
 
     notifier_enabled = Bool
+    concurrent_poll = Bool(True)
+    publish_period = Float(1)
 
 
 class DashboardServerPreferencesPane(PreferencesPane):
@@ -32,7 +34,25 @@ class DashboardServerPreferencesPane(PreferencesPane):
     model_factory = DashboardServerPreferences
 
     def traits_view(self):
-        v = View(Item("notifier_enabled"))
+        v = View(
+            Item("notifier_enabled"),
+            VGroup(
+                Item(
+                    "concurrent_poll",
+                    tooltip="Poll each device on its own period. "
+                    "A slow device does not delay the other devices",
+                ),
+                Item(
+                    "publish_period",
+                    label="Publish Period (s)",
+                    enabled_when="concurrent_poll",
+                    tooltip="Send the new values to the notifier and Labspy every "
+                    "publish period seconds",
+                ),
+                show_border=True,
+                label="Poll",
+            ),
+        )
 
         return v
 
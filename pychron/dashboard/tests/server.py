@@ -0,0 +1,129 @@
+import time
+import unittest
+
+from traits.api import provides
+
+from pychron.dashboard.server import DashboardServer
+from pychron.dashboard.device import DashboardDevice
+from pychron.hardware.core.i_core_device import ICoreDevice
+from pychron.hardware.dummy_device import DummyDevice
+from pychron.labspy.client import LabspyClient
+
+
+@provides(ICoreDevice)
+class Gauge(DummyDevice):
+    def __init__(self, delay=0, *args, **kw):
+        super(Gauge, self).__init__(*args, **kw)
+        self.delay = delay
+        self.ncalls = 0
+        self.value = 0
+
+    def get(self, *args, **kw):
+        self.ncalls += 1
+        self.value += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+class Labspy(LabspyClient):
+    def __init__(self, *args, **kw):
+        super(Labspy, self).__init__(bind=False, *args, **kw)
+        self.batches = []
+        self.measurements = []
+
+    def add_measurement(self, *args):
+        self.measurements.append(args)
+
+    def add_measurements(self, ms):
+        self.batches.append(ms)
+
+
+def make_device(name, period, delay=0, timeout=0):
+    dev = DashboardDevice(
+        name=name, use=True, hardware_device=Gauge(name=name, delay=delay)
+    )
+    dev.add_value(
+        "pressure",
+        "<{},pressure>".format(name),
+        "get",
+        period,
+        True,
+        0,
+        "torr",
+        timeout,
+        False,
+        "",
+    )
+    dev.setup_graph()
+    return dev
+
+
+class DashboardServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = DashboardServer(labspy_client=Labspy(), publish_period=0.1)
+
+    def tearDown(self):
+        self.server.stop_poll()
+
+    def test_poll_period(self):
+        dev = make_device("a", 5)
+        dev.add_value("b", "<a,b>", "get", 2, True, 0, "", 0, False, "")
+        dev.add_value("c", "<a,c>", "get", 1, False, 0, "", 0, False, "")
+        self.assertEqual(dev.poll_period, 2)
+
+        dev = make_device("on_change", "on_change", timeout=60)
+        self.assertEqual(dev.poll_period, 1)
+
+        dev = make_device("on_change", "on_change")
+        self.assertIsNone(dev.poll_period)
+
+    def test_trigger_tolerance(self):
+        dev = make_device("a", 1)
+        pv = dev.values[0]
+        pv.last_time = time.time() - 0.9
+        dev.trigger()
+        self.assertEqual(dev.hardware_device.ncalls, 0)
+        dev.trigger(tolerance=0.5)
+        self.assertEqual(dev.hardware_device.ncalls, 1)
+
+    def test_isolated_timeout(self):
+        slow = make_device("slow", 0.05, delay=1)
+        fast = make_device("fast", 0.05)
+        self.server.devices = [slow, fast]
+        self.server.start_poll()
+        time.sleep(0.6)
+        self.server.stop_poll()
+
+        self.assertEqual(slow.hardware_device.ncalls, 1)
+        self.assertGreater(fast.hardware_device.ncalls, 5)
+
+    def test_batch_publish(self):
+        devs = [make_device(n, 0.05) for n in "abc"]
+        self.server.devices = devs
+        self.server.start_poll()
+        time.sleep(0.5)
+        self.server.stop_poll()
+
+        batches = self.server.labspy_client.batches
+        n = sum(d.hardware_device.ncalls for d in devs)
+        self.assertEqual(sum(len(b) for b in batches), n)
+        self.assertLess(len(batches), n)
+        self.assertEqual(batches[0][0][1:], ("pressure", 1, "torr"))
+
+    def test_publish_after_stop(self):
+        dev = make_device("a", 1)
+        self.server.devices = [dev]
+        self.server.start_poll()
+        self.server.stop_poll()
+        nbatches = len(self.server.labspy_client.batches)
+
+        # published immediately
+        dev.update_value_event = ("pressure", 1, "torr")
+        self.assertEqual(len(self.server.labspy_client.batches), nbatches)
+        self.assertEqual(
+            self.server.labspy_client.measurements, [("a", "pressure", 1, "torr")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,9 @@ INTERCEPTS = "intercepts"
 PEAKCENTER = "peakcenter"
 COSMOGENIC = "cosmogenic"
 
+# extension of the optional columnar sidecar written next to <runid>.data.json
+COLUMNAR_EXT = ".npz"
+
 HISTORY_PATHS = (None, DATA, BASELINES, BLANKS, ICFACTORS, INTERCEPTS, TAGS)
 
 static = (PEAKCENTER, "extraction", "monitor")
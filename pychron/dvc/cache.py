@@ -13,65 +13,213 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
-from datetime import datetime
+import time
+from collections import OrderedDict
+from threading import RLock
+
+# rough size of an analysis without its raw data, i.e. the python objects, ufloats and metadata
+ANALYSIS_BASE_SIZE = 32 * 1024
+ISOTOPE_BASE_SIZE = 4 * 1024
+
+
+def _array_nbytes(a):
+    if a is None:
+        return 0
+    try:
+        return a.nbytes
+    except AttributeError:
+        try:
+            return len(a) * 8
+        except TypeError:
+            return 0
+
+
+def estimate_size(value):
+    """
+    approximate memory used by a cached analysis.
+
+    return base, raw. raw is the size of the loaded isotope evolutions, baselines, sniffs and
+    whiffs. it is 0 if the raw data has not been loaded
+    """
+    base, raw = ANALYSIS_BASE_SIZE, 0
+    isotopes = getattr(value, "isotopes", None)
+    if isotopes:
+        for iso in isotopes.values():
+            base += ISOTOPE_BASE_SIZE
+            for m in (
+                iso,
+                getattr(iso, "baseline", None),
+                getattr(iso, "sniff", None),
+                getattr(iso, "whiff", None),
+            ):
+                if m is not None:
+                    raw += _array_nbytes(getattr(m, "xs", None))
+                    raw += _array_nbytes(getattr(m, "ys", None))
+    return base, raw
+
+
+class CacheEntry(object):
+    __slots__ = ("value", "accessed", "base", "raw", "repository")
+
+    def __init__(self, value, base, raw, repository):
+        self.value = value
+        self.accessed = time.monotonic()
+        self.base = base
+        self.raw = raw
+        self.repository = repository
 
 
 class DVCCache(object):
-    def __init__(self, max_size=1000):
-        self._cache = {}
+    """
+    least recently used cache of analyses.
+
+    entries are kept in access order so eviction and expiry pop from the front.
+    entries are evicted when there are more than max_size entries or they use more than
+    max_bytes. entries not accessed for ttl seconds are removed by clean()
+    """
+
+    def __init__(self, max_size=1000, max_bytes=0, ttl=60 * 15, sizer=estimate_size):
+        self._cache = OrderedDict()
+        self._lock = RLock()
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizer = sizer
+
+        self._base_bytes = 0
+        self._raw_bytes = 0
+        # number of entries with raw data loaded
+        self._nraw = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
 
     def clear(self):
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._base_bytes = 0
+            self._raw_bytes = 0
+            self._nraw = 0
 
     def remove(self, key):
-        try:
-            self._cache.pop(key)
-        except KeyError:
-            pass
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._account(entry, -1)
+                self.invalidations += 1
+
+    def remove_repository(self, name):
+        """
+        remove all the analyses of the repository name, e.g. after the repository was pulled
+        """
+        with self._lock:
+            for k in [k for k, v in self._cache.items() if v.repository == name]:
+                self.remove(k)
 
     def clean(self):
-        t = 60 * 15  # 15 minutes
-        now = datetime.now()
-        remove = (
-            k
-            for k, v in self._cache.items()
-            if (now - v["date_accessed"]).total_seconds() > t
-        )
+        if not self.ttl:
+            return
+
+        expire = time.monotonic() - self.ttl
+        with self._lock:
+            while self._cache:
+                entry = next(iter(self._cache.values()))
+                if entry.accessed > expire:
+                    break
 
-        for k in remove:
-            del self._cache[k]
+                self._pop_oldest()
+                self.expirations += 1
 
     def report(self):
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "with_raw": self._nraw,
+                "nbytes": self.nbytes,
+                "base_bytes": self._base_bytes,
+                "raw_bytes": self._raw_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    @property
+    def size(self):
         return len(self._cache)
 
+    @property
+    def nbytes(self):
+        return self._base_bytes + self._raw_bytes
+
     def get(self, item):
-        obj = self._cache.get(item)
-        if obj:
-            obj["date_accessed"] = datetime.now()
-            return obj["value"]
+        with self._lock:
+            entry = self._cache.get(item)
+            if entry is None:
+                self.misses += 1
+                return
+
+            self.hits += 1
+            entry.accessed = time.monotonic()
+            self._cache.move_to_end(item)
+
+            # raw data may have been loaded since the entry was added
+            self._resize(entry)
+            self._evict()
+            return entry.value
 
     def update(self, key, value):
-        if key not in self._cache and len(self._cache) > self.max_size:
-            self.remove_oldest()
+        base, raw = self._sizer(value)
+        entry = CacheEntry(
+            value, base, raw, getattr(value, "repository_identifier", None)
+        )
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._account(old, -1)
 
-        self._cache[key] = {"date_accessed": datetime.now(), "value": value}
+            self._cache[key] = entry
+            self._account(entry, 1)
+            self._evict()
 
     def remove_oldest(self):
         """
-        Remove the entry that has the oldest accessed date
+        Remove the least recently accessed entry
         """
-        oldest_entry = None
-        for key in self._cache:
-            if oldest_entry is None:
-                oldest_entry = key
-            elif (
-                self._cache[key]["date_accessed"]
-                < self._cache[oldest_entry]["date_accessed"]
-            ):
-                oldest_entry = key
+        with self._lock:
+            if self._cache:
+                self._pop_oldest()
+                self.evictions += 1
+
+    # private
+    def _account(self, entry, sign):
+        self._base_bytes += sign * entry.base
+        self._raw_bytes += sign * entry.raw
+        if entry.raw:
+            self._nraw += sign
 
-        self._cache.pop(oldest_entry)
+    def _resize(self, entry):
+        self._account(entry, -1)
+        entry.base, entry.raw = self._sizer(entry.value)
+        self._account(entry, 1)
+
+    def _pop_oldest(self):
+        k, entry = self._cache.popitem(last=False)
+        self._account(entry, -1)
+
+    def _over_budget(self):
+        if self.max_size and len(self._cache) > self.max_size:
+            return True
+        return bool(self.max_bytes and self.nbytes > self.max_bytes)
+
+    def _evict(self):
+        # the most recently used entry is at the end and is never evicted
+        while len(self._cache) > 1 and self._over_budget():
+            self.remove_oldest()
 
 
 # ============= EOF =============================================
@@ -0,0 +1,196 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import glob
+import os
+
+from numpy import array, float32, frombuffer, load, savez, vstack
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.binpack import format_blob
+from pychron.dvc import dvc_load, COLUMNAR_EXT
+
+# Columnar sidecar for the raw isotope data stored in <runid>.data.json.
+#
+# The sidecar is an uncompressed numpy .npz file written next to the .data.json file.
+# Each signal, sniff and baseline is stored as a (2, n) float32 array (row 0 = xs, row 1 = ys)
+# keyed by
+#
+#     signals.<isotope>.<detector>
+#     sniffs.<isotope>.<detector>
+#     baselines.<detector>
+#
+# float32 is the precision used by the ">ff" base64 blobs, so values loaded from either
+# source are identical.
+
+COLUMNAR_VERSION = 1
+KINDS = ("signals", "sniffs", "baselines")
+
+
+def columnar_path(path):
+    """
+    return the sidecar path for a .data.json path
+    """
+    head, _ = os.path.splitext(path)
+    return "{}{}".format(head, COLUMNAR_EXT)
+
+
+def make_key(kind, detector, isotope=None):
+    if isotope:
+        return "{}.{}.{}".format(kind, isotope, detector)
+    return "{}.{}".format(kind, detector)
+
+
+def split_key(key):
+    args = key.split(".", 2)
+    if len(args) == 3:
+        return args
+    kind, det = args
+    return kind, None, det
+
+
+def dump_columnar(path, data):
+    """
+    data: dict of key: (xs, ys)
+    """
+    arrays = {k: array((xs, ys), dtype=float32) for k, (xs, ys) in data.items()}
+    arrays["version"] = array([COLUMNAR_VERSION])
+
+    with open(path, "wb") as wfile:
+        savez(wfile, **arrays)
+
+
+def load_columnar(path):
+    """
+    load a sidecar into the same layout as a .data.json file.
+    each item has a "data" entry, a (2, n) float64 array, instead of a "blob"
+
+    return None if the sidecar does not exist or is unreadable
+    """
+    if not os.path.isfile(path):
+        return
+
+    ret = {k: [] for k in KINDS}
+    try:
+        with load(path, allow_pickle=False) as npz:
+            for key in npz.files:
+                if key == "version":
+                    continue
+
+                kind, iso, det = split_key(key)
+                if kind not in ret:
+                    continue
+
+                d = {"detector": det, "data": npz[key].astype(float)}
+                if iso:
+                    d["isotope"] = iso
+                ret[kind].append(d)
+    except (OSError, ValueError) as e:
+        print("load columnar exception. error: {}, {}".format(e, path))
+        return
+
+    return ret
+
+
+def blob_to_columns(blob, fmt=">ff"):
+    """
+    convert a base64 encoded blob into a (2, n) array
+    """
+    if not blob:
+        return array([[], []], dtype=float32)
+
+    raw = format_blob(blob)
+    n = len(raw) // 8
+    xy = frombuffer(raw[: n * 8], dtype="{}f4".format(fmt[0]))
+    return vstack((xy[::2], xy[1::2]))
+
+
+def convert_data_file(path, overwrite=False):
+    """
+    write the columnar sidecar for an existing .data.json file
+
+    return True if a sidecar was written
+    """
+    cpath = columnar_path(path)
+    if os.path.isfile(cpath) and not overwrite:
+        return False
+
+    jd = dvc_load(path)
+    if not jd:
+        return False
+
+    fmt = jd.get("format", ">ff")
+    data = {}
+    for kind in KINDS:
+        for d in jd.get(kind, []):
+            det = d.get("detector")
+            if det is None:
+                continue
+
+            if kind == "baselines":
+                key = make_key(kind, det)
+            else:
+                iso = d.get("isotope")
+                if iso is None:
+                    continue
+                key = make_key(kind, det, iso)
+
+            data[key] = blob_to_columns(d.get("blob"), fmt)
+
+    dump_columnar(cpath, data)
+    return True
+
+
+def backfill_repository(root, overwrite=False):
+    """
+    write columnar sidecars for every .data.json file in the repository at root.
+
+    return the number of sidecars written
+    """
+    n = 0
+    for p in glob.iglob(
+        os.path.join(root, "**", ".data", "*.data.json"), recursive=True
+    ):
+        if convert_data_file(p, overwrite=overwrite):
+            n += 1
+    return n
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from pychron.paths import paths
+
+    parser = argparse.ArgumentParser(
+        description="Backfill columnar raw data sidecars for DVC repositories"
+    )
+    parser.add_argument("repositories", nargs="*", help="repository names. default=all")
+    parser.add_argument("--root", default="~/Pychron", help="pychron root directory")
+    parser.add_argument(
+        "--overwrite", action="store_true", help="rewrite existing sidecars"
+    )
+    args = parser.parse_args()
+
+    paths.build(os.path.expanduser(args.root))
+    repos = args.repositories or sorted(os.listdir(paths.repository_dataset_dir))
+    for r in repos:
+        rp = os.path.join(paths.repository_dataset_dir, r)
+        if os.path.isdir(rp):
+            print("{:<40s} {}".format(r, backfill_repository(rp, args.overwrite)))
+
+# ============= EOF =============================================
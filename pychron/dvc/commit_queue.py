@@ -0,0 +1,402 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Any, Int, Float, Str, Bool
+
+# ============= standard library imports ========================
+import os
+import time
+from threading import Thread, Event, RLock
+
+from git.exc import GitCommandError
+
+# ============= local library imports  ==========================
+from pychron.dvc import dvc_dump, dvc_load
+from pychron.git_archive.repo_manager import GitRepoManager
+from pychron.loggable import Loggable
+
+PUSH_FAILED_MESSAGE = (
+    "NON FATAL\n\n"
+    "DVC/Git upload of analysis not successful."
+    "Do you want to CANCEL the experiment?\n"
+)
+
+
+class CommitJob(object):
+    """
+    the files of one analysis to commit to a repository.
+
+    paths are committed with message. commits is a list of (message, paths) committed
+    after, one commit each, so every tag is the subject of its own commit
+    """
+
+    def __init__(
+        self,
+        repository,
+        paths,
+        message,
+        meta_message=None,
+        branch=None,
+        push=True,
+        timestamp=None,
+        commits=None,
+    ):
+        self.repository = repository
+        self.paths = list(paths)
+        self.message = message
+        self.meta_message = meta_message
+        self.branch = branch
+        self.push = push
+        self.timestamp = timestamp or time.time()
+        self.commits = [(m, list(ps)) for m, ps in commits or []]
+
+    def iter_commits(self):
+        yield self.message, self.paths
+        for m, ps in self.commits:
+            yield m, ps
+
+    def to_dict(self):
+        return {
+            k: getattr(self, k)
+            for k in (
+                "repository",
+                "paths",
+                "message",
+                "meta_message",
+                "branch",
+                "push",
+                "timestamp",
+                "commits",
+            )
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**d)
+
+
+class DVCCommitQueue(Loggable):
+    """
+    commit and push the files saved by the DVCPersister in a background thread.
+
+    jobs are committed when batch_size jobs are queued or the oldest job has waited
+    batch_period seconds. each job is committed as it would be without the queue, one
+    commit per tag, so the history of an analysis is unchanged. the meta repository is
+    committed once per batch and each repository is pushed once per batch. failed pushes
+    are retried with an increasing delay.
+
+    the queued jobs and the repositories with unpushed commits are written to a journal so
+    they are committed and pushed after a restart.
+
+    the git operations of the queue happen on the worker thread while holding the
+    repository lock shared with DVC (see get_repository_lock)
+    """
+
+    dvc = Any
+    journal_path = Str
+    batch_size = Int(1)
+    batch_period = Float(0)
+    retry_period = Float(30)
+    max_retry_period = Float(60 * 10)
+    # report a failed push after this many attempts
+    push_retries = Int(3)
+    exception_queue = Any
+    alive = Bool(False)
+
+    def __init__(self, *args, **kw):
+        super(DVCCommitQueue, self).__init__(*args, **kw)
+        self._lock = RLock()
+        self._wake = Event()
+        self._idle = Event()
+        self._idle.set()
+        self._thread = None
+        self._flush = False
+
+        self._jobs = []
+        # jobs being committed. kept in the journal until the commit is complete
+        self._committing = []
+        # repository path: [number of failed pushes, time of the next attempt]
+        self._unpushed = {}
+        self._repos = {}
+
+        self.ncommits = 0
+        self.npushes = 0
+        self.nfailed_pushes = 0
+
+        self._load_journal()
+
+    def start(self):
+        if self.alive:
+            return
+
+        self.alive = True
+        self._thread = Thread(target=self._run, name="DVCCommitQueue")
+        self._thread.daemon = True
+        self._thread.start()
+        if self._jobs or self._unpushed:
+            self.info(
+                "resuming {} jobs, {} unpushed repositories".format(
+                    len(self._jobs), len(self._unpushed)
+                )
+            )
+            self.flush(wait=False)
+
+    def stop(self, timeout=30):
+        if self.alive:
+            self.flush(timeout=timeout)
+            self.alive = False
+            self._wake.set()
+            self._thread.join(timeout)
+            self._thread = None
+
+    def put(self, job, exception_queue=None):
+        """
+        queue a job. the files in job.paths need to be written before the job is queued
+        """
+        with self._lock:
+            if exception_queue is not None:
+                self.exception_queue = exception_queue
+
+            self._jobs.append(job)
+            self._idle.clear()
+            self._dump_journal()
+
+        self.debug("queued {} njobs={}".format(job.message, len(self._jobs)))
+        self._wake.set()
+
+    def flush(self, wait=True, timeout=None):
+        """
+        commit the queued jobs and push now.
+
+        wait: block until the jobs are committed and the pushes attempted.
+        return True if the queue is idle
+        """
+        with self._lock:
+            if not (self._jobs or self._unpushed):
+                return True
+
+            self._flush = True
+            self._idle.clear()
+
+        self._wake.set()
+        if wait and self.alive:
+            return self._idle.wait(timeout)
+
+    @property
+    def njobs(self):
+        return len(self._jobs)
+
+    @property
+    def unpushed(self):
+        return list(self._unpushed)
+
+    # private
+    def _run(self):
+        while self.alive:
+            self._wake.wait(self._get_timeout())
+            self._wake.clear()
+            try:
+                self._process()
+            except BaseException as e:
+                self.debug_exception()
+                self.warning("commit queue failed. {}".format(e))
+
+    def _get_timeout(self):
+        timeouts = [1.0]
+        with self._lock:
+            if self._jobs and self.batch_period:
+                timeouts.append(
+                    self._jobs[0].timestamp + self.batch_period - time.time()
+                )
+            now = time.time()
+            timeouts.extend(t - now for _, t in self._unpushed.values())
+        return max(0.1, min(timeouts))
+
+    def _is_ready(self):
+        if self._flush or len(self._jobs) >= self.batch_size:
+            return True
+
+        return bool(
+            self._jobs
+            and self.batch_period
+            and time.time() - self._jobs[0].timestamp >= self.batch_period
+        )
+
+    def _process(self):
+        with self._lock:
+            force = self._flush
+            self._flush = False
+            jobs = []
+            if self._is_ready() or force:
+                jobs, self._jobs = self._jobs, []
+                self._committing = jobs
+
+        if jobs:
+            try:
+                self._commit_jobs(jobs)
+            except BaseException:
+                # requeue the jobs so they are retried
+                with self._lock:
+                    self._jobs = jobs + self._jobs
+                    self._committing = []
+                raise
+
+        self._push(force)
+
+        with self._lock:
+            if not self._jobs and (force or not self._unpushed):
+                self._idle.set()
+
+    def _commit_jobs(self, jobs):
+        # group by repository and branch keeping the queued order
+        groups = {}
+        for job in jobs:
+            groups.setdefault((job.repository, job.branch), []).append(job)
+
+        for (path, branch), gjobs in groups.items():
+            repo = self._get_repository(path)
+            with repo.lock:
+                if branch:
+                    self._checkout_branch(repo, branch)
+
+                for job in gjobs:
+                    self._commit_job(repo, job)
+
+        meta = [j.meta_message for j in jobs if j.meta_message]
+        if meta:
+            dvc = self.dvc
+            with dvc.meta_repo.lock:
+                dvc.meta_pull(accept_our=True)
+                dvc.meta_commit("\n".join(meta))
+            if any(j.push for j in jobs if j.meta_message):
+                self._add_unpushed(dvc.meta_repo.path)
+
+        with self._lock:
+            self._committing = []
+            self._dump_journal()
+
+    def _commit_job(self, repo, job):
+        for msg, ps in job.iter_commits():
+            for p in ps:
+                if os.path.isfile(p):
+                    repo.add(p, commit=False, verbose=False)
+                else:
+                    self.debug("not at valid file {}".format(p))
+
+            # nothing staged if the job was committed before a restart
+            if repo.has_staged() and repo.commit(msg):
+                self.ncommits += 1
+                if job.push:
+                    self._add_unpushed(job.repository)
+
+    def _push(self, force):
+        now = time.time()
+        with self._lock:
+            items = [
+                (p, n) for p, (n, t) in self._unpushed.items() if force or t <= now
+            ]
+
+        for path, n in items:
+            if self._push_repository(path):
+                self.npushes += 1
+                with self._lock:
+                    self._unpushed.pop(path, None)
+            else:
+                n += 1
+                self.nfailed_pushes += 1
+                delay = min(self.retry_period * 2 ** (n - 1), self.max_retry_period)
+                self.warning(
+                    "push {} failed. attempt={}, retry in {:0.0f}s".format(
+                        path, n, delay
+                    )
+                )
+                with self._lock:
+                    self._unpushed[path] = [n, time.time() + delay]
+
+                if n == self.push_retries and self.exception_queue:
+                    self.exception_queue.put(("NonFatal", PUSH_FAILED_MESSAGE))
+
+        if items:
+            with self._lock:
+                self._dump_journal()
+
+    def _push_repository(self, path):
+        dvc = self.dvc
+        try:
+            if path == dvc.meta_repo.path:
+                repo = dvc.meta_repo
+            else:
+                repo = self._get_repository(path)
+
+            with repo.lock:
+                if repo is dvc.meta_repo:
+                    dvc.meta_push()
+                else:
+                    dvc.push_repository(repo)
+
+                # GitRepoManager.push logs and swallows the push errors
+                return not repo.has_unpushed_commits(branch=repo.get_current_branch())
+        except GitCommandError as e:
+            self.debug("push {} failed. {}".format(path, e))
+
+    def _add_unpushed(self, path):
+        with self._lock:
+            if path not in self._unpushed:
+                self._unpushed[path] = [0, 0]
+
+    def _get_repository(self, path):
+        try:
+            repo = self._repos[path]
+        except KeyError:
+            repo = GitRepoManager()
+            repo.open_repo(path)
+            self._repos[path] = repo
+        return repo
+
+    def _checkout_branch(self, repo, branch):
+        repo.create_branch(branch, inform=False, push=True)
+        try:
+            repo.checkout_branch(branch, inform=False, load_history=False)
+        except GitCommandError:
+            repo.reset()
+            repo.checkout_branch(branch, inform=False, load_history=False)
+
+        repo.smart_pull(branch=branch, accept_our=True)
+
+    def _load_journal(self):
+        if not self.journal_path:
+            return
+
+        obj = dvc_load(self.journal_path)
+        if obj:
+            self._jobs = [CommitJob.from_dict(j) for j in obj.get("jobs", [])]
+            self._unpushed = {p: [0, 0] for p in obj.get("unpushed", [])}
+
+    def _dump_journal(self):
+        if not self.journal_path:
+            return
+
+        obj = {
+            "jobs": [j.to_dict() for j in self._committing + self._jobs],
+            "unpushed": list(self._unpushed),
+        }
+        tmp = "{}.tmp".format(self.journal_path)
+        dvc_dump(obj, tmp)
+        os.replace(tmp, self.journal_path)
+
+
+# ============= EOF =============================================
@@ -14,9 +14,11 @@
 # limitations under the License.
 # ===============================================================================
 
+import multiprocessing
 import os
 import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -24,7 +26,18 @@ from operator import itemgetter
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
 from git import Repo, GitCommandError, NoSuchPathError, Actor
-from traits.api import Instance, Str, Set, List, provides, Bool, Int
+from traits.api import (
+    Instance,
+    Str,
+    Set,
+    List,
+    provides,
+    Bool,
+    Int,
+    Enum,
+    Any,
+    Float,
+)
 from uncertainties import ufloat, std_dev, nominal_value
 
 from pychron import json
@@ -47,6 +60,8 @@ from pychron.dvc import (
     USE_GIT_TAGGING,
 )
 from pychron.dvc.cache import DVCCache
+from pychron.dvc.columnar import columnar_path
+from pychron.dvc.commit_queue import DVCCommitQueue
 from pychron.dvc.defaults import TRIGA, HOLDER_24_SPOKES, LASER221, LASER65
 from pychron.dvc.dvc_analysis import DVCAnalysis
 from pychron.dvc.dvc_database import DVCDatabase
@@ -56,7 +71,16 @@ from pychron.dvc.func import (
     push_repositories,
     make_interpreted_age_dict,
 )
+from pychron.dvc.parallel import (
+    AnalysisRecordSpec,
+    LockedProxy,
+    PARALLEL_MODES,
+    PROCESS,
+    make_batches,
+    load_analysis_documents,
+)
 from pychron.dvc.meta_repo import MetaRepo, get_frozen_flux, get_frozen_productions
+from pychron.dvc.offline_index import index_factory, OfflineIndexUpdater
 from pychron.dvc.tasks.dvc_preferences import DVCConnectionItem
 from pychron.dvc.util import Tag, DVCInterpretedAge
 from pychron.envisage.browser.record_views import InterpretedAgeRecordView
@@ -68,12 +92,14 @@ from pychron.git_archive.repo_manager import (
     GitRepoManager,
     format_date,
     get_repository_branch,
+    get_repository_lock,
 )
 from pychron.git_archive.views import StatusView
 from pychron.globals import globalv
 from pychron.loggable import Loggable
 from pychron.paths import paths, r_mkdir
 from pychron.processing.interpreted_age import InterpretedAge
+from pychron.processing.isotope import batch_fit_isotopes
 from pychron.pychron_constants import (
     RATIO_KEYS,
     INTERFERENCE_KEYS,
@@ -116,6 +142,17 @@ class DVC(Loggable):
     use_cocktail_irradiation = Str
     use_cache = Bool
     max_cache_size = Int
+    max_cache_mbytes = Int
+    use_offline_index = Bool
+    offline_index = Any
+    _offline_index_updater = Any
+    use_commit_queue = Bool
+    commit_batch_size = Int(1)
+    commit_batch_period = Float
+    commit_queue = Any
+    make_analyses_workers = Int
+    make_analyses_mode = Enum(PARALLEL_MODES)
+    make_analyses_batch_size = Int(50)
     irradiation_prefix = Str
     irradiation_project_prefix = Str
 
@@ -149,6 +186,9 @@ class DVC(Loggable):
         # update meta repo.
         self.meta_pull()
 
+        if self.use_offline_index:
+            self.update_offline_index()
+
         if self.db.connect():
             return True
 
@@ -699,8 +739,9 @@ class DVC(Loggable):
         self.commit_manual_edits(repository_identifier, ps, msg)
 
     def commit_manual_edits(self, repository_identifier, ps, msg):
-        if self.repository_add_paths(repository_identifier, ps):
-            self.repository_commit(repository_identifier, msg)
+        with get_repository_lock(repository_path(repository_identifier)):
+            if self.repository_add_paths(repository_identifier, ps):
+                self.repository_commit(repository_identifier, msg)
 
     def status_view(self, repo):
         repo = self._get_repository(repo, as_current=False)
@@ -728,9 +769,18 @@ class DVC(Loggable):
         author = self.get_author(author)
         for expid, ais in groupby(sorted(items, key=key), key=key):
             ps = [p for _, p in ais]
-            if self.repository_add_paths(expid, ps):
-                self.repository_commit(expid, msg, author)
-                mod_repositories.append(expid)
+            # include the columnar sidecars of any rewritten .data files
+            ps.extend(
+                [
+                    cp
+                    for cp in (columnar_path(p) for p in ps if p.endswith(".data.json"))
+                    if os.path.isfile(cp)
+                ]
+            )
+            with get_repository_lock(repository_path(expid)):
+                if self.repository_add_paths(expid, ps):
+                    self.repository_commit(expid, msg, author)
+                    mod_repositories.append(expid)
 
         return mod_repositories
 
@@ -740,6 +790,10 @@ class DVC(Loggable):
         if not isinstance(modifiers, (list, tuple)):
             modifiers = (modifiers,)
 
+        if self._cache:
+            for ai in ans:
+                self._cache.remove(ai.uuid)
+
         mod_repositories = []
         for expid, ais in groupby_repo(ans):
             ps = [
@@ -747,14 +801,19 @@ class DVC(Loggable):
                 for x in ais
                 for modifier in modifiers
             ]
-            if self.repository_add_paths(expid, ps):
-                if self.repository_commit(expid, msg, author):
-                    mod_repositories.append(expid)
-                else:
-                    self.warning_dialog(
-                        "There is an issue with your repository. {}. Please fix it before "
-                        "trying to save any changes".format(expid)
-                    )
+            added, committed = False, False
+            with get_repository_lock(repository_path(expid)):
+                if self.repository_add_paths(expid, ps):
+                    added = True
+                    committed = self.repository_commit(expid, msg, author)
+
+            if committed:
+                mod_repositories.append(expid)
+            elif added:
+                self.warning_dialog(
+                    "There is an issue with your repository. {}. Please fix it before "
+                    "trying to save any changes".format(expid)
+                )
         return mod_repositories
 
     def update_tag(self, an, add=True, **kw):
@@ -773,7 +832,7 @@ class DVC(Loggable):
             self.info("Delete existing icfactors for {}".format(ai))
             ai.delete_icfactors(dets)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_age(ai)
 
@@ -790,7 +849,7 @@ class DVC(Loggable):
                 )
 
         if self._cache:
-            self._cache.remove(ai.uiid)
+            self._cache.remove(ai.uuid)
         self._update_current_age(ai)
 
     def save_blanks(self, ai, keys, refs):
@@ -798,7 +857,7 @@ class DVC(Loggable):
             self.info("Saving blanks for {}".format(ai))
             ai.dump_blanks(keys, refs, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current_blanks(ai, keys)
 
@@ -806,7 +865,7 @@ class DVC(Loggable):
         if keys:
             self.info("Saving equilibration for {}".format(ai))
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
             return ai.dump_equilibration(keys, reviewed=True)
@@ -814,9 +873,10 @@ class DVC(Loggable):
     def save_fits(self, ai, keys):
         if keys:
             self.info("Saving fits for {}".format(ai))
+            batch_fit_isotopes(ai.get_fit_measurements(keys))
             ai.dump_fits(keys, reviewed=True)
             if self._cache:
-                self._cache.remove(ai.uiid)
+                self._cache.remove(ai.uuid)
 
             self._update_current(ai, keys)
 
@@ -1102,6 +1162,8 @@ class DVC(Loggable):
         frozen_productions = {}
         sample_prep = {}
         meta_repo = self.meta_repo
+        # read HEAD once so the flux histories are looked up in the meta repo index
+        meta_head = meta_repo.get_index_head()
         use_cocktail_irradiation = self.use_cocktail_irradiation
         if not quick:
             for exp in exps:
@@ -1144,7 +1206,9 @@ class DVC(Loggable):
 
                     key = "{}{}".format(irrad, level)
                     if key not in flux_histories:
-                        c = meta_repo.get_flux_history(irrad, level, max_count=1)
+                        c = meta_repo.get_flux_history(
+                            irrad, level, max_count=1, head=meta_head
+                        )
                         v = None
                         if c:
                             c = c[0]
@@ -1162,7 +1226,7 @@ class DVC(Loggable):
 
             sens = meta_repo.get_sensitivities()
 
-        def func(*args):
+        def func(*args, **kw):
             try:
                 return self._make_record(
                     branches=branches,
@@ -1177,7 +1241,8 @@ class DVC(Loggable):
                     sample_prep=sample_prep,
                     quick=quick,
                     reload=reload,
-                    *args
+                    *args,
+                    **kw
                 )
             except BaseException:
                 record = args[0]
@@ -1188,10 +1253,16 @@ class DVC(Loggable):
                 )
                 self.debug_exception()
 
-        if use_progress:
-            ret = progress_loader(records, func, threshold=1, step=25)
+        if (
+            self.make_analyses_workers > 1
+            and len(records) > self.make_analyses_batch_size
+        ):
+            ret = self._make_records_parallel(records, func, use_progress)
         else:
-            ret = [func(r, None, 0, 0) for r in records]
+            if use_progress:
+                ret = progress_loader(records, func, threshold=1, step=25)
+            else:
+                ret = [func(r, None, 0, 0) for r in records]
 
         et = time.time() - st
 
@@ -1213,6 +1284,7 @@ class DVC(Loggable):
 
         if self.use_cache:
             cache.clean()
+            self.debug("analysis cache {}".format(cache.report()))
             ret = cached_records + ret
 
         return ret
@@ -1263,7 +1335,8 @@ class DVC(Loggable):
 
     def repository_add_paths(self, repository_identifier, paths):
         repo = self._get_repository(repository_identifier)
-        return repo.add_paths(paths)
+        with repo.lock:
+            return repo.add_paths(paths)
 
     def get_author(self, author=None):
         if not self.use_default_commit_author:
@@ -1290,7 +1363,10 @@ class DVC(Loggable):
         self.debug("Repository commit: {} msg: {}".format(repository, msg))
         repo = self._get_repository(repository)
         author = self.get_author(author)
-        return repo.commit(msg, author=author)
+        with repo.lock:
+            ret = repo.commit(msg, author=author)
+        self._update_offline_index(repository)
+        return ret
 
     def remote_repositories(self):
         rs = []
@@ -1359,17 +1435,21 @@ class DVC(Loggable):
                     return True
 
             repo = self._get_repository(name)
-            repo.pull(use_progress=use_progress, use_auto_pull=self.use_auto_pull)
+            head = self._get_cache_head(repo)
+            with repo.lock:
+                repo.pull(use_progress=use_progress, use_auto_pull=self.use_auto_pull)
 
-            # merge any new commits on the data_collection branch to this branch
-            try:
-                repo.merge("origin/data_collection", inform=False)
-            except BaseException:
-                self.debug(
-                    "merge with origin/data_collection failed. This is not an issue if you are only using local "
-                    "repos"
-                )
+                # merge any new commits on the data_collection branch to this branch
+                try:
+                    repo.merge("origin/data_collection", inform=False)
+                except BaseException:
+                    self.debug(
+                        "merge with origin/data_collection failed. This is not an issue if you are only using local "
+                        "repos"
+                    )
 
+            self._invalidate_repository_cache(name, repo, head)
+            self._update_offline_index(name)
             return True
         else:
             self.debug("getting repository from remote")
@@ -1422,7 +1502,9 @@ class DVC(Loggable):
         self.information_dialog(msg)
 
     def pull_repository(self, repo):
+        name = repo
         repo = self._get_repository(repo)
+        head = self._get_cache_head(repo)
         self.debug("pull repository {}".format(repo))
         for gi in self.application.get_services(IGitHost):
             self.debug(
@@ -1430,7 +1512,10 @@ class DVC(Loggable):
                     gi.default_remote_name, gi.remote_url
                 )
             )
-            repo.smart_pull(remote=gi.default_remote_name)
+            with repo.lock:
+                repo.smart_pull(remote=gi.default_remote_name)
+
+        self._invalidate_repository_cache(name, repo, head)
 
     def push_repository(self, repo, **kw):
         repo = self._get_repository(repo)
@@ -1441,7 +1526,8 @@ class DVC(Loggable):
                     gi.default_remote_name, gi.remote_url
                 )
             )
-            repo.push(remote=gi.default_remote_name, **kw)
+            with repo.lock:
+                repo.push(remote=gi.default_remote_name, **kw)
 
     def push_repositories(self, changes):
         if self.use_auto_push or self.confirmation_dialog(
@@ -1452,7 +1538,8 @@ class DVC(Loggable):
 
     def delete_local_commits(self, repo, **kw):
         r = self._get_repository(repo)
-        r.delete_local_commits(**kw)
+        with r.lock:
+            r.delete_local_commits(**kw)
 
     # IDatastore
     def get_greatest_aliquot(self, identifier):
@@ -1492,23 +1579,27 @@ class DVC(Loggable):
         self.meta_commit("updated chronology for {}".format(name))
 
     def meta_pull(self, **kw):
-        return self.meta_repo.smart_pull(**kw)
+        with self.meta_repo.lock:
+            return self.meta_repo.smart_pull(**kw)
 
     def meta_push(self):
-        self.meta_repo.push()
+        with self.meta_repo.lock:
+            self.meta_repo.push()
 
     def meta_add_all(self):
-        self.meta_repo.add_unstaged(paths.meta_root, add_all=True)
+        with self.meta_repo.lock:
+            self.meta_repo.add_unstaged(paths.meta_root, add_all=True)
 
     def meta_commit(self, msg):
-        changes = self.meta_repo.has_staged()
-        if changes:
-            self.debug("meta repo has changes: {}".format(changes))
-            self.meta_repo.report_local_changes()
-            self.meta_repo.commit(msg)
-            self.meta_repo.clear_cache = True
-        else:
-            self.debug("no changes to meta repo")
+        with self.meta_repo.lock:
+            changes = self.meta_repo.has_staged()
+            if changes:
+                self.debug("meta repo has changes: {}".format(changes))
+                self.meta_repo.report_local_changes()
+                self.meta_repo.commit(msg)
+                self.meta_repo.clear_cache = True
+            else:
+                self.debug("no changes to meta repo")
 
     def add_production(self, irrad, name, prod):
         self.meta_repo.add_production_to_irradiation(irrad, name, prod)
@@ -1897,7 +1988,60 @@ class DVC(Loggable):
         if self.use_cache:
             self._cache.clear()
 
+    def update_offline_index(self, repositories=None, use_db=False):
+        """
+        update the offline index from the local repositories. the local repositories are
+        updated in the background
+
+        use_db: add the database records of the repositories that are not cloned locally
+
+        return the number of database records added
+        """
+        index = self.offline_index
+        if index is None:
+            return 0
+
+        if repositories is None:
+            repositories = self.get_local_repositories()
+
+        n = 0
+        local = []
+        for name in repositories:
+            root = repository_path(name)
+            if os.path.isdir(os.path.join(root, ".git")):
+                local.append(name)
+            elif use_db:
+                n += index.add_records(self.db.get_repository_analyses(name))
+
+        self._offline_index_updater.add(local)
+        self.debug(
+            "offline index update queued for {} repositories. n={}".format(
+                len(local), n
+            )
+        )
+        return n
+
     # private
+    def _update_offline_index(self, name):
+        if self._offline_index_updater is not None:
+            self._offline_index_updater.add(name)
+
+    def _get_cache_head(self, repo):
+        if self._cache:
+            try:
+                return repo.get_head()
+            except BaseException:
+                pass
+
+    def _invalidate_repository_cache(self, name, repo, head):
+        """
+        remove the cached analyses of repository name if a pull changed its HEAD
+        """
+        if self._cache:
+            if head is None or self._get_cache_head(repo) != head:
+                self.debug("invalidate cached analyses for {}".format(name))
+                self._cache.remove_repository(name)
+
     def _update_current_blanks(
         self, ai, keys=None, dban=None, force=False, update_age=True, commit=True
     ):
@@ -2125,8 +2269,13 @@ class DVC(Loggable):
         calculate_f_only=False,
         reload=False,
         quick=False,
+        docs=None,
+        warn=True,
+        meta_repo=None,
+        use_cache=True,
     ):
-        meta_repo = self.meta_repo
+        if meta_repo is None:
+            meta_repo = self.meta_repo
         if prog:
             # this accounts for ~85% of the time!!!
             prog.change_message(
@@ -2160,27 +2309,35 @@ class DVC(Loggable):
             uuid = record.uuid
 
             try:
-                a = DVCAnalysis(uuid, rid, expid)
+                a = DVCAnalysis(uuid, rid, expid, docs=docs)
             except AnalysisNotAnvailableError:
                 self.debug("uuid={}, rid={}, expid={}".format(uuid, rid, expid))
-                self.warning_dialog(
+                msg = (
                     "Analysis {} not in local repository {}. "
                     "You may need to pull changes. If local repository is up to date you may "
                     "need to push changes from the data collection computer".format(
                         rid, expid
                     )
                 )
+                if warn:
+                    self.warning_dialog(msg)
+                else:
+                    self.warning(msg)
                 return
 
             a.group_id = record.group_id
             a.set_tag(record.tag)
 
+            if isinstance(record, AnalysisRecordSpec):
+                sample_id, sample_note = record.sample_id, record.sample_note
+            else:
+                dbsam = record.irradiation_position.sample
+                sample_id, sample_note = dbsam.id, dbsam.note or ""
+
             if sample_prep:
-                a.sample_prep_comment = sample_prep.get(
-                    record.irradiation_position.sample.id
-                )
+                a.sample_prep_comment = sample_prep.get(sample_id)
 
-            a.sample_note = record.irradiation_position.sample.note or ""
+            a.sample_note = sample_note
 
             if not quick:
                 a.load_name = record.load_name
@@ -2296,10 +2453,145 @@ class DVC(Loggable):
                 else:
                     a.calculate_age()
 
-        if self._cache:
+        if use_cache and self._cache:
             self._cache.update(record.uuid, a)
         return a
 
+    def _resolve_repository_identifiers(self, records):
+        """
+        return a dict of index: repository identifier for the records associated with
+        multiple repositories. the selected repositories are used to pick one. the records
+        that can not be resolved are reported in one dialog and skipped
+        """
+        resolved = {}
+        unresolved = []
+        for i, r in enumerate(records):
+            if isinstance(r, DVCAnalysis) or r.repository_identifier:
+                continue
+
+            exps = getattr(r, "repository_ids", None) or []
+            rr = [si for si in self.selected_repositories or [] if si in exps]
+            if len(rr) == 1:
+                resolved[i] = rr[0]
+            else:
+                unresolved.append("{} ({})".format(r.record_id, ",".join(exps)))
+
+        if unresolved:
+            self.warning_dialog(
+                "Analyses associated with multiple repositories. Select one of the "
+                "repositories and reload. Skipping {}".format(", ".join(unresolved))
+            )
+        return resolved
+
+    def _make_records_parallel(self, records, func, use_progress):
+        """
+        make analyses on a pool of workers.
+
+        records are converted to AnalysisRecordSpecs on this thread and batched by repository.
+
+        thread mode: workers make and reduce the analyses
+        process mode: workers read and parse the json documents. the analyses are made and
+        reduced on this thread from the parsed documents. DVCAnalysis and uncertainties objects
+        never cross the process boundary
+
+        return analyses in the same order as records
+        """
+        n = len(records)
+        results = [None] * n
+        specs = {}
+        # resolve the repositories here so the workers never open a dialog
+        expids = self._resolve_repository_identifiers(records)
+        for i, r in enumerate(records):
+            if isinstance(r, DVCAnalysis):
+                results[i] = func(r, None, i, n)
+            else:
+                spec = AnalysisRecordSpec.from_record(r)
+                if not spec.repository_identifier:
+                    spec.repository_identifier = expids.get(i)
+                    if not spec.repository_identifier:
+                        continue
+                specs[i] = spec
+
+        batches = make_batches(list(specs.items()), self.make_analyses_batch_size)
+        workers = self.make_analyses_workers
+        mode = self.make_analyses_mode
+        self.debug(
+            "make analyses parallel. mode={}, workers={}, batches={}".format(
+                mode, workers, len(batches)
+            )
+        )
+
+        if mode == PROCESS:
+            executor = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            root = paths.repository_dataset_dir
+
+            def submit(batch):
+                return executor.submit(load_analysis_documents, root, batch)
+
+            def finish(result):
+                return [
+                    (
+                        i,
+                        func(
+                            specs[i], None, i, n, docs=docs, warn=False, use_cache=False
+                        ),
+                    )
+                    for i, docs in result
+                ]
+
+        else:
+            executor = ThreadPoolExecutor(workers)
+            # the cache is updated on this thread once the workers are done
+            meta_repo = LockedProxy(self.meta_repo)
+
+            def work(batch):
+                return [
+                    (
+                        i,
+                        func(
+                            spec,
+                            None,
+                            i,
+                            n,
+                            warn=False,
+                            meta_repo=meta_repo,
+                            use_cache=False,
+                        ),
+                    )
+                    for i, spec in batch
+                ]
+
+            def submit(batch):
+                return executor.submit(work, batch)
+
+            def finish(result):
+                return result
+
+        try:
+            futures = [submit(b) for b in batches]
+
+            def collect(fut, prog, i, nb):
+                if prog:
+                    prog.change_message("Loading analyses {}/{}".format(i + 1, nb))
+                return finish(fut.result())
+
+            if use_progress:
+                items = progress_loader(futures, collect, threshold=1)
+            else:
+                items = [item for fut in futures for item in finish(fut.result())]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        cache = self._cache
+        for i, a in items:
+            results[i] = a
+            if cache and a is not None:
+                cache.update(records[i].uuid, a)
+
+        return [a for a in results if a is not None]
+
     def _get_repository(self, repository_identifier, as_current=True):
         if isinstance(repository_identifier, GitRepoManager):
             repo = repository_identifier
@@ -2335,6 +2627,18 @@ class DVC(Loggable):
         )
         bind_preference(self, "use_cache", "{}.use_cache".format(prefid))
         bind_preference(self, "max_cache_size", "{}.max_cache_size".format(prefid))
+        bind_preference(self, "max_cache_mbytes", "{}.max_cache_mbytes".format(prefid))
+        bind_preference(
+            self, "use_offline_index", "{}.use_offline_index".format(prefid)
+        )
+        bind_preference(
+            self, "make_analyses_workers", "{}.make_analyses_workers".format(prefid)
+        )
+        for attr in ("commit_batch_size", "commit_batch_period", "use_commit_queue"):
+            bind_preference(self, attr, "pychron.dvc.experiment.{}".format(attr))
+        bind_preference(
+            self, "make_analyses_mode", "{}.make_analyses_mode".format(prefid)
+        )
         bind_preference(
             self, "update_currents_enabled", "{}.update_currents_enabled".format(prefid)
         )
@@ -2368,9 +2672,49 @@ class DVC(Loggable):
         else:
             self.use_cache = False
 
+    def _use_offline_index_changed(self, new):
+        index = None
+        if new and paths.index_db:
+            index = index_factory(paths.index_db)
+
+        self.offline_index = index
+        self._offline_index_updater = OfflineIndexUpdater(index) if index else None
+        self.db.offline_index = index
+        self.db.use_offline_index = index is not None
+
+    def _use_commit_queue_changed(self, new):
+        queue = self.commit_queue
+        if queue is not None:
+            queue.stop()
+
+        queue = None
+        if new:
+            queue = DVCCommitQueue(
+                dvc=self,
+                journal_path=paths.commit_journal or "",
+                batch_size=max(1, self.commit_batch_size),
+                batch_period=self.commit_batch_period,
+            )
+            queue.start()
+        self.commit_queue = queue
+
+    def _commit_batch_size_changed(self, new):
+        if self.commit_queue:
+            self.commit_queue.batch_size = max(1, new)
+
+    def _commit_batch_period_changed(self, new):
+        if self.commit_queue:
+            self.commit_queue.batch_period = new
+
+    def _max_cache_mbytes_changed(self, new):
+        if self._cache:
+            self._cache.max_bytes = new * 1e6
+
     def _use_cache_changed(self):
         if self.use_cache:
-            self._cache = DVCCache(max_size=self.max_cache_size)
+            self._cache = DVCCache(
+                max_size=self.max_cache_size, max_bytes=self.max_cache_mbytes * 1e6
+            )
         else:
             self._cache = None
 
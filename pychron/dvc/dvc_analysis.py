@@ -36,6 +36,7 @@ from pychron.dvc import (
     ICFACTORS,
     PEAKCENTER,
     COSMOGENIC,
+    COLUMNAR_EXT,
 )
 from pychron.dvc import (
     dvc_dump,
@@ -47,6 +48,7 @@ from pychron.dvc import (
     repository_path,
     AnalysisNotAnvailableError,
 )
+from pychron.dvc.columnar import load_columnar, columnar_path, convert_data_file
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.runid import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
@@ -89,8 +91,12 @@ class DVCAnalysis(Analysis):
     production_obj = None
     chronology_obj = None
     use_repository_suffix = False
+    _docs = None
 
     def __init__(self, uuid, record_id, repository_identifier, *args, **kw):
+        # docs: optional dict of modifier: json document already loaded by the caller,
+        # e.g. by a worker process. see pychron.dvc.parallel
+        self._docs = kw.pop("docs", None)
         super(DVCAnalysis, self).__init__(*args, **kw)
         self.record_id = record_id
         path = analysis_path((uuid, record_id), repository_identifier)
@@ -105,9 +111,8 @@ class DVCAnalysis(Analysis):
         head, ext = os.path.splitext(bname)
 
         ep = os.path.join(root, "extraction", "{}.extr{}".format(head, ext))
-        if os.path.isfile(ep):
-            jd = dvc_load(ep)
-
+        jd = self._load_doc(ep, "extraction")
+        if jd is not None:
             self.load_extraction(jd)
 
         else:
@@ -117,8 +122,8 @@ class DVCAnalysis(Analysis):
                 )
             )
 
-        if os.path.isfile(path):
-            jd = dvc_load(path)
+        jd = self._load_doc(path)
+        if jd is not None:
             self.load_spectrometer_parameters(jd.get("spec_sha"))
             self.load_environmentals(jd.get("environmental"))
 
@@ -129,6 +134,7 @@ class DVCAnalysis(Analysis):
             )
 
         self.load_paths()
+        self._docs = None
 
     @property
     def irradiation_position_position(self):
@@ -236,8 +242,8 @@ class DVCAnalysis(Analysis):
         for modifier in modifiers:
             path = self._analysis_path(modifier=modifier)
             if path:
-                if os.path.isfile(path):
-                    jd = dvc_load(path)
+                jd = self._load_doc(path, modifier)
+                if jd is not None:
                     if jd:
                         func = getattr(self, "_load_{}".format(modifier))
                         try:
@@ -286,7 +292,14 @@ class DVCAnalysis(Analysis):
 
         path = self._analysis_path(modifier=".data")
 
-        jd = dvc_load(path)
+        # prefer the columnar sidecar. fall back to the base64 blobs in .data.json
+        jd = None
+        cpath = self._analysis_path(modifier=".data", extension=COLUMNAR_EXT)
+        if cpath:
+            jd = load_columnar(cpath)
+
+        if jd is None:
+            jd = dvc_load(path)
 
         signals = jd.get("signals", [])
         baselines = jd.get("baselines", [])
@@ -310,16 +323,12 @@ class DVCAnalysis(Analysis):
             if not iso:
                 continue
 
-            blob = sd.get("blob")
-            if blob:
-                iso.unpack_data(format_blob(blob), n_only)
+            self._unpack_raw(iso, sd, n_only)
 
             # det = sd['detector']
             bd = next((b for b in baselines if b.get("detector") == det), None)
             if bd:
-                blob = bd.get("blob")
-                if blob:
-                    iso.baseline.unpack_data(format_blob(blob), n_only)
+                self._unpack_raw(iso.baseline, bd, n_only)
 
         # loop thru keys to make sure none were missed this can happen when only loading baseline
         if keys:
@@ -328,9 +337,7 @@ class DVCAnalysis(Analysis):
                 if bd:
                     for iso in self.itervalues():
                         if iso.detector == k:
-                            blob = bd.get("blob")
-                            if blob:
-                                iso.baseline.unpack_data(format_blob(blob), n_only)
+                            self._unpack_raw(iso.baseline, bd, n_only)
 
         for sn in sniffs:
             isok = sn.get("isotope")
@@ -345,14 +352,9 @@ class DVCAnalysis(Analysis):
             if keys and key not in keys and isok not in keys:
                 continue
 
-            data = None
-            blob = sn.get("blob")
-            if blob:
-                data = format_blob(blob)
-
             for iso in self.itervalues():
                 if iso.detector == det:
-                    iso.sniff.unpack_data(data, n_only)
+                    self._unpack_raw(iso.sniff, sn, n_only)
 
         if not n_only and not keys:
             self.has_raw_data = True
@@ -454,6 +456,10 @@ class DVCAnalysis(Analysis):
         jd["sniffs"] = nsniffs
         dvc_dump(jd, path)
 
+        # keep the columnar sidecar in sync with the rewritten blobs
+        if os.path.isfile(columnar_path(path)):
+            convert_data_file(path, overwrite=True)
+
         return path
 
     def dump_fits(self, keys, reviewed=False):
@@ -461,6 +467,11 @@ class DVCAnalysis(Analysis):
         isoks, dks = list(map(tuple, partition(keys, lambda x: x in sisos)))
 
         def update(d, i):
+            # a batch fit measurement has no regressor. keep the saved exclusions
+            ue = i.user_excluded
+            if ue is None:
+                ue = d.get("user_excluded") or []
+
             d.update(
                 fit=i.fit,
                 error_type=i.error_type,
@@ -471,8 +482,8 @@ class DVCAnalysis(Analysis):
                 reviewed=reviewed,
                 include_baseline_error=i.include_baseline_error,
                 filter_outliers_dict=i.filter_outliers_dict,
-                user_excluded=i.user_excluded,
-                outlier_excluded=i.outlier_excluded,
+                user_excluded=ue,
+                outlier_excluded=i.outlier_excluded or [],
             )
 
         # save intercepts
@@ -605,6 +616,25 @@ class DVCAnalysis(Analysis):
         return self._analysis_path(modifier=modifier)
 
     # private
+    def _load_doc(self, path, modifier=None):
+        """
+        return the preloaded document for modifier if available otherwise load path.
+        return None if path does not exist
+        """
+        if self._docs is not None and modifier in self._docs:
+            return self._docs[modifier]
+
+        if os.path.isfile(path):
+            return dvc_load(path)
+
+    def _unpack_raw(self, obj, d, n_only):
+        if "data" in d:
+            obj.unpack_array(d["data"], n_only)
+        else:
+            blob = d.get("blob")
+            if blob:
+                obj.unpack_data(format_blob(blob), n_only)
+
     def _load_cosmogenic(self, jd):
         self.arar_constants.cosmo_from_dict(jd)
 
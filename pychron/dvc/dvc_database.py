@@ -23,7 +23,7 @@ from sqlalchemy.sql.functions import count
 from sqlalchemy.util import OrderedSet
 
 # ============= enthought library imports =======================
-from traits.api import HasTraits, Str, List, TraitError
+from traits.api import HasTraits, Str, List, TraitError, Any, Bool
 from traitsui.api import Item
 
 from pychron import version
@@ -167,7 +167,7 @@ def principal_investigator_filter(q, principal_investigators):
     return q
 
 
-def make_at_filter(analysis_types):
+def make_at_filter(analysis_types, table=AnalysisTbl):
     if isinstance(analysis_types, (tuple, list)):
         analysis_types = [at.lower() for at in analysis_types]
     else:
@@ -183,17 +183,17 @@ def make_at_filter(analysis_types):
 
     if "blank" in analysis_types:
         ret = or_(
-            AnalysisTbl.analysis_type.startswith("blank"),
-            AnalysisTbl.analysis_type.in_(analysis_types),
+            table.analysis_type.startswith("blank"),
+            table.analysis_type.in_(analysis_types),
         )
     else:
-        ret = AnalysisTbl.analysis_type.in_(analysis_types)
+        ret = table.analysis_type.in_(analysis_types)
 
     return ret
 
 
-def analysis_type_filter(q, analysis_types):
-    ret = make_at_filter(analysis_types)
+def analysis_type_filter(q, analysis_types, table=AnalysisTbl):
+    ret = make_at_filter(analysis_types, table)
     q = q.filter(ret)
     return q
 
@@ -211,7 +211,21 @@ def exclude_invalid_analyses(q):
     return q.filter(AnalysisChangeTbl.tag != "invalid")
 
 
-def extract_devices_query(analysis_types, extract_devices, q):
+def merge_index_records(records, dbrecords, order="asc", limit=None):
+    """
+    merge the offline index records with the database records of the repositories that are
+    not indexed. the index records take precedence
+    """
+    uuids = {r.uuid for r in records}
+    records = list(records) + [r for r in dbrecords if r.uuid not in uuids]
+    if order:
+        records.sort(key=lambda r: r.timestamp, reverse=order == "desc")
+    if limit:
+        records = records[:limit]
+    return records
+
+
+def extract_devices_query(analysis_types, extract_devices, q, table=AnalysisTbl):
     if extract_devices and (
         "air" not in analysis_types and "cocktail" not in analysis_types
     ):
@@ -229,7 +243,7 @@ def extract_devices_query(analysis_types, extract_devices, q):
                 if ei not in (EXTRACT_DEVICE, NO_EXTRACT_DEVICE, NULL_STR)
             ]
             if es:
-                q = in_func(q, AnalysisTbl.extract_device, es)
+                q = in_func(q, table.extract_device, es)
     return q
 
 
@@ -258,6 +272,10 @@ class DVCDatabase(DatabaseAdapter):
     level = Str
     levels = List
 
+    # local read only index of the analysis records. see pychron.dvc.offline_index
+    offline_index = Any
+    use_offline_index = Bool
+
     def __init__(self, clear=False, auto_add=False, *args, **kw):
         super(DVCDatabase, self).__init__(*args, **kw)
 
@@ -1568,7 +1586,45 @@ class DVCDatabase(DatabaseAdapter):
         order="asc",
         limit=None,
         verbose_query=True,
+        use_index=True,
     ):
+        index = self._get_offline_index() if use_index else None
+        if index is not None:
+            rs, n = index.get_labnumber_analyses(
+                lns,
+                low_post=low_post,
+                high_post=high_post,
+                omit_key=omit_key,
+                exclude_uuids=exclude_uuids,
+                include_invalid=include_invalid,
+                mass_spectrometers=mass_spectrometers,
+                repositories=repositories,
+                loads=loads,
+                order=order,
+                limit=limit,
+            )
+            missing = self._get_unindexed_repositories(index, repositories)
+            if not missing:
+                return rs, n
+
+            dbrs, _ = self.get_labnumber_analyses(
+                lns,
+                low_post=low_post,
+                high_post=high_post,
+                omit_key=omit_key,
+                exclude_uuids=exclude_uuids,
+                include_invalid=include_invalid,
+                mass_spectrometers=mass_spectrometers,
+                repositories=missing,
+                loads=loads,
+                order=order,
+                limit=limit,
+                verbose_query=verbose_query,
+                use_index=False,
+            )
+            rs = merge_index_records(rs, dbrs, order, limit)
+            return rs, len(rs)
+
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
             q = q.join(IrradiationPositionTbl)
@@ -1642,6 +1698,7 @@ class DVCDatabase(DatabaseAdapter):
         exclude_uuids=None,
         exclude_invalid=True,
         verbose=True,
+        use_index=True,
     ):
         if verbose:
             self.debug("------get analyses by date range parameters------")
@@ -1656,10 +1713,40 @@ class DVCDatabase(DatabaseAdapter):
             self.debug("exclude_uuids={}".format(exclude_uuids))
             self.debug("-------------------------------------------------")
 
+        index = self._get_offline_index() if use_index else None
+        if index is not None:
+            kw = dict(
+                labnumber=labnumber,
+                limit=limit,
+                analysis_types=analysis_types,
+                mass_spectrometers=mass_spectrometers,
+                extract_devices=extract_devices,
+                project=project,
+                loads=loads,
+                order=order,
+                exclude_uuids=exclude_uuids,
+                exclude_invalid=exclude_invalid,
+            )
+            rs = index.get_analyses_by_date_range(
+                lpost, hpost, repositories=repositories, exclude=exclude, **kw
+            )
+            missing = self._get_unindexed_repositories(index, repositories)
+            if not missing:
+                return rs
+
+            # exclude holds index ids. they do not apply to the database
+            dbrs = self.get_analyses_by_date_range(
+                lpost, hpost, repositories=missing, verbose=False, use_index=False, **kw
+            )
+            return merge_index_records(rs, dbrs, order, limit)
+
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
             if exclude_invalid:
                 q = q.join(AnalysisChangeTbl)
+            if repositories:
+                q = q.join(RepositoryAssociationTbl)
+                q = in_func(q, RepositoryAssociationTbl.repository, repositories)
             if labnumber:
                 q = q.join(IrradiationPositionTbl)
             if project:
@@ -2602,6 +2689,30 @@ class DVCDatabase(DatabaseAdapter):
             c.units = units
 
     # private
+    def _get_offline_index(self):
+        if self.use_offline_index:
+            return self.offline_index
+
+    def _get_unindexed_repositories(self, index, repositories):
+        """
+        return the repositories, or all the repositories in the database if repositories is
+        None, that are not in the offline index. their analyses are queried from the database
+        """
+        if not self.connected:
+            return []
+
+        if repositories is None:
+            repositories = self.get_repository_identifiers()
+
+        indexed = index.get_indexed_repositories()
+        missing = [r for r in repositories if r not in indexed]
+        if missing:
+            self.debug(
+                "querying database for repositories not in the offline index. "
+                "{}".format(",".join(missing))
+            )
+        return missing
+
     def _get_date_range(self, q, asc=None, desc=None, hours=0):
         if asc is None:
             asc = AnalysisTbl.timestamp.asc()
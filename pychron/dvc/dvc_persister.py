@@ -17,6 +17,7 @@
 import hashlib
 import os
 import shutil
+import time
 from datetime import datetime
 
 from apptools.preferences.preference_binding import bind_preference
@@ -40,7 +41,11 @@ from pychron.dvc import (
     BLANKS,
     BASELINES,
     ICFACTORS,
+    DATA,
+    COLUMNAR_EXT,
 )
+from pychron.dvc.columnar import dump_columnar, make_key
+from pychron.dvc.commit_queue import CommitJob
 from pychron.experiment.automated_run.persistence import BasePersister
 from pychron.experiment.automated_run.persistence_spec import PersistenceSpec
 from pychron.experiment.automated_run.spec import AutomatedRunSpec
@@ -91,6 +96,7 @@ class DVCPersister(BasePersister):
     use_data_collection_branch = Bool(False)
 
     save_log_enabled = Bool(False)
+    use_columnar_data = Bool(False)
     arar_mapping = None
 
     def __init__(self, bind=True, load_mapping=True, *args, **kw):
@@ -106,6 +112,10 @@ class DVCPersister(BasePersister):
                 "pychron.experiment.use_data_collection_branch",
             )
 
+            bind_preference(
+                self, "use_columnar_data", "pychron.dvc.experiment.use_columnar_data"
+            )
+
         if load_mapping:
             self._load_arar_mapping()
 
@@ -307,16 +317,20 @@ class DVCPersister(BasePersister):
         # will modify repository to NoRepo if repository_identifier does not exist
         self._check_repository_identifier()
 
-        self._save_analysis(timestamp)
+        timeline = self.timeline
+        with timeline.span("dvc_save_analysis"):
+            self._save_analysis(timestamp)
+
         dvc = self.dvc
-        with dvc.session_ctx():
-            try:
-                self._save_analysis_db(timestamp)
-            except DatabaseError as e:
-                self.debug_exception()
-                self.warning(e)
-                if exception_queue:
-                    exception_queue.put(("Fatal", "DatabaseError. see log"))
+        with timeline.span("dvc_save_analysis_db"):
+            with dvc.session_ctx():
+                try:
+                    self._save_analysis_db(timestamp)
+                except DatabaseError as e:
+                    self.debug_exception()
+                    self.warning(e)
+                    if exception_queue:
+                        exception_queue.put(("Fatal", "DatabaseError. see log"))
 
         # save monitor
         self._save_monitor()
@@ -326,8 +340,16 @@ class DVCPersister(BasePersister):
 
         # stage files
 
+        st = time.perf_counter()
         if self.stage_files:
-            if commit:
+            queue = dvc.commit_queue
+            if commit and queue is not None:
+                # commit and push in the background
+                queue.put(
+                    self._make_commit_job(ar, spec_path, commit_tag, push),
+                    exception_queue=exception_queue,
+                )
+            elif commit:
                 if self.use_data_collection_branch:
                     ar.create_branch("data_collection", inform=False, push=True)
                     try:
@@ -345,6 +367,8 @@ class DVCPersister(BasePersister):
                 paths = [
                     spec_path,
                 ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
+                if self.use_columnar_data:
+                    paths.append(self._make_path(modifier=DATA, extension=COLUMNAR_EXT))
 
                 for p in paths:
                     if os.path.isfile(p):
@@ -423,6 +447,7 @@ class DVCPersister(BasePersister):
                             )
                         )
 
+        timeline.add("dvc_commit", st, time.perf_counter() - st)
         self.info("================= post measurement save finished =================")
         if complete_event:
             self.debug("clear save flag")
@@ -435,12 +460,78 @@ class DVCPersister(BasePersister):
             npath = self._make_path("logs", ".log")
             shutil.copyfile(path, npath)
             ar = self.active_repository
-            ar.smart_pull(accept_our=True)
-            ar.add(npath, commit=False)
-            ar.commit("<COLLECTION> log")
-            self.dvc.push_repository(ar)
+            queue = self.dvc.commit_queue
+            if queue is not None:
+                queue.put(CommitJob(ar.path, [npath], "<COLLECTION> log"))
+                return
+
+            with ar.lock:
+                ar.smart_pull(accept_our=True)
+                ar.add(npath, commit=False)
+                ar.commit("<COLLECTION> log")
+                self.dvc.push_repository(ar)
+
+    def save_timeline_file(self, timeline, **meta):
+        if self.save_enabled:
+            self.debug("saving timeline file")
+
+            npath = self._make_path("timelines")
+            timeline.dump(npath, **meta)
+            ar = self.active_repository
+            queue = self.dvc.commit_queue
+            if queue is not None:
+                queue.put(CommitJob(ar.path, [npath], "<COLLECTION> timeline"))
+                return
+
+            with ar.lock:
+                ar.smart_pull(accept_our=True)
+                ar.add(npath, commit=False)
+                ar.commit("<COLLECTION> timeline")
+                self.dvc.push_repository(ar)
 
     # private
+    def _make_commit_job(self, ar, spec_path, commit_tag, push):
+        """
+        make a job that makes the same commits as the commits made without the
+        commit queue
+        """
+        paths = [
+            spec_path,
+        ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
+        if self.use_columnar_data:
+            paths.append(self._make_path(modifier=DATA, extension=COLUMNAR_EXT))
+
+        commits = []
+        ps = [self._make_path(INTERCEPTS), self._make_path(BASELINES)]
+        ps = [p for p in ps if os.path.isfile(p)]
+        if ps:
+            commits.append(("<ISOEVO> default collection fits", ps))
+
+        for pp, tag, msg in (
+            (
+                "blanks",
+                "BLANKS",
+                "preceding {}".format(self.per_spec.previous_blank_runid),
+            ),
+            ("icfactors", "ICFactor", "default"),
+        ):
+            p = self._make_path(pp)
+            if os.path.isfile(p):
+                commits.append(("<{}> {}".format(tag, msg), [p]))
+
+        branch = "data_collection" if self.use_data_collection_branch else None
+        return CommitJob(
+            ar.path,
+            paths,
+            "<{}> {}".format(commit_tag, self.per_spec.run_spec.runid),
+            meta_message="repo updated for analysis {}".format(
+                self.per_spec.run_spec.runid
+            ),
+            branch=branch,
+            push=push,
+            commits=commits,
+        )
+
     def _load_arar_mapping(self):
         """
         Isotope: IsotopeKey
@@ -638,6 +729,7 @@ class DVCPersister(BasePersister):
         signals = []
         baselines = []
         sniffs = []
+        columns = {}
         blanks = {}
         intercepts = {}
         cbaselines = {}
@@ -662,6 +754,12 @@ class DVCPersister(BasePersister):
                 d = {"isotope": iso.name, "detector": iso.detector, "blob": blob}
                 ss.append(d)
 
+            columns[make_key("signals", iso.detector, iso.name)] = (iso.xs, iso.ys)
+            columns[make_key("sniffs", iso.detector, iso.name)] = (
+                iso.sniff.xs,
+                iso.sniff.ys,
+            )
+
             detector = next(
                 (d for d in per_spec.active_detectors if d.name == iso.detector), None
             )
@@ -682,6 +780,10 @@ class DVCPersister(BasePersister):
             if iso.detector not in dets:
                 bblob = encode_blob(iso.baseline.pack(endianness, as_hex=False))
                 baselines.append({"detector": iso.detector, "blob": bblob})
+                columns[make_key("baselines", iso.detector)] = (
+                    iso.baseline.xs,
+                    iso.baseline.ys,
+                )
                 dets[iso.detector] = {
                     "deflection": per_spec.defl_dict.get(iso.detector),
                     "gain": per_spec.gains.get(iso.detector),
@@ -822,6 +924,10 @@ class DVCPersister(BasePersister):
         }
         dvc_dump(data, p)
 
+        if self.use_columnar_data:
+            p = self._make_path(modifier=DATA, extension=COLUMNAR_EXT)
+            dump_columnar(p, columns)
+
     def _save_macrochron(self, obj):
         pass
 
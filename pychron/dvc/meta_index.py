@@ -0,0 +1,110 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+from copy import deepcopy
+
+# ============= local library imports  ==========================
+
+
+def file_stamp(path):
+    """
+    cheap change detection. return (mtime_ns, size) or None if path does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    return st.st_mtime_ns, st.st_size
+
+
+class LevelPositions(list):
+    """
+    the positions of an irradiation level with an index keyed by position.
+    see MetaRepo.get_flux_from_positions
+    """
+
+    def __init__(self, positions):
+        super(LevelPositions, self).__init__(positions)
+        self.by_position = {}
+        for p in self:
+            # keep the first match like a linear scan would
+            self.by_position.setdefault(p.get("position"), p)
+
+    def copy(self):
+        return LevelPositions(deepcopy(list(self)))
+
+
+class MetaIndex(object):
+    """
+    parsed meta repo files keyed by e.g. (irradiation, level).
+
+    an entry is reused until the mtime or size of any of its source files changes. flux
+    histories are git log lookups and are reused until the meta repo HEAD changes
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._histories = {}
+        self._head = None
+
+    def get(self, key, paths, factory):
+        """
+        key: hashable
+        paths: source files of the entry
+        factory: callable that parses the source files
+        """
+        stamps = tuple(file_stamp(p) for p in paths)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] == stamps:
+            return entry[2]
+
+        v = factory()
+        self._entries[key] = (tuple(os.path.abspath(p) for p in paths), stamps, v)
+        return v
+
+    def get_history(self, head, key, factory):
+        if head is None:
+            return factory()
+
+        if head != self._head:
+            self._head = head
+            self._histories = {}
+
+        try:
+            return self._histories[key]
+        except KeyError:
+            v = self._histories[key] = factory()
+            return v
+
+    def invalidate(self, path):
+        """
+        drop the entries that depend on path
+        """
+        path = os.path.abspath(path)
+        for k, (ps, _, _) in list(self._entries.items()):
+            if path in ps:
+                self._entries.pop(k)
+
+    def clear(self):
+        self._entries = {}
+        self._histories = {}
+        self._head = None
+
+
+# ============= EOF =============================================
@@ -15,9 +15,10 @@
 # ===============================================================================
 import os
 import shutil
+from copy import deepcopy
 from datetime import datetime
 
-from traits.api import Bool
+from traits.api import Bool, Instance
 from uncertainties import ufloat
 
 from pychron.core.helpers.datetime_tools import ISO_FORMAT_STR
@@ -27,6 +28,7 @@ from pychron.core.helpers.filetools import (
     list_directory,
 )
 from pychron.dvc import dvc_dump, dvc_load, repository_path, list_frozen_productions
+from pychron.dvc.meta_index import MetaIndex, LevelPositions
 from pychron.dvc.meta_object import (
     IrradiationGeometry,
     Chronology,
@@ -112,6 +114,7 @@ def get_frozen_flux(repo, irradiation):
 
 class MetaRepo(GitRepoManager):
     clear_cache = Bool
+    index = Instance(MetaIndex, ())
 
     def get_correlation_ellipses(self):
         p = os.path.join(paths.meta_root, "correlation_ellipses.json")
@@ -119,7 +122,7 @@ class MetaRepo(GitRepoManager):
 
     def get_monitor_info(self, irrad, level):
         age, decay = NULL_STR, NULL_STR
-        positions = self._get_level_positions(irrad, level)
+        positions = self._get_indexed_flux_positions(irrad, level)
         # assume all positions have same monitor_age/decay constant. Not strictly true. Potential some ambiquity but
         # will not be resolved now 8/26/18.
         if positions:
@@ -134,6 +137,12 @@ class MetaRepo(GitRepoManager):
 
         return str(age), str(decay)
 
+    def add(self, p, *args, **kw):
+        # reparse files written through the meta repo even if the filesystem mtime resolution
+        # is too coarse to notice the change
+        self.index.invalidate(p)
+        return super(MetaRepo, self).add(p, *args, **kw)
+
     def add_unstaged(self, *args, **kw):
         super(MetaRepo, self).add_unstaged(self.path, **kw)
 
@@ -575,21 +584,40 @@ class MetaRepo(GitRepoManager):
 
         return dvc_load(p)
 
-    def get_flux_history(self, irradiation, level, **kw):
-        greps = ["fit flux for {}{}".format(irradiation, level)]
-        cs = self.get_commits_from_log(greps, **kw)
-        return cs
+    def get_flux_history(self, irradiation, level, head=None, **kw):
+        """
+        head: meta repo HEAD sha. the git log lookup is cached per HEAD
+        """
+
+        def factory():
+            greps = ["fit flux for {}{}".format(irradiation, level)]
+            return self.get_commits_from_log(greps, **kw)
+
+        if head is None:
+            head = self.get_index_head()
+
+        key = (irradiation, level, tuple(sorted(kw.items())))
+        return self.index.get_history(head, key, factory)
+
+    def get_index_head(self):
+        try:
+            return self.get_head()
+        except (ValueError, AttributeError):
+            pass
 
     def get_flux_positions(self, irradiation, level):
-        positions = self._get_level_positions(irradiation, level)
-        return positions
+        """
+        return a copy of the indexed LevelPositions
+        """
+        return self._get_indexed_flux_positions(irradiation, level).copy()
 
     def get_level_obj(self, irradiation, level):
         p = self.get_level_path(irradiation, level)
         return dvc_load(p), p
 
     def get_flux(self, irradiation, level, position):
-        positions = self.get_flux_positions(irradiation, level)
+        # get_flux_from_positions only reads the positions. no need to copy
+        positions = self._get_indexed_flux_positions(irradiation, level)
         return self.get_flux_from_positions(position, positions)
 
     def get_flux_from_positions(self, position, positions):
@@ -600,7 +628,11 @@ class MetaRepo(GitRepoManager):
             ufloat(28.201, 0),
         )
         if positions:
-            pos = next((p for p in positions if p["position"] == position), None)
+            by_position = getattr(positions, "by_position", None)
+            if by_position is not None:
+                pos = by_position.get(position)
+            else:
+                pos = next((p for p in positions if p["position"] == position), None)
             if pos:
                 j, je, pe = (
                     pos.get("j", 0),
@@ -685,24 +717,38 @@ class MetaRepo(GitRepoManager):
         return Gains(p)
 
     # @cached('clear_cache')
-    def get_production(self, irrad, level, allow_null=False, **kw):
+    def get_production(self, irrad, level, allow_null=False, force=False, **kw):
         path = os.path.join(paths.meta_root, irrad, "productions.json")
-        obj = dvc_load(path)
+        obj = self.index.get(("productions", irrad), (path,), lambda: dvc_load(path))
 
         pname = obj.get(level, "")
         p = os.path.join(
             paths.meta_root, irrad, "productions", add_extension(pname, ext=".json")
         )
 
-        ip = Production(p, allow_null=allow_null)
+        def factory():
+            return Production(p, allow_null=allow_null)
+
+        if force:
+            ip = factory()
+        else:
+            # callers modify the production. never hand out the indexed instance
+            ip = deepcopy(self.index.get(("production", p, allow_null), (p,), factory))
         # print 'new production id={}, name={}, irrad={}, level={}'.format(id(ip), pname, irrad, level)
         return pname, ip
 
     # @cached('clear_cache')
     def get_chronology(self, name, allow_null=False, **kw):
         chron = None
+        p = os.path.join(paths.meta_root, name, "chronology.txt")
         try:
-            chron = irradiation_chronology(name, allow_null=allow_null)
+            chron = self.index.get(
+                ("chronology", name, allow_null),
+                (p,),
+                lambda: irradiation_chronology(name, allow_null=allow_null),
+            )
+            # use_irradiation_endtime is set per call. never hand out the indexed instance
+            chron = deepcopy(chron)
             if self.application:
                 chron.use_irradiation_endtime = self.application.get_boolean_preference(
                     "pychron.arar.constants.use_irradiation_endtime", False
@@ -729,6 +775,17 @@ class MetaRepo(GitRepoManager):
         return os.path.join(paths.meta_root, "sensitivity.json")
 
     # private
+    def _get_indexed_flux_positions(self, irradiation, level):
+        """
+        return the LevelPositions shared by all callers until the level file changes. read only
+        """
+        p = self.get_level_path(irradiation, level)
+
+        def factory():
+            return LevelPositions(self._get_level_positions(irradiation, level))
+
+        return self.index.get(("level", irradiation, level), (p,), factory)
+
     def _get_level_positions(self, irrad, level):
         obj, p = self.get_level_obj(irrad, level)
         if isinstance(obj, list):
@@ -1,268 +1,660 @@
-# # ===============================================================================
-# # Copyright 2015 Jake Ross
-# #
-# # Licensed under the Apache License, Version 2.0 (the "License");
-# # you may not use this file except in compliance with the License.
-# # You may obtain a copy of the License at
-# #
-# # http://www.apache.org/licenses/LICENSE-2.0
-# #
-# # Unless required by applicable law or agreed to in writing, software
-# # distributed under the License is distributed on an "AS IS" BASIS,
-# # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# # See the License for the specific language governing permissions and
-# # limitations under the License.
-# # ===============================================================================
-#
-# # ============= enthought library imports =======================
-# import os
-#
-# from traits.api import provides
-#
-# # ============= standard library imports ========================
-# from sqlalchemy import Column, String, Integer, Float, distinct, DateTime
-# from sqlalchemy.ext.declarative import declarative_base, declared_attr
-# # ============= local library imports  ==========================
-# from pychron.database.core.database_adapter import DatabaseAdapter
-# from pychron.database.i_browser import IBrowser
-# from pychron.experiment.utilities.identifier import make_step
-#
-# Base = declarative_base()
-#
-#
-# class NoSchemaError(BaseException):
-#     pass
-#
-#
-# class DVCIndex(object):
-#     @declared_attr
-#     def __tablename__(self):
-#         return self.__name__
-#
-#     id = Column(Integer, primary_key=True)
-#     repo = Column(String(200))
-#
-#
-# class AnalysisIndex(DVCIndex, Base):
-#     identifier = Column(String(80))
-#     aliquot = Column(Integer)
-#     increment = Column(Integer)
-#     cleanup = Column(Float)
-#     duration = Column(Float)
-#     extract_value = Column(Float)
-#     uuid = Column(String(36))
-#     analysis_type = Column(String(40))
-#     position = Column(String(120))
-#
-#     measurement_script = Column(String(80))
-#     extraction_script = Column(String(80))
-#
-#     mass_spectrometer = Column(String(80))
-#     extract_device = Column(String(80))
-#
-#     sample = Column(String(80))
-#     project = Column(String(80))
-#     material = Column(String(80))
-#
-#     irradiation = Column(String(80))
-#     irradiation_level = Column(String(80))
-#     irradiation_position = Column(String(80))
-#
-#     tag = Column(String(80))
-#     analysis_timestamp = Column(DateTime)
-#
-#     measurement = None
-#     extraction = None
-#
-#     @property
-#     def labnumber(self):
-#         return LabnumberRecord(self)
-#
-#     @property
-#     def step(self):
-#         return make_step(self.increment)
-#
-#
-# class MassSpecRecord(object):
-#     __slots__ = ['name']
-#
-#     def __init__(self, name):
-#         self.name = name
-#
-#
-# class ProjectRecord(object):
-#     __slots__ = ['name']
-#
-#     def __init__(self, name):
-#         self.name = name
-#
-#
-# class SampleObject(object):
-#     def __init__(self, sample, project, material):
-#         self.material = material
-#         self.project = project
-#         self.name = sample
-#
-#
-# class IrradiationPosObject(object):
-#     def __init__(self, pos, level):
-#         self.position = pos
-#         self.level = level
-#
-#
-# class LevelObject(object):
-#     def __init__(self, name, irrad):
-#         self.name = name
-#         self.irradiation = irrad
-#
-#
-# class IrradiationObject(object):
-#     def __init__(self, name):
-#         self.name = name
-#
-#
-# class LabnumberRecord(object):
-#     def __init__(self, r):
-#         self.name = r.identifier
-#         self.labnumber = r.identifier
-#         self.identifier = r.identifier
-#         self.sample = SampleObject(r.sample, r.project, r.material)
-#
-#         irrad = IrradiationObject(r.irradiation)
-#         level = LevelObject(r.irradiation_level, irrad)
-#         self.irradiation_position = IrradiationPosObject(r.irradiation_position, level)
-#
-#
-# def index_factory(path, overwrite=False):
-#     """
-#     create a new sqlite db.
-#     if path not a file or overwrite create all tables
-#     :param path:
-#     :param overwrite:
-#     :return:
-#     """
-#
-#     if os.path.isfile(path):
-#         if overwrite:
-#             os.remove(path)
-#     else:
-#         overwrite = True
-#
-#     db = IndexAdapter(path=path)
-#     db.connect()
-#     if overwrite:
-#         db.create_all(Base.metadata)
-#     return db
-#
-#
-# @provides(IBrowser)
-# class IndexAdapter(DatabaseAdapter):
-#     schema = AnalysisIndex
-#     kind = 'sqlite'
-#
-#     # irradiations = Property
-#     # levels = Property(depends_on='irradiation')
-#     # irradiation = Str
-#     # level = ''
-#
-#     # @cached_property
-#     def get_irradiations(self):
-#         with self.session_ctx() as sess:
-#             q = sess.query(distinct(AnalysisIndex.irradiation))
-#             q = q.order_by(AnalysisIndex.irradiation.asc())
-#             irs = [v[0] for v in self._query_all(q)]
-#             return irs
-#
-#     # @cached_property
-#     def get_levels(self):
-#         with self.session_ctx() as sess:
-#             q = sess.query(distinct(AnalysisIndex.irradiation_level))
-#             q = q.filter(AnalysisIndex.irradiation == self.irradiation)
-#             return [v[0] for v in self._query_all(q)]
-#
-#     # browswer protocol
-#     def get_analysis_groups(self, *args, **kw):
-#         return []
-#
-#     def get_project_labnumbers(self, project_names, filter_non_run, low_post=None, high_post=None,
-#                                analysis_types=None, mass_spectrometers=None):
-#         with self.session_ctx() as sess:
-#             q = sess.query(AnalysisIndex)
-#             q = q.filter(AnalysisIndex.project.in_(project_names))
-#             q = q.group_by(AnalysisIndex.identifier)
-#             qs = self._query_all(q)
-#
-#             return [LabnumberRecord(qi) for qi in qs]
-#
-#     def get_labnumber_analyses(self, lns, low_post=None, high_post=None,
-#                                omit_key=None, exclude_uuids=None, mass_spectrometers=None, **kw):
-#         with self.session_ctx() as sess:
-#             q = sess.query(AnalysisIndex)
-#             q = q.filter(AnalysisIndex.identifier.in_(lns))
-#             return self._query_all(q), int(q.count())
-#
-#     def get_projects(self, **kw):
-#         with self.session_ctx() as sess:
-#             q = sess.query(distinct(AnalysisIndex.project))
-#             q = q.order_by(AnalysisIndex.project.asc())
-#
-#             qs = self._query_all(q)
-#             return [ProjectRecord(v[0]) for v in qs]
-#
-#     def get_mass_spectrometers(self):
-#         with self.session_ctx() as sess:
-#             q = sess.query(distinct(AnalysisIndex.mass_spectrometer))
-#             qs = self._query_all(q)
-#             return [MassSpecRecord(v[0]) for v in qs]
-#
-#     def get_analysis_types(self):
-#         return []
-#
-#     def get_extraction_devices(self):
-#         return []
-#
-#     def get_analysis_exists(self, uuid):
-#         with self.session_ctx() as sess:
-#             q = sess.query(AnalysisIndex.uuid)
-#             q = q.filter(AnalysisIndex.uuid == uuid)
-#
-#             return self._query_one(q) is not None
-#
-#     def add_analysis_to_index(self, repopath, ai):
-#         if self.get_analysis_exists(ai.uuid):
-#             self.info('Analysis already in index: {}'.format(ai.record_id))
-#             return
-#
-#         # add to sqlite index
-#         self.add(repo=repopath,
-#                  identifier=ai.identifier,
-#                  aliquot=ai.aliquot,
-#                  increment=ai.increment,
-#                  cleanup=ai.cleanup_duration,
-#                  duration=ai.extract_duration,
-#                  extract_value=ai.extract_value,
-#                  uuid=ai.uuid,
-#                  measurement_script=ai.measurement_script_name,
-#                  extraction_script=ai.extraction_script_name,
-#                  mass_spectrometer=ai.mass_spectrometer,
-#                  extract_device=ai.extract_device,
-#                  material=ai.material,
-#                  sample=ai.sample,
-#                  project=ai.project,
-#                  irradiation=ai.irradiation,
-#                  irradiation_level=ai.irradiation_level,
-#                  irradiation_position=ai.irradiation_position,
-#                  tag=ai.tag,
-#                  position=ai.position,
-#                  analysis_timestamp=ai.rundate,
-#                  analysis_type=ai.analysis_type)
-#
-#     def add(self, **kw):
-#         if self.schema is None:
-#             raise NoSchemaError()
-#
-#         with self.session_ctx():
-#             obj = self.schema(**kw)
-#             self._add_item(obj)
-#
-# # ============= EOF =============================================
+# ===============================================================================
+# Copyright 2015 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+from datetime import datetime
+from queue import Queue
+from threading import Lock, Thread
+
+from git import Repo
+from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+from sqlalchemy import Column, Integer, Float, DateTime, not_, or_, text
+from sqlalchemy.ext.declarative import declarative_base
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.datetime_tools import make_timef
+from pychron.core.utils import alphas
+from pychron.database.core.database_adapter import DatabaseAdapter
+from pychron.database.core.query import in_func
+from pychron.database.orms import stringcolumn
+from pychron.dvc import dvc_load, repository_path
+from pychron.dvc.dvc_database import analysis_type_filter, extract_devices_query
+from pychron.experiment.utilities.runid import make_runid
+from pychron.pychron_constants import DATE_FORMAT
+
+# A local sqlite index of the analysis records the browser and the find nodes query.
+#
+# The index mirrors the AnalysisTbl, IrradiationPositionTbl, SampleTbl and ProjectTbl columns in a
+# single denormalized table. It is filled from the analysis files of the local repositories and
+# from the database. Each repository remembers the git sha it was indexed at so an update only
+# reads the files changed since then.
+#
+# DVCDatabase uses the index as a read only source when DVC.use_offline_index is enabled
+
+Base = declarative_base()
+
+META_KEYS = (
+    "uuid",
+    "identifier",
+    "aliquot",
+    "increment",
+    "analysis_type",
+    "mass_spectrometer",
+    "comment",
+    "irradiation",
+    "irradiation_level",
+    "sample",
+    "material",
+    "grainsize",
+    "project",
+    "principal_investigator",
+)
+
+# bump when the AnalysisIndexTbl columns change. an index with a different version is rebuilt
+INDEX_VERSION = 2
+
+TIMESTAMP_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", DATE_FORMAT)
+
+
+class IndexStateTbl(Base):
+    __tablename__ = "IndexStateTbl"
+    repository_identifier = stringcolumn(140, primary_key=True)
+    sha = stringcolumn(40)
+    timestamp = Column(DateTime)
+
+
+class AnalysisIndexTbl(Base):
+    __tablename__ = "AnalysisIndexTbl"
+    id = Column(Integer, primary_key=True)
+    repository_identifier = stringcolumn(140, index=True)
+    # path of the analysis file relative to the repository. None if added from the database
+    path = stringcolumn(255)
+
+    uuid = stringcolumn(40, index=True)
+    identifier = stringcolumn(80, index=True)
+    aliquot = Column(Integer)
+    increment = Column(Integer)
+    analysis_type = stringcolumn(45)
+    timestamp = Column(DateTime, index=True)
+    mass_spectrometer = stringcolumn(45)
+    extract_device = stringcolumn(45)
+    extract_value = Column(Float)
+    measurementName = stringcolumn(45)
+    extractionName = stringcolumn(45)
+    comment = stringcolumn(200)
+    change_tag = stringcolumn(45)
+    load_name = stringcolumn(80)
+
+    # IrradiationPositionTbl
+    irradiation = stringcolumn(80)
+    irradiation_level = stringcolumn(80)
+    irradiation_position_position = Column(Integer)
+
+    # SampleTbl
+    sample = stringcolumn(80)
+    # only known for rows added from the database
+    sample_id = Column(Integer)
+    sample_note = stringcolumn(140)
+    material = stringcolumn(80)
+    grainsize = stringcolumn(80)
+
+    # ProjectTbl
+    project = stringcolumn(80)
+    principal_investigator = stringcolumn(140)
+
+    group_id = 0
+    frozen = False
+    delta_time = 0
+    review_status = None
+    is_plateau_step = None
+    load_holder = ""
+    position = ""
+
+    _temporary_tag = None
+    _repository_ids = None
+
+    @property
+    def step(self):
+        return alphas(self.increment)
+
+    @property
+    def meas_script_name(self):
+        return self.measurementName
+
+    @property
+    def extract_script_name(self):
+        return self.extractionName
+
+    @property
+    def timestampf(self):
+        return make_timef(self.timestamp)
+
+    @property
+    def analysis_timestamp(self):
+        return self.timestamp
+
+    @property
+    def rundate(self):
+        return self.timestamp
+
+    @property
+    def record_id(self):
+        return make_runid(self.identifier, self.aliquot, self.increment)
+
+    @property
+    def irradiation_info(self):
+        return "{}{} {}".format(
+            self.irradiation, self.irradiation_level, self.irradiation_position_position
+        )
+
+    @property
+    def irradiation_position(self):
+        sample = IndexedSample(self.sample_id, self.sample, self.sample_note or "")
+        return IndexedIrradiationPosition(
+            self.identifier, self.irradiation_position_position, sample
+        )
+
+    @property
+    def display_uuid(self):
+        return (self.uuid or "")[:8]
+
+    @property
+    def repository_ids(self):
+        return self._repository_ids or [self.repository_identifier]
+
+    @property
+    def tag(self):
+        return self._temporary_tag or self.change_tag
+
+    def set_tag(self, t):
+        self._temporary_tag = t
+
+    def get_load_name(self):
+        return self.load_name or ""
+
+    def get_load_holder(self):
+        return ""
+
+    def bind(self):
+        pass
+
+
+class IndexedSample(object):
+    def __init__(self, id, name, note):
+        self.id = id
+        self.name = name
+        self.note = note
+
+
+class IndexedIrradiationPosition(object):
+    """
+    stands in for the IrradiationPositionTbl of a database record so an index row can be
+    recalled like an AnalysisTbl
+    """
+
+    def __init__(self, identifier, position, sample):
+        self.identifier = identifier
+        self.position = position
+        self.sample = sample
+
+
+def parse_timestamp(ts):
+    if isinstance(ts, datetime):
+        return ts
+
+    if ts:
+        for fmt in TIMESTAMP_FORMATS:
+            try:
+                return datetime.strptime(ts, fmt)
+            except ValueError:
+                continue
+
+
+def _to_int(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return
+
+
+def meta_path(rel):
+    """
+    return the relative path of the analysis file that rel belongs to or None.
+
+    analysis files are <sub>/<name>.json. the tags and extraction files of an analysis are
+    <sub>/tags/<name>.tags.json and <sub>/extraction/<name>.extr.json
+    """
+    rel = rel.replace("\\", "/")
+    if not rel.endswith(".json"):
+        return
+
+    parts = rel.split("/")
+    name = parts[-1][:-5]
+    if len(parts) == 2:
+        if "." not in name:
+            return rel
+    elif len(parts) == 3 and parts[1] in ("tags", "extraction"):
+        return "{}/{}.json".format(parts[0], name.split(".")[0])
+
+
+def _modifier_path(root, rel, modifier):
+    sub, name = rel.split("/")
+    return os.path.join(
+        root, sub, modifier, "{}.{}.json".format(name[:-5], modifier[:4])
+    )
+
+
+def analysis_row(name, root, rel):
+    """
+    read the analysis file rel of repository name into a row of AnalysisIndexTbl.
+    return None if rel is not an analysis file
+    """
+    jd = dvc_load(os.path.join(root, rel))
+    if not isinstance(jd, dict) or not jd.get("uuid"):
+        return
+
+    row = {k: jd.get(k) for k in META_KEYS}
+    at = row["analysis_type"]
+    if not at or at.lower() == "sample":
+        row["analysis_type"] = "unknown"
+
+    row["repository_identifier"] = name
+    row["path"] = rel
+    row["timestamp"] = parse_timestamp(jd.get("timestamp"))
+    row["measurementName"] = jd.get("measurement")
+    row["extractionName"] = jd.get("extraction")
+    row["irradiation_position_position"] = _to_int(jd.get("irradiation_position"))
+
+    ext = dvc_load(_modifier_path(root, rel, "extraction"))
+    row["extract_device"] = ext.get("extract_device")
+    row["extract_value"] = ext.get("extract_value")
+    row["load_name"] = ext.get("load_name")
+
+    tag = dvc_load(_modifier_path(root, rel, "tags"))
+    row["change_tag"] = tag.get("name") or "ok"
+    return row
+
+
+def record_row(record):
+    """
+    make a row of AnalysisIndexTbl from a database AnalysisTbl record
+    """
+    record.bind()
+    row = {
+        k: getattr(record, k, None)
+        for k in META_KEYS
+        + (
+            "timestamp",
+            "extract_device",
+            "extract_value",
+            "measurementName",
+            "extractionName",
+            "load_name",
+            "irradiation_position_position",
+        )
+    }
+    row["repository_identifier"] = record.repository_identifier
+    row["change_tag"] = record.tag
+    try:
+        dbsam = record.irradiation_position.sample
+        row["sample_id"] = dbsam.id
+        row["sample_note"] = dbsam.note
+    except AttributeError:
+        pass
+    return row
+
+
+def tag_filter(tag):
+    """
+    rows not tagged tag. rows without a tag are included
+    """
+    t = AnalysisIndexTbl.change_tag
+    return or_(t.is_(None), t != tag)
+
+
+def index_factory(path, overwrite=False):
+    """
+    create or open the sqlite index at path
+    """
+    if overwrite and os.path.isfile(path):
+        os.remove(path)
+
+    db = OfflineIndex(path=path)
+    db.connect(test=False)
+    with db.session_ctx() as sess:
+        version = sess.execute(text("PRAGMA user_version")).scalar()
+        if version != INDEX_VERSION:
+            # rebuilt from scratch. every repository is reindexed on its next update
+            Base.metadata.drop_all(sess.get_bind())
+
+        # readers do not block the writer
+        sess.execute(text("PRAGMA journal_mode=WAL"))
+        sess.execute(text("PRAGMA user_version={}".format(INDEX_VERSION)))
+        sess.commit()
+        db.create_all(Base.metadata)
+    return db
+
+
+class OfflineIndexUpdater(object):
+    """
+    updates the repositories of an OfflineIndex in a background thread so startup and
+    commits do not wait on the index. a repository queued while it is already pending is
+    only updated once
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._queue = Queue()
+        self._pending = set()
+        self._lock = Lock()
+        self._thread = None
+
+    def add(self, names):
+        if isinstance(names, str):
+            names = (names,)
+
+        with self._lock:
+            for name in names:
+                if name not in self._pending:
+                    self._pending.add(name)
+                    self._queue.put(name)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="OfflineIndexUpdater")
+                self._thread.daemon = True
+                self._thread.start()
+
+    def join(self):
+        self._queue.join()
+
+    def _run(self):
+        while 1:
+            name = self._queue.get()
+            with self._lock:
+                self._pending.discard(name)
+            try:
+                self.index.update_repository(name)
+            except BaseException as e:
+                self.index.warning("failed updating index for {}. {}".format(name, e))
+            finally:
+                self._queue.task_done()
+
+
+class OfflineIndex(DatabaseAdapter):
+    kind = "sqlite"
+    test_func = None
+
+    def get_indexed_sha(self, name):
+        with self.session_ctx() as sess:
+            s = sess.query(IndexStateTbl).get(name)
+            if s:
+                return s.sha
+
+    def get_indexed_repositories(self):
+        """
+        return the names of the repositories indexed from a repository or the database
+        """
+        with self.session_ctx() as sess:
+            names = {r for (r,) in sess.query(IndexStateTbl.repository_identifier)}
+            q = sess.query(AnalysisIndexTbl.repository_identifier).distinct()
+            names.update(r for (r,) in q)
+        return names
+
+    def update_repository(self, name, root=None):
+        """
+        index the analysis files of repository name that changed since the last update
+
+        return the number of analysis files indexed
+        """
+        if root is None:
+            root = repository_path(name)
+
+        try:
+            repo = Repo(root)
+            head = repo.head.commit.hexsha
+        except (InvalidGitRepositoryError, NoSuchPathError, ValueError):
+            self.debug("cannot index {}. not a git repository".format(name))
+            return 0
+
+        sha = self.get_indexed_sha(name)
+        if sha == head:
+            return 0
+
+        changed, deleted = None, []
+        if sha:
+            try:
+                changed, deleted = self._get_changes(repo, sha, head)
+            except GitCommandError:
+                self.debug("{} not in history of {}. reindexing".format(sha, name))
+
+        if changed is None:
+            changed = self._walk(root)
+            deleted = None
+
+        rows = [r for r in (analysis_row(name, root, rel) for rel in changed) if r]
+        with self.session_ctx() as sess:
+            q = sess.query(AnalysisIndexTbl)
+            q = q.filter(AnalysisIndexTbl.repository_identifier == name)
+            if deleted is None:
+                q.delete(synchronize_session=False)
+            else:
+                ps = list(changed) + deleted
+                for i in range(0, len(ps), 500):
+                    qq = q.filter(AnalysisIndexTbl.path.in_(ps[i : i + 500]))
+                    qq.delete(synchronize_session=False)
+
+            self._remove_uuids(sess, name, [r["uuid"] for r in rows])
+            sess.bulk_insert_mappings(AnalysisIndexTbl, rows)
+            sess.merge(
+                IndexStateTbl(
+                    repository_identifier=name, sha=head, timestamp=datetime.now()
+                )
+            )
+            sess.commit()
+
+        self.debug("indexed {} analyses for {} at {}".format(len(rows), name, head))
+        return len(rows)
+
+    def add_records(self, records):
+        """
+        add database records. records already indexed from a repository are not replaced
+
+        return the number of records added
+        """
+        rows = [record_row(r) for r in records]
+        rows = [r for r in rows if r["repository_identifier"] and r["uuid"]]
+        if not rows:
+            return 0
+
+        with self.session_ctx() as sess:
+            q = sess.query(
+                AnalysisIndexTbl.repository_identifier, AnalysisIndexTbl.uuid
+            )
+            q = q.filter(AnalysisIndexTbl.uuid.in_({r["uuid"] for r in rows}))
+            existing = set(q.all())
+            rows = [
+                r
+                for r in rows
+                if (r["repository_identifier"], r["uuid"]) not in existing
+            ]
+            sess.bulk_insert_mappings(AnalysisIndexTbl, rows)
+            sess.commit()
+
+        return len(rows)
+
+    def remove_repository(self, name):
+        with self.session_ctx() as sess:
+            for t in (AnalysisIndexTbl, IndexStateTbl):
+                q = sess.query(t).filter(t.repository_identifier == name)
+                q.delete(synchronize_session=False)
+            sess.commit()
+
+    # browser protocol
+    def get_labnumber_analyses(
+        self,
+        lns,
+        low_post=None,
+        high_post=None,
+        omit_key=None,
+        exclude_uuids=None,
+        include_invalid=False,
+        mass_spectrometers=None,
+        repositories=None,
+        loads=None,
+        order="asc",
+        limit=None,
+        verbose_query=False,
+    ):
+        with self.session_ctx() as sess:
+            q = sess.query(AnalysisIndexTbl)
+            q = in_func(q, AnalysisIndexTbl.mass_spectrometer, mass_spectrometers)
+            q = in_func(q, AnalysisIndexTbl.repository_identifier, repositories)
+            q = in_func(q, AnalysisIndexTbl.identifier, lns)
+            q = in_func(q, AnalysisIndexTbl.load_name, loads)
+
+            if low_post:
+                q = q.filter(AnalysisIndexTbl.timestamp >= low_post)
+            if high_post:
+                q = q.filter(AnalysisIndexTbl.timestamp <= high_post)
+            if exclude_uuids:
+                q = q.filter(not_(AnalysisIndexTbl.uuid.in_(exclude_uuids)))
+            if not include_invalid:
+                q = q.filter(tag_filter("invalid"))
+            if omit_key:
+                q = q.filter(tag_filter(omit_key))
+
+            if order:
+                q = q.order_by(getattr(AnalysisIndexTbl.timestamp, order)())
+
+            if limit:
+                q = q.limit(limit)
+
+            rs = self._query_all(q, verbose_query=verbose_query)
+
+        rs = merge_repositories(rs)
+        return rs, len(rs)
+
+    def get_analyses_by_date_range(
+        self,
+        lpost,
+        hpost,
+        labnumber=None,
+        limit=None,
+        analysis_types=None,
+        mass_spectrometers=None,
+        extract_devices=None,
+        project=None,
+        repositories=None,
+        loads=None,
+        order="asc",
+        exclude=None,
+        exclude_uuids=None,
+        exclude_invalid=True,
+        verbose=False,
+    ):
+        with self.session_ctx() as sess:
+            q = sess.query(AnalysisIndexTbl)
+            if labnumber:
+                q = q.filter(AnalysisIndexTbl.identifier == labnumber)
+            if mass_spectrometers:
+                q = in_func(q, AnalysisIndexTbl.mass_spectrometer, mass_spectrometers)
+            if analysis_types:
+                q = analysis_type_filter(q, analysis_types, table=AnalysisIndexTbl)
+
+            q = extract_devices_query(
+                analysis_types, extract_devices, q, table=AnalysisIndexTbl
+            )
+            q = in_func(q, AnalysisIndexTbl.repository_identifier, repositories)
+            q = in_func(q, AnalysisIndexTbl.load_name, loads)
+
+            if project:
+                q = q.filter(AnalysisIndexTbl.project == project)
+            if lpost:
+                q = q.filter(AnalysisIndexTbl.timestamp >= lpost)
+            if hpost:
+                q = q.filter(AnalysisIndexTbl.timestamp <= hpost)
+            if exclude_invalid:
+                q = q.filter(tag_filter("invalid"))
+            if exclude:
+                q = q.filter(not_(AnalysisIndexTbl.id.in_(exclude)))
+            if exclude_uuids:
+                q = q.filter(not_(AnalysisIndexTbl.uuid.in_(exclude_uuids)))
+
+            q = q.order_by(getattr(AnalysisIndexTbl.timestamp, order)())
+            if limit:
+                q = q.limit(limit)
+
+            rs = self._query_all(q, verbose_query=verbose)
+
+        return merge_repositories(rs)
+
+    # private
+    def _get_changes(self, repo, sha, head):
+        changed, deleted = set(), []
+        diff = repo.git.diff("--name-status", "--no-renames", sha, head)
+        for line in diff.splitlines():
+            status, rel = line.split("\t", 1)
+            mp = meta_path(rel)
+            if mp is None:
+                continue
+
+            if status == "D" and mp == rel:
+                deleted.append(rel)
+            else:
+                changed.add(mp)
+        return changed, deleted
+
+    def _walk(self, root):
+        for sub in os.listdir(root):
+            d = os.path.join(root, sub)
+            if sub.startswith(".") or not os.path.isdir(d):
+                continue
+
+            for f in os.listdir(d):
+                rel = "{}/{}".format(sub, f)
+                if meta_path(rel) == rel:
+                    yield rel
+
+    def _remove_uuids(self, sess, name, uuids):
+        # remove database rows now indexed from the repository
+        for i in range(0, len(uuids), 500):
+            q = sess.query(AnalysisIndexTbl)
+            q = q.filter(AnalysisIndexTbl.repository_identifier == name)
+            q = q.filter(AnalysisIndexTbl.uuid.in_(uuids[i : i + 500]))
+            q.delete(synchronize_session=False)
+
+
+def merge_repositories(records):
+    """
+    records of an analysis associated with multiple repositories are merged into one record
+    with repository_identifier=None like AnalysisTbl. records must be detached from the session
+    """
+    ret = []
+    seen = {}
+    for r in records:
+        p = seen.get(r.uuid)
+        if p is None:
+            seen[r.uuid] = r
+            ret.append(r)
+        else:
+            p._repository_ids = p.repository_ids + [r.repository_identifier]
+            p.repository_identifier = None
+    return ret
+
+
+# ============= EOF =============================================
@@ -0,0 +1,161 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from itertools import groupby
+from threading import RLock
+
+# ============= local library imports  ==========================
+from pychron.dvc import (
+    analysis_path,
+    dvc_load,
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    PEAKCENTER,
+    COSMOGENIC,
+)
+
+# keep this module light. it is imported by every worker process
+
+THREAD = "thread"
+PROCESS = "process"
+PARALLEL_MODES = (THREAD, PROCESS)
+
+DOC_MODIFIERS = (
+    None,
+    "extraction",
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    PEAKCENTER,
+    COSMOGENIC,
+)
+
+
+class AnalysisRecordSpec(object):
+    """
+    plain, picklable copy of the attributes of a database record that are required to make
+    a DVCAnalysis. Built on the calling thread so that no database objects are touched by the
+    workers.
+    """
+
+    __slots__ = (
+        "uuid",
+        "record_id",
+        "repository_identifier",
+        "group_id",
+        "tag",
+        "sample_id",
+        "sample_note",
+        "load_name",
+        "load_holder",
+    )
+
+    def __init__(self, **kw):
+        for k in self.__slots__:
+            setattr(self, k, kw.get(k))
+
+    @classmethod
+    def from_record(cls, record):
+        sample_id, sample_note = None, ""
+        try:
+            dbsam = record.irradiation_position.sample
+            sample_id = dbsam.id
+            sample_note = dbsam.note or ""
+        except AttributeError:
+            pass
+
+        return cls(
+            uuid=record.uuid,
+            record_id=record.record_id,
+            repository_identifier=record.repository_identifier,
+            group_id=getattr(record, "group_id", 0),
+            tag=record.tag,
+            sample_id=sample_id,
+            sample_note=sample_note,
+            load_name=getattr(record, "load_name", ""),
+            load_holder=getattr(record, "load_holder", ""),
+        )
+
+
+class LockedProxy(object):
+    """
+    call the methods of obj while holding lock. used to share the MetaRepo between the
+    thread mode workers
+    """
+
+    def __init__(self, obj, lock=None):
+        self._obj = obj
+        self._lock = lock or RLock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kw):
+            with self._lock:
+                return attr(*args, **kw)
+
+        return wrapper
+
+
+def make_batches(items, size):
+    """
+    items: list of (index, AnalysisRecordSpec)
+
+    group items by repository and split each group into batches of at most size items
+    """
+    size = max(1, size)
+
+    def key(x):
+        return x[1].repository_identifier
+
+    batches = []
+    for _, gs in groupby(sorted(items, key=key), key=key):
+        gs = list(gs)
+        batches.extend(gs[i : i + size] for i in range(0, len(gs), size))
+    return batches
+
+
+def load_analysis_documents(root, batch):
+    """
+    process pool worker.
+
+    read and parse the json documents for each analysis in batch.
+
+    root: repository root directory. paths is not built in a worker process
+    batch: list of (index, AnalysisRecordSpec)
+
+    return list of (index, docs) where docs is a dict of modifier: document. modifier=None is the
+    analysis' meta document. missing documents are None
+    """
+    ret = []
+    for idx, spec in batch:
+        docs = {}
+        name = (spec.uuid, spec.record_id)
+        for m in DOC_MODIFIERS:
+            p = analysis_path(name, spec.repository_identifier, modifier=m, root=root)
+            docs[m] = dvc_load(p) if p else None
+        ret.append((idx, docs))
+    return ret
+
+
+# ============= EOF =============================================
@@ -74,6 +74,9 @@ class DVCPlugin(BaseTaskPlugin):
         # dvc.meta_repo.cmd('push', '-u','origin','master')
 
         dvc = self.application.get_service(DVC)
+        if dvc.commit_queue:
+            dvc.commit_queue.stop()
+
         with dvc.session_ctx(use_parent_session=False):
             names = dvc.get_usernames()
             self.debug("dumping usernames {}".format(names))
@@ -16,7 +16,7 @@
 
 # ============= enthought library imports =======================
 from envisage.ui.tasks.preferences_pane import PreferencesPane
-from traits.api import Str, Bool, Int
+from traits.api import Str, Bool, Int, Enum, Float
 from traitsui.api import View, Item, HGroup, VGroup
 
 from pychron.core.helpers.strtools import to_bool
@@ -26,6 +26,7 @@ from pychron.database.tasks.connection_preferences import (
     ConnectionPreferencesPane,
     ConnectionFavoriteItem,
 )
+from pychron.dvc.parallel import PARALLEL_MODES
 from pychron.envisage.tasks.base_preferences_helper import BasePreferencesHelper
 
 
@@ -157,6 +158,10 @@ class DVCPreferences(BasePreferencesHelper):
     use_cocktail_irradiation = Bool
     use_cache = Bool
     max_cache_size = Int
+    max_cache_mbytes = Int
+    use_offline_index = Bool
+    make_analyses_workers = Int
+    make_analyses_mode = Enum(PARALLEL_MODES)
     update_currents_enabled = Bool
     use_auto_pull = Bool(True)
     use_auto_push = Bool(False)
@@ -209,9 +214,42 @@ class DVCPreferencesPane(PreferencesPane):
                     HGroup(
                         Item("use_cache", label="Enabled"),
                         Item("max_cache_size", label="Max Size"),
+                        Item(
+                            "max_cache_mbytes",
+                            label="Max MB",
+                            tooltip="Approximate memory limit of the cache. 0 for no limit",
+                        ),
                     ),
                     label="Cache",
                 ),
+                BorderVGroup(
+                    Item(
+                        "use_offline_index",
+                        label="Enabled",
+                        tooltip="Browse analyses using a local index of the repositories "
+                        "instead of querying the database",
+                    ),
+                    label="Offline Index",
+                ),
+                BorderVGroup(
+                    HGroup(
+                        Item(
+                            "make_analyses_workers",
+                            label="Workers",
+                            tooltip="Number of workers used to load analyses. "
+                            "0 or 1 loads analyses one at a time",
+                        ),
+                        Item(
+                            "make_analyses_mode",
+                            label="Mode",
+                            tooltip="thread: load and reduce analyses on a thread pool\n"
+                            "process: read and parse the analysis files on a process pool. "
+                            "The analyses are still made and reduced one at a time",
+                            enabled_when="make_analyses_workers>1",
+                        ),
+                    ),
+                    label="Parallel Loading",
+                ),
             )
         )
         return v
@@ -222,6 +260,10 @@ class DVCExperimentPreferences(BasePreferencesHelper):
     use_dvc_persistence = Bool
     dvc_save_timeout_minutes = Int
     use_dvc_overlap_save = Bool
+    use_columnar_data = Bool
+    use_commit_queue = Bool
+    commit_batch_size = Int
+    commit_batch_period = Float
 
 
 class DVCExperimentPreferencesPane(PreferencesPane):
@@ -238,8 +280,36 @@ class DVCExperimentPreferencesPane(PreferencesPane):
                     label="DVC Save timeout (minutes)",
                     enabled_when="use_dvc_overlap_save",
                 ),
+                Item(
+                    "use_columnar_data",
+                    label="Save Columnar Data",
+                    tooltip="Write a binary (.npz) copy of the raw signals next to the "
+                    ".data file. Raw data loads much faster when the copy is available",
+                ),
                 label="DVC",
-            )
+            ),
+            BorderVGroup(
+                Item(
+                    "use_commit_queue",
+                    label="Enabled",
+                    tooltip="Commit and push the analyses in the background. The next "
+                    "run does not wait for the git operations to complete",
+                ),
+                Item(
+                    "commit_batch_size",
+                    label="Batch Size",
+                    tooltip="Commit after this many analyses",
+                    enabled_when="use_commit_queue",
+                ),
+                Item(
+                    "commit_batch_period",
+                    label="Batch Period (s)",
+                    tooltip="Commit the queued analyses after this many seconds. "
+                    "0 to commit only when the batch is full",
+                    enabled_when="use_commit_queue",
+                ),
+                label="Commit Queue",
+            ),
         )
         return v
 
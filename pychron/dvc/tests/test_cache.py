@@ -0,0 +1,122 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import zeros
+
+from pychron.dvc.cache import DVCCache, estimate_size, ANALYSIS_BASE_SIZE
+
+
+class Measurement(object):
+    def __init__(self, n):
+        self.xs = zeros(n)
+        self.ys = zeros(n)
+
+
+class Analysis(object):
+    def __init__(self, repository_identifier="a", n=0):
+        self.repository_identifier = repository_identifier
+        self.isotopes = {"Ar40": Measurement(n)}
+
+
+def sizer(value):
+    return value, 0
+
+
+class DVCCacheTestCase(unittest.TestCase):
+    def test_lru(self):
+        c = DVCCache(max_size=3)
+        for i in range(3):
+            c.update(i, i)
+
+        # 0 is now the most recently used
+        self.assertEqual(c.get(0), 0)
+        c.update(3, 3)
+
+        self.assertIsNone(c.get(1))
+        self.assertEqual(c.get(0), 0)
+        self.assertEqual(c.size, 3)
+
+        r = c.report()
+        self.assertEqual(r["evictions"], 1)
+        self.assertEqual(r["hits"], 2)
+        self.assertEqual(r["misses"], 1)
+
+    def test_max_bytes(self):
+        c = DVCCache(max_size=0, max_bytes=100, sizer=sizer)
+        c.update("a", 60)
+        c.update("b", 30)
+        self.assertEqual(c.nbytes, 90)
+
+        c.update("c", 20)
+        self.assertIsNone(c.get("a"))
+        self.assertEqual(c.nbytes, 50)
+
+        # an entry larger than the budget is still kept
+        c.update("d", 200)
+        self.assertEqual(c.size, 1)
+        self.assertEqual(c.get("d"), 200)
+
+    def test_ttl(self):
+        c = DVCCache(ttl=60)
+        c.update("a", 1)
+        c.update("b", 2)
+        c._cache["a"].accessed = time.monotonic() - 120
+
+        c.clean()
+        self.assertIsNone(c.get("a"))
+        self.assertEqual(c.get("b"), 2)
+        self.assertEqual(c.report()["expirations"], 1)
+
+    def test_remove_repository(self):
+        c = DVCCache()
+        c.update(1, Analysis("a"))
+        c.update(2, Analysis("b"))
+        c.update(3, Analysis("a"))
+
+        c.remove_repository("a")
+        self.assertEqual(c.size, 1)
+        self.assertIsNotNone(c.get(2))
+        self.assertEqual(c.report()["invalidations"], 2)
+
+    def test_raw_size(self):
+        a = Analysis(n=0)
+        base, raw = estimate_size(a)
+        self.assertGreater(base, ANALYSIS_BASE_SIZE)
+        self.assertEqual(raw, 0)
+
+        c = DVCCache()
+        c.update(1, a)
+        self.assertEqual(c.report()["with_raw"], 0)
+
+        # raw data loaded after the analysis was cached
+        a.isotopes["Ar40"] = Measurement(100)
+        c.get(1)
+        r = c.report()
+        self.assertEqual(r["raw_bytes"], 1600)
+        self.assertEqual(r["with_raw"], 1)
+
+        c.remove(1)
+        self.assertEqual(c.nbytes, 0)
+
+    def test_threads(self):
+        c = DVCCache(max_size=50, max_bytes=40 * 10, sizer=sizer)
+
+        def work(i):
+            for j in range(200):
+                k = (i * 200 + j) % 120
+                c.update(k, 10)
+                c.get((k + 7) % 120)
+                if not j % 50:
+                    c.remove_repository(None)
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(work, range(8)))
+
+        # the accounting matches the entries
+        self.assertLessEqual(c.size, 40)
+        self.assertEqual(c.nbytes, 10 * c.size)
+
+
+if __name__ == "__main__":
+    unittest.main()
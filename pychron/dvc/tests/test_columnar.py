@@ -0,0 +1,103 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import os
+import shutil
+import tempfile
+import unittest
+
+from numpy import linspace
+
+from pychron.core.helpers.binpack import encode_blob, format_blob, pack
+from pychron.dvc import dvc_dump
+from pychron.dvc.columnar import (
+    columnar_path,
+    convert_data_file,
+    load_columnar,
+    backfill_repository,
+)
+from pychron.processing.isotope import Isotope
+
+
+def make_blob(xs, ys):
+    return encode_blob(pack(">ff", zip(xs, ys)))
+
+
+class ColumnarTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        d = os.path.join(self.root, "ab", ".data")
+        os.makedirs(d)
+        self.path = os.path.join(d, "abcdef.data.json")
+
+        self.xs = linspace(0.1, 100.3, 123)
+        self.ys = linspace(5.03, 1.07, 123) ** 2
+        blob = make_blob(self.xs, self.ys)
+
+        self.jd = {
+            "format": ">ff",
+            "signals": [{"isotope": "Ar40", "detector": "H1", "blob": blob}],
+            "sniffs": [{"isotope": "Ar40", "detector": "H1", "blob": blob}],
+            "baselines": [{"detector": "H1", "blob": blob}],
+        }
+        dvc_dump(self.jd, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_path(self):
+        self.assertEqual(columnar_path(self.path), self.path[:-5] + ".npz")
+
+    def test_missing(self):
+        self.assertIsNone(load_columnar(columnar_path(self.path)))
+
+    def test_roundtrip(self):
+        self.assertTrue(convert_data_file(self.path))
+        jd = load_columnar(columnar_path(self.path))
+
+        for kind in ("signals", "sniffs", "baselines"):
+            self.assertEqual(len(jd[kind]), 1)
+            d = jd[kind][0]
+            self.assertEqual(d["detector"], "H1")
+
+            a = Isotope("Ar40", "H1")
+            a.unpack_array(d["data"])
+            b = Isotope("Ar40", "H1")
+            b.unpack_data(format_blob(self.jd[kind][0]["blob"]))
+
+            self.assertEqual(list(a.xs), list(b.xs))
+            self.assertEqual(list(a.ys), list(b.ys))
+
+        self.assertEqual(jd["signals"][0]["isotope"], "Ar40")
+        self.assertNotIn("isotope", jd["baselines"][0])
+
+    def test_n_only(self):
+        convert_data_file(self.path)
+        jd = load_columnar(columnar_path(self.path))
+        a = Isotope("Ar40", "H1")
+        a.unpack_array(jd["signals"][0]["data"], n_only=True)
+        self.assertEqual(a.n, 123)
+        self.assertEqual(a.xs.shape[0], 0)
+
+    def test_backfill(self):
+        self.assertEqual(backfill_repository(self.root), 1)
+        # existing sidecars are skipped
+        self.assertEqual(backfill_repository(self.root), 0)
+        self.assertEqual(backfill_repository(self.root, overwrite=True), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# ============= EOF =============================================
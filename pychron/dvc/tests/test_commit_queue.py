@@ -0,0 +1,204 @@
+import os
+import shutil
+import tempfile
+import unittest
+from queue import Queue
+
+from git import Repo
+
+from pychron.dvc.commit_queue import CommitJob, DVCCommitQueue
+from pychron.git_archive.repo_manager import GitRepoManager, get_repository_lock
+
+
+def make_repo(root, name):
+    remote = os.path.join(root, "{}.git".format(name))
+    Repo.init(remote, bare=True)
+
+    path = os.path.join(root, name)
+    repo = Repo.clone_from(remote, path)
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", "test")
+        cw.set_value("user", "email", "test@example.com")
+
+    with open(os.path.join(path, "README.md"), "w") as wfile:
+        wfile.write(name)
+    repo.git.add(A=True)
+    repo.git.commit("-m", "init")
+    repo.git.push("origin", repo.active_branch.name)
+    return path, remote
+
+
+class DVC(object):
+    """
+    the parts of DVC used by the commit queue
+    """
+
+    def __init__(self, meta_path):
+        self.meta_repo = GitRepoManager()
+        self.meta_repo.open_repo(meta_path)
+
+    def meta_pull(self, **kw):
+        return self.meta_repo.smart_pull(**kw)
+
+    def meta_commit(self, msg):
+        if self.meta_repo.has_staged():
+            self.meta_repo.commit(msg)
+
+    def meta_push(self):
+        self.meta_repo.push()
+
+    def push_repository(self, repo):
+        repo.push()
+
+
+class DVCCommitQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path, self.remote = make_repo(self.root, "Repo1")
+        self.meta_path, _ = make_repo(self.root, "MetaData")
+        self.dvc = DVC(self.meta_path)
+        self.journal = os.path.join(self.root, "journal.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _queue(self, **kw):
+        return DVCCommitQueue(dvc=self.dvc, journal_path=self.journal, **kw)
+
+    def _write(self, name):
+        p = os.path.join(self.path, "{}.json".format(name))
+        with open(p, "w") as wfile:
+            wfile.write(name)
+        return p
+
+    def _job(self, name, meta=None, **kw):
+        p = self._write(name)
+        return CommitJob(self.path, [p], "<COLLECTION> {}".format(name), meta, **kw)
+
+    def _log(self, path):
+        return Repo(path).git.log("--format=%s").split("\n")
+
+    def _remote_log(self):
+        r = Repo(self.remote)
+        return r.git.log(r.head.reference.name, "--format=%s").split("\n")
+
+    def test_batch(self):
+        q = self._queue(batch_size=2)
+        q.put(self._job("a"))
+        q._process()
+        self.assertEqual(q.njobs, 1)
+        self.assertEqual(self._log(self.path), ["init"])
+
+        q.put(self._job("b", meta="repo updated for analysis b"))
+        q._process()
+        self.assertEqual(q.njobs, 0)
+        self.assertEqual(q.ncommits, 2)
+        self.assertEqual(q.npushes, 2)
+        log = ["<COLLECTION> b", "<COLLECTION> a", "init"]
+        self.assertEqual(self._log(self.path), log)
+        self.assertEqual(self._remote_log(), log)
+        self.assertEqual(q.unpushed, [])
+
+    def test_meta(self):
+        q = self._queue()
+        with open(os.path.join(self.meta_path, "flux.json"), "w") as wfile:
+            wfile.write("{}")
+        Repo(self.meta_path).git.add(A=True)
+
+        q.put(self._job("a", meta="repo updated for analysis a"))
+        q._process()
+        self.assertEqual(
+            self._log(self.meta_path), ["repo updated for analysis a", "init"]
+        )
+
+    def test_journal(self):
+        q = self._queue()
+        q.put(self._job("a"))
+        self.assertTrue(os.path.isfile(self.journal))
+
+        # restart
+        q = self._queue()
+        self.assertEqual(q.njobs, 1)
+        q._process()
+        self.assertEqual(self._log(self.path), ["<COLLECTION> a", "init"])
+
+        q = self._queue()
+        self.assertEqual(q.njobs, 0)
+
+    def test_push_retry(self):
+        eq = Queue()
+        q = self._queue(push_retries=1)
+        shutil.move(self.remote, self.remote + ".moved")
+
+        q.put(self._job("a"), exception_queue=eq)
+        q._process()
+        self.assertEqual(q.unpushed, [self.path])
+        self.assertEqual(q.nfailed_pushes, 1)
+        self.assertEqual(eq.get_nowait()[0], "NonFatal")
+
+        # the unpushed repository is kept in the journal
+        self.assertEqual(self._queue().unpushed, [self.path])
+
+        shutil.move(self.remote + ".moved", self.remote)
+        q._process()
+        self.assertEqual(q.unpushed, [self.path])
+
+        # retried once the delay has passed or when flushed
+        q._flush = True
+        q._process()
+        self.assertEqual(q.unpushed, [])
+        self.assertEqual(self._remote_log(), ["<COLLECTION> a", "init"])
+
+    def test_thread(self):
+        q = self._queue(batch_size=10)
+        q.start()
+        try:
+            q.put(self._job("a"))
+            q.put(self._job("b"))
+            self.assertTrue(q.flush(timeout=30))
+        finally:
+            q.stop()
+
+        self.assertEqual(
+            self._remote_log(), ["<COLLECTION> b", "<COLLECTION> a", "init"]
+        )
+
+    def test_commits(self):
+        commits = [
+            ("<ISOEVO> default collection fits", [self._write("a.intercepts")]),
+            ("<BLANKS> preceding b-01", [self._write("a.blanks")]),
+        ]
+        q = self._queue()
+        q.put(self._job("a", commits=commits))
+        self.assertEqual(self._queue().njobs, 1)
+        q._process()
+        self.assertEqual(
+            self._log(self.path),
+            [
+                "<BLANKS> preceding b-01",
+                "<ISOEVO> default collection fits",
+                "<COLLECTION> a",
+                "init",
+            ],
+        )
+
+        log = Repo(self.path).git.log("--format=%s", "--", "a.intercepts.json")
+        self.assertEqual(log, "<ISOEVO> default collection fits")
+
+    def test_repository_lock(self):
+        q = self._queue()
+        q.start()
+        try:
+            with get_repository_lock(self.path):
+                q.put(self._job("a"))
+                self.assertFalse(q.flush(timeout=1))
+                self.assertEqual(self._log(self.path), ["init"])
+            self.assertTrue(q.flush(timeout=30))
+        finally:
+            q.stop()
+
+        self.assertEqual(self._log(self.path), ["<COLLECTION> a", "init"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dvc import dvc_dump
+from pychron.dvc.meta_index import MetaIndex, LevelPositions
+from pychron.dvc.meta_repo import MetaRepo
+from pychron.paths import paths
+
+
+class MetaIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "a.json")
+        self._write(1)
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, v, mtime=None):
+        dvc_dump({"v": v}, self.path)
+        if mtime is not None:
+            os.utime(self.path, ns=(mtime, mtime))
+
+    def _factory(self):
+        self.calls += 1
+        with open(self.path) as rfile:
+            return rfile.read()
+
+    def test_reuse(self):
+        idx = MetaIndex()
+        a = idx.get("a", (self.path,), self._factory)
+        b = idx.get("a", (self.path,), self._factory)
+        self.assertIs(a, b)
+        self.assertEqual(self.calls, 1)
+
+    def test_stamp_invalidation(self):
+        idx = MetaIndex()
+        self._write(1, mtime=10**18)
+        idx.get("a", (self.path,), self._factory)
+
+        self._write(2, mtime=10**18 + 1)
+        v = idx.get("a", (self.path,), self._factory)
+        self.assertEqual(self.calls, 2)
+        self.assertIn("2", v)
+
+    def test_path_invalidation(self):
+        idx = MetaIndex()
+        idx.get("a", (self.path,), self._factory)
+        idx.get("b", (os.path.join(self.root, "b.json"),), lambda: None)
+
+        idx.invalidate(self.path)
+        idx.get("a", (self.path,), self._factory)
+        self.assertEqual(self.calls, 2)
+
+    def test_history(self):
+        idx = MetaIndex()
+        idx.get_history("h1", "k", self._factory)
+        idx.get_history("h1", "k", self._factory)
+        self.assertEqual(self.calls, 1)
+
+        idx.get_history("h2", "k", self._factory)
+        self.assertEqual(self.calls, 2)
+
+        # no head. never cached
+        idx.get_history(None, "k", self._factory)
+        idx.get_history(None, "k", self._factory)
+        self.assertEqual(self.calls, 4)
+
+    def test_level_positions(self):
+        ps = LevelPositions(
+            [
+                {"position": 1, "j": 1},
+                {"position": 2, "j": 2},
+                {"position": 1, "j": 3},
+            ]
+        )
+        self.assertEqual(len(ps), 3)
+        self.assertEqual(ps.by_position[1]["j"], 1)
+        self.assertEqual(ps.by_position[2]["j"], 2)
+
+
+class MetaRepoIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.meta_root = paths.meta_root
+        self.root = tempfile.mkdtemp()
+        paths.meta_root = self.root
+
+        os.mkdir(os.path.join(self.root, "NM-1"))
+        self.level_path = os.path.join(self.root, "NM-1", "A.json")
+        self._write_level(0.001)
+
+    def tearDown(self):
+        paths.meta_root = self.meta_root
+        shutil.rmtree(self.root)
+
+    def _write_level(self, j):
+        positions = [
+            {"position": i, "j": j * i, "j_err": 0, "decay_constants": {}}
+            for i in range(1, 5)
+        ]
+        dvc_dump({"z": 0, "positions": positions}, self.level_path)
+
+    def test_flux_positions(self):
+        repo = MetaRepo()
+        a = repo.get_flux_positions("NM-1", "A")
+        b = repo.get_flux_positions("NM-1", "A")
+        self.assertEqual(a, b)
+
+        flux = repo.get_flux_from_positions(3, a)
+        self.assertAlmostEqual(flux["j"].nominal_value, 0.003)
+
+        # each caller gets its own copy
+        self.assertIsNot(a, b)
+        a.by_position[3]["j"] = 1
+        flux = repo.get_flux_from_positions(3, repo.get_flux_positions("NM-1", "A"))
+        self.assertAlmostEqual(flux["j"].nominal_value, 0.003)
+
+    def test_chronology_copy(self):
+        with open(os.path.join(self.root, "NM-1", "chronology.txt"), "w") as wfile:
+            wfile.write("1.0,2020-01-01 00:00:00,2020-01-01 10:00:00\n")
+
+        repo = MetaRepo()
+        a = repo.get_chronology("NM-1")
+        a.use_irradiation_endtime = True
+
+        b = repo.get_chronology("NM-1")
+        self.assertIsNot(a, b)
+        self.assertFalse(b.use_irradiation_endtime)
+        self.assertEqual(a.get_doses(), b.get_doses())
+
+    def test_production_copy(self):
+        dvc_dump({"A": "P1"}, os.path.join(self.root, "NM-1", "productions.json"))
+        os.mkdir(os.path.join(self.root, "NM-1", "productions"))
+        dvc_dump(
+            {"K4039": [0.001, 0.0001]},
+            os.path.join(self.root, "NM-1", "productions", "P1.json"),
+        )
+
+        repo = MetaRepo()
+        _, a = repo.get_production("NM-1", "A")
+        a.K4039 = 1
+
+        _, b = repo.get_production("NM-1", "A")
+        self.assertIsNot(a, b)
+        self.assertEqual(b.K4039, 0.001)
+
+    def test_flux_positions_modified(self):
+        repo = MetaRepo()
+        a = repo.get_flux_positions("NM-1", "A")
+
+        self._write_level(0.002)
+        repo.index.invalidate(self.level_path)
+
+        b = repo.get_flux_positions("NM-1", "A")
+        self.assertIsNot(a, b)
+        flux = repo.get_flux_from_positions(3, b)
+        self.assertAlmostEqual(flux["j"].nominal_value, 0.006)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+from git import Repo
+from sqlalchemy import text
+
+from pychron.dvc import dvc_dump
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.offline_index import (
+    index_factory,
+    meta_path,
+    OfflineIndexUpdater,
+    INDEX_VERSION,
+)
+
+
+def make_meta(i, identifier="1000", analysis_type="unknown"):
+    return {
+        "uuid": "uuid-{:04d}".format(i),
+        "identifier": identifier,
+        "aliquot": i,
+        "increment": None,
+        "analysis_type": analysis_type,
+        "mass_spectrometer": "jan",
+        "timestamp": "2020-01-{:02d}T12:00:00".format(i + 1),
+        "sample": "FC-2",
+        "material": "sanidine",
+        "project": "Test",
+        "irradiation": "NM-1",
+        "irradiation_level": "A",
+        "irradiation_position": "3",
+    }
+
+
+class Record(object):
+    """
+    minimal stand in for a database AnalysisTbl record
+    """
+
+    def __init__(self, i, repository_identifier):
+        self.repository_identifier = repository_identifier
+        self.tag = "ok"
+        for k, v in make_meta(i).items():
+            setattr(self, k, v)
+        self.timestamp = datetime(2020, 2, 1)
+
+    def bind(self):
+        pass
+
+
+class Database(object):
+    """
+    the parts of DVCDatabase used to query the offline index
+    """
+
+    connected = True
+    use_offline_index = True
+
+    _get_offline_index = DVCDatabase._get_offline_index
+    _get_unindexed_repositories = DVCDatabase._get_unindexed_repositories
+
+    def __init__(self, index, records):
+        self.offline_index = index
+        self.records = records
+        self.queried = []
+
+    def debug(self, msg):
+        pass
+
+    def get_repository_identifiers(self):
+        return ["Repo1", "Repo2"]
+
+    def get_labnumber_analyses(self, lns, use_index=True, **kw):
+        if use_index:
+            return DVCDatabase.get_labnumber_analyses(self, lns, **kw)
+
+        self.queried.append(kw["repositories"])
+        return self.records, len(self.records)
+
+
+class OfflineIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.repo_root = os.path.join(self.root, "Repo1")
+        self.repo = Repo.init(self.repo_root)
+        with self.repo.config_writer() as cw:
+            cw.set_value("user", "name", "test")
+            cw.set_value("user", "email", "test@example.com")
+
+        for i in range(5):
+            self._dump(make_meta(i), "100", "{:04d}".format(i))
+        self._dump(make_meta(9, analysis_type="blank_unknown"), "200", "0009")
+        self._commit()
+
+        self.index = index_factory(os.path.join(self.root, "index.sqlite3"))
+
+    def tearDown(self):
+        self.index.close_session()
+        shutil.rmtree(self.root)
+
+    def _dump(self, obj, sub, name, modifier=None):
+        d = os.path.join(self.repo_root, sub)
+        if modifier:
+            d = os.path.join(d, modifier)
+            name = "{}.{}".format(name, modifier[:4])
+        os.makedirs(d, exist_ok=True)
+        dvc_dump(obj, os.path.join(d, "{}.json".format(name)))
+
+    def _commit(self):
+        self.repo.git.add(A=True)
+        self.repo.git.commit("-m", "update")
+
+    def _get(self, lns=("1000",), **kw):
+        rs, _ = self.index.get_labnumber_analyses(list(lns), **kw)
+        return rs
+
+    def test_meta_path(self):
+        self.assertEqual(meta_path("100/0001.json"), "100/0001.json")
+        self.assertEqual(meta_path("100/tags/0001.tags.json"), "100/0001.json")
+        self.assertEqual(meta_path("100/extraction/0001.extr.json"), "100/0001.json")
+        self.assertIsNone(meta_path("100/intercepts/0001.inte.json"))
+        self.assertIsNone(meta_path("repository.json"))
+        self.assertIsNone(meta_path("100/0001.data.json"))
+
+    def test_index(self):
+        self.assertEqual(self.index.update_repository("Repo1", self.repo_root), 6)
+        rs = self._get()
+        self.assertEqual(len(rs), 6)
+        r = rs[1]
+        self.assertEqual(r.record_id, "1000-01")
+        self.assertEqual(r.repository_identifier, "Repo1")
+        self.assertEqual(r.irradiation_position_position, 3)
+        self.assertEqual(r.tag, "ok")
+
+        # nothing changed
+        self.assertEqual(self.index.update_repository("Repo1", self.repo_root), 0)
+
+    def test_wal(self):
+        with self.index.session_ctx() as sess:
+            mode = sess.execute(text("PRAGMA journal_mode")).scalar()
+        self.assertEqual(mode, "wal")
+
+    def test_incremental(self):
+        self.index.update_repository("Repo1", self.repo_root)
+
+        self._dump({"name": "invalid"}, "100", "0002", modifier="tags")
+        os.remove(os.path.join(self.repo_root, "100", "0003.json"))
+        self._commit()
+
+        self.assertEqual(self.index.update_repository("Repo1", self.repo_root), 1)
+        self.assertEqual(len(self._get()), 4)
+        self.assertEqual(len(self._get(include_invalid=True)), 5)
+
+    def test_date_range(self):
+        self.index.update_repository("Repo1", self.repo_root)
+        rs = self.index.get_analyses_by_date_range(
+            datetime(2020, 1, 2), datetime(2020, 1, 20), analysis_types=["blank"]
+        )
+        self.assertEqual([r.uuid for r in rs], ["uuid-0009"])
+
+    def test_add_records(self):
+        self.index.update_repository("Repo1", self.repo_root)
+
+        # already indexed from the repository
+        self.assertEqual(self.index.add_records([Record(0, "Repo1")]), 0)
+        # associated with a second repository
+        self.assertEqual(self.index.add_records([Record(0, "Repo2")]), 1)
+
+        rs = self._get(order="asc")
+        self.assertEqual(len(rs), 6)
+        r = rs[0]
+        self.assertIsNone(r.repository_identifier)
+        self.assertEqual(sorted(r.repository_ids), ["Repo1", "Repo2"])
+
+    def test_null_tag(self):
+        self.index.update_repository("Repo1", self.repo_root)
+        record = Record(0, "Repo2")
+        record.tag = None
+        self.index.add_records([record])
+
+        self.assertEqual(len(self._get(repositories=["Repo2"])), 1)
+        rs = self.index.get_analyses_by_date_range(None, None, repositories=["Repo2"])
+        self.assertEqual(len(rs), 1)
+
+    def test_database_fallback(self):
+        self.index.update_repository("Repo1", self.repo_root)
+        self.assertEqual(self.index.get_indexed_repositories(), {"Repo1"})
+
+        # uuid-0000 is also indexed
+        dbrecords = [Record(0, "Repo2"), Record(20, "Repo2")]
+        db = Database(self.index, dbrecords)
+        rs, n = db.get_labnumber_analyses(["1000"], order="desc")
+        self.assertEqual(db.queried, [["Repo2"]])
+        self.assertEqual(n, 7)
+        self.assertEqual(rs[0].uuid, "uuid-0020")
+        self.assertEqual(rs[0].repository_identifier, "Repo2")
+
+        # everything requested is indexed
+        db.queried = []
+        rs, n = db.get_labnumber_analyses(["1000"], repositories=["Repo1"])
+        self.assertEqual(db.queried, [])
+        self.assertEqual(n, 6)
+
+        # the database is not available
+        db.connected = False
+        rs, n = db.get_labnumber_analyses(["1000"])
+        self.assertEqual(db.queried, [])
+        self.assertEqual(n, 6)
+
+    def test_irradiation_position(self):
+        self.index.update_repository("Repo1", self.repo_root)
+        r = self._get()[0]
+        self.assertEqual(r.irradiation_position.position, 3)
+        self.assertEqual(r.irradiation_position.sample.name, "FC-2")
+        self.assertIsNone(r.irradiation_position.sample.id)
+        self.assertEqual(r.irradiation_position.sample.note, "")
+
+        record = Record(0, "Repo2")
+        record.uuid = "uuid-db"
+        record.irradiation_position = SimpleNamespace(
+            sample=SimpleNamespace(id=12, note="a note")
+        )
+        self.index.add_records([record])
+
+        r = self._get(order="desc")[0]
+        self.assertEqual(r.uuid, "uuid-db")
+        self.assertEqual(r.irradiation_position.sample.id, 12)
+        self.assertEqual(r.irradiation_position.sample.note, "a note")
+
+    def test_version(self):
+        self.index.update_repository("Repo1", self.repo_root)
+        with self.index.session_ctx() as sess:
+            sess.execute(text("PRAGMA user_version=1"))
+            sess.commit()
+        self.index.close_session()
+
+        self.index = index_factory(os.path.join(self.root, "index.sqlite3"))
+        with self.index.session_ctx() as sess:
+            version = sess.execute(text("PRAGMA user_version")).scalar()
+        self.assertEqual(version, INDEX_VERSION)
+        self.assertIsNone(self.index.get_indexed_sha("Repo1"))
+        self.assertEqual(len(self._get()), 0)
+
+    def test_updater(self):
+        updater = OfflineIndexUpdater(self.index)
+        # the repository path is resolved by the index
+        self.index.update_repository = lambda name, root=None: (
+            self.index.__class__.update_repository(self.index, name, self.repo_root)
+        )
+        updater.add(["Repo1", "Repo1"])
+        updater.join()
+        self.assertEqual(len(self._get()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pychron.dvc import dvc_dump, analysis_path
+from pychron.dvc.dvc import DVC
+from pychron.dvc.parallel import (
+    AnalysisRecordSpec,
+    LockedProxy,
+    make_batches,
+    load_analysis_documents,
+    PROCESS,
+    THREAD,
+)
+from pychron.paths import paths
+
+
+def make_spec(i, repo):
+    return AnalysisRecordSpec(
+        uuid="runid{:04d}".format(i),
+        record_id="runid{:04d}".format(i),
+        repository_identifier=repo,
+    )
+
+
+class Record(object):
+    def __init__(self, i, repo, repository_ids=None):
+        self.uuid = "runid{:04d}".format(i)
+        self.record_id = self.uuid
+        self.repository_identifier = repo
+        self.repository_ids = repository_ids
+        self.tag = "ok"
+
+
+class Maker(object):
+    """
+    the parts of DVC used by _make_records_parallel
+    """
+
+    make_analyses_batch_size = 2
+    make_analyses_workers = 3
+    selected_repositories = ["B"]
+    meta_repo = None
+    _cache = None
+
+    _make_records_parallel = DVC._make_records_parallel
+    _resolve_repository_identifiers = DVC._resolve_repository_identifiers
+
+    def __init__(self, mode):
+        self.make_analyses_mode = mode
+        self.warnings = []
+
+    def debug(self, msg):
+        pass
+
+    def warning_dialog(self, msg):
+        self.warnings.append(msg)
+
+
+def make_record(spec, prog, i, n, docs=None, warn=True, use_cache=True, **kw):
+    assert not use_cache
+    assert not warn
+    return spec.uuid, spec.repository_identifier, docs is not None
+
+
+class ParallelTestCase(unittest.TestCase):
+    def test_pickle(self):
+        spec = make_spec(1, "Foo")
+        spec.tag = "ok"
+        nspec = pickle.loads(pickle.dumps(spec))
+        for k in AnalysisRecordSpec.__slots__:
+            self.assertEqual(getattr(nspec, k), getattr(spec, k))
+
+    def test_batches(self):
+        items = [(i, make_spec(i, "AB"[i % 2])) for i in range(11)]
+        batches = make_batches(items, 2)
+
+        # batches never mix repositories
+        for b in batches:
+            self.assertEqual(len({s.repository_identifier for _, s in b}), 1)
+            self.assertLessEqual(len(b), 2)
+
+        idxs = sorted(i for b in batches for i, _ in b)
+        self.assertEqual(idxs, list(range(11)))
+
+    def test_load_documents(self):
+        root = tempfile.mkdtemp()
+        try:
+            spec = make_spec(1, "Foo")
+            os.mkdir(os.path.join(root, "Foo"))
+            p = analysis_path(spec.uuid, "Foo", root=root, mode="w")
+            dvc_dump({"timestamp": "foo"}, p)
+            p = analysis_path(
+                spec.uuid, "Foo", modifier="intercepts", root=root, mode="w"
+            )
+            dvc_dump({"Ar40": {}}, p)
+
+            ((idx, docs),) = load_analysis_documents(root, [(3, spec)])
+            self.assertEqual(idx, 3)
+            self.assertEqual(docs[None], {"timestamp": "foo"})
+            self.assertEqual(docs["intercepts"], {"Ar40": {}})
+            self.assertIsNone(docs["blanks"])
+        finally:
+            shutil.rmtree(root)
+
+    def _make_records(self, mode):
+        records = [Record(i, "AB"[i % 2]) for i in range(7)]
+        # resolved from the selected repositories
+        records[2] = Record(2, None, ["A", "B"])
+        # dropped
+        records[5] = Record(5, None, ["A", "C"])
+
+        root = tempfile.mkdtemp()
+        dataset_dir = paths.repository_dataset_dir
+        try:
+            paths.repository_dataset_dir = root
+            for r in records:
+                repo = r.repository_identifier or "B"
+                os.makedirs(os.path.join(root, repo), exist_ok=True)
+                p = analysis_path(r.uuid, repo, root=root, mode="w")
+                dvc_dump({}, p)
+
+            maker = Maker(mode)
+            ans = maker._make_records_parallel(records, make_record, False)
+        finally:
+            paths.repository_dataset_dir = dataset_dir
+            shutil.rmtree(root)
+
+        self.assertEqual(
+            [a[0] for a in ans],
+            ["runid{:04d}".format(i) for i in (0, 1, 2, 3, 4, 6)],
+        )
+        self.assertEqual(ans[2][1], "B")
+        self.assertEqual(len(maker.warnings), 1)
+        self.assertIn("runid0005", maker.warnings[0])
+        return ans
+
+    def test_make_records_thread(self):
+        ans = self._make_records(THREAD)
+        self.assertFalse(any(a[2] for a in ans))
+
+    def test_make_records_process(self):
+        ans = self._make_records(PROCESS)
+        self.assertTrue(all(a[2] for a in ans))
+
+    def test_locked_proxy(self):
+        class Counter(object):
+            name = "counter"
+            active = 0
+            max_active = 0
+
+            def incr(self):
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                for i in range(1000):
+                    pass
+                self.active -= 1
+
+        c = Counter()
+        proxy = LockedProxy(c)
+        self.assertEqual(proxy.name, "counter")
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda i: proxy.incr(), range(200)))
+        self.assertEqual(c.max_active, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# ============= EOF =============================================
@@ -42,7 +42,10 @@ class EmulationServer(object):
 
     def stop(self):
         self._alive = False
-        self.server.server_close()
+        server = getattr(self, "server", None)
+        if server is not None:
+            server.shutdown()
+            server.server_close()
 
     def run(self, host=None, port=None):
         if host is None:
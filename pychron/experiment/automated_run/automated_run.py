@@ -23,8 +23,9 @@ import os
 import re
 import time
 import weakref
+from functools import partial
 from pprint import pformat
-from threading import Event as TEvent, Thread
+from threading import Event as TEvent, Thread, Lock
 
 from numpy import Inf, polyfit, linspace, polyval
 from traits.api import (
@@ -56,6 +57,7 @@ from pychron.core.yaml import yload
 from pychron.experiment import ExtractionException
 from pychron.experiment.automated_run.hop_util import parse_hops
 from pychron.experiment.automated_run.persistence_spec import PersistenceSpec
+from pychron.experiment.automated_run.timeline import NULL_TIMELINE
 
 from pychron.experiment.conditional.conditional import (
     TruncationConditional,
@@ -277,6 +279,12 @@ class AutomatedRun(Loggable):
     _intensities = None
 
     log_path = Str
+    # RunTimeline set by the executor
+    timeline = NULL_TIMELINE
+    # the overlapped post measurement save and the timeline finish deferred until it is done
+    _save_thread = None
+    _deferred_timeline = None
+    _timeline_lock = None
 
     failed_intensity_count_threshold = Int(3)
     use_equilibration_analysis = Bool(False)
@@ -1155,6 +1163,7 @@ class AutomatedRun(Loggable):
         for p in (self.persister, self.xls_persister, self.dvc_persister):
             if p is not None:
                 p.per_spec = self.persistence_spec
+                p.timeline = self.timeline
 
         if self.monitor is None:
             return self._start()
@@ -1314,13 +1323,30 @@ class AutomatedRun(Loggable):
                 i = 0
             i += 1
 
-    def post_finish(self):
+    def post_finish(self, timeline_callback=None):
+        """
+        timeline_callback: called with the timeline after it is saved. if the overlapped
+        save is still running the timeline is saved on the save thread once it is done so
+        the save spans are included
+        """
         if self.use_dvc_persistence:
             if self.log_path:
                 self.dvc_persister.save_run_log_file(self.log_path)
             else:
                 self.debug("no log path to save")
 
+        lock = self._timeline_lock
+        if lock is not None:
+            with lock:
+                if self._save_thread is not None:
+                    self.debug("saving timeline after the post measurement save")
+                    self._deferred_timeline = partial(
+                        self._finish_timeline, timeline_callback
+                    )
+                    return
+
+        self._finish_timeline(timeline_callback)
+
     def save(self, exception_queue=None, complete_event=None):
         self.debug(
             "post measurement save measured={} aborted={}, exception_queue={}, complete_event={}".format(
@@ -1363,9 +1389,9 @@ class AutomatedRun(Loggable):
 
             # save to database
             if exception_queue:  # parallel save not currently working
-                t = Thread(
-                    target=self._persister_save_action,
-                    args=("post_measurement_save",),
+                self._timeline_lock = Lock()
+                t = self._save_thread = Thread(
+                    target=self._overlapped_save,
                     kwargs={
                         "exception_queue": exception_queue,
                         "complete_event": complete_event,
@@ -1952,15 +1978,48 @@ anaylsis_type={}
 
     def _persister_save_action(self, func, *args, **kw):
         self.debug("persistence save...")
+        timeline = self.timeline
         if self.use_db_persistence:
             self.debug("persistence save - db")
-            getattr(self.persister, func)(*args, **kw)
+            with timeline.span("{}_db".format(func)):
+                getattr(self.persister, func)(*args, **kw)
         if self.use_dvc_persistence:
             self.debug("persistence save - dvc")
-            getattr(self.dvc_persister, func)(*args, **kw)
+            with timeline.span("{}_dvc".format(func)):
+                getattr(self.dvc_persister, func)(*args, **kw)
         if self.use_xls_persistence:
             self.debug("persistence save - xls")
-            getattr(self.xls_persister, func)(*args, **kw)
+            with timeline.span("{}_xls".format(func)):
+                getattr(self.xls_persister, func)(*args, **kw)
+
+    def _overlapped_save(self, **kw):
+        try:
+            self._persister_save_action("post_measurement_save", **kw)
+        finally:
+            with self._timeline_lock:
+                self._save_thread = None
+                finish, self._deferred_timeline = self._deferred_timeline, None
+
+            if finish is not None:
+                finish()
+
+    def _finish_timeline(self, callback=None):
+        self._save_timeline()
+        if callback is not None:
+            callback(self.timeline)
+
+    def _save_timeline(self):
+        timeline = self.timeline
+        if not timeline.enabled:
+            return
+
+        meta = {"runid": self.runid, "uuid": self.uuid}
+        if self.use_dvc_persistence:
+            self.dvc_persister.save_timeline_file(timeline, **meta)
+        elif self.log_path:
+            p = "{}.timeline.json".format(os.path.splitext(self.log_path)[0])
+            self.debug("saving timeline to {}".format(p))
+            timeline.dump(p, **meta)
 
     def _persister_action(self, func, *args, **kw):
         getattr(self.persister, func)(*args, **kw)
@@ -2772,6 +2831,7 @@ anaylsis_type={}
             data_writer=data_writer,
             experiment_type=self.experiment_type,
             refresh_age=self.spec.analysis_type in ("unknown", "cocktail"),
+            timeline=self.timeline,
         )
 
         self._update_persister_spec(time_zero=starttime)
@@ -2793,8 +2853,9 @@ anaylsis_type={}
                 self._setup_isotope_graph(starttime_offset, color, grpname)
 
         # time.sleep(0.5)
-        with self.persister.writer_ctx():
-            m.measure()
+        with self.timeline.span("measure_{}".format(grpname)):
+            with self.persister.writer_ctx():
+                m.measure()
 
         # mem_log('post measure')
         if m.terminated:
@@ -20,9 +20,18 @@ from threading import Event
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance
+from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance, Float, Dict
 
 from pychron.envisage.consoleable import Consoleable
+from pychron.experiment.automated_run.live_plot import (
+    LIVE_PLOT_MODES,
+    INLINE,
+    QUEUED,
+    OFF,
+    JitterMeter,
+    LivePlotQueue,
+)
+from pychron.experiment.automated_run.timeline import NULL_TIMELINE
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF
 
 
@@ -71,6 +80,18 @@ class DataCollector(Consoleable):
     not_intensity_count = 0
     trigger = None
     plot_panel_update_period = Int(1)
+    # fit the isotopes with running sums while measuring instead of refitting every check
+    use_live_fit = Bool(True)
+
+    live_plot_mode = Enum(LIVE_PLOT_MODES)
+    live_plot_frame_rate = Float(10)
+    # live_plot_mode: JitterMeter.report() of the last block measured in that mode
+    jitter_reports = Dict
+    _jitter = None
+    _plot_queue = None
+    _detector_map = None
+    # RunTimeline of the automated run
+    timeline = NULL_TIMELINE
 
     def __init__(self, *args, **kw):
         super(DataCollector, self).__init__(*args, **kw)
@@ -79,6 +100,10 @@ class DataCollector(Consoleable):
             "plot_panel_update_period",
             "pychron.experiment.plot_panel_update_period",
         )
+        bind_preference(self, "live_plot_mode", "pychron.experiment.live_plot_mode")
+        bind_preference(
+            self, "live_plot_frame_rate", "pychron.experiment.live_plot_frame_rate"
+        )
 
     # def wait(self):
     #     st = time.time()
@@ -120,11 +145,45 @@ class DataCollector(Consoleable):
 
         self._alive = True
 
-        self._measure()
+        self._detector_map = {d.name: d for d in self.detectors}
+        self._jitter = JitterMeter(self.period_ms * 0.001)
+
+        pq = None
+        if self.live_plot_mode == QUEUED:
+            pq = self._plot_queue = LivePlotQueue(
+                self._plot_queued, frame_rate=self.live_plot_frame_rate
+            )
+            pq.start()
+
+        ig = self.isotope_group
+        if ig is not None:
+            ig.set_live_fit(self.use_live_fit)
+        try:
+            self._measure()
+        finally:
+            if ig is not None:
+                # the next access does a full refit with outlier filtering
+                ig.set_live_fit(False)
+            if pq is not None:
+                pq.stop()
+                self._plot_queue = None
 
         tt = time.time() - self.starttime
         self.debug("estimated time: {:0.3f} actual time: :{:0.3f}".format(et, tt))
 
+        report = self._jitter.report()
+        self.jitter_reports[self.live_plot_mode] = report
+        self.debug(
+            "acquisition jitter plotting={} n={} jitter={:0.4f}s max={:0.4f}s "
+            "plot_time={:0.3f}s".format(
+                self.live_plot_mode,
+                report["n"],
+                report["jitter"],
+                report["max_deviation"],
+                report["plot_time"],
+            )
+        )
+
     # def plot_data(self, *args, **kw):
     #     from pychron.core.ui.gui import invoke_in_main_thread
     #     invoke_in_main_thread(self._plot_data, *args, **kw)
@@ -159,8 +218,10 @@ class DataCollector(Consoleable):
         period = self.period_ms * 0.001
         i = 1
 
+        timeline = self.timeline
         while not evt.is_set():
-            result = self._check_iteration(i)
+            with timeline.span("conditionals"):
+                result = self._check_iteration(i)
             if not result:
                 if not self._pre_trigger_hook():
                     break
@@ -169,6 +230,7 @@ class DataCollector(Consoleable):
                     self.trigger()
 
                 evt.wait(period)
+                self._jitter.tick()
                 self.automated_run.plot_panel.counts = i
                 inc = self._iter_hook(i)
                 if inc is None:
@@ -204,8 +266,10 @@ class DataCollector(Consoleable):
         return self._iteration(i)
 
     def _iteration(self, i, detectors=None):
+        timeline = self.timeline
         try:
-            data = self._get_data(detectors)
+            with timeline.span("read_intensities"):
+                data = self._get_data(detectors)
             if not data:
                 return
 
@@ -217,8 +281,17 @@ class DataCollector(Consoleable):
 
         if k is not None and s is not None:
             x = self._get_time(t)
-            self._save_data(x, k, s)
-            self._plot_data(i, x, k, s)
+            with timeline.span("save_data"):
+                self._save_data(x, k, s)
+
+            mode = self.live_plot_mode
+            if mode == QUEUED:
+                self._queue_plot_data(i, x, k, s)
+            elif mode == INLINE:
+                with timeline.span("plot"):
+                    st = time.perf_counter()
+                    self._plot_data(i, x, k, s)
+                    self._jitter.add_plot_time(time.perf_counter() - st)
 
         return inc
 
@@ -273,8 +346,11 @@ class DataCollector(Consoleable):
 
     def _update_baseline_peak_hop(self, x, keys, signals):
         ig = self.isotope_group
+        sd = dict(zip(keys, signals))
         for iso in ig.itervalues():
-            signal = self._get_signal(keys, signals, iso.detector)
+            signal = sd.get(iso.detector)
+            if signal is None:
+                signal = self._get_signal(keys, signals, iso.detector)
             if signal is not None:
                 if not ig.append_data(iso.name, iso.detector, x, signal, "baseline"):
                     self.debug(
@@ -286,12 +362,11 @@ class DataCollector(Consoleable):
         a = self.isotope_group
         kind = self.collection_kind
 
-        for dn in keys:
+        for dn, signal in zip(keys, signals):
             dn = self._get_detector(dn)
             if dn:
                 iso = dn.isotope
                 if iso:
-                    signal = self._get_signal(keys, signals, dn.name)
                     if signal is not None:
                         if not a.append_data(iso, dn.name, x, signal, kind):
                             self.debug(
@@ -312,7 +387,11 @@ class DataCollector(Consoleable):
 
     def _get_detector(self, d):
         if isinstance(d, str):
-            d = next((di for di in self.detectors if di.name == d), None)
+            dm = self._detector_map
+            if dm is not None:
+                d = dm.get(d)
+            else:
+                d = next((di for di in self.detectors if di.name == d), None)
         return d
 
     def _plot_data(self, cnt, x, keys, signals):
@@ -324,10 +403,89 @@ class DataCollector(Consoleable):
         if not cnt % self.plot_panel_update_period:
             self.plot_panel.update()
 
+    def _queue_plot_data(self, cnt, x, keys, signals):
+        """
+        resolve the plot targets when the data is collected. the collection kind and
+        series change between blocks and the queue may be drained on the gui thread after
+        the next block has started
+        """
+        pts = []
+        for dn, signal in zip(keys, signals):
+            det = self._get_detector(dn)
+            if det:
+                for t in self._get_plot_targets(cnt, det):
+                    pts.append(t + (det.ypadding, x, signal))
+
+        self._plot_queue.push((self.collection_kind, pts))
+
+    def _plot_queued(self, items):
+        """
+        plot the items queued since the last frame. the points of each series are added
+        at once and the plot panel is updated once
+        """
+        series = {}
+        for kind, pts in items:
+            for g, name, fit, s, fs, ypadding, x, signal in pts:
+                key = (id(g), name, s)
+                try:
+                    datums = series[key][-1]
+                except KeyError:
+                    datums = []
+                # keep the latest fit and padding
+                series[key] = (g, name, fit, s, fs, ypadding, kind, datums)
+                datums.append((x, signal))
+
+        for g, name, fit, s, fs, ypadding, kind, datums in series.values():
+            pid = self._get_plotid(g, name, kind)
+            if pid is not None:
+                g.add_datums(
+                    datums,
+                    series=s,
+                    plotid=pid,
+                    update_y_limits=True,
+                    ypadding=ypadding,
+                )
+                if fit:
+                    g.set_fit(fit, plotid=pid, series=fs)
+
+        self.plot_panel.update()
+
     def _set_plot_data(self, cnt, det, x, signal):
+        for g, name, fit, series, fit_series in self._get_plot_targets(cnt, det):
+            pid = self._get_plotid(g, name)
+            if pid is None:
+                continue
+
+            g.add_datum(
+                (x, signal),
+                series=series,
+                plotid=pid,
+                update_y_limits=True,
+                ypadding=det.ypadding,
+            )
+            if fit:
+                g.set_fit(fit, plotid=pid, series=fit_series)
+
+    def _get_plotid(self, g, name, kind=None):
+        if kind is None:
+            kind = self.collection_kind
+
+        pid = g.get_plotid_by_ytitle(name)
+        if pid is None:
+            # this case arises when doing a sniff and a peakhop.
+            # the sniff graph and the signal graph have different plots and its ok not to warn about this
+            if not kind == SNIFF:
+                self.critical(
+                    "failed to locate {}, ytitles={}".format(name, g.get_plot_ytitles())
+                )
+        return pid
+
+    def _get_plot_targets(self, cnt, det):
+        """
+        return a list of (graph, name, fit, series, fit_series)
+        """
         iso = det.isotope
         detname = det.name
-        ypadding = det.ypadding
         gs = []
         if self.collection_kind == SNIFF:
             if iso:
@@ -355,29 +513,7 @@ class DataCollector(Consoleable):
                     self.fit_series_idx,
                 )
             ]
-
-        for g, name, fit, series, fit_series in gs:
-            pid = g.get_plotid_by_ytitle(name)
-            if pid is None:
-                # this case arises when doing a sniff and a peakhop.
-                # the sniff graph and the signal graph have different plots and its ok not to warn about this
-                if not self.collection_kind == SNIFF:
-                    self.critical(
-                        "failed to locate {}, ytitles={}".format(
-                            name, g.get_plot_ytitles()
-                        )
-                    )
-                continue
-
-            g.add_datum(
-                (x, signal),
-                series=series,
-                plotid=pid,
-                update_y_limits=True,
-                ypadding=ypadding,
-            )
-            if fit:
-                g.set_fit(fit, plotid=pid, series=fit_series)
+        return gs
 
     # ===============================================================================
     #
@@ -0,0 +1,124 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from threading import Lock
+
+from numpy import zeros
+
+# ============= local library imports  ==========================
+
+
+class BufferedDataWriter(object):
+    """
+    write the signals of a measurement block to the hdf5 TimeSeries tables.
+
+    the tables are resolved once per detector. rows are accumulated in preallocated structured
+    arrays and appended to the tables in bulk when block_size rows are buffered or flush_period
+    seconds have passed since the last flush.
+
+    the buffer is only written on the thread that calls the writer or flush. pytables is not
+    thread safe. AutomatedRunPersister.writer_ctx flushes all writers before the file is closed
+    so a truncated or canceled run does not lose the buffered rows
+    """
+
+    def __init__(
+        self, data_manager, grpname, block_size=50, flush_period=5.0, logger=None
+    ):
+        self._dm = data_manager
+        self._grpname = grpname
+        self._block_size = max(1, block_size)
+        self._flush_period = flush_period
+        self._logger = logger
+
+        self._lock = Lock()
+        # detector name: [table, buffer, number of buffered rows].
+        # table is None if the detector has no table
+        self._tables = {}
+        self._ncycles = 0
+        self._last_flush = time.monotonic()
+        self.nrows = 0
+        self.nflushes = 0
+
+    def __call__(self, dets, x, keys, signals):
+        with self._lock:
+            for det in dets:
+                k = det.name
+                if k not in keys:
+                    continue
+
+                try:
+                    entry = self._tables[k]
+                except KeyError:
+                    entry = self._tables[k] = self._resolve(det)
+
+                t, buf, n = entry
+                if t is not None:
+                    buf["time"][n] = x
+                    buf["value"][n] = signals[keys.index(k)]
+                    entry[2] = n + 1
+
+            # each table gets at most one row per cycle
+            self._ncycles += 1
+            if (
+                self._ncycles >= self._block_size
+                or time.monotonic() - self._last_flush >= self._flush_period
+            ):
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    # private
+    def _resolve(self, det):
+        k = det.name
+        if self._grpname == "baseline":
+            grp = "/{}".format(self._grpname)
+        else:
+            grp = "/{}/{}".format(self._grpname, det.isotope)
+
+        t = self._dm.get_table(k, grp)
+        if t is None:
+            if det.isotope and self._grpname and k and self._logger:
+                self._logger.debug(
+                    "no table. group:{} det:{} iso:{}".format(
+                        self._grpname, k, det.isotope
+                    )
+                )
+            return [None, None, 0]
+
+        return [t, zeros(self._block_size, dtype=t.description._v_dtype), 0]
+
+    def _flush(self):
+        if self._ncycles:
+            for entry in self._tables.values():
+                t, buf, n = entry
+                if n:
+                    t.append(buf[:n])
+                    t.flush()
+                    self.nrows += n
+                    entry[2] = 0
+
+            self.nflushes += 1
+
+        self._ncycles = 0
+        self._last_flush = time.monotonic()
+
+
+# ============= EOF =============================================
@@ -0,0 +1,152 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from collections import deque
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.timer import Timer
+
+# inline: plot each cycle on the acquisition thread
+# queued: queue the data and plot it on the gui thread at frame_rate
+# off: do not plot
+INLINE = "inline"
+QUEUED = "queued"
+OFF = "off"
+LIVE_PLOT_MODES = (INLINE, QUEUED, OFF)
+
+
+class JitterMeter(object):
+    """
+    deviation of the intervals between acquisition cycles from the measurement period and
+    the time spent plotting on the acquisition thread
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.n = 0
+        self.max_deviation = 0
+        self.plot_time = 0
+        self._last = None
+        self._sum = 0
+        self._sum2 = 0
+
+    def tick(self, t=None):
+        if t is None:
+            t = time.perf_counter()
+
+        last = self._last
+        self._last = t
+        if last is not None:
+            dev = abs(t - last - self.period)
+            self.n += 1
+            self._sum += dev
+            self._sum2 += dev * dev
+            self.max_deviation = max(self.max_deviation, dev)
+
+    def add_plot_time(self, dt):
+        self.plot_time += dt
+
+    def report(self):
+        """
+        return a dict. jitter is the rms deviation of the intervals from the period.
+        all times in seconds
+        """
+        n = self.n
+        return {
+            "n": n,
+            "period": self.period,
+            "mean_deviation": self._sum / n if n else 0,
+            "jitter": (self._sum2 / n) ** 0.5 if n else 0,
+            "max_deviation": self.max_deviation,
+            "plot_time": self.plot_time,
+        }
+
+
+class LivePlotQueue(object):
+    """
+    hand the collected data from the acquisition thread to the gui thread.
+
+    the acquisition thread pushes items onto a deque. append and popleft are atomic so no
+    lock is needed. a timer asks the gui thread to drain the queue frame_rate times a
+    second. func is called with all the items queued since the last frame so the points
+    can be added to the graphs at once.
+
+    an item must carry everything needed to plot it. it may be drawn after the
+    acquisition thread has moved on to the next block
+    """
+
+    def __init__(self, func, frame_rate=10, invoke=None):
+        self.func = func
+        self.frame_rate = frame_rate
+        if invoke is None:
+            from pychron.core.ui.gui import invoke_in_main_thread as invoke
+        self._invoke = invoke
+        self._queue = deque()
+        self._timer = None
+        self._frame_pending = False
+
+        self.nitems = 0
+        self.nframes = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def push(self, item):
+        self._queue.append(item)
+
+    def start(self):
+        if self._timer is None:
+            period = 1000.0 / max(self.frame_rate, 0.1)
+            self._timer = Timer(period, self._request_frame)
+
+    def stop(self):
+        """
+        stop the timer and plot the remaining items
+        """
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+        if self._queue:
+            self._invoke(self.drain)
+
+    def drain(self):
+        self._frame_pending = False
+        q = self._queue
+        items = []
+        while 1:
+            try:
+                items.append(q.popleft())
+            except IndexError:
+                break
+
+        if items:
+            self.nitems += len(items)
+            self.nframes += 1
+            self.func(items)
+
+    # private
+    def _request_frame(self):
+        # skip frames while the gui thread is behind
+        if self._queue and not self._frame_pending:
+            self._frame_pending = True
+            self._invoke(self.drain)
+
+
+# ============= EOF =============================================
@@ -44,7 +44,8 @@ class PeakHopCollector(DataCollector):
         self.hop_generator = generate_hops(self.hops)
 
     def _pre_trigger_hook(self):
-        args = self._do_hop()
+        with self.timeline.span("hop"):
+            args = self._do_hop()
 
         if args:
             is_baseline, dets, isos = args
@@ -19,6 +19,7 @@ import binascii
 import math
 import os
 import time
+from contextlib import contextmanager
 
 from traits.api import Instance, Bool, Interface, provides, Long, Str, Float
 from xlwt import Workbook, struct
@@ -28,7 +29,9 @@ from pychron.core.helpers.filetools import subdirize
 from pychron.core.helpers.strtools import to_bool
 from pychron.core.ui.preference_binding import set_preference
 from pychron.database.adapters.local_lab_adapter import LocalLabAdapter
+from pychron.experiment.automated_run.data_writer import BufferedDataWriter
 from pychron.experiment.automated_run.hop_util import parse_hops
+from pychron.experiment.automated_run.timeline import NULL_TIMELINE
 from pychron.experiment.automated_run.mass_spec_persistence_spec import (
     MassSpecPersistenceSpec,
 )
@@ -63,6 +66,8 @@ class BasePersister(Loggable):
         "pychron.experiment.automated_run.persistence_spec.PersistenceSpec", ()
     )
     save_enabled = Bool(False)
+    # RunTimeline of the active run
+    timeline = NULL_TIMELINE
 
     def set_preferences(self, preferences):
         pass
@@ -231,9 +236,14 @@ class AutomatedRunPersister(BasePersister):
     grouping_threshold = Float
     grouping_suffix = Str
 
+    # rows buffered by the data writers before they are written to the hdf5 file
+    data_writer_block_size = 50
+    data_writer_flush_period = 5
+
     _db_extraction_id = None
     _temp_analysis_buffer = None
     _current_data_frame = None
+    _data_writers = None
 
     def __init__(self, *args, **kw):
         super(AutomatedRunPersister, self).__init__(*args, **kw)
@@ -302,50 +312,24 @@ class AutomatedRunPersister(BasePersister):
     def get_data_writer(self, grpname):
         """
         grpname should be a str such as "signal", "baseline",etc
-        return a closure for writing the data
+        return a callable for writing the data.
+
+        rows are buffered and written in blocks. the writer is flushed when writer_ctx exits
 
         :param grpname: str
-        :return: function
+        :return: BufferedDataWriter
         """
-        tables = {}
-
-        def write_data(dets, x, keys, signals):
-            # todo: test whether saving data to h5 in real time is expansive
-
-            # disable H5 data writer
-            # self.unique_warning('NOT Writing data to H5 in real time')
-            # return
-
-            dm = self.data_manager
-            for det in dets:
-                k = det.name
-                try:
-                    if k in keys:
-                        if grpname == "baseline":
-                            grp = "/{}".format(grpname)
-                        else:
-                            grp = "/{}/{}".format(grpname, det.isotope)
-
-                        tag = "{}/{}".format(grp, k)
-                        if tag in tables:
-                            t = tables["tag"]
-                        else:
-                            t = dm.get_table(k, grp)
-
-                        nrow = t.row
-                        nrow["time"] = x
-                        nrow["value"] = signals[keys.index(k)]
-                        nrow.append()
-                        t.flush()
-                except AttributeError as e:
-                    if det.isotope and grpname and k:
-                        self.debug(
-                            "error: {} group:{} det:{} iso:{}".format(
-                                e, grpname, k, det.isotope
-                            )
-                        )
-
-        return write_data
+        writer = BufferedDataWriter(
+            self.data_manager,
+            grpname,
+            block_size=self.data_writer_block_size,
+            flush_period=self.data_writer_flush_period,
+            logger=self,
+        )
+        if self._data_writers is None:
+            self._data_writers = []
+        self._data_writers.append(writer)
+        return writer
 
     def build_tables(self, grpname, detectors, n):
         """
@@ -393,8 +377,19 @@ class AutomatedRunPersister(BasePersister):
     def get_last_aliquot(self, identifier):
         return self.datahub.get_greatest_aliquot(identifier)
 
+    @contextmanager
     def writer_ctx(self):
-        return self.data_manager.open_file(self._current_data_frame)
+        with self.data_manager.open_file(self._current_data_frame):
+            try:
+                yield
+            finally:
+                # write any buffered rows before the file is closed
+                for w in self._data_writers or ():
+                    w.flush()
+                    self.debug(
+                        "data writer nrows={} nflushes={}".format(w.nrows, w.nflushes)
+                    )
+                self._data_writers = None
 
     # def pre_extraction_save(self):
     #     """
@@ -361,12 +361,15 @@ class AutomatedRunSpec(HasTraits):
                     # if duration:
                     # arun.setup_context(script)
 
-                    ok = script.syntax_ok()
+                    ctx = None
+                    if duration and si in ("measurement_script", "extraction_script"):
+                        ctx = self.make_script_context()
+
+                    ok = script.syntax_ok(ctx=ctx)
                     script_oks.append(ok)
                     script_context[name] = script, ok
                     if ok and duration:
                         if si in ("measurement_script", "extraction_script"):
-                            ctx = self.make_script_context()
                             d = script.calculate_estimated_duration(ctx)
                             logger.debug(
                                 "script duration name:{} seconds:{}".format(name, d)
@@ -0,0 +1,283 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import HasTraits, List, Str, Int, Float, Property
+from traitsui.api import View, UItem, TabularEditor
+from traitsui.tabular_adapter import TabularAdapter
+
+# ============= standard library imports ========================
+import json
+import time
+from datetime import datetime
+from threading import Lock
+
+from numpy import percentile
+
+# ============= local library imports  ==========================
+
+DEFAULT_CAPACITY = 8192
+PERCENTILES = (50, 95, 99)
+
+
+class Span(object):
+    __slots__ = ("timeline", "phase", "start")
+
+    def __init__(self, timeline, phase):
+        self.timeline = timeline
+        self.phase = phase
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.timeline.add(self.phase, self.start, time.perf_counter() - self.start)
+
+
+class NullSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class RunTimeline(object):
+    """
+    the phases of a run as (phase, start, duration) spans.
+
+    times are from the monotonic perf_counter clock. the spans are kept in a fixed size
+    ring buffer so a long run keeps its last capacity spans. a disabled timeline records
+    nothing and span returns a shared no-op context manager
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=True):
+        self.enabled = enabled and capacity > 0
+        self.capacity = capacity if self.enabled else 0
+        self.t0 = time.perf_counter()
+        self.started = datetime.now()
+        # number of spans ever added
+        self.n = 0
+
+        c = self.capacity
+        self._phases = [None] * c
+        self._starts = [0.0] * c
+        self._durations = [0.0] * c
+        self._lock = Lock()
+
+    def __len__(self):
+        return min(self.n, self.capacity)
+
+    @property
+    def dropped(self):
+        return self.n - len(self)
+
+    def span(self, phase):
+        """
+        with timeline.span('read_intensities'):
+            ...
+        """
+        if self.enabled:
+            return Span(self, phase)
+        return NULL_SPAN
+
+    def add(self, phase, start, duration):
+        if not self.enabled:
+            return
+
+        # spans are added by the executor and the overlapped save thread
+        with self._lock:
+            i = self.n % self.capacity
+            self._phases[i] = phase
+            self._starts[i] = start
+            self._durations[i] = duration
+            self.n += 1
+
+    def spans(self):
+        """
+        return a list of (phase, start, duration) oldest first. start is relative to the
+        creation of the timeline
+        """
+        with self._lock:
+            n = len(self)
+            i = self.n % self.capacity if self.n > n else 0
+            idx = [(i + j) % self.capacity for j in range(n)] if n else []
+            t0 = self.t0
+            return [
+                (self._phases[k], self._starts[k] - t0, self._durations[k]) for k in idx
+            ]
+
+    def durations(self):
+        """
+        return a dict of phase: list of durations
+        """
+        ds = {}
+        for phase, _, dur in self.spans():
+            ds.setdefault(phase, []).append(dur)
+        return ds
+
+    def to_dict(self, **meta):
+        """
+        phases are stored once and each span as [phase index, start us, duration us]
+        """
+        phases = []
+        pidx = {}
+        spans = []
+        for phase, st, dur in self.spans():
+            try:
+                pi = pidx[phase]
+            except KeyError:
+                pi = pidx[phase] = len(phases)
+                phases.append(phase)
+            spans.append((pi, int(st * 1e6), int(dur * 1e6)))
+
+        d = dict(meta)
+        d.update(
+            started=self.started.isoformat(),
+            dropped=self.dropped,
+            phases=phases,
+            spans=spans,
+        )
+        return d
+
+    def dump(self, path, **meta):
+        with open(path, "w") as wfile:
+            json.dump(self.to_dict(**meta), wfile, separators=(",", ":"))
+
+
+NULL_TIMELINE = RunTimeline(enabled=False)
+
+
+class PhaseStats(HasTraits):
+    name = Str
+    n = Int
+    total = Float
+    p50 = Float
+    p95 = Float
+    p99 = Float
+    max = Float
+
+
+class PhaseStatsAdapter(TabularAdapter):
+    columns = [
+        ("Phase", "name"),
+        ("N", "n"),
+        ("Total (s)", "total"),
+        ("p50 (s)", "p50"),
+        ("p95 (s)", "p95"),
+        ("p99 (s)", "p99"),
+        ("Max (s)", "max"),
+    ]
+
+    total_text = Property
+    p50_text = Property
+    p95_text = Property
+    p99_text = Property
+    max_text = Property
+
+    def _get_total_text(self):
+        return self._fmt("total")
+
+    def _get_p50_text(self):
+        return self._fmt("p50")
+
+    def _get_p95_text(self):
+        return self._fmt("p95")
+
+    def _get_p99_text(self):
+        return self._fmt("p99")
+
+    def _get_max_text(self):
+        return self._fmt("max")
+
+    def _fmt(self, attr):
+        return "{:0.4f}".format(getattr(self.item, attr))
+
+
+class TimelineSummary(HasTraits):
+    """
+    percentiles of the phase durations of the runs of an experiment queue
+    """
+
+    phases = List(PhaseStats)
+    nruns = Int
+
+    def __init__(self, *args, **kw):
+        super(TimelineSummary, self).__init__(*args, **kw)
+        self._durations = {}
+
+    def clear(self):
+        self._durations = {}
+        self.nruns = 0
+        self.phases = []
+
+    def add(self, timeline):
+        if not timeline.enabled:
+            return
+
+        for phase, ds in timeline.durations().items():
+            self._durations.setdefault(phase, []).extend(ds)
+        self.nruns += 1
+        self.phases = self._make_phases()
+
+    def report(self):
+        """
+        return a dict of phase: dict of n, total, p50, p95, p99, max
+        """
+        return {
+            p.name: {
+                k: getattr(p, k) for k in ("n", "total", "p50", "p95", "p99", "max")
+            }
+            for p in self.phases
+        }
+
+    def traits_view(self):
+        return View(
+            UItem(
+                "phases",
+                editor=TabularEditor(
+                    adapter=PhaseStatsAdapter(), editable=False, operations=[]
+                ),
+            )
+        )
+
+    # private
+    def _make_phases(self):
+        ps = []
+        for name, ds in self._durations.items():
+            p50, p95, p99 = percentile(ds, PERCENTILES)
+            ps.append(
+                PhaseStats(
+                    name=name,
+                    n=len(ds),
+                    total=sum(ds),
+                    p50=p50,
+                    p95=p95,
+                    p99=p99,
+                    max=max(ds),
+                )
+            )
+        return sorted(ps, key=lambda p: p.total, reverse=True)
+
+
+# ============= EOF =============================================
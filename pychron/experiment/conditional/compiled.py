@@ -0,0 +1,129 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import builtins
+
+from uncertainties import nominal_value, std_dev
+
+# ============= local library imports  ==========================
+from pychron.experiment.conditional.regexes import (
+    MAPPER_KEY_REGEX,
+    STD_REGEX,
+    INTERPOLATE_REGEX,
+)
+from pychron.experiment.conditional.utilities import tokenize, get_teststr_attr_func
+
+# maximum number of distinct evaluated test strings to keep compiled. the evaluated string
+# only changes if a token has no value or an interpolated value changes
+MAX_CODES = 64
+
+GLOBALS = {"__builtins__": builtins}
+
+
+def compile_expression(s):
+    return compile(s, "<conditional>", "eval")
+
+
+class CompiledToken(object):
+    __slots__ = ("teststr", "key", "func", "oper", "interpolations")
+
+    def __init__(self, token, oper):
+        ts, key, func = get_teststr_attr_func(token)
+
+        self.key = key.replace("(", "_").replace(")", "_")
+        self.teststr = ts.replace("(", "_").replace(")", "_")
+        self.func = func
+        self.oper = oper
+        self.interpolations = INTERPOLATE_REGEX.findall(self.teststr)
+
+
+class CompiledConditional(object):
+    """
+    a conditional teststr parsed once.
+
+    evaluate() produces the same test string, context and result as
+    AutomatedRunConditional._make_context followed by eval. the context dict and the
+    test string parts are reused between evaluations and the evaluated test strings are
+    compiled once
+    """
+
+    def __init__(self, teststr, window=0, mapper=""):
+        self.teststr = teststr
+        self.window = window
+        self.use_std = bool(STD_REGEX.match(teststr))
+        self.tokens = [CompiledToken(ti, oper) for ti, oper in tokenize(teststr)]
+
+        self.mapper_key = None
+        self.mapper_code = None
+        if mapper:
+            m = MAPPER_KEY_REGEX.search(mapper)
+            if m:
+                self.mapper_key = m.group(0)
+                self.mapper_code = compile_expression(mapper)
+
+        self.ctx = {}
+        self._parts = []
+        self._codes = {}
+
+    def evaluate(self, obj, data):
+        """
+        return teststr, ctx, result. result is None if there was nothing to evaluate.
+        ctx is reused by the next evaluation
+        """
+        ctx = self.ctx
+        ctx.clear()
+        parts = self._parts
+        del parts[:]
+
+        window = self.window
+        for token in self.tokens:
+            v = token.func(obj, data, window)
+            if v is None:
+                continue
+
+            vv = std_dev(v) if self.use_std else nominal_value(v)
+            if self.mapper_code is not None:
+                vv = eval(self.mapper_code, {self.mapper_key: vv})
+            ctx[token.key] = vv
+
+            ts = token.teststr
+            for temp in token.interpolations:
+                ts = ts.replace(temp, str(obj.get_interpolated_value(temp)))
+
+            parts.append(ts)
+            if token.oper:
+                parts.append(token.oper)
+
+        teststr = " ".join(parts)
+        if not (teststr and ctx):
+            return teststr, ctx, None
+
+        return teststr, ctx, eval(self._get_code(teststr), GLOBALS, ctx)
+
+    def _get_code(self, teststr):
+        codes = self._codes
+        try:
+            return codes[teststr]
+        except KeyError:
+            if len(codes) >= MAX_CODES:
+                codes.clear()
+            code = codes[teststr] = compile_expression(teststr)
+            return code
+
+
+# ============= EOF =============================================
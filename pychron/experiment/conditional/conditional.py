@@ -29,6 +29,7 @@ from uncertainties import nominal_value, std_dev
 # ============= local library imports  ==========================
 from pychron.core.helpers.strtools import ps
 from pychron.core.yaml import yload
+from pychron.experiment.conditional.compiled import CompiledConditional
 from pychron.experiment.conditional.regexes import (
     MAPPER_KEY_REGEX,
     STD_REGEX,
@@ -42,6 +43,7 @@ from pychron.experiment.conditional.utilities import (
     extract_attr,
 )
 from pychron.experiment.utilities.conditionals import RUN, QUEUE, SYSTEM
+from pychron.globals import globalv
 from pychron.loggable import Loggable
 from pychron.paths import paths
 from pychron.pychron_constants import (
@@ -250,6 +252,11 @@ class AutomatedRunConditional(BaseConditional):
     _ctx = None
     value_context = None
 
+    # evaluate the teststr parsed once by CompiledConditional. False to tokenize and
+    # evaluate the teststr on every check
+    use_compiled = True
+    _compiled = None
+
     # def __init__(self, attr, teststr,
     # start_count=0,
     # frequency=1,
@@ -333,7 +340,65 @@ class AutomatedRunConditional(BaseConditional):
                 cnt_flag = b and c
                 return cnt_flag
 
+    def get_compiled(self):
+        c = self._compiled
+        if c is None:
+            c = self._compiled = CompiledConditional(
+                self.teststr, self.window, self.mapper
+            )
+        return c
+
+    def _teststr_changed(self):
+        self._compiled = None
+
+    def _window_changed(self):
+        self._compiled = None
+
+    def _mapper_changed(self):
+        self._compiled = None
+
     def _check(self, run, data, cnt, verbose=False):
+        if not self.use_compiled:
+            return self._check_interpreted(run, data, cnt, verbose)
+
+        teststr, ctx, result = self.get_compiled().evaluate(run, data)
+        self._teststr, self._ctx = teststr, ctx
+        self.value_context = None
+
+        # only format the context when the conditional trips or when debugging
+        if verbose or globalv.automated_run_debug:
+            self.value_context = pprint.pformat(ctx, width=1)
+            self.debug(
+                'Count: {} evaluate ot="{}" t="{}", ctx="{}"'.format(
+                    cnt, self.teststr, teststr, self.value_context
+                )
+            )
+
+        if result is None:
+            return
+
+        if result:
+            self.trips += 1
+            self.debug(
+                "condition {} is true trips={}/{}".format(
+                    teststr, self.trips, self.ntrips
+                )
+            )
+            if self.trips >= self.ntrips:
+                # ctx is reused by the next evaluation
+                self._ctx = ctx = dict(ctx)
+                self.value_context = pprint.pformat(ctx, width=1)
+                self.debug(
+                    'tripped ot="{}" ctx="{}"'.format(self.teststr, self.value_context)
+                )
+                self.tripped = True
+                self.message = "condition {} is True".format(teststr)
+                self.trips = 0
+                return True
+        else:
+            self.trips = 0
+
+    def _check_interpreted(self, run, data, cnt, verbose=False):
         """
         make a teststr and context from the run and data
         evaluate the teststr with the context
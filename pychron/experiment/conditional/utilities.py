@@ -97,9 +97,11 @@ def get_teststr_attr_func(token):
 
 # wrappers
 def wrapper(fstr, token, ai):
+    code = compile(fstr, "<conditional>", "eval")
+
     def func(obj, data, window):
         return eval(
-            fstr,
+            code,
             {
                 "attr": ai,
                 "aa": obj.isotope_group,
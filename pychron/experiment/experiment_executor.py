@@ -64,6 +64,7 @@ from pychron.envisage.preference_mixin import PreferenceMixin
 from pychron.envisage.view_util import open_view
 from pychron.experiment import events, PreExecuteCheckException
 from pychron.experiment.automated_run.persistence import ExcelPersister
+from pychron.experiment.automated_run.timeline import RunTimeline, NULL_TIMELINE
 from pychron.experiment.conditional.conditional import conditionals_from_file
 from pychron.experiment.conditional.conditionals_view import ConditionalsView
 from pychron.experiment.conflict_resolver import ConflictResolver
@@ -240,6 +241,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
     execute_open_queues = Bool(True)
     use_preceding_blank = Bool(True)
     save_all_runs = Bool(False)
+    use_run_timeline = Bool(False)
 
     # dvc
     use_dvc_persistence = Bool(False)
@@ -334,6 +336,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
             "use_preceding_blank",
             "execute_open_queues",
             "save_all_runs",
+            "use_run_timeline",
         )
         self._preference_binder(prefid, attrs)
 
@@ -540,6 +543,11 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         self.experiment_queue.automated_runs_scroll_to_row = 0
 
     def _wait_for_dvc_save(self, spec):
+        """
+        wait for the previous run to be written to the local repository.
+        when the dvc commit queue is enabled the commit and push happen in the background
+        and are not waited for
+        """
         if (
             self.use_dvc_overlap_save
             and self._save_complete_evt
@@ -675,6 +683,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         self.stats.experiment_queues = self.experiment_queues
         self.stats.active_queue = exp
         self.stats.reset()
+        self.stats.timeline_summary.clear()
         self.stats.start_timer()
 
         exp.start_timestamp = datetime.now()
@@ -960,6 +969,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         st = time.time()
 
         self.debug("do run")
+        run.timeline = timeline = (
+            RunTimeline() if self.use_run_timeline else NULL_TIMELINE
+        )
 
         self.stats.start_run(run)
 
@@ -1000,7 +1012,10 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 run.spec.state = FAILED
                 break
 
-            if not getattr(self, step)(run):
+            with timeline.span(step[1:]):
+                ok = getattr(self, step)(run)
+
+            if not ok:
                 self.warning("{} did not complete successfully".format(step[1:]))
                 if (
                     step != "_post_measurement"
@@ -1023,7 +1038,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 kw["exception_queue"] = self._exception_queue
                 kw["complete_event"] = self._save_complete_evt
 
-            run.save(**kw)
+            with timeline.span("save"):
+                run.save(**kw)
 
         self._save_complete_evt.set()
         self.run_completed = run
@@ -1032,7 +1048,10 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         # check to see if action should be taken
         if run.spec.state not in (CANCELED, FAILED):
-            if self._post_run_check(run):
+            with timeline.span("post_run_check"):
+                failed = self._post_run_check(run)
+
+            if failed:
                 self._err_message = "Post Run Check Failed"
                 self.warning("post run check failed")
             else:
@@ -1080,7 +1099,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         self._do_event(events.END_RUN, run=run, delay_after_run=delay_after_run)
 
         remove_root_handler(handler)
-        run.post_finish()
+        # the timeline is summarized once it is complete. with an overlapped save that is
+        # after the save thread finishes
+        run.post_finish(timeline_callback=self.stats.timeline_summary.add)
         self._set_thread_name(self.experiment_queue.name)
         self.experiment_queue.refresh_table_needed = True
 
@@ -1214,6 +1235,19 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         msg = "{} {}".format(n, msg)
         self._set_message(msg, c)
 
+        self._flush_dvc_commit_queue()
+
+    def _flush_dvc_commit_queue(self):
+        """
+        commit and push the analyses still waiting in the dvc commit queue
+        """
+        if self.use_dvc_persistence:
+            dvc = self.datahub.stores.get("dvc")
+            queue = getattr(dvc, "commit_queue", None)
+            if queue is not None:
+                self.debug("flush dvc commit queue. njobs={}".format(queue.njobs))
+                queue.flush(wait=False)
+
     def _show_conditionals(
         self, active_run=None, tripped=None, conditionals=None, kind="live"
     ):
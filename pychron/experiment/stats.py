@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from traits.api import Property, String, Float, Any, Int, List, Instance
 
 from pychron.core.helpers.timer import Timer
+from pychron.experiment.automated_run.timeline import TimelineSummary
 from pychron.experiment.duration_tracker import AutomatedRunDurationTracker
 from pychron.loggable import Loggable
 from pychron.pychron_constants import NULL_STR
@@ -112,6 +113,8 @@ class StatsGroup(Loggable):
     current_run_duration = String
     current_run_duration_f = Float
 
+    timeline_summary = Instance(TimelineSummary, ())
+
     _timer = Any
 
     elapsed = Property(depends_on="_elapsed")
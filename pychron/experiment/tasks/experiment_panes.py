@@ -552,7 +552,12 @@ class StatsPane(TraitsDockPane):
             Readonly("run_duration"),
             label="Selection",
         )
-        v = View(VGroup(gen_grp, cur_grp, sel_grp))
+        timeline_grp = BorderVGroup(
+            UItem("timeline_summary", style="custom"),
+            label="Run Timeline",
+            visible_when="timeline_summary.nruns",
+        )
+        v = View(VGroup(gen_grp, cur_grp, sel_grp, timeline_grp))
         return v
 
 
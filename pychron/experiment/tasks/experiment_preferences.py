@@ -26,6 +26,7 @@ from pychron.envisage.tasks.base_preferences_helper import (
     BaseConsolePreferences,
     BaseConsolePreferencesPane,
 )
+from pychron.experiment.automated_run.live_plot import LIVE_PLOT_MODES
 from pychron.pychron_constants import (
     QTEGRA_INTEGRATION_TIMES,
     XE,
@@ -106,8 +107,11 @@ class ExperimentPreferences(BasePreferencesHelper):
     ratio_change_detection_enabled = Bool(False)
     use_preceding_blank = Bool(False)
     plot_panel_update_period = PositiveInteger(1)
+    live_plot_mode = Enum(LIVE_PLOT_MODES)
+    live_plot_frame_rate = PositiveFloat(10)
     execute_open_queues = Bool
     save_all_runs = Bool
+    use_run_timeline = Bool
 
     use_data_collection_branch = Bool(False)
 
@@ -288,6 +292,12 @@ class ExperimentPreferencesPane(PreferencesPane):
                 label="Save All analyses",
                 tooltip="Save analysis even if run canceled or failed",
             ),
+            Item(
+                "use_run_timeline",
+                label="Save Run Timeline",
+                tooltip="Record how long each phase of a run takes and save the "
+                "timeline next to the analysis",
+            ),
             label="Persist",
             show_border=True,
         )
@@ -342,6 +352,18 @@ class ExperimentPreferencesPane(PreferencesPane):
                     label="Regression Update Period",
                     tooltip="update the isotope regression graph every N counts",
                 ),
+                Item(
+                    "live_plot_mode",
+                    label="Live Plot",
+                    tooltip="inline: plot each count on the measurement thread\n"
+                    "queued: plot on the GUI thread at the Live Plot Frame Rate\n"
+                    "off: do not plot while measuring",
+                ),
+                Item(
+                    "live_plot_frame_rate",
+                    label="Live Plot Frame Rate (1/s)",
+                    enabled_when='live_plot_mode=="queued"',
+                ),
                 pc_grp,
                 persist_grp,
                 monitor_grp,
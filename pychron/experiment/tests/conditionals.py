@@ -1,9 +1,15 @@
 from __future__ import absolute_import
+import os
+import tempfile
 import unittest
 
 from numpy import linspace
 
-from pychron.experiment.conditional.conditional import conditional_from_dict, tokenize
+from pychron.experiment.conditional.conditional import (
+    conditional_from_dict,
+    conditionals_from_file,
+    tokenize,
+)
 from pychron.processing.arar_age import ArArAge
 from pychron.processing.isotope import Isotope
 
@@ -37,6 +43,9 @@ class Arun(object):
     def get_device_value(self, dev_name):
         return 60
 
+    def get_interpolated_value(self, v):
+        return {"$max": 100, "$min": 1}.get(v, 0)
+
 
 class ParseConditionalsTestCase(unittest.TestCase):
     def setUp(self):
@@ -320,5 +329,134 @@ class ConditionalsTestCase(unittest.TestCase):
         self.assertEqual(ret, expected)
 
 
+# every conditional syntax supported by the conditionals files
+SYNTAXES = (
+    {"check": "device.pneumatics<80"},
+    {"check": "bone.ig.pressure<1e-7"},
+    {"check": "Ar40/Ar39>1"},
+    {"check": "Ar40/Ar39<1"},
+    {"check": "age>0.1 and age<100"},
+    {"check": "age>0.1 and between(Ar40,0,100)"},
+    {"check": "age>0.1 or Ar40<100"},
+    {"check": "age<0.1 or Ar40<100"},
+    {"check": "age>10 and age<100 or age<0"},
+    {"check": "age>0.1"},
+    {"check": "not age<0.1"},
+    {"check": "not Ar40>100"},
+    {"check": "between(Ar40,0,5)"},
+    {"check": "between(Ar40,0.0,5.0)"},
+    {"check": "between(Ar40.bs,0,1)"},
+    {"check": "between(min(Ar40),0,5)"},
+    {"check": "between(max(Ar40),200,205)"},
+    {"check": "not between(Ar40,0,5)"},
+    {"check": "slope(Ar40)>0.1"},
+    {"check": "not slope(Ar40)>0.1"},
+    {"check": "min(Ar40)>0"},
+    {"check": "min(Ar40)<170", "window": 10},
+    {"check": "max(Ar40)>0"},
+    {"check": "average(Ar40)>1"},
+    {"check": "average(Ar40)>182", "window": 10},
+    {"check": "Ar40.cur>1"},
+    {"check": "Ar40.bs==0.25"},
+    {"check": "Ar40.bs_corrected<10"},
+    {"check": "Ar40>900", "mapper": "x+1000"},
+    {"check": "Ar40>1", "window": 10},
+    {"check": "Ar40<$max"},
+    {"check": "Ar40>$min and age<$max"},
+    {"check": "CDD.inactive"},
+    {"check": "L2(CDD).inactive"},
+    {"check": "CDD.deflection==2000"},
+    {"check": "L2(CDD).deflection==2000"},
+    {"check": "instant_age>0"},
+    {"teststr": "Ar40>1", "ntrips": 2},
+    {"comp": "Ar39>1", "start": 10, "frequency": 5},
+)
+
+CONDITIONALS_FILE = """
+terminations:
+  - teststr: age>1000
+  - teststr: Ar40.bs_corrected<10 and slope(Ar40)>0.1
+    start: 5
+truncations:
+  - teststr: Ar40>10
+    abbreviated_count_ratio: 0.5
+  - teststr: not between(Ar40,0,5)
+actions:
+  - teststr: Ar40.inactive
+    action: sleep(1)
+    resume: True
+cancelations:
+  - check: max(Ar40)>1e9
+"""
+
+
+def clean_ctx(ctx):
+    # eval adds __builtins__ to the interpreted conditional's context
+    if ctx is not None:
+        return {k: v for k, v in ctx.items() if k != "__builtins__"}
+
+
+class CompiledConditionalsTestCase(unittest.TestCase):
+    """
+    the compiled conditionals give the same results as the interpreted conditionals
+    """
+
+    setUp = ConditionalsTestCase.setUp
+
+    def _pair(self, d, kind="TerminationConditional"):
+        compiled = conditional_from_dict(d, kind)
+        interpreted = conditional_from_dict(d, kind)
+        interpreted.use_compiled = False
+        return compiled, interpreted
+
+    def _assert_same(self, compiled, interpreted, data=([], []), counts=(1000,)):
+        for cnt in counts:
+            a = compiled.check(self.arun, data, cnt)
+            b = interpreted.check(self.arun, data, cnt)
+            msg = compiled.teststr
+            self.assertEqual(a, b, msg)
+            self.assertEqual(compiled._teststr, interpreted._teststr, msg)
+            self.assertEqual(clean_ctx(compiled._ctx), clean_ctx(interpreted._ctx), msg)
+            self.assertEqual(compiled.trips, interpreted.trips, msg)
+            self.assertEqual(compiled.message, interpreted.message, msg)
+
+    def test_syntaxes(self):
+        for d in SYNTAXES:
+            for data in (([], []), (["H1"], [10])):
+                compiled, interpreted = self._pair(d)
+                self._assert_same(compiled, interpreted, data, counts=(1000, 1005))
+
+    def test_ntrips(self):
+        compiled, interpreted = self._pair({"check": "Ar40>1", "ntrips": 3})
+        self._assert_same(compiled, interpreted, counts=range(100, 104))
+        self.assertTrue(compiled.tripped)
+
+    def test_changed(self):
+        compiled, interpreted = self._pair({"check": "Ar40>1"})
+        self._assert_same(compiled, interpreted)
+
+        for c in (compiled, interpreted):
+            c.teststr = "Ar40<1"
+        self._assert_same(compiled, interpreted)
+        self.assertIsNone(compiled.check(self.arun, ([], []), 1000))
+
+    def test_file(self):
+        fd, p = tempfile.mkstemp(suffix=".yaml")
+        with os.fdopen(fd, "w") as wfile:
+            wfile.write(CONDITIONALS_FILE)
+
+        try:
+            compiled = conditionals_from_file(p)
+            interpreted = conditionals_from_file(p)
+        finally:
+            os.remove(p)
+
+        self.assertEqual(len(compiled), 4)
+        for tag, cs in compiled.items():
+            for a, b in zip(cs, interpreted[tag]):
+                b.use_compiled = False
+                self._assert_same(a, b, counts=(1, 6, 1000))
+
+
 if __name__ == "__main__":
     unittest.main()
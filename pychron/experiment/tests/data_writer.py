@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.experiment.automated_run.persistence import AutomatedRunPersister
+
+
+class Detector(object):
+    def __init__(self, name, isotope):
+        self.name = name
+        self.isotope = isotope
+
+
+class DataWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.dets = [Detector("H1", "Ar40"), Detector("CDD", "Ar36")]
+
+        p = os.path.join(self.root, "run.hdf5")
+        per = AutomatedRunPersister(
+            data_writer_block_size=4, data_writer_flush_period=1000
+        )
+        per._current_data_frame = p
+        with per.data_manager.open_file(p, "w"):
+            pass
+
+        per.build_tables("signal", self.dets, 10)
+        self.persister = per
+        self.path = p
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _read(self, grp="signal"):
+        dm = self.persister.data_manager
+        with dm.open_file(self.path, "r"):
+            return {
+                d.name: dm.get_table(d.name, "/{}/{}".format(grp, d.isotope)).read()
+                for d in self.dets
+            }
+
+    def _write(self, writer, n, keys=("H1", "CDD")):
+        for i in range(n):
+            writer(self.dets, i, list(keys), [i * 10.0, i * 0.1][: len(keys)])
+
+    def test_block(self):
+        per = self.persister
+        writer = per.get_data_writer("signal")
+        with per.writer_ctx():
+            self._write(writer, 6)
+            # one block written, two cycles buffered
+            self.assertEqual(writer.nrows, 8)
+            self.assertEqual(writer.nflushes, 1)
+
+        # buffered rows written when the context exits
+        self.assertEqual(writer.nrows, 12)
+        self.assertIsNone(per._data_writers)
+
+        rows = self._read()
+        self.assertEqual(list(rows["H1"]["time"]), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(list(rows["H1"]["value"]), [0, 10, 20, 30, 40, 50])
+        self.assertEqual(len(rows["CDD"]), 6)
+
+    def test_missing_detector(self):
+        per = self.persister
+        writer = per.get_data_writer("signal")
+        with per.writer_ctx():
+            self._write(writer, 2, keys=("H1",))
+            self._write(writer, 1)
+            writer(
+                self.dets + [Detector("L2", "Ar38")], 3, ["H1", "CDD", "L2"], [1, 2, 3]
+            )
+
+        rows = self._read()
+        self.assertEqual(len(rows["H1"]), 4)
+        self.assertEqual(list(rows["CDD"]["time"]), [0, 3])
+
+    def test_canceled(self):
+        per = self.persister
+        writer = per.get_data_writer("signal")
+        try:
+            with per.writer_ctx():
+                self._write(writer, 3)
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertEqual(len(self._read()["H1"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
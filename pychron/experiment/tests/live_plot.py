@@ -0,0 +1,154 @@
+import unittest
+from types import SimpleNamespace
+
+from pychron.experiment.automated_run.data_collector import DataCollector
+from pychron.experiment.automated_run.live_plot import JitterMeter, LivePlotQueue
+from pychron.pychron_constants import SIGNAL, BASELINE
+
+
+class Graph(object):
+    def __init__(self, titles):
+        self.titles = titles
+        self.datums = []
+        self.fits = []
+
+    def get_plotid_by_ytitle(self, name):
+        if name in self.titles:
+            return self.titles.index(name)
+
+    def add_datums(self, datums, series=0, plotid=0, **kw):
+        self.datums.append((plotid, series, datums))
+
+    def set_fit(self, fit, plotid=0, series=0):
+        self.fits.append((plotid, series, fit))
+
+
+class IsotopeGroup(object):
+    def get_isotope_title(self, name, detector):
+        return name
+
+    def get_isotope(self, name=None, detector=None, kind=None):
+        fit = "average" if kind == "baseline" else "linear"
+        return SimpleNamespace(get_fit=lambda cnt: fit)
+
+
+class Collector(object):
+    _queue_plot_data = DataCollector._queue_plot_data
+    _plot_queued = DataCollector._plot_queued
+    _get_plotid = DataCollector._get_plotid
+    _get_plot_targets = DataCollector._get_plot_targets
+    _get_detector = DataCollector._get_detector
+
+    def __init__(self):
+        self.detectors = [SimpleNamespace(name="H1", isotope="Ar40", ypadding=0.1)]
+        self._detector_map = {d.name: d for d in self.detectors}
+        self.isotope_group = IsotopeGroup()
+        self.plot_panel = SimpleNamespace(
+            isotope_graph=Graph(["Ar40"]),
+            baseline_graph=Graph(["H1"]),
+            update=lambda: None,
+        )
+        self.collection_kind = SIGNAL
+        self.series_idx = 1
+        self.fit_series_idx = 2
+        self._plot_queue = LivePlotQueue(self._plot_queued, invoke=lambda f: f())
+
+    def critical(self, msg):
+        raise AssertionError(msg)
+
+
+class JitterMeterTestCase(unittest.TestCase):
+    def test_no_intervals(self):
+        j = JitterMeter(1)
+        j.tick(0)
+        r = j.report()
+        self.assertEqual(r["n"], 0)
+        self.assertEqual(r["jitter"], 0)
+
+    def test_report(self):
+        j = JitterMeter(1)
+        for t in (0, 1, 2.5, 3, 4):
+            j.tick(t)
+        j.add_plot_time(0.25)
+        j.add_plot_time(0.5)
+
+        r = j.report()
+        self.assertEqual(r["n"], 4)
+        self.assertAlmostEqual(r["mean_deviation"], 0.25)
+        self.assertAlmostEqual(r["jitter"], (0.5 / 4) ** 0.5)
+        self.assertAlmostEqual(r["max_deviation"], 0.5)
+        self.assertAlmostEqual(r["plot_time"], 0.75)
+
+
+class LivePlotQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.frames = []
+        self.invoked = []
+        self.queue = LivePlotQueue(self.frames.append, invoke=self.invoked.append)
+
+    def test_drain(self):
+        q = self.queue
+        for i in range(3):
+            q.push((i, i * 0.1))
+        self.assertEqual(len(q), 3)
+
+        q.drain()
+        self.assertEqual(len(q), 0)
+        self.assertEqual(len(self.frames), 1)
+        self.assertEqual([it[0] for it in self.frames[0]], [0, 1, 2])
+        self.assertEqual(q.nitems, 3)
+        self.assertEqual(q.nframes, 1)
+
+        # nothing to plot
+        q.drain()
+        self.assertEqual(len(self.frames), 1)
+
+    def test_request_frame(self):
+        q = self.queue
+        q._request_frame()
+        self.assertEqual(self.invoked, [])
+
+        q.push((0, 0))
+        q._request_frame()
+        q.push((1, 1))
+        # the previous frame has not been drawn yet
+        q._request_frame()
+        self.assertEqual(len(self.invoked), 1)
+
+        self.invoked.pop()()
+        self.assertEqual(len(self.frames[0]), 2)
+
+        q.push((2, 2))
+        q._request_frame()
+        self.assertEqual(len(self.invoked), 1)
+
+    def test_stop(self):
+        q = self.queue
+        q.push((0, 0))
+        q.stop()
+        self.assertEqual(len(self.invoked), 1)
+        self.invoked.pop()()
+        self.assertEqual(len(self.frames), 1)
+
+
+class QueuedPlotTestCase(unittest.TestCase):
+    def test_targets_captured(self):
+        c = Collector()
+        c._queue_plot_data(0, 1.0, ("H1",), (10,))
+
+        # the next block starts before the queue is drained
+        c.collection_kind = BASELINE
+        c.series_idx = 3
+        c.fit_series_idx = 4
+        c._queue_plot_data(1, 2.0, ("H1",), (0.1,))
+        c._plot_queue.drain()
+
+        panel = c.plot_panel
+        self.assertEqual(panel.isotope_graph.datums, [(0, 1, [(1.0, 10)])])
+        self.assertEqual(panel.isotope_graph.fits, [(0, 2, "linear")])
+        self.assertEqual(panel.baseline_graph.datums, [(0, 0, [(2.0, 0.1)])])
+        self.assertEqual(panel.baseline_graph.fits, [(0, 0, "average")])
+
+
+if __name__ == "__main__":
+    unittest.main()
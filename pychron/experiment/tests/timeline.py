@@ -0,0 +1,188 @@
+import json
+import os
+import tempfile
+import unittest
+from threading import Event, Lock, Thread
+
+from pychron.experiment.automated_run.automated_run import AutomatedRun
+from pychron.experiment.automated_run.timeline import (
+    RunTimeline,
+    NULL_TIMELINE,
+    NULL_SPAN,
+    TimelineSummary,
+)
+
+
+class RunTimelineTestCase(unittest.TestCase):
+    def test_disabled(self):
+        self.assertIs(NULL_TIMELINE.span("a"), NULL_SPAN)
+        with NULL_TIMELINE.span("a"):
+            pass
+        NULL_TIMELINE.add("a", 0, 1)
+        self.assertEqual(len(NULL_TIMELINE), 0)
+        self.assertEqual(NULL_TIMELINE.spans(), [])
+
+    def test_span(self):
+        tl = RunTimeline()
+        with tl.span("a"):
+            pass
+        with tl.span("b"):
+            pass
+
+        spans = tl.spans()
+        self.assertEqual([s[0] for s in spans], ["a", "b"])
+        self.assertTrue(all(s[2] >= 0 for s in spans))
+        self.assertLessEqual(spans[0][1], spans[1][1])
+
+    def test_ring_buffer(self):
+        tl = RunTimeline(capacity=4)
+        for i in range(10):
+            tl.add("p{}".format(i), tl.t0 + i, i)
+
+        self.assertEqual(len(tl), 4)
+        self.assertEqual(tl.dropped, 6)
+        self.assertEqual(tl.spans(), [("p{}".format(i), i, i) for i in range(6, 10)])
+
+    def test_durations(self):
+        tl = RunTimeline()
+        for i in range(3):
+            tl.add("a", tl.t0, i)
+        tl.add("b", tl.t0, 5)
+        self.assertEqual(tl.durations(), {"a": [0, 1, 2], "b": [5]})
+
+    def test_dump(self):
+        tl = RunTimeline()
+        tl.add("a", tl.t0 + 1, 0.5)
+        tl.add("b", tl.t0 + 2, 0.25)
+        tl.add("a", tl.t0 + 3, 0.125)
+
+        fd, p = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            tl.dump(p, runid="1000-01A")
+            with open(p, "r") as rfile:
+                d = json.load(rfile)
+        finally:
+            os.remove(p)
+
+        self.assertEqual(d["runid"], "1000-01A")
+        self.assertEqual(d["dropped"], 0)
+        self.assertEqual(d["phases"], ["a", "b"])
+        self.assertEqual(
+            d["spans"],
+            [[0, 1000000, 500000], [1, 2000000, 250000], [0, 3000000, 125000]],
+        )
+
+
+class TimelineSummaryTestCase(unittest.TestCase):
+    def test_add(self):
+        s = TimelineSummary()
+        s.add(NULL_TIMELINE)
+        self.assertEqual(s.nruns, 0)
+
+        for _ in range(2):
+            tl = RunTimeline()
+            for i in range(1, 51):
+                tl.add("a", tl.t0, i)
+            tl.add("b", tl.t0, 5000)
+            s.add(tl)
+
+        self.assertEqual(s.nruns, 2)
+        # sorted by total duration
+        self.assertEqual([p.name for p in s.phases], ["b", "a"])
+
+        r = s.report()
+        a = r["a"]
+        self.assertEqual(a["n"], 100)
+        self.assertEqual(a["total"], 2 * sum(range(1, 51)))
+        self.assertAlmostEqual(a["p50"], 25.5)
+        self.assertAlmostEqual(a["p95"], 48)
+        self.assertAlmostEqual(a["p99"], 50)
+        self.assertEqual(a["max"], 50)
+        self.assertEqual(r["b"]["p99"], 5000)
+
+        s.clear()
+        self.assertEqual(s.nruns, 0)
+        self.assertEqual(s.phases, [])
+
+
+class Run(object):
+    post_finish = AutomatedRun.post_finish
+    _overlapped_save = AutomatedRun._overlapped_save
+    _finish_timeline = AutomatedRun._finish_timeline
+
+    use_dvc_persistence = False
+    _save_thread = None
+    _deferred_timeline = None
+    _timeline_lock = None
+
+    def __init__(self):
+        self.timeline = RunTimeline()
+        self.saved = []
+        self.release = Event()
+
+    def debug(self, msg):
+        pass
+
+    def _persister_save_action(self, func, **kw):
+        self.release.wait(5)
+        with self.timeline.span("{}_dvc".format(func)):
+            pass
+
+    def _save_timeline(self):
+        self.saved.append([phase for phase, _, _ in self.timeline.spans()])
+
+    def save(self):
+        self._timeline_lock = Lock()
+        t = self._save_thread = Thread(target=self._overlapped_save)
+        t.start()
+        return t
+
+
+class OverlappedSaveTimelineTestCase(unittest.TestCase):
+    def test_no_save_thread(self):
+        run = Run()
+        summarized = []
+        run.post_finish(timeline_callback=summarized.append)
+        self.assertEqual(run.saved, [[]])
+        self.assertEqual(summarized, [run.timeline])
+
+    def test_deferred(self):
+        run = Run()
+        summarized = []
+        t = run.save()
+        run.post_finish(timeline_callback=summarized.append)
+        self.assertEqual(run.saved, [])
+        self.assertEqual(summarized, [])
+
+        run.release.set()
+        t.join()
+        self.assertEqual(run.saved, [["post_measurement_save_dvc"]])
+        self.assertEqual(summarized, [run.timeline])
+
+    def test_save_finished_first(self):
+        run = Run()
+        run.release.set()
+        run.save().join()
+        run.post_finish()
+        self.assertEqual(run.saved, [["post_measurement_save_dvc"]])
+
+    def test_concurrent_add(self):
+        tl = RunTimeline(capacity=10000)
+
+        def add():
+            for i in range(2000):
+                tl.add("a", tl.t0, i)
+
+        ts = [Thread(target=add) for _ in range(4)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+
+        self.assertEqual(tl.n, 8000)
+        self.assertEqual(len(tl.spans()), 8000)
+
+
+if __name__ == "__main__":
+    unittest.main()
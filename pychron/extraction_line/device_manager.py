@@ -13,10 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ===============================================================================
-from threading import Thread
-import time
+from pychron.hardware.core.scan_scheduler import get_scan_scheduler
 from pychron.managers.manager import Manager
-from traits.api import Float, Bool
+from traits.api import Float, Bool, List
 from traitsui.api import View, UItem, Item, ListEditor, InstanceEditor
 
 
@@ -26,7 +25,7 @@ class DeviceManager(Manager):
     device_view_name = "device_view"
     update_enabled = Bool
 
-    _thread = None
+    _tasks = List
 
     def finish_loading(self, *args, **kw):
         super().finish_loading(*args, **kw)
@@ -35,31 +34,45 @@ class DeviceManager(Manager):
 
     def start_scans(self):
         if self.update_enabled:
-            self._thread = Thread(target=self._scan)
-            self._thread.start()
+            self.stop_scans()
+            self.is_alive = True
+            scheduler = get_scan_scheduler()
+            for h in self.devices:
+                if h.is_scanable:
+                    # update the device every scan period but not more often than the
+                    # manager's period
+                    period = h.scan_period * h.time_dict[h.scan_units] / 1000.0
+                    self._tasks.append(
+                        scheduler.add(
+                            h.name,
+                            self._make_scan(h),
+                            max(period, self.period),
+                            group=h.get_scan_group(),
+                        )
+                    )
         else:
             self.warning(
                 "Not starting device updates. Updates disabled. enable in Preferences/ExtractionLine"
             )
 
-    def _scan(self):
-        self.is_alive = True
-        if self.devices:
-            while self.is_alive:
-                for h in self.devices:
-                    if h.is_scanable and h.should_update():
-                        if hasattr(h, "scan_func"):
-                            func = h.scan_func
-                        else:
-                            func = "update"
-                        if isinstance(func, str):
-                            func = getattr(h, func)
-                        with h.lock_scan():
-                            func()
-                time.sleep(self.period)
+    def _make_scan(self, h):
+        def scan():
+            if hasattr(h, "scan_func"):
+                func = h.scan_func
+            else:
+                func = "update"
+            if isinstance(func, str):
+                func = getattr(h, func)
+            with h.lock_scan():
+                func()
+
+        return scan
 
     def stop_scans(self):
         self.is_alive = False
+        for t in self._tasks:
+            t.stop()
+        self._tasks = []
 
     def traits_view(self):
         if self.devices:
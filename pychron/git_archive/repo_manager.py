@@ -22,6 +22,7 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from threading import Lock, RLock
 
 import git
 from git import Repo
@@ -49,6 +50,23 @@ def get_repository_branch(path):
     return b.name
 
 
+_repository_locks = {}
+_repository_locks_lock = Lock()
+
+
+def get_repository_lock(path):
+    """
+    return the lock shared by everything that runs git operations on the repository at path
+    """
+    key = os.path.normcase(os.path.realpath(path))
+    with _repository_locks_lock:
+        try:
+            lock = _repository_locks[key]
+        except KeyError:
+            lock = _repository_locks[key] = RLock()
+        return lock
+
+
 def grep(arg, name):
     process = subprocess.Popen(["grep", "-lr", arg, name], stdout=subprocess.PIPE)
     stdout, stderr = process.communicate()
@@ -108,6 +126,10 @@ class GitRepoManager(Loggable):
     def set_name(self, p):
         self.name = "{}<GitRepo>".format(os.path.basename(p))
 
+    @property
+    def lock(self):
+        return get_repository_lock(self.path)
+
     def open_repo(self, name, root=None):
         """
         name: name of repo
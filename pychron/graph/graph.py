@@ -32,14 +32,15 @@ from chaco.array_data_source import ArrayDataSource
 from chaco.axis import PlotAxis
 from enable.component_editor import ComponentEditor
 from enable.container import Container
-from numpy import array, hstack, Inf, column_stack
+from numpy import array, Inf, column_stack
 from pyface.timer.api import do_after as do_after_timer
-from traits.api import Instance, List, Str, Property, Dict, Event, Bool
+from traits.api import Instance, List, Str, Property, Dict, Event, Bool, Int
 from traitsui.api import View, Item, UItem
 
 from pychron.core.helpers.color_generators import colorname_generator as color_generator
 from pychron.core.helpers.filetools import add_extension
 from pychron.graph.context_menu_mixin import ContextMenuMixin
+from pychron.graph.live_data import LiveSeries, DataSourceAdapter
 from pychron.graph.ml_label import MPlotAxis
 from pychron.graph.offset_plot_label import OffsetPlotLabel
 from pychron.graph.tools.axis_tool import AxisTool
@@ -196,6 +197,12 @@ class Graph(ContextMenuMixin):
     data_len = List
     data_limits = List
 
+    # maximum number of min/max bins displayed for a series updated with add_datum.
+    # 0 displays every point. get_data and export_data return the full resolution data
+    live_decimation = Int(0)
+    # (plotid, names): LiveSeries
+    _live_series = Dict
+
     def __init__(self, *args, **kw):
         """ """
         super(Graph, self).__init__(*args, **kw)
@@ -257,8 +264,7 @@ class Graph(ContextMenuMixin):
         else:
             s = self.series[plotid][series][axis]
 
-        p = self.plots[plotid]
-        return p.data.get_data(s)
+        return self._get_full_resolution_data(plotid, s)
 
     def get_aux_data(self, plotid=0, series=1):
         plot = self.plots[plotid]
@@ -346,6 +352,7 @@ class Graph(ContextMenuMixin):
         self.series = [[] for _ in x]
         self.data_len = [[] for _ in x]
         self.data_limits = [[] for _ in x]
+        self._live_series = {}
 
         for pi in self.plots:
             for k, pp in list(pi.plots.items()):
@@ -374,6 +381,7 @@ class Graph(ContextMenuMixin):
         self.series = []
         self.data_len = []
         self.data_limits = []
+        self._live_series = {}
 
         if clear_container:
             self.plotcontainer = pc = self.container_factory()
@@ -811,11 +819,10 @@ class Graph(ContextMenuMixin):
 
         si = plot.plots["aux{:03d}".format(series)][0]
 
-        oi = si.index.get_data()
-        ov = si.value.get_data()
-
-        si.index.set_data(hstack((oi, [datum[0]])))
-        si.value.set_data(hstack((ov, [datum[1]])))
+        data = DataSourceAdapter(si)
+        ls = self._get_live_series(("aux", plotid, series), ("index", "value"), data)
+        ls.add(datum)
+        ls.update_plot_data(data)
 
         # if do_after:
         #     do_after_timer(do_after, add)
@@ -838,17 +845,14 @@ class Graph(ContextMenuMixin):
         except IndexError:
             print("adding data", plotid, series, self.series[plotid])
 
-        plot = self.plots[plotid]
-        data = plot.data
-        for n, ds in ((names[0], xs), (names[1], ys)):
-            xx = data.get_data(n)
-            xx = hstack((xx, ds))
-            data.set_data(n, xx)
+        data = self.plots[plotid].data
+        ls = self._get_live_series((plotid, names), names, data)
+        ls.extend((xs, ys))
+        ls.update_plot_data(data)
 
         if update_y_limits:
-            ys = data[names[1]]
-            mi = ys.min()
-            ma = ys.max()
+            mi = ls.y.min
+            ma = ls.y.max
             if isinstance(ypadding, str):
                 ypad = max(0.1, abs(mi - ma)) * float(ypadding)
             else:
@@ -877,33 +881,49 @@ class Graph(ContextMenuMixin):
             print("adding datum", plotid, series, self.series[plotid])
             return
 
-        plot = self.plots[plotid]
-
         if not hasattr(datum, "__iter__"):
             datum = (datum,)
 
-        data = plot.data
-        mi, ma = -Inf, Inf
-        for i, (name, di) in enumerate(zip(names, datum)):
-            d = data.get_data(name)
-            nd = hstack((d, di))
-            data.set_data(name, nd)
-
-            if i == 1:
-                # y values
-                mi = min(nd)
-                ma = max(nd)
+        data = self.plots[plotid].data
+        ls = self._get_live_series((plotid, names), names, data)
+        ls.add(datum)
+        ls.update_plot_data(data)
 
         if update_y_limits:
-            if isinstance(ypadding, str):
-                ypad = abs(ma - mi) * float(ypadding)
-            else:
-                ypad = ypadding
-            mi -= ypad
-            if ymin_anchor is not None:
-                mi = max(ymin_anchor, mi)
+            self._update_live_y_limits(ls, len(datum), plotid, ypadding, ymin_anchor)
 
-            self.set_y_limits(min_=mi, max_=ma + ypad, plotid=plotid)
+    def add_datums(
+        self,
+        datums,
+        plotid=0,
+        series=0,
+        update_y_limits=False,
+        ypadding=10,
+        ymin_anchor=None,
+    ):
+        """
+        add several points to a series. same as add_datum for each point but the plot data
+        and limits are only set once
+        """
+        if not datums:
+            return
+
+        try:
+            names = self.series[plotid][series]
+        except (IndexError, TypeError):
+            print("adding datums", plotid, series, self.series[plotid])
+            return
+
+        data = self.plots[plotid].data
+        ls = self._get_live_series((plotid, names), names, data)
+        for datum in datums:
+            ls.add(datum)
+        ls.update_plot_data(data)
+
+        if update_y_limits:
+            self._update_live_y_limits(
+                ls, len(datums[0]), plotid, ypadding, ymin_anchor
+            )
 
     def add_range_selector(self, plotid=0, series=0):
         from chaco.tools.range_selection import RangeSelection
@@ -1040,12 +1060,20 @@ class Graph(ContextMenuMixin):
             def write(l):
                 wfile.write("{}\n".format(l))
 
-            for plot in self.plots:
+            for i, plot in enumerate(self.plots):
                 line = plot.y_axis.title
                 write(line)
+                names = {id(v): k for k, v in plot.datasources.items()}
                 for k, pp in plot.plots.items():
                     pp = pp[0]
-                    a = column_stack((pp.index.get_data(), pp.value.get_data()))
+                    a = column_stack(
+                        [
+                            self._get_full_resolution_data(
+                                i, names.get(id(ds)), ds.get_data()
+                            )
+                            for ds in (pp.index, pp.value)
+                        ]
+                    )
 
                     e = getattr(pp, "yerror", None)
 
@@ -1062,6 +1090,47 @@ class Graph(ContextMenuMixin):
                     for row in a:
                         write(",".join(["{:0.8f}".format(r) for r in row]))
 
+    def _get_live_series(self, key, names, data, max_size=None):
+        """
+        return the LiveSeries for key. a new series is made from the current data if the
+        data was set by something other than the LiveSeries
+        """
+        ls = self._live_series.get(key)
+        if ls is None or ls.max_size != max_size or not ls.is_current(data):
+            ls = LiveSeries(
+                names, data, max_size=max_size, decimation=self.live_decimation
+            )
+            self._live_series[key] = ls
+        return ls
+
+    def _update_live_y_limits(self, ls, ndim, plotid, ypadding, ymin_anchor):
+        mi, ma = -Inf, Inf
+        if ndim > 1:
+            # y values
+            mi = ls.y.min
+            ma = ls.y.max
+
+        if isinstance(ypadding, str):
+            ypad = abs(ma - mi) * float(ypadding)
+        else:
+            ypad = ypadding
+        mi -= ypad
+        if ymin_anchor is not None:
+            mi = max(ymin_anchor, mi)
+
+        self.set_y_limits(min_=mi, max_=ma + ypad, plotid=plotid)
+
+    def _get_full_resolution_data(self, plotid, name, default=None):
+        data = self.plots[plotid].data
+        if self.live_decimation:
+            for key, ls in self._live_series.items():
+                if key[0] == plotid and name in ls.names and ls.is_current(data):
+                    return ls.get_data(name)
+
+        if default is None:
+            default = data.get_data(name)
+        return default
+
     def _series_factory(self, x, y, yer=None, plotid=0, add=True, **kw):
         """ """
 
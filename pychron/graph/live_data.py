@@ -0,0 +1,210 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import arange, unique, concatenate, Inf
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.growable_buffer import GrowableBuffer
+
+
+class MinMaxDecimator(object):
+    """
+    incremental min/max decimation of a series with increasing x.
+
+    the raw points are grouped into bins of binsize points. each complete bin is shown as
+    its minimum and maximum points so peaks are not lost. the points of the incomplete
+    bin are shown the same way and replaced as points are added. when the number of bins
+    exceeds 2 * nbins the binsize is doubled and the bins are recomputed from the raw
+    data, which is O(n) but happens each time the data doubles
+    """
+
+    def __init__(self, nbins):
+        self.nbins = max(1, nbins)
+        self.binsize = 1
+        self.x = GrowableBuffer()
+        self.y = GrowableBuffer()
+        self._ncomplete = 0
+        self._nprovisional = 0
+        self._reset_bin()
+
+    def add(self, xs, ys):
+        """
+        add the last point of the raw series xs, ys
+        """
+        self._add_to_bin(len(ys) - 1, xs.data[-1], ys.data[-1])
+
+        self.x.truncate(len(self.x) - self._nprovisional)
+        self.y.truncate(len(self.y) - self._nprovisional)
+        self._nprovisional = self._emit_bin()
+
+        if self._bin_n == self.binsize:
+            self._ncomplete += 1
+            self._nprovisional = 0
+            self._reset_bin()
+
+            if self._ncomplete >= 2 * self.nbins:
+                self.binsize *= 2
+                self.rebuild(xs, ys)
+
+    def rebuild(self, xs, ys):
+        xd, yd = xs.data, ys.data
+        while len(yd) // self.binsize >= 2 * self.nbins:
+            self.binsize *= 2
+
+        b = self.binsize
+        m = len(yd) // b
+        self.x.clear()
+        self.y.clear()
+        if m:
+            yy = yd[: m * b].reshape(m, b)
+            base = arange(m) * b
+            imin = base + yy.argmin(axis=1)
+            imax = base + yy.argmax(axis=1)
+            idx = unique(concatenate((imin, imax)))
+            self.x.extend(xd[idx])
+            self.y.extend(yd[idx])
+
+        self._ncomplete = m
+        self._nprovisional = 0
+        self._reset_bin()
+        for i in range(m * b, len(yd)):
+            self._add_to_bin(i, xd[i], yd[i])
+
+        if self._bin_n:
+            self._nprovisional = self._emit_bin()
+
+    # private
+    def _reset_bin(self):
+        self._bin_n = 0
+        # (index, x, y)
+        self._bin_min = (None, None, Inf)
+        self._bin_max = (None, None, -Inf)
+
+    def _add_to_bin(self, i, x, y):
+        if not self._bin_n:
+            self._bin_min = self._bin_max = (i, x, y)
+        elif y < self._bin_min[2]:
+            self._bin_min = (i, x, y)
+        elif y > self._bin_max[2]:
+            self._bin_max = (i, x, y)
+        self._bin_n += 1
+
+    def _emit_bin(self):
+        a, b = self._bin_min, self._bin_max
+        if a[0] == b[0]:
+            pts = (a,)
+        elif a[0] < b[0]:
+            pts = (a, b)
+        else:
+            pts = (b, a)
+
+        for _, x, y in pts:
+            self.x.append(x)
+            self.y.append(y)
+        return len(pts)
+
+
+class DataSourceAdapter(object):
+    """
+    ArrayPlotData like access to the index and value data sources of a renderer
+    """
+
+    def __init__(self, renderer):
+        self._sources = {"index": renderer.index, "value": renderer.value}
+
+    def get_data(self, name):
+        return self._sources[name].get_data()
+
+    def set_data(self, name, v):
+        self._sources[name].set_data(v)
+
+
+class LiveSeries(object):
+    """
+    the full resolution data of a series that is updated one point at a time.
+
+    names are the ArrayPlotData names of the series, e.g. (x, y) or (x, y, yer).
+    displayed holds the arrays last set on the plot data. if the plot data was replaced by
+    somebody else the series is out of date and rebuilt from the plot data
+    """
+
+    def __init__(self, names, data=None, max_size=None, decimation=0):
+        self.names = names
+        self.max_size = max_size
+        self.decimation = decimation
+        self.buffers = [
+            GrowableBuffer(data.get_data(n) if data else None, max_size=max_size)
+            for n in names
+        ]
+        self.decimator = None
+        if decimation and not max_size and len(names) > 1:
+            self.decimator = MinMaxDecimator(decimation)
+            self.decimator.rebuild(*self.buffers[:2])
+
+        self.displayed = None
+
+    @property
+    def x(self):
+        return self.buffers[0]
+
+    @property
+    def y(self):
+        return self.buffers[1]
+
+    def is_current(self, data):
+        d = self.displayed
+        if d is None:
+            return False
+
+        return all(data.get_data(n) is di for n, di in zip(self.names, d))
+
+    def add(self, datum):
+        for b, v in zip(self.buffers, datum):
+            b.append(v)
+
+        if self.decimator:
+            self.decimator.add(*self.buffers[:2])
+
+    def extend(self, data):
+        for b, vs in zip(self.buffers, data):
+            b.extend(vs)
+
+        if self.decimator:
+            self.decimator.rebuild(*self.buffers[:2])
+
+    def update_plot_data(self, data):
+        """
+        set the data to display on the plot
+        """
+        dec = self.decimator
+        if dec and len(self.x) > 2 * dec.nbins:
+            # the error bars of a decimated series are not shown
+            arrays = [dec.x.data, dec.y.data]
+            arrays.extend([] for _ in self.names[2:])
+        else:
+            arrays = [b.data for b in self.buffers]
+
+        for n, a in zip(self.names, arrays):
+            data.set_data(n, a)
+        self.displayed = [data.get_data(n) for n in self.names]
+
+    def get_data(self, name):
+        return self.buffers[self.names.index(name)].data
+
+
+# ============= EOF =============================================
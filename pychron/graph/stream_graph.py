@@ -26,7 +26,7 @@ set_qt()
 from pyface.timer.api import do_after as do_after_timer
 
 # =============standard library imports ========================
-from numpy import hstack, Inf
+from numpy import Inf
 import time
 
 # =============local library imports  ==========================
@@ -125,8 +125,8 @@ class StreamGraph(Graph):
         for _k, v in self.plots[plotid].plots.items():
             ds = v[0].value.get_data()
             try:
-                ma = max(ma, max(ds))
-                mi = min(mi, min(ds))
+                ma = max(ma, ds.max())
+                mi = min(mi, ds.min())
             except ValueError:
                 return
 
@@ -167,12 +167,7 @@ class StreamGraph(Graph):
         self.set_x_limits(max_=ma, min_=mi, plotid=plotid)
 
     def record(self, y, x=None, series=0, plotid=0, track_x=True, track_y=True):
-        xn, yn = self.series[plotid][series]
-
-        plot = self.plots[plotid]
-
-        xd = plot.data.get_data(xn)
-        yd = plot.data.get_data(yn)
+        names = self.series[plotid][series]
         if x is None:
             try:
                 tg = self.time_generators[plotid]
@@ -202,16 +197,17 @@ class StreamGraph(Graph):
                 mi = self.cur_min[plotid]
 
             self.set_y_limits(max_=ma, min_=mi, pad="0.1", plotid=plotid)
-        lim = int(-dl)
 
-        new_xd = hstack((xd[lim:], [nx]))
-        new_yd = hstack((yd[lim:], [float(y)]))
+        # keep the last data limit points and the new point
+        max_size = int(dl) + 1 if int(dl) else None
 
-        plot.data.set_data(xn, new_xd)
-        plot.data.set_data(yn, new_yd)
+        data = self.plots[plotid].data
+        ls = self._get_live_series((plotid, names), names, data, max_size=max_size)
+        ls.add((nx, float(y)))
+        ls.update_plot_data(data)
 
-        self.cur_max[plotid] = max(self.cur_max[plotid], max(new_yd))
-        self.cur_min[plotid] = min(self.cur_min[plotid], min(new_yd))
+        self.cur_max[plotid] = max(self.cur_max[plotid], ls.y.max)
+        self.cur_min[plotid] = min(self.cur_min[plotid], ls.y.min)
         return nx
 
     def record_multiple(self, ys, plotid=0, series=None, track_y=True):
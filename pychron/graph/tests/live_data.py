@@ -0,0 +1,115 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from numpy import sin
+
+from pychron.core.helpers.growable_buffer import GrowableBuffer
+from pychron.graph.graph import Graph
+from pychron.graph.live_data import MinMaxDecimator
+from pychron.graph.stream_graph import StreamGraph
+
+
+class MinMaxDecimatorTestCase(unittest.TestCase):
+    def _check(self, xs, ys, d):
+        self.assertLessEqual(len(d.y), 4 * d.nbins + 2)
+        self.assertEqual(d.y.data.min(), ys.data.min())
+        self.assertEqual(d.y.data.max(), ys.data.max())
+        # x increasing
+        self.assertTrue((d.x.data[1:] > d.x.data[:-1]).all())
+        # decimated points are raw points
+        idx = d.x.data.astype(int)
+        self.assertTrue((ys.data[idx] == d.y.data).all())
+
+    def test_incremental(self):
+        xs, ys = GrowableBuffer(), GrowableBuffer()
+        d = MinMaxDecimator(20)
+        for i in range(1500):
+            xs.append(i)
+            ys.append(sin(i / 30.0) + random.random() * 0.1)
+            d.add(xs, ys)
+            self._check(xs, ys, d)
+
+        self.assertGreater(d.binsize, 1)
+
+    def test_rebuild(self):
+        xs, ys = GrowableBuffer(), GrowableBuffer()
+        d = MinMaxDecimator(20)
+        for i in range(777):
+            xs.append(i)
+            ys.append(random.random())
+            d.add(xs, ys)
+
+        r = MinMaxDecimator(20)
+        r.rebuild(xs, ys)
+        self.assertEqual(r.binsize, d.binsize)
+        self.assertEqual(list(r.x.data), list(d.x.data))
+        self.assertEqual(list(r.y.data), list(d.y.data))
+
+
+class GraphLiveDataTestCase(unittest.TestCase):
+    def test_add_datum(self):
+        g = Graph()
+        g.new_plot()
+        g.new_series()
+        xs = []
+        ys = []
+        for i in range(500):
+            y = random.random()
+            xs.append(i)
+            ys.append(y)
+            g.add_datum((i, y), update_y_limits=True, ypadding=0)
+
+        self.assertEqual(list(g.get_data()), xs)
+        self.assertEqual(list(g.get_data(axis=1)), ys)
+        r = g.plots[0].value_range
+        self.assertEqual(r.low_setting, min(ys))
+        self.assertEqual(r.high_setting, max(ys))
+
+    def test_set_data(self):
+        g = Graph()
+        g.new_plot()
+        g.new_series()
+        g.add_datum((0, 1))
+        g.set_data([5, 6])
+        g.set_data([7, 8], axis=1)
+        g.add_datum((7, 9))
+        self.assertEqual(list(g.get_data()), [5, 6, 7])
+        self.assertEqual(list(g.get_data(axis=1)), [7, 8, 9])
+
+    def test_decimation(self):
+        g = Graph(live_decimation=10)
+        g.new_plot()
+        g.new_series()
+        for i in range(1000):
+            g.add_datum((i, random.random()))
+
+        self.assertLessEqual(len(g.plots[0].data.get_data("y0")), 42)
+        self.assertEqual(len(g.get_data()), 1000)
+
+        root = tempfile.mkdtemp()
+        try:
+            p = os.path.join(root, "export.csv")
+            g.export_data(p)
+            with open(p, "r") as rfile:
+                # title, series name, header
+                self.assertEqual(len(rfile.readlines()), 1003)
+        finally:
+            shutil.rmtree(root)
+
+    def test_record(self):
+        g = StreamGraph()
+        g.new_plot(data_limit=10)
+        g.new_series()
+        ys = [random.random() for _ in range(100)]
+        for i, y in enumerate(ys):
+            g.record(y, x=i)
+
+        self.assertEqual(list(g.get_data(axis=1)), ys[-11:])
+        self.assertEqual(g.cur_max[0], max(ys))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,11 @@ from pychron.hardware.core.communicators.communicator import (
     Communicator,
     process_response,
 )
+from pychron.hardware.core.communicators.ethernet_pool import (
+    get_endpoint,
+    LatencyHistogram,
+    PooledRequest,
+)
 from pychron.regex import IPREGEX
 
 
@@ -251,6 +256,12 @@ class EthernetCommunicator(Communicator):
     default_timeout = 3
     default_datasize = 2**12
 
+    # send TCP requests through a shared persistent connection. see EthernetEndpoint
+    use_pool = False
+    pipeline = False
+    endpoint = None
+    latency = None
+
     _comms_report_attrs = (
         "host",
         "port",
@@ -258,6 +269,8 @@ class EthernetCommunicator(Communicator):
         "kind",
         "timeout",
         "default_datasize",
+        "use_pool",
+        "pipeline",
     )
 
     @property
@@ -331,13 +344,29 @@ class EthernetCommunicator(Communicator):
             optional=True,
             default=2**12,
         )
+        self.use_pool = self.config_get(
+            config,
+            "Communications",
+            "pooled",
+            cast="boolean",
+            optional=True,
+            default=False,
+        )
+        self.pipeline = self.config_get(
+            config,
+            "Communications",
+            "pipeline",
+            cast="boolean",
+            optional=True,
+            default=False,
+        )
         if self.kind is None:
             self.kind = "UDP"
 
         return True
 
     def open(self, *args, **kw):
-        for k in ("host", "port", "message_frame", "kind"):
+        for k in ("host", "port", "message_frame", "kind", "use_pool", "pipeline"):
             if k in kw:
                 setattr(self, k, kw[k])
 
@@ -418,6 +447,33 @@ class EthernetCommunicator(Communicator):
             self.error_mode = True
             self.handler = None
 
+    @property
+    def pooled(self):
+        return self.use_pool and not self.read_port and self.kind.lower() == "tcp"
+
+    def get_endpoint(self):
+        if self.endpoint is None:
+            self.endpoint = get_endpoint(
+                self.host,
+                self.port,
+                read_terminator=self.read_terminator or "",
+                message_frame=self.message_frame or "",
+                connect_timeout=self.timeout or 1,
+                pipeline=self.pipeline,
+                strip=self.strip,
+                datasize=self.default_datasize,
+            )
+            self.latency = LatencyHistogram()
+        return self.endpoint
+
+    def latency_report(self):
+        """
+        return the round trip time statistics of the requests sent by this communicator.
+        only available if pooled
+        """
+        if self.latency:
+            return self.latency.report()
+
     def ask(
         self,
         cmd,
@@ -451,6 +507,18 @@ class EthernetCommunicator(Communicator):
 
         cmd = "{}{}".format(cmd, self.write_terminator)
 
+        if self.pooled:
+            return self._pooled_ask(
+                cmd,
+                retries,
+                verbose,
+                quiet,
+                info,
+                timeout,
+                message_frame,
+                delay,
+            )
+
         r = None
         with self._lock:
             if use_error_mode and self.error_mode:
@@ -531,6 +599,14 @@ class EthernetCommunicator(Communicator):
             return ""
 
     def tell(self, cmd, verbose=True, quiet=False, info=None):
+        if self.pooled:
+            cmd = "{}{}".format(cmd, self.write_terminator)
+            ep = self.get_endpoint()
+            ep.wait(ep.submit(PooledRequest(cmd, read=False)))
+            if verbose or self.verbose and not quiet:
+                self.log_tell(cmd, info)
+            return
+
         with self._lock:
             handler = self.get_handler()
             if handler:
@@ -544,6 +620,37 @@ class EthernetCommunicator(Communicator):
                     self.error_mode = True
 
     # private
+    def _pooled_ask(
+        self, cmd, retries, verbose, quiet, info, timeout, message_frame, delay
+    ):
+        if timeout is None:
+            timeout = self.default_timeout
+
+        ep = self.get_endpoint()
+        req = PooledRequest(
+            cmd,
+            timeout=timeout,
+            message_frame=message_frame,
+            delay=delay,
+            retries=retries,
+        )
+        r = ep.wait(ep.submit(req))
+        self._record_pooled(cmd, req, verbose or (self.verbose and not quiet), info)
+        return r
+
+    def _record_pooled(self, cmd, req, verbose, info=None):
+        if req.rtt is not None:
+            self.latency.add(req.rtt)
+
+        if verbose:
+            if req.response is None:
+                re = "ERROR: Connection refused: {}, timeout={}".format(
+                    self.address, req.timeout
+                )
+            else:
+                re = process_response(req.response)
+            self.log_response(cmd, re, info)
+
     def _reset_connection(self):
         self.handler = None
         self.error_mode = False
@@ -0,0 +1,430 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Int, Float, Bool, Str
+
+# ============= standard library imports ========================
+import socket
+import time
+from bisect import bisect_left
+from queue import Queue, Empty
+from threading import Thread, Event, Lock
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+# upper edges of the latency histogram bins in seconds. 0.1 ms to ~13 s
+LATENCY_BINS = tuple(0.0001 * 2**i for i in range(18))
+
+
+class LatencyHistogram(object):
+    """
+    counts of round trip times in logarithmically spaced bins
+    """
+
+    def __init__(self, bins=LATENCY_BINS):
+        self.bins = bins
+        self.counts = [0] * (len(bins) + 1)
+        self.n = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._lock = Lock()
+
+    def add(self, dt):
+        with self._lock:
+            self.counts[bisect_left(self.bins, dt)] += 1
+            self.n += 1
+            self.total += dt
+            if self.min is None or dt < self.min:
+                self.min = dt
+            if self.max is None or dt > self.max:
+                self.max = dt
+
+    @property
+    def mean(self):
+        if self.n:
+            return self.total / self.n
+
+    def percentile(self, p):
+        """
+        return the upper edge of the bin that contains the p-th percentile. p in [0, 100]
+        """
+        if not self.n:
+            return
+
+        target = self.n * p / 100.0
+        c = 0
+        for edge, ci in zip(self.bins, self.counts):
+            c += ci
+            if c >= target:
+                return edge
+        return self.max
+
+    def report(self):
+        return {
+            "n": self.n,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class PooledRequest(object):
+    __slots__ = (
+        "cmd",
+        "timeout",
+        "message_frame",
+        "delay",
+        "retries",
+        "read",
+        "response",
+        "rtt",
+        "done",
+        "_event",
+    )
+
+    def __init__(
+        self, cmd, timeout=3, message_frame=None, delay=None, retries=3, read=True
+    ):
+        self.cmd = cmd
+        self.timeout = timeout
+        self.message_frame = message_frame
+        self.delay = delay
+        self.retries = retries
+        self.read = read
+        self.response = None
+        self.rtt = None
+        self.done = False
+        self._event = Event()
+
+    def finish(self, response=None, rtt=None):
+        self.response = response
+        self.rtt = rtt
+        self.done = True
+        self._event.set()
+
+    def wait(self, timeout=None):
+        return self._event.wait(timeout)
+
+
+class EthernetEndpoint(Loggable):
+    """
+    a persistent TCP connection to a host and port shared by all the communicators that
+    use it.
+
+    requests are queued and sent by a single I/O thread so callers do not contend for a
+    lock or reconnect for every command. the connection is opened on the first request,
+    reopened after an error and closed after idle_timeout seconds without requests.
+
+    if pipeline is set and the responses are delimited by read_terminator, the requests
+    queued while the thread was busy are sent in one write and the responses are read
+    back in order. a device that handles commands one at a time only needs to answer each
+    command in turn for this to work
+    """
+
+    host = Str
+    port = Int
+    connect_timeout = Float(1.0)
+    idle_timeout = Float(60)
+    pipeline = Bool(False)
+    max_batch = Int(16)
+
+    read_terminator = Str
+    message_frame = Str
+    strip = Bool(True)
+    datasize = Int(2**12)
+
+    def __init__(self, *args, **kw):
+        super(EthernetEndpoint, self).__init__(*args, **kw)
+        self._queue = Queue()
+        self._handler = None
+        self._rbuf = b""
+        self._thread = None
+        self._alive = False
+        self._start_lock = Lock()
+        self._last_io = 0
+
+        self.histogram = LatencyHistogram()
+        self.nconnects = 0
+        self.nerrors = 0
+        self.nbatches = 0
+
+    @property
+    def address(self):
+        return "tcp://{}:{}".format(self.host, self.port)
+
+    @property
+    def alive(self):
+        return self._alive
+
+    @property
+    def can_pipeline(self):
+        return self.pipeline and bool(self.read_terminator) and not self.message_frame
+
+    def submit(self, request):
+        self.start()
+        self._queue.put(request)
+        return request
+
+    def ask(self, cmd, **kw):
+        """
+        send cmd and block until the response is read. return the response or None
+        """
+        return self.wait(self.submit(PooledRequest(cmd, **kw)))
+
+    def wait(self, request):
+        while not request.wait(1):
+            if not self._alive:
+                break
+        return request.response
+
+    def start(self):
+        with self._start_lock:
+            if self._alive:
+                return
+
+            self._alive = True
+            self._thread = Thread(
+                target=self._run, name="Endpoint {}".format(self.address)
+            )
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        with self._start_lock:
+            if not self._alive:
+                return
+            self._queue.put(None)
+
+        self._thread.join()
+        self._thread = None
+
+    def report(self):
+        r = self.histogram.report()
+        r.update(
+            connects=self.nconnects,
+            errors=self.nerrors,
+            batches=self.nbatches,
+        )
+        return r
+
+    # private
+    def _run(self):
+        try:
+            while 1:
+                try:
+                    req = self._queue.get(timeout=min(self.idle_timeout, 1))
+                except Empty:
+                    if (
+                        self._handler is not None
+                        and time.monotonic() - self._last_io > self.idle_timeout
+                    ):
+                        self.debug("closing idle connection")
+                        self._close()
+                    continue
+
+                if req is None:
+                    break
+
+                batch = [req]
+                stop = False
+                if self.can_pipeline:
+                    while len(batch) < self.max_batch:
+                        try:
+                            r = self._queue.get_nowait()
+                        except Empty:
+                            break
+                        if r is None:
+                            stop = True
+                            break
+                        batch.append(r)
+
+                self._process(batch)
+                if stop:
+                    break
+        finally:
+            self._close()
+            with self._start_lock:
+                self._alive = False
+
+            # release anybody still waiting
+            while 1:
+                try:
+                    req = self._queue.get_nowait()
+                except Empty:
+                    break
+                if req is not None:
+                    req.finish()
+
+    def _process(self, batch):
+        try:
+            retries = max(r.retries for r in batch)
+            for i in range(max(1, retries)):
+                pending = [r for r in batch if not r.done]
+                if not pending:
+                    break
+
+                try:
+                    self._connect()
+                    if len(pending) > 1 and not any(
+                        r.delay or r.message_frame for r in pending
+                    ):
+                        self._pipelined(pending)
+                    else:
+                        for r in pending:
+                            self._transact(r)
+                except (OSError, EOFError) as e:
+                    # a late response would be read as the answer to the next command.
+                    # always start over on a new connection
+                    self.nerrors += 1
+                    self.debug("request failed. attempt={} error={}".format(i + 1, e))
+                    self._close()
+        finally:
+            for r in batch:
+                if not r.done:
+                    r.finish()
+            self._last_io = time.monotonic()
+
+    def _transact(self, req):
+        st = time.perf_counter()
+        self._handler.sock.sendall(req.cmd.encode("utf-8"))
+        if req.delay:
+            time.sleep(req.delay)
+        self._finish(req, st)
+
+    def _pipelined(self, reqs):
+        self.nbatches += 1
+        st = time.perf_counter()
+        self._handler.sock.sendall(b"".join(r.cmd.encode("utf-8") for r in reqs))
+        for r in reqs:
+            self._finish(r, st)
+
+    def _finish(self, req, st):
+        resp = None
+        if req.read:
+            resp = self._read(req)
+            if resp is None:
+                # checksum failure
+                raise EOFError("invalid response")
+
+        rtt = time.perf_counter() - st
+        self.histogram.add(rtt)
+        req.finish(resp, rtt)
+
+    def _read(self, req):
+        """
+        a request with its own message_frame is read with that frame even if the
+        endpoint has a read_terminator. framed requests are never pipelined
+        """
+        handler = self._handler
+        handler.sock.settimeout(req.timeout)
+        if req.message_frame or not self.read_terminator or self.message_frame:
+            self._rbuf = b""
+            return handler.get_packet(message_frame=req.message_frame)
+
+        rt = handler.read_terminator
+        while 1:
+            idx = self._rbuf.find(rt)
+            if idx >= 0:
+                end = idx + len(rt)
+                data, self._rbuf = self._rbuf[:end], self._rbuf[end:]
+                break
+
+            s = handler.sock.recv(self.datasize)
+            if not s:
+                raise EOFError("connection closed by {}".format(self.address))
+            self._rbuf += s
+
+        data = data.decode("utf-8")
+        if self.strip:
+            data = data.strip()
+        return data
+
+    def _connect(self):
+        if self._handler is not None:
+            return
+
+        # imported here to avoid a circular import with ethernet_communicator
+        from pychron.hardware.core.communicators.ethernet_communicator import (
+            TCPHandler,
+        )
+
+        h = TCPHandler()
+        h.keep_alive = True
+        if self.read_terminator:
+            h.read_terminator = self.read_terminator.encode("utf-8")
+        h.set_frame(self.message_frame)
+        h.datasize = self.datasize
+        h.strip = self.strip
+        try:
+            h.open_socket((self.host, self.port), timeout=self.connect_timeout)
+        except OSError:
+            h.end()
+            raise
+
+        h.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._handler = h
+        self._rbuf = b""
+        self.nconnects += 1
+
+    def _close(self):
+        if self._handler is not None:
+            self._handler.end()
+            self._handler = None
+        self._rbuf = b""
+
+
+_endpoints = {}
+_endpoints_lock = Lock()
+
+
+def get_endpoint(host, port, read_terminator="", message_frame="", **kw):
+    """
+    return the shared endpoint for host and port. kw are set on a new endpoint.
+
+    communicators only share an endpoint if all their settings match
+    """
+    key = (host, port, read_terminator, message_frame) + tuple(sorted(kw.items()))
+    with _endpoints_lock:
+        try:
+            ep = _endpoints[key]
+        except KeyError:
+            ep = _endpoints[key] = EthernetEndpoint(
+                name="Endpoint {}:{}".format(host, port),
+                host=host,
+                port=port,
+                read_terminator=read_terminator,
+                message_frame=message_frame,
+                **kw
+            )
+        return ep
+
+
+def close_endpoints():
+    with _endpoints_lock:
+        eps = list(_endpoints.values())
+        _endpoints.clear()
+
+    for ep in eps:
+        ep.stop()
+
+
+# ============= EOF =============================================
@@ -0,0 +1,301 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Int
+
+# ============= standard library imports ========================
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Condition, Event
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+# weight of the latest interval in the jitter moving average
+JITTER_ALPHA = 0.2
+# seconds
+MIN_PERIOD = 0.001
+
+
+class ScanTask(object):
+    """
+    a periodic call registered with the ScanScheduler.
+
+    implements the parts of core.helpers.timer.Timer used by the scanable devices so a task
+    can be used in place of a Timer
+    """
+
+    def __init__(self, scheduler, name, func, period, group=None):
+        self.scheduler = scheduler
+        self.name = name
+        self.func = func
+        self.period = period
+        # tasks with the same group are called one after another, never at the same time
+        self.group = group if group is not None else ("task", id(self))
+        self.due = 0
+
+        self.active = True
+        # queued or running. a due task is skipped while it is pending
+        self.pending = False
+        self._idle = Event()
+        self._idle.set()
+
+        self.nruns = 0
+        self.nskipped = 0
+        self.nerrors = 0
+        self.last_start = None
+        self.last_lag = 0
+        self.max_lag = 0
+        self.jitter = 0
+        self.duration = 0
+
+    def run(self, due):
+        self._idle.clear()
+        st = time.monotonic()
+        try:
+            self.func()
+        except BaseException as e:
+            self.nerrors += 1
+            self.scheduler.debug("scan {} failed. {}".format(self.name, e))
+        finally:
+            self.duration = time.monotonic() - st
+            self._record(st, due)
+            self.pending = False
+            self._idle.set()
+
+    def report(self):
+        return {
+            "period": self.period,
+            "nruns": self.nruns,
+            "nskipped": self.nskipped,
+            "nerrors": self.nerrors,
+            "lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "jitter": self.jitter,
+            "duration": self.duration,
+        }
+
+    # Timer interface
+    def Stop(self):
+        self.scheduler.remove(self)
+
+    stop = Stop
+
+    def isActive(self):
+        return self.active
+
+    def wait_for_completion(self, timeout=None):
+        if not self._idle.wait(timeout):
+            return "timeout"
+
+    def set_interval(self, v):
+        """
+        v: period in ms
+        """
+        self.period = v / 1000.0
+
+    def get_interval(self):
+        return self.period
+
+    # private
+    def _record(self, st, due):
+        self.nruns += 1
+        self.last_lag = lag = max(0, st - due)
+        self.max_lag = max(self.max_lag, lag)
+        if self.last_start is not None:
+            dev = abs(st - self.last_start - self.period)
+            self.jitter += JITTER_ALPHA * (dev - self.jitter)
+        self.last_start = st
+
+
+class ScanScheduler(Loggable):
+    """
+    call the scan functions of many devices from one dispatch thread and a small pool of
+    workers instead of a timer thread per device.
+
+    tasks are kept in a priority queue ordered by their due time. due tasks of the same
+    group, e.g. devices sharing a CommunicationScheduler or a serial port, are queued and
+    called back to back by a single worker.
+
+    a task that is still queued or running when it is due again is skipped, and the task
+    is rescheduled from the current time when it has fallen more than a period behind.
+    slow devices therefore do not pile up calls or run in bursts to catch up
+    """
+
+    nworkers = Int(4)
+
+    def __init__(self, *args, **kw):
+        super(ScanScheduler, self).__init__(*args, **kw)
+        self._cond = Condition()
+        self._heap = []
+        self._counter = itertools.count()
+        self._tasks = {}
+        # group: deque of (task, due). a group is in _groups while a worker is running it
+        self._groups = {}
+        self._thread = None
+        self._pool = None
+        self._alive = False
+
+    def add(self, name, func, period, group=None, delay=0):
+        """
+        call func every period seconds. the first call is made after delay seconds
+
+        return a ScanTask
+        """
+        task = ScanTask(self, name, func, period, group)
+        with self._cond:
+            self._tasks[id(task)] = task
+            self._push(task, time.monotonic() + delay)
+            self._cond.notify()
+
+        self.debug("added {} period={}s group={}".format(name, period, group))
+        self.start()
+        return task
+
+    def remove(self, task):
+        with self._cond:
+            task.active = False
+            self._tasks.pop(id(task), None)
+            self._cond.notify()
+
+    def start(self):
+        with self._cond:
+            if self._alive:
+                return
+            self._alive = True
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.nworkers, thread_name_prefix="ScanWorker"
+        )
+        self._thread = Thread(target=self._dispatch, name="ScanScheduler")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._alive = False
+            for task in self._tasks.values():
+                task.active = False
+            self._tasks.clear()
+            self._heap = []
+            self._cond.notify()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    @property
+    def tasks(self):
+        with self._cond:
+            return list(self._tasks.values())
+
+    def report(self):
+        """
+        return name: metrics for each task.
+        lag is how late the last call started. jitter is the moving average of the
+        deviation of the interval between calls from the period
+        """
+        return {t.name: t.report() for t in self.tasks}
+
+    # private
+    def _push(self, task, due):
+        task.due = due
+        heapq.heappush(self._heap, (due, next(self._counter), task))
+
+    def _dispatch(self):
+        cond = self._cond
+        while 1:
+            with cond:
+                if not self._alive:
+                    break
+
+                now = time.monotonic()
+                due = []
+                heap = self._heap
+                while heap and heap[0][0] <= now:
+                    d, _, task = heapq.heappop(heap)
+                    if task.active:
+                        due.append((task, d))
+
+                for task, d in due:
+                    self._reschedule(task, d, now)
+                    if task.pending:
+                        task.nskipped += 1
+                    else:
+                        task.pending = True
+                        self._queue(task, d)
+
+                timeout = heap[0][0] - now if heap else None
+                if not due:
+                    cond.wait(timeout)
+
+    def _reschedule(self, task, due, now):
+        period = max(task.period, MIN_PERIOD)
+        nd = due + period
+        if nd <= now:
+            # behind by more than a period. skip the missed calls
+            task.nskipped += int((now - due) // period)
+            nd = now + period
+        self._push(task, nd)
+
+    def _queue(self, task, due):
+        group = task.group
+        q = self._groups.get(group)
+        if q is None:
+            self._groups[group] = q = deque()
+            q.append((task, due))
+            self._pool.submit(self._run_group, group)
+        else:
+            q.append((task, due))
+
+    def _run_group(self, group):
+        q = self._groups[group]
+        while 1:
+            with self._cond:
+                if not q:
+                    del self._groups[group]
+                    break
+                task, due = q.popleft()
+
+            if task.active:
+                task.run(due)
+            else:
+                task.pending = False
+                task._idle.set()
+
+
+_scan_scheduler = None
+
+
+def get_scan_scheduler():
+    """
+    return the scheduler shared by all the scanable devices
+    """
+    global _scan_scheduler
+    if _scan_scheduler is None:
+        _scan_scheduler = ScanScheduler()
+    return _scan_scheduler
+
+
+# ============= EOF =============================================
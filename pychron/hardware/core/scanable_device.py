@@ -27,6 +27,7 @@ from pychron.core.helpers.datetime_tools import generate_datetimestamp
 from pychron.database.data_warehouse import DataWarehouse
 from pychron.graph.plot_record import PlotRecord
 from pychron.hardware.core.alarm import Alarm
+from pychron.hardware.core.scan_scheduler import get_scan_scheduler
 from pychron.hardware.core.viewable_device import ViewableDevice
 from pychron.managers.data_managers.csv_data_manager import CSVDataManager
 from pychron.paths import paths
@@ -59,6 +60,9 @@ class ScanableDevice(ViewableDevice):
     data_manager = Instance(CSVDataManager)
     time_dict = dict(ms=1, s=1000, m=60000, h=3600000)
 
+    # scan with the shared ScanScheduler instead of a Timer thread per device
+    use_scan_scheduler = True
+
     _scanning = Bool(False)
     _auto_started = False
     _last_update = None
@@ -193,6 +197,22 @@ class ScanableDevice(ViewableDevice):
         self._last_update = time.time()
         return su
 
+    def get_scan_group(self):
+        """
+        devices that share a CommunicationScheduler or a serial port are scanned one
+        after another by the ScanScheduler
+        """
+        comm = getattr(self, "communicator", None)
+        if comm is not None:
+            scheduler = getattr(comm, "scheduler", None)
+            if scheduler is not None:
+                return "scheduler:{}".format(scheduler.name)
+
+            if getattr(comm, "baudrate", None) is not None:
+                port = getattr(comm, "port", None)
+                if port:
+                    return "port:{}".format(port)
+
     def lock_scan(self):
         if self._scan_lock is None:
             self._scan_lock = Lock()
@@ -236,9 +256,14 @@ class ScanableDevice(ViewableDevice):
         if period is None:
             period = self.scan_period * self.time_dict[self.scan_units]
 
-        from pychron.core.helpers.timer import Timer
+        if self.use_scan_scheduler:
+            self.timer = get_scan_scheduler().add(
+                self.name, self.scan, period / 1000.0, group=self.get_scan_group()
+            )
+        else:
+            from pychron.core.helpers.timer import Timer
 
-        self.timer = Timer(period, self.scan)
+            self.timer = Timer(period, self.scan)
         self.info("Scan started func={} period={}".format(self.scan_func, period))
 
     def stop_scan(self):
@@ -0,0 +1,145 @@
+import socket
+import time
+import unittest
+
+from six.moves.socketserver import BaseRequestHandler
+
+from pychron.emulation_server import EmulationServer
+from pychron.hardware.core.communicators.ethernet_communicator import (
+    EthernetCommunicator,
+)
+from pychron.hardware.core.communicators.ethernet_pool import (
+    LatencyHistogram,
+    PooledRequest,
+    close_endpoints,
+)
+
+
+class LineEmulator(BaseRequestHandler):
+    """
+    answer each \\r terminated command with "<command>:ok\\n" until the client disconnects.
+    "close" drops the connection
+    """
+
+    nconnections = 0
+    commands = []
+
+    def handle(self):
+        LineEmulator.nconnections += 1
+        buf = b""
+        while 1:
+            s = self.request.recv(1024)
+            if not s:
+                break
+            buf += s
+            while b"\r" in buf:
+                cmd, buf = buf.split(b"\r", 1)
+                cmd = cmd.decode("utf-8")
+                LineEmulator.commands.append(cmd)
+                if cmd == "close":
+                    return
+                if not cmd.startswith("tell"):
+                    self.request.sendall("{}:ok\n".format(cmd).encode("utf-8"))
+
+
+def free_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+class EthernetPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        LineEmulator.nconnections = 0
+        LineEmulator.commands = []
+        self.port = free_port()
+        self.server = EmulationServer("127.0.0.1", self.port, LineEmulator)
+        self.server.start(join=False)
+        for i in range(50):
+            if getattr(self.server, "server", None):
+                break
+            time.sleep(0.01)
+
+    def tearDown(self):
+        close_endpoints()
+        self.server.stop()
+
+    def _communicator(self, **kw):
+        c = EthernetCommunicator(name="test")
+        c.read_terminator = chr(10)
+        c.open(host="127.0.0.1", port=self.port, kind="TCP", use_pool=True, **kw)
+        c.simulation = False
+        return c
+
+    def test_persistent(self):
+        c = self._communicator()
+        for i in range(20):
+            self.assertEqual(
+                c.ask("cmd{}".format(i), verbose=False), "cmd{}:ok".format(i)
+            )
+
+        self.assertEqual(LineEmulator.nconnections, 1)
+        self.assertEqual(c.latency_report()["n"], 20)
+        self.assertEqual(c.get_endpoint().nconnects, 1)
+
+    def test_shared_endpoint(self):
+        a = self._communicator()
+        b = self._communicator()
+        self.assertIs(a.get_endpoint(), b.get_endpoint())
+        self.assertEqual(a.ask("a", verbose=False), "a:ok")
+        self.assertEqual(b.ask("b", verbose=False), "b:ok")
+        self.assertEqual(LineEmulator.nconnections, 1)
+
+    def test_pipeline(self):
+        c = self._communicator(pipeline=True)
+        cmds = ["cmd{}".format(i) for i in range(10)]
+        ep = c.get_endpoint()
+        reqs = [ep.submit(PooledRequest("{}\r".format(ci))) for ci in cmds]
+        rs = [ep.wait(r) for r in reqs]
+        self.assertEqual(rs, ["{}:ok".format(ci) for ci in cmds])
+        self.assertEqual(LineEmulator.commands, cmds)
+        self.assertGreaterEqual(ep.nbatches, 1)
+
+    def test_endpoint_settings(self):
+        a = self._communicator()
+        b = self._communicator(pipeline=True)
+        self.assertIsNot(a.get_endpoint(), b.get_endpoint())
+        self.assertFalse(a.get_endpoint().pipeline)
+        self.assertTrue(b.get_endpoint().pipeline)
+
+        c = self._communicator()
+        c.strip = False
+        self.assertIsNot(a.get_endpoint(), c.get_endpoint())
+
+    def test_tell(self):
+        c = self._communicator()
+        c.tell("tell1", verbose=False)
+        self.assertEqual(c.ask("a", verbose=False), "a:ok")
+        self.assertEqual(LineEmulator.commands, ["tell1", "a"])
+
+    def test_reconnect(self):
+        c = self._communicator()
+        self.assertEqual(c.ask("a", verbose=False), "a:ok")
+        self.assertIsNone(c.ask("close", retries=2, verbose=False))
+        self.assertEqual(c.ask("b", verbose=False), "b:ok")
+
+        ep = c.get_endpoint()
+        self.assertEqual(ep.nerrors, 2)
+        self.assertEqual(ep.nconnects, 3)
+
+    def test_histogram(self):
+        h = LatencyHistogram()
+        for dt in (0.00005, 0.001, 0.001, 0.002, 0.5):
+            h.add(dt)
+
+        self.assertEqual(h.n, 5)
+        self.assertEqual(h.min, 0.00005)
+        self.assertEqual(h.max, 0.5)
+        self.assertAlmostEqual(h.percentile(50), 0.0016)
+        self.assertAlmostEqual(h.percentile(100), 0.8192)
+
+
+if __name__ == "__main__":
+    unittest.main()
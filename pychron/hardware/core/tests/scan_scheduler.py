@@ -0,0 +1,96 @@
+import time
+import unittest
+from threading import Lock
+
+from pychron.hardware.core.scan_scheduler import ScanScheduler
+
+
+class Device(object):
+    def __init__(self, name, delay=0, shared=None):
+        self.name = name
+        self.delay = delay
+        self.count = 0
+        self.shared = shared
+
+    def scan(self):
+        if self.shared is not None:
+            # fails if devices of the same group are scanned at the same time
+            if not self.shared.acquire(blocking=False):
+                raise AssertionError("concurrent scan")
+            try:
+                self._scan()
+            finally:
+                self.shared.release()
+        else:
+            self._scan()
+
+    def _scan(self):
+        self.count += 1
+        if self.delay:
+            time.sleep(self.delay)
+
+
+class ScanSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = ScanScheduler(nworkers=4)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_period(self):
+        d = Device("a")
+        task = self.scheduler.add(d.name, d.scan, 0.02)
+        time.sleep(0.25)
+        task.stop()
+        self.assertTrue(8 <= d.count <= 14, d.count)
+
+        r = self.scheduler.report()
+        self.assertNotIn("a", r)
+        self.assertEqual(task.report()["nruns"], d.count)
+        self.assertLess(task.max_lag, 0.1)
+
+    def test_group(self):
+        lock = Lock()
+        ds = [Device(str(i), delay=0.01, shared=lock) for i in range(3)]
+        tasks = [self.scheduler.add(d.name, d.scan, 0.02, group="port:1") for d in ds]
+        time.sleep(0.3)
+
+        for t in tasks:
+            self.assertEqual(t.nerrors, 0)
+            self.assertGreater(t.nruns, 2)
+
+    def test_backpressure(self):
+        d = Device("slow", delay=0.1)
+        task = self.scheduler.add(d.name, d.scan, 0.01)
+        time.sleep(0.35)
+        task.stop()
+        task.wait_for_completion(1)
+
+        # calls are skipped instead of queued while the device is busy
+        self.assertLessEqual(d.count, 4)
+        self.assertGreater(task.nskipped, 10)
+
+    def test_stop(self):
+        d = Device("a")
+        task = self.scheduler.add(d.name, d.scan, 0.01)
+        time.sleep(0.05)
+        task.Stop()
+        task.wait_for_completion(1)
+        n = d.count
+        time.sleep(0.05)
+        self.assertEqual(d.count, n)
+        self.assertFalse(task.isActive())
+
+    def test_error(self):
+        def func():
+            raise ValueError
+
+        task = self.scheduler.add("error", func, 0.01)
+        time.sleep(0.2)
+        # the task keeps running after an error
+        self.assertGreater(task.nerrors, 1)
+        self.assertEqual(task.nerrors, task.nruns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -297,6 +297,37 @@ class LabspyClient(Loggable):
         except BaseException as e:
             self.debug("failed adding measurement. {}".format(e))
 
+    @auto_connect
+    def add_measurements(self, measurements):
+        """
+        add many measurements with one commit. auto_connect opens the session the
+        measurements are added in
+
+        measurements: list of (dev, tag, val, unit)
+        """
+        self.debug("adding {} measurements".format(len(measurements)))
+        triggers = None
+        if os.path.isfile(paths.notification_triggers):
+            triggers = self.notification_triggers
+
+        db = self.db
+        ocoa = db.commit_on_add
+        db.commit_on_add = False
+        try:
+            for dev, tag, val, unit in measurements:
+                try:
+                    val = float(val)
+                    db.add_measurement(dev, tag, val, unit)
+                    if triggers:
+                        self._check_notifications(dev, tag, val, unit, triggers)
+                except BaseException as e:
+                    self.debug(
+                        "failed adding measurement {} {}. {}".format(dev, tag, e)
+                    )
+            db.commit()
+        finally:
+            db.commit_on_add = ocoa
+
     def connect(self):
         self.warning("not connected to db {}".format(self.db.public_url))
         return self.db.connect()
@@ -333,17 +364,19 @@ class LabspyClient(Loggable):
 
         return config
 
-    def _check_notifications(self, dev, tag, val, unit):
-        if not os.path.isfile(paths.notification_triggers):
-            self.debug(
-                "no notification trigger file available. {}".format(
-                    paths.notification_triggers
+    def _check_notifications(self, dev, tag, val, unit, triggers=None):
+        if triggers is None:
+            if not os.path.isfile(paths.notification_triggers):
+                self.debug(
+                    "no notification trigger file available. {}".format(
+                        paths.notification_triggers
+                    )
                 )
-            )
-            return
+                return
+            triggers = self.notification_triggers
 
         ns = []
-        for nt in self.notification_triggers:
+        for nt in triggers:
             self.debug("testing {} {} {} {}".format(dev, tag, val, unit))
             if nt.test(dev, tag, val, unit):
                 self.debug("notification triggered")
@@ -50,6 +50,8 @@ class AutoCenterConfig(HasTraits):
     blocksize = Int
     blocksize_step = Int
     inverted = Bool(True)
+    # evaluate the search thresholds on a thread pool
+    use_parallel_search = Bool(False)
 
     def __init__(self, yd=None, *args, **kw):
         if yd is not None:
@@ -146,6 +148,7 @@ class AutoCenterManager(MachineVisionManager):
             preprocess=config.preprop,
             search=config.search,
             inverted=config.inverted,
+            parallel=config.use_parallel_search,
         )
 
         if dx is None and dy is None:
@@ -20,6 +20,7 @@ from traits.api import Float
 # ============= standard library imports ========================
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from operator import attrgetter
 from collections import deque, OrderedDict
 from numpy import (
@@ -52,6 +53,7 @@ from skimage import feature
 from pychron.core.geometry.convex_hull import convex_hull
 from pychron.loggable import Loggable
 from pychron.mv.segment.region import RegionSegmenter
+from pychron.mv.threshold_prefetcher import ThresholdPrefetcher
 from pychron.image.cv_wrapper import (
     grayspace,
     draw_contour_list,
@@ -121,6 +123,14 @@ class Locator(Loggable):
     # class level _cache
     _cached_threshold = deque()
 
+    # threads used to evaluate thresholds when _find_targets_bs is called with parallel=True
+    search_workers = 4
+    # levels of the binary search evaluated ahead of the search
+    prefetch_depth = 2
+    # seconds spent in each stage of the last threshold search
+    search_timings = None
+    _search_pool = None
+
     # @classmethod
     # def clear_cache(cls):
     #     cls._cached_threshold = deque()
@@ -261,8 +271,20 @@ class Locator(Loggable):
         threshold_limiting=True,
         filter_targets=True,
         search_start=False,
+        parallel=False,
         **kw
     ):
+        """
+        binary search of the thresholds around the mean of the frame.
+
+        parallel: evaluate the thresholds on a thread pool ahead of the search. the
+            targets are the same as the sequential search
+
+        the seconds spent in each stage are saved to search_timings. segment, polygons and
+        filter are summed over all the evaluated thresholds
+        """
+        timings = OrderedDict()
+        sst = st = time.perf_counter()
         if preprocess:
             if not isinstance(preprocess, dict):
                 preprocess = {}
@@ -275,6 +297,7 @@ class Locator(Loggable):
 
         if inverted:
             src = invert(src)
+        timings["preprocess"] = time.perf_counter() - st
 
         # image.set_frame(colorspace(frame / self.pixel_depth * 255))
         if image:
@@ -297,12 +320,18 @@ class Locator(Loggable):
         self.debug("src mean={}, {}, {}".format(sm, low, high))
 
         def find(t):
+            """
+            return targets, (segment, polygons, filter) times
+            """
+            t0 = time.perf_counter()
             nsrc = seg.segment(src, t)
             per = _binary_percent(nsrc)
+            t1 = time.perf_counter()
             if threshold_limiting and (per > 0.85 or per < 0.25):
-                return []
+                return [], (t1 - t0, 0, 0)
 
             ts = self._find_polygon_targets(nsrc)
+            t2 = time.perf_counter()
             # self.debug('t={} polygons={}'.format(t, len(ts) if ts else 0))
             if filter_targets:
                 ts = self._filter_targets(
@@ -311,7 +340,23 @@ class Locator(Loggable):
                 # self.debug('t={} filtered poly={}'.format(t, len(ts) if ts else 0))
             # ts = _arc_approximation_filter(frame, ts, dim)
 
-            return ts
+            return ts, (t1 - t0, t2 - t1, time.perf_counter() - t2)
+
+        def accept(threshold, depth):
+            return low <= threshold <= high and depth <= search_depth
+
+        results = []
+        if parallel:
+            prefetcher = ThresholdPrefetcher(
+                self._get_search_pool(), find, accept, self.prefetch_depth
+            )
+            evaluate = prefetcher.get
+        else:
+
+            def evaluate(threshold, depth):
+                r = find(threshold)
+                results.append(r)
+                return r
 
         visited = OrderedDict()
 
@@ -322,14 +367,16 @@ class Locator(Loggable):
                 # self.debug('visited {}'.format(threshold))
                 return []
 
-            if threshold > high or threshold < low:
+            if not accept(threshold, depth):
                 # self.debug('outbounds {}'.format(threshold))
                 return []
 
-            if depth > search_depth:
+            if not self.alive:
                 return []
 
-            tt = find(threshold)
+            tt, _ = evaluate(threshold, depth)
+            # copy so a prefetched result is not modified
+            tt = list(tt)
             visited[threshold] = len(tt) if tt else 0
             if tt or sum(visited.values()) < min_targets:
                 at = find_bs(int(threshold / 2), depth + 1)
@@ -348,10 +395,38 @@ class Locator(Loggable):
 
             return tt
 
+        st = time.perf_counter()
         ts = find_bs(int(sm), 0)
+        timings["search"] = time.perf_counter() - st
+        if parallel:
+            prefetcher.cancel()
+            results = prefetcher.results()
+
+        for i, k in enumerate(("segment", "polygons", "filter")):
+            timings[k] = sum(r[1][i] for r in results)
+        timings["total"] = time.perf_counter() - sst
+        timings["nvisited"] = len(visited)
+        timings["nevaluated"] = len(results)
+        self.search_timings = timings
+
         self.debug("visited n={} thresholds={}".format(len(visited), visited))
+        self.debug(
+            "search timings {}".format(
+                ", ".join(
+                    "{}={}".format(k, v if isinstance(v, int) else "{:0.4f}".format(v))
+                    for k, v in timings.items()
+                )
+            )
+        )
         return ts
 
+    def _get_search_pool(self):
+        if self._search_pool is None:
+            self._search_pool = ThreadPoolExecutor(
+                max_workers=self.search_workers, thread_name_prefix="LocatorSearch"
+            )
+        return self._search_pool
+
     def _find_targets(
         self,
         image,
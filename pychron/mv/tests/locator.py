@@ -0,0 +1,78 @@
+import unittest
+
+from numpy import mgrid, clip, uint8
+from numpy.random import RandomState
+
+try:
+    from pychron.mv.locator import Locator
+except ImportError:
+    Locator = None
+
+
+def make_frame(seed, offset=(4, -3), radius=25, size=120):
+    """
+    a frame like the ones recorded by the autocenter camera. a dark hole on a bright
+    tray with an illumination gradient and noise
+    """
+    rs = RandomState(seed)
+    yy, xx = mgrid[:size, :size]
+    cx, cy = size / 2 + offset[0], size / 2 + offset[1]
+    frame = 170 + 30 * xx / size + rs.normal(0, 8, (size, size))
+    frame[(xx - cx) ** 2 + (yy - cy) ** 2 < radius**2] = 60 + rs.normal(0, 8)
+    return clip(frame, 0, 255).astype(uint8)
+
+
+def summarize(targets):
+    return [(t.area, tuple(t.centroid)) for t in targets]
+
+
+@unittest.skipIf(Locator is None, "machine vision dependencies not installed")
+class LocatorParallelSearchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.locator = Locator(pxpermm=23)
+
+    def _find(self, frame, parallel):
+        loc = self.locator
+        ts = loc._find_targets_bs(
+            None,
+            frame,
+            25,
+            "circle",
+            {"stretch_intensity": True, "blur": 0},
+            parallel=parallel,
+            inverted=True,
+        )
+        return summarize(ts), loc.search_timings
+
+    def test_same_targets(self):
+        for seed in range(5):
+            frame = make_frame(seed, offset=(seed, -seed))
+            ts, timings = self._find(frame, False)
+            pts, ptimings = self._find(frame, True)
+            self.assertEqual(pts, ts)
+            self.assertEqual(ptimings["nvisited"], timings["nvisited"])
+            self.assertGreaterEqual(ptimings["nevaluated"], ptimings["nvisited"])
+
+    def test_deterministic(self):
+        frame = make_frame(11)
+        expected, _ = self._find(frame, True)
+        for i in range(5):
+            ts, _ = self._find(frame, True)
+            self.assertEqual(ts, expected)
+
+    def test_timings(self):
+        _, timings = self._find(make_frame(3), True)
+        for k in (
+            "preprocess",
+            "segment",
+            "polygons",
+            "filter",
+            "search",
+            "total",
+        ):
+            self.assertGreaterEqual(timings[k], 0)
+        self.assertGreaterEqual(timings["total"], timings["search"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from pychron.mv.threshold_prefetcher import ThresholdPrefetcher
+
+
+class ThresholdPrefetcherTestCase(unittest.TestCase):
+    def test_prefetch(self):
+        lock = Lock()
+        calls = []
+
+        def func(t):
+            with lock:
+                calls.append(t)
+            return [t], (0, 0, 0)
+
+        def accept(t, depth):
+            return 50 <= t <= 200 and depth <= 6
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            p = ThresholdPrefetcher(pool, func, accept, prefetch_depth=1)
+            self.assertEqual(p.get(100, 0), ([100], (0, 0, 0)))
+            pool.shutdown(wait=True)
+
+        # 100 and the children within the limits
+        self.assertEqual(sorted(calls), [50, 66, 100, 125, 150])
+        self.assertEqual(len(p.results()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
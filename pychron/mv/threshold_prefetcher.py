@@ -0,0 +1,83 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+# ============= local library imports  ==========================
+
+
+def _child_thresholds(threshold):
+    """
+    the thresholds the binary search tries after threshold, in the order it tries them
+    """
+    return (
+        int(threshold / 2),
+        int(threshold / 1.5),
+        int(threshold * 1.5),
+        int(threshold * 1.25),
+    )
+
+
+class ThresholdPrefetcher(object):
+    """
+    evaluate the thresholds of the binary search on a thread pool ahead of the search.
+
+    when the search asks for a threshold it is submitted, if it has not been already,
+    followed by the thresholds the search could try in the next prefetch_depth levels.
+    the search waits only for the threshold it asked for so the result is the same as a
+    sequential search regardless of the order the evaluations finish
+    """
+
+    def __init__(self, pool, func, accept, prefetch_depth=2):
+        self._pool = pool
+        self._func = func
+        self._accept = accept
+        self._prefetch_depth = prefetch_depth
+        self._futures = {}
+
+    def get(self, threshold, depth):
+        self._prefetch(threshold, depth, self._prefetch_depth)
+        return self._futures[threshold].result()
+
+    def cancel(self):
+        """
+        cancel the evaluations that have not started
+        """
+        for f in self._futures.values():
+            f.cancel()
+
+    def results(self):
+        """
+        return the results of the finished evaluations, including the ones the search did
+        not use
+        """
+        return [
+            f.result()
+            for f in self._futures.values()
+            if f.done() and not f.cancelled() and f.exception() is None
+        ]
+
+    def _prefetch(self, threshold, depth, levels):
+        if threshold not in self._futures:
+            self._futures[threshold] = self._pool.submit(self._func, threshold)
+
+        if levels:
+            for t in _child_thresholds(threshold):
+                if self._accept(t, depth + 1):
+                    self._prefetch(t, depth + 1, levels - 1)
+
+
+# ============= EOF =============================================
@@ -120,6 +120,9 @@ class IdeogramOptions(AgeOptions):
     skew_max = Float(0.2)
     shapiro_wilk_alpha = Float(0.05)
     age_normalize = Bool
+    # recalculate the ages from F with the vectorized age equation. nominal values and
+    # 1 sigma errors only
+    use_batch_ages = Bool(False)
     age_normalize_value = Float(0)
 
     use_centered_range = Bool
@@ -221,6 +221,12 @@ class CalculationSubOptions(SubOptions):
             ),
             Item("error_calc_method", width=-150, label="Error Calculation Method"),
             Item("nsigma", label="Age Error NSigma"),
+            Item(
+                "use_batch_ages",
+                label="Fast Nominal Ages",
+                tooltip="Recalculate the ages from F for all analyses at once. "
+                "Use when re-plotting after changing J or the decay constants",
+            ),
             BorderVGroup(
                 J_ERROR_GROUP,
                 BorderHGroup(
@@ -213,6 +213,7 @@ class Paths(object):
     isotope_dir = None
 
     index_db = None
+    commit_journal = None
     sample_dir = None
 
     offline_db_dir = None
@@ -448,6 +449,8 @@ class Paths(object):
         self.dvc_dir = join(self.data_dir, ".dvc")
         self.repository_dataset_dir = join(self.dvc_dir, "repositories")
         self.meta_root = join(self.dvc_dir, "MetaData")
+        self.index_db = join(self.dvc_dir, "index.sqlite3")
+        self.commit_journal = join(self.dvc_dir, "commit_journal.json")
         self.sample_dir = join(self.data_dir, "sample_entry")
         self.media_storage_dir = join(self.data_dir, "media")
         self.offline_db_dir = join(self.data_dir, "offline_db")
@@ -22,7 +22,7 @@ from pyface.constant import YES
 from traits.api import Bool, List
 
 from pychron.core.helpers.iterfuncs import groupby_group_id
-from pychron.core.progress import progress_loader
+from pychron.core.progress import progress_loader, progress_iterator
 from pychron.options.options_manager import (
     BlanksOptionsManager,
     ICFactorOptionsManager,
@@ -43,6 +43,7 @@ from pychron.pipeline.nodes.figure import FigureNode
 from pychron.pipeline.results.define_equilibration import DefineEquilibrationResult
 from pychron.pipeline.results.iso_evo import IsoEvoResult
 from pychron.pipeline.state import get_detector_set, get_isotope_pairs_set
+from pychron.processing.isotope import batch_fit_isotopes
 from pychron.pychron_constants import NULL_STR
 
 
@@ -312,6 +313,16 @@ class FitIsotopeEvolutionNode(FitNode):
             if self.check_refit(unks):
                 return
 
+            progress_iterator(unks, self._load_raw_data, threshold=1)
+
+            # fit all the evolutions at once instead of one regressor per isotope
+            ms = [
+                m
+                for ai in unks
+                for m in ai.get_fit_measurements(self._keys, include_baselines=True)
+            ]
+            batch_fit_isotopes(ms)
+
             fs = progress_loader(unks, self._assemble_result, threshold=1, step=10)
 
             if self.editor:
@@ -322,14 +333,15 @@ class FitIsotopeEvolutionNode(FitNode):
                 e = IsoEvolutionResultsEditor(fs, self._fits)
                 state.editors.append(e)
 
-    def _assemble_result(self, xi, prog, i, n):
+    def _load_raw_data(self, xi, prog, i, n):
         if prog:
             prog.change_message("Load raw data {}".format(xi.record_id))
 
-        fits = self._fits
         xi.load_raw_data(self._keys)
+        xi.set_fits(self._fits)
 
-        xi.set_fits(fits)
+    def _assemble_result(self, xi, prog, i, n):
+        fits = self._fits
         isotopes = xi.isotopes
         for f in fits:
             k = f.name
@@ -453,7 +465,7 @@ class FitIsotopeEvolutionNode(FitNode):
                     smart_filter_goodness=smart_filter_goodness,
                     smart_filter_threshold=smart_filter_threshold,
                     smart_filter=e,
-                    regression_str=iso.regressor.tostring(),
+                    regression_str=iso.regression_str(),
                     fit=iso.fit,
                     isotope=k,
                 )
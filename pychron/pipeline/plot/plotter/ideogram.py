@@ -48,6 +48,7 @@ from pychron.pipeline.plot.overlays.subgroup_overlay import SubGroupPointOverlay
 from pychron.pipeline.plot.plotter.arar_figure import BaseArArFigure
 from pychron.pipeline.plot.point_move_tool import OverlayMoveTool
 from pychron.processing.analyses.analysis_group import InterpretedAgeGroup
+from pychron.processing.argon_batch import batch_ages, BATCH_AGE_ATTRS
 from pychron.processing.interpreted_age import InterpretedAge
 from pychron.pychron_constants import (
     PLUSMINUS,
@@ -189,12 +190,19 @@ class Ideogram(BaseArArFigure):
         graph = self.graph
 
         try:
-            xs, es = array(
-                [
-                    (nominal_value(ai), std_dev(ai))
-                    for ai in self._get_xs(key=index_attr)
-                ]
-            ).T
+            ages = None
+            if opt.use_batch_ages and index_attr in BATCH_AGE_ATTRS:
+                # nominal values and 1 sigma errors only
+                ages = batch_ages(self.sorted_analyses, index_attr)
+
+            if ages is None:
+                ages = array(
+                    [
+                        (nominal_value(ai), std_dev(ai))
+                        for ai in self._get_xs(key=index_attr)
+                    ]
+                ).T
+            xs, es = ages
 
             xs = self.normalize(xs, es)
             self.xs = xs
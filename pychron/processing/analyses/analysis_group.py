@@ -16,6 +16,7 @@
 
 
 import math
+from functools import wraps
 from operator import attrgetter
 
 from numpy import array, nan, average
@@ -24,7 +25,6 @@ from numpy import array, nan, average
 from traits.api import (
     List,
     Property,
-    cached_property,
     Str,
     Bool,
     Int,
@@ -35,6 +35,7 @@ from traits.api import (
     on_trait_change,
     Color,
     Dict,
+    Undefined,
 )
 from uncertainties import ufloat, nominal_value, std_dev
 
@@ -90,7 +91,7 @@ from pychron.pychron_constants import (
 
 
 def AGProperty(*depends):
-    d = "dirty,analyses:[temp_status]"
+    d = "revision"
     if depends:
         d = "{},{}".format(d, ",".join(depends))
     return Property(depends_on=d)
@@ -104,6 +105,36 @@ def MetaDataProperty(*depends):
     return Property(depends_on=d)
 
 
+def revision_cached(func):
+    """
+    cached_property for AnalysisGroup getters that counts cache hits and misses.
+
+    traits clears the cached value when the revision of the group changes. a value computed
+    while the revision changed is returned but not cached
+    """
+    name = func.__name__[5:]
+    cname = "_traits_cache_{}".format(name)
+
+    @wraps(func)
+    def decorator(self):
+        d = self.__dict__
+        counts = d.setdefault("_memo_counts", {}).setdefault(name, [0, 0])
+        result = d.get(cname, Undefined)
+        if result is Undefined:
+            counts[1] += 1
+            revision = self.revision
+            result = func(self)
+            if self.revision == revision:
+                d[cname] = result
+        else:
+            counts[0] += 1
+
+        return result
+
+    decorator.cached_property = True
+    return decorator
+
+
 class AnalysisGroup(IdeogramPlotable):
     attribute = Str("uage")
     analyses = List
@@ -132,7 +163,7 @@ class AnalysisGroup(IdeogramPlotable):
     moles_k39_error_kind = Enum(*ERROR_TYPES)
     signal_k39_error_kind = Enum(*ERROR_TYPES)
 
-    mswd = Property
+    mswd = AGProperty()
 
     isochron_age_error_kind = Str(SE)
     isochron_method = Enum(ISOCHRON_METHODS)
@@ -178,6 +209,8 @@ class AnalysisGroup(IdeogramPlotable):
 
     # percent_39Ar = AGProperty()
     dirty = Event
+    # incremented when anything the AGProperties depend on changes
+    revision = Int
 
     isochron_3640 = None
     isochron_regressor = None
@@ -190,6 +223,33 @@ class AnalysisGroup(IdeogramPlotable):
     def __init__(self, *args, **kw):
         super(AnalysisGroup, self).__init__(make_arar_constants=False, *args, **kw)
 
+    @on_trait_change(
+        "dirty, analyses[], analyses:[temp_status], attribute, omit_by_tag, "
+        "exclude_non_plateau, arar_constants, age_error_kind, kca_error_kind, "
+        "kcl_error_kind, rad40_error_kind, moles_k39_error_kind, "
+        "signal_k39_error_kind, isochron_age_error_kind, isochron_method, "
+        "integrated_age_weighting, include_j_error_in_integrated, "
+        "include_j_error_in_mean, include_j_position_error, include_decay_error_mean"
+    )
+    def invalidate(self):
+        """
+        start a new revision. the cached values are recalculated on the next access.
+        call after modifying the analyses, e.g. recalculating their ages
+        """
+        self.revision += 1
+
+    def memo_stats(self):
+        """
+        return name: (hits, misses, hit rate) for each cached value that was accessed
+        """
+        stats = {}
+        for k, (hits, misses) in self.__dict__.get("_memo_counts", {}).items():
+            stats[k] = hits, misses, hits / float(hits + misses)
+        return stats
+
+    def reset_memo_stats(self):
+        self.__dict__.pop("_memo_counts", None)
+
     def _analyses_changed(self, new):
         if new:
             a = new[0]
@@ -432,6 +492,7 @@ class AnalysisGroup(IdeogramPlotable):
     def age_attr(self):
         return "uage_w_position_err" if self.include_j_position_error else "uage"
 
+    @revision_cached
     def _get_mswd(self):
         attr = self.attribute
         if attr.startswith("uage"):
@@ -441,11 +502,11 @@ class AnalysisGroup(IdeogramPlotable):
 
         return self._calculate_mswd(attr)
 
-    @cached_property
+    @revision_cached
     def _get_shapiro_wilk_pvalue(self):
         return shapiro_wilk_pvalue(self.sorted_clean_analyses())
 
-    @cached_property
+    @revision_cached
     def _get_skewness(self):
         try:
             s = skewness_value(self.sorted_clean_analyses())
@@ -453,7 +514,7 @@ class AnalysisGroup(IdeogramPlotable):
             s = 0
         return s
 
-    @cached_property
+    @revision_cached
     def _get_age_span(self):
         ans = self.clean_analyses()
         ages = [nominal_value(a.age) for a in ans]
@@ -464,7 +525,7 @@ class AnalysisGroup(IdeogramPlotable):
 
         return ret
 
-    @cached_property
+    @revision_cached
     def _get_j_err(self):
         j = self.j
         try:
@@ -473,14 +534,14 @@ class AnalysisGroup(IdeogramPlotable):
             e = nan
         return e
 
-    @cached_property
+    @revision_cached
     def _get_j(self):
         j = ufloat(0, 0)
         if self.analyses:
             j = self.analyses[0].j
         return j
 
-    @cached_property
+    @revision_cached
     def _get_isochron_age(self):
         try:
             a = self.calculate_isochron_age()
@@ -492,14 +553,14 @@ class AnalysisGroup(IdeogramPlotable):
 
         return a
 
-    @cached_property
+    @revision_cached
     def _get_arith_age(self):
         v, e = self._calculate_arithmetic_mean(self.age_attr)
         e = self._modify_error(v, e, self.age_error_kind)
         aa = ufloat(v, e)
         return self._apply_external_err(aa)
 
-    @cached_property
+    @revision_cached
     def _get_weighted_age(self):
         attr = self.attribute
         if attr.startswith("uage"):
@@ -514,7 +575,7 @@ class AnalysisGroup(IdeogramPlotable):
         except AttributeError:
             return ufloat(0, 0)
 
-    @cached_property
+    @revision_cached
     def _get_weighted_mean_f(self):
         v, e = self._calculate_weighted_mean("uF", self.age_error_kind)
         me = self._modify_error(v, e, self.age_error_kind)
@@ -526,11 +587,11 @@ class AnalysisGroup(IdeogramPlotable):
         except AttributeError:
             return ufloat(0, 0)
 
-    @cached_property
+    @revision_cached
     def _get_total_n(self):
         return len(self.analyses)
 
-    @cached_property
+    @revision_cached
     def _get_nanalyses(self):
         return len(list(self.clean_analyses()))
 
@@ -788,6 +849,15 @@ class StepHeatAnalysisGroup(AnalysisGroup):
     total_ar39 = AGProperty()
     total_k2o = AGProperty()
 
+    @on_trait_change(
+        "fixed_step_low, fixed_step_high, calculate_fixed_plateau, "
+        "plateau_age_error_kind, plateau_nsteps, plateau_gas_fraction, "
+        "plateau_overlap_sigma, plateau_method, integrated_include_omitted, "
+        "include_j_error_in_plateau"
+    )
+    def _plateau_options_changed(self):
+        self.invalidate()
+
     def set_isochron_trapped(self, state, include_error=None):
         v = None
         if state:
@@ -799,6 +869,7 @@ class StepHeatAnalysisGroup(AnalysisGroup):
         for a in self.analyses:
             a.arar_constants.trapped_atm4036 = v
             a.recalculate_age(force=True)
+        self.invalidate()
 
     @property
     def integrated_enabled(self):
@@ -814,7 +885,7 @@ class StepHeatAnalysisGroup(AnalysisGroup):
     def plateau_analyses(self):
         return [a for a in self.clean_analyses() if self.get_is_plateau_step(a)]
 
-    @cached_property
+    @revision_cached
     def _get_total_k2o(self):
         total = sum(
             [
@@ -824,7 +895,7 @@ class StepHeatAnalysisGroup(AnalysisGroup):
         )
         return nominal_value(total)
 
-    @cached_property
+    @revision_cached
     def _get_total_ar39(self):
         total = sum([a.k39 for a in self.analyses])
         return nominal_value(total)
@@ -884,7 +955,7 @@ class StepHeatAnalysisGroup(AnalysisGroup):
                     return False
             return self.fixed_steps
 
-    @cached_property
+    @revision_cached
     def _get_integrated_age(self):
         if self.integrated_include_omitted:
             ans = self.analyses
@@ -904,7 +975,7 @@ class StepHeatAnalysisGroup(AnalysisGroup):
         if not (l is None and h is None):
             return l, h
 
-    @cached_property
+    @revision_cached
     def _get_plateau_age(self):
         ans = self.analyses
         v, e = 0, 0
@@ -995,7 +1066,7 @@ class InterpretedAgeGroup(StepHeatAnalysisGroup, Preferred):
     lithologies = List
 
     comments = Str
-    preferred_age = Property
+    preferred_age = AGProperty()
 
     # modeled_j = ''
     # modeled_j_err = ''
@@ -1197,7 +1268,14 @@ class InterpretedAgeGroup(StepHeatAnalysisGroup, Preferred):
         pv = self._get_pv(attr)
         return pv
 
+    @on_trait_change(
+        "preferred_values[], preferred_values:[kind, error_kind, weighting]"
+    )
+    def _preferred_options_changed(self):
+        self.invalidate()
+
     # get preferred objects
+    @revision_cached
     def _get_preferred_age(self):
         pa = ufloat(0, 0)
 
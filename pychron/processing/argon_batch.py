@@ -0,0 +1,312 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import (
+    asarray,
+    zeros,
+    where,
+    einsum,
+    log,
+    abs as nabs,
+    errstate,
+    array,
+    atleast_1d,
+    broadcast_to,
+)
+from uncertainties import nominal_value, std_dev
+
+# ============= local library imports  ==========================
+from pychron.processing.arar_constants import ArArConstants
+
+# Vectorized batch versions of calculate_f and age_equation.
+#
+# The scalar functions in argon_calculations work on one analysis at a time with ufloat
+# arithmetic. The functions here evaluate N analyses in one pass over numpy arrays and propagate
+# first order (linear) errors. The partial derivatives are computed with the complex step
+# method, which is exact to machine precision. uncertainties also propagates first order
+# errors so the two paths agree to
+#
+#     F, age:               rtol=1e-12
+#     F_err, age_err:       rtol=1e-9
+#
+# see pychron.processing.tests.argon_batch
+#
+# Limitations
+#     - the cosmogenic correction is not supported. batch_calculate_f raises a ValueError
+#       before doing any work if arar_constants.use_cosmogenic_correction is set
+#     - only nominal values and 1 sigma errors are returned. use the scalar path if correlated
+#       ufloats are required, e.g. for error components
+#
+# batch_ages is used by the ideogram when IdeogramOptions.use_batch_ages is set
+
+PRODUCTION_KEYS = ("K4039", "K3839", "K3739", "Ca3937", "Ca3837", "Ca3637", "Cl3638")
+
+# the ArArAge age attributes batch_ages can calculate
+BATCH_AGE_ATTRS = ("uage", "uage_w_j_err", "uage_w_position_err")
+
+# complex step size. derivative = imag(f(x + ih)) / h
+CSTEP = 1e-20
+
+
+def _f_kernel(iso, pr, atm4036, fixed_k3739, decay_time, arc, use_fixed):
+    a40, a39, a38, a37, a36 = iso
+    k4039, k3839, k3739, ca3937, ca3837, ca3637, cl3638 = pr
+
+    if use_fixed:
+        x = fixed_k3739
+        y = where(ca3937 == 0, 1, 1 / where(ca3937 == 0, 1, ca3937))
+        ca37 = (a39 * x * y) / (x + y)
+        ca39 = ca3937 * ca37
+        k39 = a39 - ca39
+        k37 = x * k39
+    else:
+        k39 = (a39 - ca3937 * a37) / (1 - k3739 * ca3937)
+        k37 = k3739 * k39
+        ca37 = a37 - k37
+        ca39 = ca3937 * ca37
+
+    k38 = k3839 * k39
+    if not arc.allow_negative_ca_correction:
+        ca37 = where(ca37.real < 0, 0, ca37)
+
+    ca36 = ca3637 * ca37
+    ca38 = ca3837 * ca37
+
+    m = cl3638 * nominal_value(arc.lambda_Cl36) * decay_time
+    atm3836 = nominal_value(arc.atm3836)
+    atm36 = (a36 - ca36 - m * (a38 - k38 - ca38)) / (1 - m * atm3836)
+
+    atm40 = atm36 * atm4036
+    k40 = k39 * k4039
+    rad40 = a40 - atm40 - k40
+
+    invalid = k39 == 0
+    return where(invalid, 1.0, rad40 / where(invalid, 1, k39))
+
+
+def _as_production(production_ratios, n):
+    if isinstance(production_ratios, dict):
+        production_ratios = [
+            broadcast_to(asarray(production_ratios.get(k, 0), dtype=float), (n,))
+            for k in PRODUCTION_KEYS
+        ]
+        return array(production_ratios)
+
+    production_ratios = asarray(production_ratios, dtype=float)
+    if production_ratios.ndim == 1:
+        production_ratios = broadcast_to(production_ratios, (n, len(PRODUCTION_KEYS)))
+    return production_ratios.T
+
+
+def _as_error(e):
+    """
+    None, scalar or (N,) errors. None is taken as 0
+    """
+    if e is None:
+        return 0.0
+
+    e = asarray(e)
+    if e.dtype == object:
+        e = array([0 if ei is None else ei for ei in e.ravel()]).reshape(e.shape)
+    return e.astype(float)
+
+
+def _as_covariance(covariances, n):
+    covariances = asarray(covariances, dtype=float)
+    if covariances.ndim == 2:
+        # 1 sigma errors
+        errs = covariances
+        covariances = zeros((n, 5, 5))
+        for i in range(5):
+            covariances[:, i, i] = errs[:, i] ** 2
+    return covariances
+
+
+def batch_calculate_f(
+    isotopes,
+    covariances,
+    production_ratios,
+    decay_time,
+    production_errors=None,
+    arar_constants=None,
+    fixed_k3739=None,
+):
+    """
+    isotopes: (N, 5) corrected isotope values. columns Ar40, Ar39, Ar38, Ar37, Ar36.
+        see ArArAge._assemble_isotope_intensities
+    covariances: (N, 5, 5) isotope covariance matrices or (N, 5) 1 sigma errors
+    production_ratios: (N, 7) or (7,) array ordered as PRODUCTION_KEYS or a dict of key: value(s)
+    decay_time: scalar or (N,) decay time in days
+    production_errors: same shape as production_ratios. 1 sigma errors
+    arar_constants: shared by all analyses
+    fixed_k3739: None, float or ufloat. overrides arar_constants.fixed_k3739 and forces
+        the fixed K37/K39 mode
+
+    return F, F_err, F_err_wo_irrad. each an (N,) array
+    """
+    if arar_constants is None:
+        arar_constants = ArArConstants()
+
+    if arar_constants.use_cosmogenic_correction:
+        raise ValueError(
+            "cosmogenic correction is not supported by the batch engine. "
+            "use argon_calculations.calculate_f"
+        )
+
+    iso = asarray(isotopes, dtype=float)
+    n = iso.shape[0]
+    iso = iso.T
+    cov = _as_covariance(covariances, n)
+
+    pr = _as_production(production_ratios, n)
+    if production_errors is None:
+        pe = zeros(pr.shape)
+    else:
+        pe = _as_production(production_errors, n)
+
+    use_fixed = bool(fixed_k3739) or arar_constants.k3739_mode.lower() != "normal"
+    if not fixed_k3739:
+        fixed_k3739 = arar_constants.fixed_k3739
+
+    fk, fke = nominal_value(fixed_k3739), std_dev(fixed_k3739)
+    atm, atme = nominal_value(arar_constants.atm4036), std_dev(arar_constants.atm4036)
+    decay_time = broadcast_to(asarray(decay_time, dtype=float), (n,))
+
+    # variables are stacked as rows. 0-4 isotopes, 5-11 production ratios,
+    # 12 atm4036, 13 fixed k3739
+    xs = zeros((14, n))
+    xs[:5] = iso
+    xs[5:12] = pr
+    xs[12] = atm
+    xs[13] = fk
+
+    def evaluate(v):
+        return _f_kernel(
+            v[:5], v[5:12], v[12], v[13], decay_time, arar_constants, use_fixed
+        )
+
+    with errstate(divide="ignore", invalid="ignore"):
+        f = evaluate(xs)
+
+        jac = zeros((14, n))
+        for i in range(14):
+            v = xs.astype(complex)
+            h = CSTEP * where(xs[i] == 0, 1, nabs(xs[i]))
+            v[i] = v[i] + 1j * h
+            jac[i] = evaluate(v).imag / h
+
+    jiso = jac[:5].T
+    var_iso = einsum("ni,nij,nj->n", jiso, cov, jiso)
+    var_pr = ((jac[5:12] * pe) ** 2).sum(axis=0)
+    var_const = (jac[12] * atme) ** 2 + (jac[13] * fke) ** 2
+
+    f_err = (var_iso + var_pr + var_const) ** 0.5
+    f_err_wo_irrad = (var_iso + var_const) ** 0.5
+
+    return f.real, f_err, f_err_wo_irrad
+
+
+def batch_age_equation(
+    j,
+    f,
+    j_err=0,
+    f_err=0,
+    include_decay_error=False,
+    lambda_k=None,
+    arar_constants=None,
+):
+    """
+    vectorized age_equation
+
+    j, j_err, f, f_err: scalars or (N,) arrays. missing (None) errors are taken as 0
+    lambda_k: float or ufloat. defaults to arar_constants.lambda_k
+
+    return age, age_err scaled to arar_constants.age_units. each an (N,) array.
+    ages with 1 + j*f <= 0 are returned as 0 +/- 0 like age_equation
+    """
+    if arar_constants is None:
+        arar_constants = ArArConstants()
+
+    if not lambda_k:
+        lambda_k = arar_constants.lambda_k
+
+    lk = nominal_value(lambda_k)
+    lke = std_dev(lambda_k) if include_decay_error else 0
+
+    j, f = atleast_1d(asarray(j, dtype=float)), atleast_1d(asarray(f, dtype=float))
+    j_err, f_err = _as_error(j_err), _as_error(f_err)
+
+    scale = arar_constants.scale_age(1.0, current="a")
+    jf = 1 + j * f
+    valid = jf > 0
+    jf = where(valid, jf, 1)
+
+    lnjf = log(jf)
+    age = scale * lnjf / lk
+
+    dadf = scale * j / (lk * jf)
+    dadj = scale * f / (lk * jf)
+    dadl = -scale * lnjf / lk**2
+
+    err = ((dadf * f_err) ** 2 + (dadj * j_err) ** 2 + (dadl * lke) ** 2) ** 0.5
+    return where(valid, age, 0), where(valid, err, 0)
+
+
+def batch_ages(analyses, attr="uage", include_decay_error=False, arar_constants=None):
+    """
+    nominal values and 1 sigma errors of the attr age of analyses recalculated from their F
+    values. F does not depend on J or the decay constants so the isotopes are not reduced
+    again, e.g. when re-plotting after editing J.
+
+    attr: one of BATCH_AGE_ATTRS. uage excludes the J error, uage_w_j_err includes it and
+        uage_w_position_err includes the position J error like ArArAge._set_age_values
+
+    return ages, errors. each an (N,) array. None if an analysis has no F or J
+    """
+    n = len(analyses)
+    if not n:
+        return zeros(0), zeros(0)
+
+    f, f_err, j, j_err = zeros(n), zeros(n), zeros(n), zeros(n)
+    for i, a in enumerate(analyses):
+        aj = getattr(a, "j", None)
+        if getattr(a, "uF", None) is None or aj is None:
+            return
+
+        f[i], f_err[i] = a.F, a.F_err or 0
+        j[i] = nominal_value(aj)
+        if attr == "uage_w_j_err":
+            j_err[i] = std_dev(aj)
+        elif attr == "uage_w_position_err":
+            j_err[i] = a.position_jerr or 0
+
+    if arar_constants is None:
+        # the batch engine assumes all analyses share the same constants
+        arar_constants = analyses[0].arar_constants
+
+    return batch_age_equation(
+        j,
+        f,
+        j_err,
+        f_err,
+        include_decay_error=include_decay_error,
+        arar_constants=arar_constants,
+    )
+
+
+# ============= EOF =============================================
@@ -30,6 +30,7 @@ from uncertainties import ufloat, nominal_value, std_dev
 from pychron.core.geometry.geometry import curvature_at
 from pychron.core.helpers.binpack import unpack
 from pychron.core.helpers.fits import natural_name_fit, fit_to_degree
+from pychron.core.regression.batch_ols import BatchSeries, batch_regress
 from pychron.core.regression.least_squares_regressor import (
     ExponentialRegressor,
     FitError,
@@ -37,6 +38,8 @@ from pychron.core.regression.least_squares_regressor import (
 )
 from pychron.core.regression.mean_regressor import MeanRegressor
 from pychron.core.regression.ols_regressor import PolynomialRegressor
+from pychron.core.regression.streaming_ols import StreamingOLS, is_streamable
+from pychron.core.helpers.growable_buffer import GrowableBuffer
 from pychron.pychron_constants import AUTO_N
 
 
@@ -61,6 +64,8 @@ class BaseMeasurement(object):
     detector_serial_id = None
     group_data = 0
     _regressor = None
+    # (xs buffer, ys buffer, xs, ys) used by append
+    _buffers = None
 
     @property
     def n(self):
@@ -90,6 +95,24 @@ class BaseMeasurement(object):
         # if self._regressor:
         #     self._regressor.dirty = True
 
+    def append(self, x, y):
+        """
+        append a point in amortized O(1). xs and ys are views of preallocated buffers that
+        are reallocated at twice the size when full.
+
+        if xs or ys were replaced since the last append the buffers are refilled from them
+        """
+        bufs = self._buffers
+        if bufs is None or bufs[2] is not self.xs or bufs[3] is not self.ys:
+            xb, yb = GrowableBuffer(self.xs), GrowableBuffer(self.ys)
+        else:
+            xb, yb = bufs[:2]
+
+        xb.append(x)
+        yb.append(y)
+        self.xs, self.ys = xs, ys = xb.data, yb.data
+        self._buffers = xb, yb, xs, ys
+
     def get_data(self):
         xs = self.offset_xs
         ys = self.ys
@@ -129,6 +152,23 @@ class BaseMeasurement(object):
             # print self.name, self.xs.shape, self.ys.shape
             # print self.name, self.ys
 
+    def unpack_array(self, data, n_only=False):
+        """
+        set xs, ys from a (2, n) array, e.g. from a columnar sidecar
+        """
+        if data is None:
+            return
+
+        xs, ys = data
+        if self.reverse_unpack:
+            xs, ys = ys, xs
+
+        if n_only:
+            self.n = xs.shape[0]
+        else:
+            self.xs = xs
+            self.ys = ys
+
     def _unpack_blob(self, blob, endianness=None):
         if endianness is None:
             endianness = self.endianness
@@ -202,11 +242,122 @@ class IsotopicMeasurement(BaseMeasurement):
     _ovalue = None
 
     _fn = None
+    _batch_fit = None
+
+    # use a streaming fit while the data is collected. see live_fit_result
+    live_fit = False
+    _stream = None
+    _stream_source = None
+    _live_result = None
 
     def __init__(self, *args, **kw):
         super(IsotopicMeasurement, self).__init__(*args, **kw)
         self.filter_outliers_dict = dict()
 
+    def set_batch_fit(self, result):
+        """
+        result: BatchFitResult. used instead of the regressor until the fit, filtering,
+        exclusions or data change. see batch_fit_isotopes
+        """
+        if result is None:
+            self._batch_fit = None
+        else:
+            self.fit = result.fit
+            self._batch_fit = (self._batch_key(), self.xs, self.ys, result)
+
+    @property
+    def batch_fit(self):
+        if self._batch_fit:
+            key, xs, ys, result = self._batch_fit
+            if xs is self.xs and ys is self.ys and key == self._batch_key():
+                return result
+
+    @property
+    def fit_result(self):
+        """
+        the batch fit or the live fit result. None if the regressor has to be used
+        """
+        bf = self.batch_fit
+        if bf is None and self.live_fit:
+            bf = self.live_fit_result
+        return bf
+
+    @property
+    def live_fit_result(self):
+        """
+        the fit of the data collected so far from a StreamingOLS that is updated with the
+        points appended since the last call.
+
+        outliers are not filtered. None if the fit, error type, truncation, grouping or
+        exclusions need the regressor
+        """
+        if not is_streamable(self.fit, self.error_type):
+            return
+        if self.truncate or self.group_data > 1 or self.get_excluded():
+            return
+
+        xs, ys = self.xs, self.ys
+        n = xs.shape[0]
+        if n != ys.shape[0]:
+            return
+
+        # appending only changes the views of the buffers. any other change replaces them
+        bufs = self._buffers
+        if bufs and bufs[2] is xs and bufs[3] is ys:
+            source = bufs[:2]
+        else:
+            source = xs, ys
+
+        stream = self._stream
+        tzo = self.time_zero_offset
+        ss = self._stream_source
+        if (
+            stream is None
+            or stream.n > n
+            or ss[0] is not source[0]
+            or ss[1] is not source[1]
+            or ss[2] != tzo
+        ):
+            # the data was replaced. start over
+            stream = self._stream = StreamingOLS()
+            self._stream_source = source[0], source[1], tzo
+            self._live_result = None
+
+        if stream.n < n:
+            stream.extend(xs[stream.n :] - tzo, ys[stream.n :])
+
+        key = (n, self.fit, self.error_type)
+        lr = self._live_result
+        if lr is None or lr[0] != key:
+            lr = self._live_result = key, stream.fit(self.fit, self.error_type)
+        return lr[1]
+
+    def set_live_fit(self, state):
+        """
+        state: if True value and error come from a streaming fit without outlier filtering
+        until set_live_fit(False), which discards it so the next access does a full refit
+        """
+        self.live_fit = state
+        if not state:
+            self._stream = self._stream_source = self._live_result = None
+
+    def get_excluded(self):
+        reg = self._regressor
+        if reg:
+            return list(set(reg.user_excluded + reg.ouser_excluded))
+        return []
+
+    def _batch_key(self):
+        return (
+            self.fit,
+            self.error_type,
+            sorted(self.filter_outliers_dict.items()),
+            self.truncate,
+            self.group_data,
+            self.time_zero_offset,
+            sorted(self.get_excluded()),
+        )
+
     def get_linear_rsquared(self):
         from pychron.core.regression.ols_regressor import OLSRegressor
 
@@ -233,18 +384,27 @@ class IsotopicMeasurement(BaseMeasurement):
 
     @property
     def rsquared(self):
+        bf = self.fit_result
+        if bf is not None:
+            return bf.rsquared
         if self._regressor:
             return self._regressor.rsquared
 
     @property
     def rsquared_adj(self):
+        bf = self.fit_result
+        if bf is not None:
+            return bf.rsquared_adj
         if self._regressor:
             return self._regressor.rsquared_adj
 
     @property
     def fn(self):
+        bf = self.fit_result
         if self._fn is not None:
             n = self._fn
+        elif bf is not None:
+            n = bf.n
         elif self._regressor:
             n = self._regressor.clean_xs.shape[0]
         else:
@@ -263,6 +423,9 @@ class IsotopicMeasurement(BaseMeasurement):
 
     @property
     def outlier_excluded(self):
+        bf = self.fit_result
+        if bf is not None:
+            return bf.outlier_excluded
         if self._regressor:
             return [int(i) for i in self._regressor.outlier_excluded]
 
@@ -421,7 +584,11 @@ class IsotopicMeasurement(BaseMeasurement):
             and not self.user_defined_value
             and self.xs.shape[0] > 1
         ):
-            v = self.regressor.predict(0)
+            bf = self.fit_result
+            if bf is not None:
+                v = bf.value
+            else:
+                v = self.regressor.predict(0)
 
             if isnan(v) or isinf(v):
                 v = 0
@@ -441,7 +608,11 @@ class IsotopicMeasurement(BaseMeasurement):
             and not self.user_defined_error
             and self.xs.shape[0] > 1
         ):
-            v = self.regressor.predict_error(0)
+            bf = self.fit_result
+            if bf is not None:
+                v = bf.error
+            else:
+                v = self.regressor.predict_error(0)
             if isnan(v) or isinf(v):
                 v = 0
             return v
@@ -548,9 +719,21 @@ class IsotopicMeasurement(BaseMeasurement):
         return self.regressor.calculate_standard_error_fit()
 
     def noutliers(self):
+        bf = self.fit_result
+        if bf is not None:
+            return len(self.get_data()[0]) - bf.n
         return self.regressor.xs.shape[0] - self.regressor.clean_xs.shape[0]
 
+    def regression_str(self):
+        bf = self.fit_result
+        if bf is not None:
+            return bf.tostring()
+        return self.regressor.tostring()
+
     def _get_curvature_ys(self):
+        bf = self.fit_result
+        if bf is not None:
+            return bf.predict(self.offset_xs)
         return self.regressor.predict(self.offset_xs)
 
     # def _error_type_changed(self):
@@ -830,4 +1013,45 @@ class Isotope(BaseIsotope):
             return "{} {}".format(self.name, e)
 
 
+def batch_fit_isotopes(isotopes):
+    """
+    fit the evolutions of many IsotopicMeasurements at once.
+    see pychron.core.regression.batch_ols
+
+    measurements the batch engine can not fit are left to their regressors
+
+    return the number of batch fit measurements
+    """
+    ms, series = [], []
+    for iso in isotopes:
+        if iso.use_stored_value or iso.truncate or iso.batch_fit is not None:
+            continue
+
+        xs, ys = iso.get_data()
+        if len(xs) <= 1 or len(xs) != len(ys):
+            continue
+
+        if iso.fit is None:
+            iso.fit = "linear"
+
+        ms.append(iso)
+        series.append(
+            BatchSeries(
+                xs,
+                ys,
+                iso.fit,
+                error_type=iso.error_type or "SEM",
+                filter_outliers_dict=iso.filter_outliers_dict,
+                excluded=iso.get_excluded(),
+            )
+        )
+
+    n = 0
+    for iso, result in zip(ms, batch_regress(series)):
+        iso.set_batch_fit(result)
+        if result is not None:
+            n += 1
+    return n
+
+
 # ============= EOF =============================================
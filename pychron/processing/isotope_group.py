@@ -18,7 +18,6 @@
 import logging
 import os
 
-from numpy import append as npappend
 from traits.api import Property, Dict, Str
 from traits.has_traits import HasTraits
 from uncertainties import ufloat
@@ -102,6 +101,15 @@ class IsotopeGroup(HasTraits):
     def iter_isotopes(self):
         return (self.isotopes[k] for k in self.isotope_keys)
 
+    def set_live_fit(self, state):
+        """
+        use streaming fits of the isotopes and baselines while the data is collected.
+        see IsotopicMeasurement.set_live_fit
+        """
+        for i in self.itervalues():
+            i.set_live_fit(state)
+            i.baseline.set_live_fit(state)
+
     def clear_isotopes(self):
         for iso in self.iter_isotopes():
             self.isotopes[iso.name] = Isotope(iso.name, iso.detector)
@@ -269,10 +277,7 @@ class IsotopeGroup(HasTraits):
             if kind == "sniff":
                 isotope._value = signal
 
-            xs = npappend(isotope.xs, x)
-            ys = npappend(isotope.ys, signal)
-            isotope.xs = xs
-            isotope.ys = ys
+            isotope.append(x, signal)
             # isotope.dirty = True
 
         isotopes = self.isotopes
@@ -354,6 +359,28 @@ class IsotopeGroup(HasTraits):
             title = "{}{}".format(name, detector)
         return title
 
+    def get_fit_measurements(self, keys, include_baselines=False):
+        """
+        keys: isotope names or detectors. see DVCAnalysis.set_fits
+
+        return the isotopes and detector baselines for keys
+        """
+        isos = self.isotopes
+        ms = []
+        for k in keys:
+            if k in isos:
+                iso = isos[k]
+                ms.append(iso)
+                if include_baselines:
+                    ms.append(iso.baseline)
+            else:
+                bs = self.get_isotope(detector=k, kind="baseline")
+                if bs is not None:
+                    ms.append(bs)
+
+        # the same baseline may be shared by several isotopes
+        return list({id(m): m for m in ms}.values())
+
     def get_isotope(self, name=None, detector=None, kind=None):
         if name is None and detector is None:
             raise NotImplementedError("name or detector required")
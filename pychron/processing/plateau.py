@@ -17,11 +17,22 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from numpy import argmax, array
+from collections import deque
+
+from numpy import (
+    argmax,
+    array,
+    asarray,
+    cumsum,
+    errstate,
+    isfinite,
+    zeros,
+    where,
+)
 from six.moves import range
 from traits.api import HasTraits, List, Array
 
-from pychron.core.stats.core import validate_mswd, calculate_mswd
+from pychron.core.stats.core import validate_mswd, calculate_mswd, get_mswd_limits
 from pychron.pychron_constants import MAHON
 
 
@@ -46,6 +57,213 @@ class Log:
 log = Log()
 
 
+def is_mahon(method):
+    return bool(method) and method.lower() == MAHON.lower()
+
+
+def find_plateau(
+    ages,
+    errors,
+    signals,
+    excludes=None,
+    method="",
+    nsteps=3,
+    gas_fraction=50,
+    overlap_sigma=2,
+):
+    """
+    return the (start, end) indices of the longest plateau or [] if there is none. the
+    result is the same as Plateau.find_plateaus_iter.
+
+    the gas released by a run of steps is a difference of the cumulative signals. for the
+    fleck criterion the longest run of overlapping steps from each start is found with
+    a sliding window of the maximum lower and minimum upper bound, so a spectrum is
+    evaluated in linear time. for the mahon criterion the mswd of a run of steps is
+    calculated from cumulative weighted sums.
+
+    excludes: indices of the excluded steps
+    """
+    ages = asarray(ages)
+    n = len(ages)
+    errors = asarray(errors)
+    signals = asarray(signals)
+
+    excluded = zeros(n, dtype=bool)
+    for i in excludes or ():
+        if 0 <= i < n:
+            excluded[i] = True
+
+    # excluded steps do not count toward the gas released
+    signals = where(excluded, 0, signals)
+    csignals = zeros(n + 1)
+    csignals[1:] = cumsum(signals)
+    gas_fraction = gas_fraction / 100.0
+    nsteps = max(1, nsteps)
+
+    with errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if is_mahon(method):
+            return _find_mswd_plateau(
+                _mswd_sums(ages, errors),
+                _mswd_limits(n),
+                csignals,
+                excluded,
+                nsteps,
+                gas_fraction,
+            )
+        else:
+            lo = ages - errors * overlap_sigma
+            hi = ages + errors * overlap_sigma
+            return _find_overlap_plateau(
+                lo.tolist(),
+                hi.tolist(),
+                csignals,
+                (signals >= 0).all(),
+                excluded.tolist(),
+                nsteps,
+                gas_fraction,
+            )
+
+
+def _longest(idxs):
+    if idxs:
+        spans = [e - s for s, e in idxs]
+        return idxs[spans.index(max(spans))]
+    return []
+
+
+def _overlap_ends(lo, hi):
+    """
+    return a list. the i-th value is the first index j > i for which the steps i to j do
+    not all overlap, or n if they do
+    """
+    n = len(lo)
+    ends = [n] * n
+    # window indices in order of decreasing lower and increasing upper bound
+    maxq = deque()
+    minq = deque()
+
+    def push(i):
+        while maxq and lo[maxq[-1]] <= lo[i]:
+            maxq.pop()
+        maxq.append(i)
+        while minq and hi[minq[-1]] >= hi[i]:
+            minq.pop()
+        minq.append(i)
+
+    j = 0
+    for i in range(n):
+        if j == i:
+            push(i)
+            j += 1
+
+        # the window already overlaps. only the pairs with the new step need checking
+        while j < n and lo[maxq[0]] < hi[j] and lo[j] < hi[minq[0]]:
+            push(j)
+            j += 1
+
+        ends[i] = j
+        if maxq[0] == i:
+            maxq.popleft()
+        if minq[0] == i:
+            minq.popleft()
+
+    return ends
+
+
+def _find_overlap_plateau(lo, hi, csignals, nonneg, excluded, nsteps, gas_fraction):
+    total = csignals[-1]
+    ends = _overlap_ends(lo, hi)
+    cs = csignals.tolist()
+
+    idxs = []
+    for start, end in enumerate(ends):
+        if excluded[start]:
+            continue
+
+        potential_end = None
+        for i in range(end - 1, start + nsteps - 2, -1):
+            if excluded[i]:
+                continue
+
+            if (cs[i + 1] - cs[start]) / total >= gas_fraction:
+                potential_end = i
+                break
+            elif nonneg:
+                # the gas released only decreases with fewer steps
+                break
+
+        if potential_end:
+            idxs.append((start, potential_end))
+
+    return _longest(idxs)
+
+
+def _mswd_sums(ages, errors):
+    """
+    return the cumulative weight, weighted age, weighted squared age and invalid step
+    counts. the ages are shifted by their weighted mean to limit the cancellation in the
+    sum of squares
+    """
+    w = 1 / errors**2
+    valid = isfinite(ages) & isfinite(w)
+    w = where(valid, w, 0)
+
+    sw = w.sum()
+    shift = (w * where(valid, ages, 0)).sum() / sw if sw > 0 else 0
+    x = where(valid, ages - shift, 0)
+
+    n = len(ages)
+    sums = []
+    for v in (w, w * x, w * x * x, ~valid):
+        c = zeros(n + 1)
+        c[1:] = cumsum(v)
+        sums.append(c)
+    return sums
+
+
+def _mswd_limits(n):
+    """
+    return the lower and upper mswd limits indexed by the number of steps
+    """
+    low = zeros(n + 1)
+    high = zeros(n + 1)
+    for k in range(2, n + 1):
+        low[k], high[k] = get_mswd_limits(k)
+    return low, high
+
+
+def _find_mswd_plateau(sums, limits, csignals, excluded, nsteps, gas_fraction):
+    s0, s1, s2, ninvalid = sums
+    low, high = limits
+    total = csignals[-1]
+    n = len(excluded)
+
+    idxs = []
+    for start in range(n):
+        if excluded[start]:
+            continue
+
+        # the mswd of a single step is not valid
+        ends = array(range(start + max(nsteps, 2) - 1, n), dtype=int)
+        if not ends.size:
+            continue
+
+        k = ends - start + 1
+        e1 = ends + 1
+        sw = s0[e1] - s0[start]
+        swx = s1[e1] - s1[start]
+        mswd = (s2[e1] - s2[start] - swx * swx / sw) / (k - 1)
+
+        ok = ~excluded[ends]
+        ok &= ninvalid[e1] == ninvalid[start]
+        ok &= (low[k] <= mswd) & (mswd <= high[k])
+        ok &= (csignals[e1] - csignals[start]) / total >= gas_fraction
+        if ok.any():
+            idxs.append((start, int(ends[ok][-1])))
+
+    return _longest(idxs)
+
+
 class Plateau(HasTraits):
     ages = Array
     errors = Array
@@ -60,17 +278,43 @@ class Plateau(HasTraits):
     use_mswd = False  # mahon criterion
     total_signal = None
 
-    def find_plateaus(self, method=""):
-        """
-        method: str either fleck 1977 or mahon 1996
-        """
-        if method.lower() == MAHON:
+    def _set_method(self, method):
+        if is_mahon(method):
             self.use_mswd = True
             self.use_overlap = False
         else:
             self.use_mswd = False
             self.use_overlap = True
 
+    def find_plateaus(self, method=""):
+        """
+        method: str either fleck 1977 or mahon 1996
+
+        return (start, end) or []
+        """
+        self._set_method(method)
+
+        excludes = self.excludes
+        ss = [s for i, s in enumerate(self.signals) if i not in excludes]
+        self.total_signal = float(sum(ss))
+
+        return find_plateau(
+            self.ages,
+            self.errors,
+            self.signals,
+            excludes=excludes,
+            method=method,
+            nsteps=self.nsteps,
+            gas_fraction=self.gas_fraction,
+            overlap_sigma=self.overlap_sigma,
+        )
+
+    def find_plateaus_iter(self, method=""):
+        """
+        reference implementation of find_plateaus. checks every run of steps
+        """
+        self._set_method(method)
+
         n = len(self.ages)
         excludes = self.excludes
         ss = [s for i, s in enumerate(self.signals) if i not in excludes]
@@ -138,8 +382,8 @@ class Plateau(HasTraits):
         """
         return False if not valid
         """
-        ages = self.ages[start, end + 1]
-        errors = self.errors[start, end + 1]
+        ages = self.ages[start : end + 1]
+        errors = self.errors[start : end + 1]
         mswd = calculate_mswd(ages, errors)
         return validate_mswd(mswd, len(ages))
 
@@ -0,0 +1,95 @@
+import unittest
+
+from uncertainties import ufloat, nominal_value, std_dev
+
+from pychron.processing.analyses.analysis import IdeogramPlotable
+from pychron.processing.analyses.analysis_group import AnalysisGroup
+from pychron.pychron_constants import SD, MSEM
+
+
+class FakeAnalysis(IdeogramPlotable):
+    def __init__(self, age, *args, **kw):
+        super(FakeAnalysis, self).__init__(*args, **kw)
+        self.uage = ufloat(*age)
+
+    @property
+    def age(self):
+        return nominal_value(self.uage)
+
+    def get_value(self, attr):
+        return getattr(self, attr)
+
+
+AGES = ((10.1, 0.2), (10.3, 0.1), (9.9, 0.3), (10.6, 0.2), (10.0, 0.4))
+
+
+class AnalysisGroupMemoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.group = AnalysisGroup(
+            analyses=[FakeAnalysis(a) for a in AGES], include_j_error_in_mean=False
+        )
+
+    def _expected(self):
+        return AnalysisGroup(
+            analyses=[FakeAnalysis(a) for a in AGES],
+            include_j_error_in_mean=False,
+            age_error_kind=self.group.age_error_kind,
+        )
+
+    def test_cached(self):
+        g = self.group
+        a = g.weighted_age
+        self.assertIs(g.weighted_age, a)
+        hits, misses, rate = g.memo_stats()["weighted_age"]
+        self.assertEqual((hits, misses), (1, 1))
+        self.assertAlmostEqual(rate, 0.5)
+
+    def test_omit(self):
+        g = self.group
+        n = g.nanalyses
+        a = g.weighted_age
+        g.analyses[3].temp_status = "omit"
+        self.assertEqual(g.nanalyses, n - 1)
+        self.assertNotEqual(nominal_value(g.weighted_age), nominal_value(a))
+
+    def test_error_kind(self):
+        g = self.group
+        g.age_error_kind = SD
+        e = std_dev(g.weighted_age)
+        g.age_error_kind = MSEM
+        e2 = std_dev(g.weighted_age)
+        self.assertNotEqual(e, e2)
+        self.assertAlmostEqual(e2, std_dev(self._expected().weighted_age))
+
+    def test_analyses_replaced(self):
+        g = self.group
+        self.assertEqual(g.total_n, len(AGES))
+        g.analyses.append(FakeAnalysis((11, 0.1)))
+        self.assertEqual(g.total_n, len(AGES) + 1)
+        g.analyses = g.analyses[:2]
+        self.assertEqual(g.total_n, 2)
+
+    def test_mswd(self):
+        g = self.group
+        m = g.mswd
+        self.assertEqual(g.mswd, m)
+        self.assertAlmostEqual(m, self._expected().mswd)
+        self.assertEqual(g.memo_stats()["mswd"][:2], (1, 1))
+
+    def test_invalidate(self):
+        g = self.group
+        a = g.weighted_age
+        g.analyses[0].uage = ufloat(20, 0.1)
+        self.assertIs(g.weighted_age, a)
+        g.invalidate()
+        self.assertNotEqual(nominal_value(g.weighted_age), nominal_value(a))
+
+    def test_reset_stats(self):
+        g = self.group
+        _ = g.arith_age
+        g.reset_memo_stats()
+        self.assertEqual(g.memo_stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
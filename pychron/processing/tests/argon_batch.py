@@ -0,0 +1,200 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import unittest
+
+from numpy import array, random, allclose
+from uncertainties import ufloat, nominal_value, std_dev, covariance_matrix
+
+from pychron.processing.arar_constants import ArArConstants
+from pychron.processing.argon_batch import (
+    PRODUCTION_KEYS,
+    batch_calculate_f,
+    batch_age_equation,
+    batch_ages,
+    BATCH_AGE_ATTRS,
+)
+from pychron.processing.arar_age import ArArAge
+from pychron.processing.argon_calculations import calculate_f, age_equation
+
+F_RTOL = 1e-12
+ERR_RTOL = 1e-9
+
+
+def make_analyses(n, seed=0):
+    rng = random.RandomState(seed)
+    ans = []
+    for i in range(n):
+        # shared baseline makes the isotopes correlated like a real analysis
+        bs = ufloat(rng.uniform(0, 0.01), 0.001)
+        isos = [
+            ufloat(v, v * rng.uniform(0.0005, 0.02)) - bs
+            for v in (
+                rng.uniform(50, 500),
+                rng.uniform(10, 100),
+                rng.uniform(0.1, 2),
+                rng.uniform(0.1, 50),
+                rng.uniform(0.01, 1),
+            )
+        ]
+        ans.append(isos)
+    return ans
+
+
+def make_production():
+    vs = (1e-3, 1.3e-2, 1e-4, 7e-4, 1.4e-5, 2.7e-4, 250)
+    return {k: ufloat(v, v * 0.02, tag=k) for k, v in zip(PRODUCTION_KEYS, vs)}
+
+
+class ArgonBatchTestCase(unittest.TestCase):
+    def _compare(self, arc, fixed_k3739=False, n=25):
+        ans = make_analyses(n)
+        pr = make_production()
+        decay_time = 100.0
+
+        scalar = [
+            calculate_f(
+                isos,
+                decay_time,
+                interferences=pr,
+                arar_constants=arc,
+                fixed_k3739=fixed_k3739,
+            )
+            for isos in ans
+        ]
+
+        isotopes = array([[nominal_value(i) for i in isos] for isos in ans])
+        covs = array([covariance_matrix(isos) for isos in ans])
+        prs = array([nominal_value(pr[k]) for k in PRODUCTION_KEYS])
+        pes = array([std_dev(pr[k]) for k in PRODUCTION_KEYS])
+
+        f, fe, fwo = batch_calculate_f(
+            isotopes,
+            covs,
+            prs,
+            decay_time,
+            production_errors=pes,
+            arar_constants=arc,
+            fixed_k3739=fixed_k3739,
+        )
+
+        sf = array([nominal_value(s[0]) for s in scalar])
+        sfe = array([std_dev(s[0]) for s in scalar])
+        sfwo = array([std_dev(s[1]) for s in scalar])
+
+        self.assertTrue(allclose(f, sf, rtol=F_RTOL, atol=0))
+        self.assertTrue(allclose(fe, sfe, rtol=ERR_RTOL, atol=0))
+        self.assertTrue(allclose(fwo, sfwo, rtol=ERR_RTOL, atol=0))
+        return f, fe, [s[0] for s in scalar]
+
+    def test_f(self):
+        self._compare(ArArConstants())
+
+    def test_f_fixed_k3739(self):
+        self._compare(ArArConstants(), fixed_k3739=ufloat(0.01, 0.001))
+
+    def test_f_no_negative_ca(self):
+        arc = ArArConstants()
+        arc.allow_negative_ca_correction = False
+        self._compare(arc)
+
+    def test_age(self):
+        arc = ArArConstants()
+        f, fe, uf = self._compare(arc)
+        j = ufloat(0.0012, 0.000005)
+
+        for include_decay_error in (False, True):
+            ages = [
+                age_equation(
+                    j, fi, include_decay_error=include_decay_error, arar_constants=arc
+                )
+                for fi in uf
+            ]
+            age, err = batch_age_equation(
+                nominal_value(j),
+                f,
+                std_dev(j),
+                fe,
+                include_decay_error=include_decay_error,
+                arar_constants=arc,
+            )
+            self.assertTrue(
+                allclose(age, [nominal_value(a) for a in ages], rtol=F_RTOL, atol=0)
+            )
+            self.assertTrue(
+                allclose(err, [std_dev(a) for a in ages], rtol=ERR_RTOL, atol=0)
+            )
+
+    def test_batch_ages(self):
+        arc = ArArConstants()
+        _, _, uf = self._compare(arc)
+
+        ans = []
+        for i, fi in enumerate(uf):
+            a = ArArAge()
+            a.arar_constants = arc
+            a.j = ufloat(0.0012 + i * 1e-6, 0.000005)
+            a.position_jerr = 0.00001
+            a.uF, a.F, a.F_err = fi, nominal_value(fi), std_dev(fi)
+            a._set_age_values(fi)
+            ans.append(a)
+
+        for attr in BATCH_AGE_ATTRS:
+            age, err = batch_ages(ans, attr)
+            scalar = [getattr(a, attr) for a in ans]
+            self.assertTrue(
+                allclose(age, [nominal_value(a) for a in scalar], rtol=F_RTOL, atol=0)
+            )
+            self.assertTrue(
+                allclose(err, [std_dev(a) for a in scalar], rtol=ERR_RTOL, atol=0)
+            )
+
+        # J edited. F is unchanged
+        for a in ans:
+            a.j = ufloat(0.0015, 0.000005)
+            a._set_age_values(a.uF)
+        age, err = batch_ages(ans)
+        self.assertTrue(
+            allclose(age, [nominal_value(a.uage) for a in ans], rtol=F_RTOL, atol=0)
+        )
+
+        ans[0].uF = None
+        self.assertIsNone(batch_ages(ans))
+
+    def test_invalid_age(self):
+        age, err = batch_age_equation(0.001, array([-2000.0, 10]))
+        self.assertEqual(age[0], 0)
+        self.assertEqual(err[0], 0)
+        self.assertGreater(age[1], 0)
+
+    def test_missing_errors(self):
+        age, err = batch_age_equation(0.001, array([10.0, 20.0]), 0, [None, 0.1])
+        self.assertEqual(err[0], 0)
+        self.assertGreater(err[1], 0)
+
+        age, err = batch_age_equation(0.001, 10.0, None, None)
+        self.assertEqual(err[0], 0)
+
+    def test_cosmogenic(self):
+        arc = ArArConstants()
+        arc.use_cosmogenic_correction = True
+        with self.assertRaises(ValueError):
+            batch_calculate_f(
+                [[1, 1, 1, 1, 1]], [[0, 0, 0, 0, 0]], {}, 0, arar_constants=arc
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,11 @@ __author__ = "ross"
 
 import unittest
 
+from numpy import array
+from numpy.random import RandomState
+
 from pychron.processing.plateau import Plateau
+from pychron.pychron_constants import FLECK, MAHON
 
 
 class PlateauTestCase(unittest.TestCase):
@@ -153,5 +157,88 @@ class PlateauTestCase(unittest.TestCase):
         return ages, errors, signals, exclude, idx
 
 
+class MahonPlateauTestCase(unittest.TestCase):
+    """
+    the mahon criterion used to be ignored and every spectrum was evaluated with the
+    fleck criterion
+    """
+
+    def _find(self, ages, errors, method):
+        signals = [1] * len(ages)
+        p = Plateau(ages=ages, errors=errors, signals=signals)
+        return p.find_plateaus(method), p.find_plateaus_iter(method)
+
+    def test_mswd_too_high(self):
+        ages = [9, 11, 9, 11, 9, 11]
+        errors = [0.6] * 6
+        self.assertEqual(self._find(ages, errors, FLECK), ((0, 5), (0, 5)))
+        self.assertEqual(self._find(ages, errors, MAHON), ([], []))
+
+    def test_mswd_too_low(self):
+        ages = [10] * 6
+        errors = [1] * 6
+        self.assertEqual(self._find(ages, errors, FLECK), ((0, 5), (0, 5)))
+        self.assertEqual(self._find(ages, errors, MAHON), ([], []))
+
+    def test_mswd_pass(self):
+        ages = [9.5, 10.5, 9.5, 10.5, 9.5, 10.5]
+        errors = [0.6] * 6
+        self.assertEqual(self._find(ages, errors, MAHON), ((0, 5), (0, 5)))
+
+    def test_method_case(self):
+        ages = [9, 11, 9, 11, 9, 11]
+        errors = [0.6] * 6
+        self.assertEqual(self._find(ages, errors, MAHON.lower()), ([], []))
+
+
+class PlateauEngineTestCase(unittest.TestCase):
+    def _random_spectrum(self, rs):
+        n = rs.randint(1, 25)
+        ages = 10 + rs.normal(0, 0.5, n)
+        # a few outliers at the start and end of the spectrum
+        k = rs.randint(0, min(n, 3))
+        ages[:k] += rs.uniform(-10, 10, k)
+        ages[n - k :] += rs.uniform(-10, 10, k)
+        errors = rs.uniform(0.05, 1, n)
+        if rs.rand() < 0.1:
+            errors[rs.randint(n)] = 0
+
+        signals = rs.uniform(0, 1, n)
+        if rs.rand() < 0.1:
+            signals[rs.randint(n)] *= -1
+
+        excludes = [i for i in range(n) if rs.rand() < 0.1]
+        options = dict(
+            nsteps=rs.randint(1, 6),
+            gas_fraction=rs.choice((0, 30, 50, 70)),
+            overlap_sigma=rs.choice((1, 2, 3)),
+        )
+        return ages, errors, signals, excludes, options
+
+    def _assert_equivalent(self, method, seed):
+        rs = RandomState(seed)
+        for i in range(300):
+            ages, errors, signals, excludes, options = self._random_spectrum(rs)
+            p = Plateau(
+                ages=ages, errors=errors, signals=signals, excludes=excludes, **options
+            )
+            expected = p.find_plateaus_iter(method)
+            self.assertEqual(p.find_plateaus(method), expected, (i, options))
+
+    def test_fleck_equivalence(self):
+        self._assert_equivalent(FLECK, 17)
+
+    def test_mahon_equivalence(self):
+        self._assert_equivalent(MAHON, 18)
+
+    def test_overlap_with_zero_error(self):
+        ages = array([10, 10, 10, 10.5, 10])
+        errors = array([0.5, 0, 0.5, 0, 0.5])
+        signals = [1, 1, 1, 1, 1]
+        p = Plateau(ages=ages, errors=errors, signals=signals)
+        self.assertEqual(p.find_plateaus(), (0, 2))
+        self.assertEqual(p.find_plateaus(), p.find_plateaus_iter())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,173 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from threading import Lock, Thread
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.logger_setup import new_logger
+from pychron.paths import paths
+
+logger = new_logger("DurationCache")
+
+DURATION_CACHE_NAME = "pyscript_durations.sqlite"
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class DurationCache(object):
+    """
+    estimated durations of pyscripts stored in a sqlite database so they are shared by
+    all the queues and sessions.
+
+    an entry is keyed by the hash of the script text and the hash of the context it was
+    estimated with. the gosubs of the script are stored with the entry as
+    {path: hash of text}. an entry is stale once the text of one of its gosubs changes
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = Lock()
+        self._refreshing = set()
+        # path: ((mtime, size), hash)
+        self._file_hashes = {}
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS durations ("
+                "key TEXT PRIMARY KEY, "
+                "name TEXT, "
+                "duration REAL, "
+                "dependencies TEXT, "
+                "timestamp REAL)"
+            )
+
+    def get(self, key):
+        """
+        return (duration, stale) or None
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT duration, dependencies FROM durations WHERE key=?", (key,)
+            ).fetchone()
+
+        if row is not None:
+            duration, deps = row
+            deps = json.loads(deps) if deps else {}
+            stale = any(self.file_hash(p) != h for p, h in deps.items())
+            return duration, stale
+
+    def set(self, key, name, duration, dependencies=None):
+        deps = json.dumps(dependencies or {}, sort_keys=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO durations VALUES (?,?,?,?,?)",
+                (key, name, duration, deps, time.time()),
+            )
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM durations")
+
+    def __len__(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM durations").fetchone()[0]
+
+    def file_hash(self, path):
+        """
+        return the hash of the text of path or None if path does not exist. the hash is
+        only recalculated when the modification time or size of the file changes
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+
+        sig = st.st_mtime_ns, st.st_size
+        cached = self._file_hashes.get(path)
+        if cached and cached[0] == sig:
+            return cached[1]
+
+        with open(path, "r") as rfile:
+            h = text_hash(rfile.read())
+
+        self._file_hashes[path] = sig, h
+        return h
+
+    def refresh(self, key, func):
+        """
+        call func in a background thread unless key is already being refreshed
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _refresh():
+            try:
+                func()
+            except BaseException as e:
+                logger.warning("failed refreshing duration {}. {}".format(key, e))
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        t = Thread(target=_refresh, name="RefreshDuration")
+        t.daemon = True
+        t.start()
+        return t
+
+    # private
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+
+_caches = {}
+_caches_lock = Lock()
+
+
+def get_duration_cache(path=None):
+    """
+    return the shared DurationCache for path. defaults to the appdata directory. returns
+    None if there is no appdata directory
+    """
+    if path is None:
+        if not paths.appdata_dir or not os.path.isdir(paths.appdata_dir):
+            return
+        path = os.path.join(paths.appdata_dir, DURATION_CACHE_NAME)
+
+    with _caches_lock:
+        try:
+            cache = _caches[path]
+        except KeyError:
+            try:
+                cache = _caches[path] = DurationCache(path)
+            except sqlite3.Error as e:
+                logger.warning("failed opening duration cache {}. {}".format(path, e))
+                cache = None
+        return cache
+
+
+# ============= EOF =============================================
@@ -39,6 +39,7 @@ from pychron.pyscripts.decorators import (
     count_verbose_skip,
     skip,
 )
+from pychron.pyscripts.duration_cache import get_duration_cache, text_hash
 from pychron.pyscripts.error import (
     PyscriptError,
     IntervalError,
@@ -108,6 +109,11 @@ class PyScript(Loggable):
     _estimated_duration = 0
     _estimated_durations = Dict
     _graph_calc = False
+    # path: hash of text of the gosubs run while estimating the duration
+    _gosubs = None
+
+    use_duration_cache = True
+    duration_cache = None
 
     trace_line = Int
     interpolation_path = Str
@@ -131,13 +137,27 @@ class PyScript(Loggable):
 
     def calculate_estimated_duration(self, ctx=None, force=False):
         """
-        maintain a dictionary of previous calculated durations.
-        key=hash(ctx), value=duration
+        the durations calculated for an explicit ctx are cached on disk keyed by the
+        hash of the text and the hash of ctx. see pychron.pyscripts.duration_cache
 
+        force skips the cache lookup
         """
 
+        key = None
         if ctx is None:
             ctx = self._ctx
+        else:
+            cache = self._get_duration_cache()
+            if cache is not None and self.text:
+                key = self._get_duration_key(ctx)
+                if not force:
+                    d = self.get_cached_duration(ctx, key=key)
+                    if d is not None:
+                        self._estimated_duration = d
+                        return self.get_estimated_duration()
+
+                # the duration of the last test was not calculated with this ctx
+                self.syntax_checked = False
 
         def calc_dur():
             self.debug("calculate duration")
@@ -149,10 +169,51 @@ class PyScript(Loggable):
 
         # self.debug('calculate estimated duration force={}, syntax_checked={}'.format(force, self.syntax_checked))
         if force or not self.syntax_checked or not ctx:
-            calc_dur()
+            if key:
+                try:
+                    calc_dur()
+                except (PyscriptError, IntervalError) as e:
+                    self.warning("failed calculating duration. {}".format(e))
+                    self.syntax_checked = False
+                    self.testing_syntax = False
+                    return self.get_estimated_duration()
+
+                cache.set(key, self.name, self._estimated_duration, self._gosubs)
+            else:
+                calc_dur()
 
         return self.get_estimated_duration()
 
+    def get_cached_duration(self, ctx, key=None):
+        """
+        return the cached duration for ctx or None.
+
+        a cached duration whose gosubs changed is returned as is and recalculated in a
+        background thread
+        """
+        cache = self._get_duration_cache()
+        if cache is None or not self.text:
+            return
+
+        if key is None:
+            key = self._get_duration_key(ctx)
+
+        r = cache.get(key)
+        if r is not None:
+            d, stale = r
+            if stale:
+                self.debug("gosubs changed. refreshing cached duration")
+                cache.refresh(key, lambda: self._refresh_cached_duration(ctx))
+            return d
+
+    def _has_fresh_cached_duration(self, ctx):
+        cache = self._get_duration_cache()
+        if cache is None or not self.text:
+            return False
+
+        r = cache.get(self._get_duration_key(ctx))
+        return r is not None and not r[1]
+
     def traceit(self, frame, event, arg):
         if event == "line":
             co = frame.f_code
@@ -200,6 +261,7 @@ class PyScript(Loggable):
         if not self.syntax_checked:
             self.debug("testing...")
             self._estimated_duration = 0
+            self._gosubs = {}
             self.syntax_checked = True
             self.testing_syntax = True
             self._syntax_error = True
@@ -280,7 +342,14 @@ class PyScript(Loggable):
                 self.exception_trace = exc
                 return exc
 
-    def syntax_ok(self, warn=True):
+    def syntax_ok(self, warn=True, ctx=None):
+        """
+        if ctx is given and a duration is cached for ctx the same text already passed
+        testing with ctx. the script is tested again if a gosub changed since
+        """
+        if ctx is not None and self._has_fresh_cached_duration(ctx):
+            return True
+
         try:
             self.test()
         except PyscriptError as e:
@@ -484,6 +553,7 @@ class PyScript(Loggable):
             s.bootstrap()
             s.calculate_estimated_duration(force=True)
             self._estimated_duration += s.get_estimated_duration()
+            self._add_gosub(s)
             return
 
         if self.testing_syntax:
@@ -862,21 +932,58 @@ class PyScript(Loggable):
 
     def _generate_ctx_hash(self, ctx):
         """
-        generate a sha1 hash from self.__class__, duration, cleanup and len(position)
+        generate a sha1 hash from self.__class__ and the values of ctx. only the number
+        of positions is used
 
         need to add __class__ to the hash because the durations of a MeasurementScript
         and a ExtractionScript will be different for the same context
         """
         sha1 = hashlib.sha1()
-
-        pos = ctx.get("position")
-        if pos:
-            pos = len(pos)
-        for v in (self.__class__, ctx.get("duration"), ctx.get("cleanup"), pos):
-            sha1.update(str(v))
+        sha1.update(str(self.__class__).encode("utf-8"))
+        for k in sorted(ctx):
+            v = ctx[k]
+            if k == "position":
+                v = len(v) if v else v
+            elif not isinstance(v, (str, int, float, bool, type(None), list, tuple)):
+                continue
+
+            sha1.update("{}={!r};".format(k, v).encode("utf-8"))
         h = sha1.hexdigest()
         return h
 
+    def _get_duration_key(self, ctx):
+        return "{}:{}".format(text_hash(self.text), self._generate_ctx_hash(ctx))
+
+    def _get_duration_cache(self):
+        if self.use_duration_cache:
+            cache = self.duration_cache
+            if cache is None:
+                cache = get_duration_cache()
+            return cache
+
+    def _add_gosub(self, s):
+        if self._gosubs is None:
+            self._gosubs = {}
+
+        if s._gosubs:
+            self._gosubs.update(s._gosubs)
+        if s.text:
+            self._gosubs[s.filename] = text_hash(s.text)
+
+    def _refresh_cached_duration(self, ctx):
+        s = self.__class__(
+            root=self.root,
+            name=self.name,
+            text=self.text,
+            manager=self.manager,
+            application=self.application,
+            duration_cache=self.duration_cache,
+            _ctx=dict(self._ctx) if self._ctx else None,
+        )
+        s.bootstrap(load=False)
+        d = s.calculate_estimated_duration(ctx, force=True)
+        self.debug("refreshed cached duration {}".format(d))
+
     # def _update_cached_duration(self, h, d):
     #     global __CACHED_DURATIONS__
     #     if len(__CACHED_DURATIONS__) > 100:
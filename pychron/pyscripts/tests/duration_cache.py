@@ -0,0 +1,128 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pychron.pyscripts.duration_cache import DurationCache, text_hash
+from pychron.pyscripts.pyscript import PyScript
+
+MAIN = """
+def main():
+    sleep(ex.duration)
+    gosub('sub')
+"""
+
+SUB = """
+def main():
+    sleep({})
+"""
+
+
+class CountingPyScript(PyScript):
+    ntests = 0
+
+    def _execute(self, *args, **kw):
+        CountingPyScript.ntests += 1
+        return super(CountingPyScript, self)._execute(*args, **kw)
+
+
+class DurationCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache = DurationCache(os.path.join(self.root, "durations.sqlite"))
+        self._write("main.py", MAIN)
+        self._write("sub.py", SUB.format(2))
+        CountingPyScript.ntests = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, name, text):
+        with open(os.path.join(self.root, name), "w") as wfile:
+            wfile.write(text)
+
+        # make sure a rewrite within the mtime resolution is noticed
+        self.cache._file_hashes.pop(os.path.join(self.root, name), None)
+
+    def _script(self, cache=True):
+        s = CountingPyScript(root=self.root, name="main.py", duration_cache=self.cache)
+        s.use_duration_cache = cache
+        s.bootstrap()
+        return s
+
+    def test_set_get(self):
+        self.cache.set("a", "main.py", 10)
+        self.assertEqual(self.cache.get("a"), (10, False))
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_shared(self):
+        self.cache.set("a", "main.py", 10)
+        cache = DurationCache(self.cache.path)
+        self.assertEqual(cache.get("a"), (10, False))
+
+    def test_stale(self):
+        p = os.path.join(self.root, "sub.py")
+        self.cache.set("a", "main.py", 10, {p: text_hash(SUB.format(2))})
+        self.assertEqual(self.cache.get("a"), (10, False))
+
+        self._write("sub.py", SUB.format(5))
+        self.assertEqual(self.cache.get("a"), (10, True))
+
+    def test_estimate_once(self):
+        ctx = dict(duration=3)
+        d = self._script(cache=False).calculate_estimated_duration(ctx)
+
+        self.assertEqual(self._script().calculate_estimated_duration(ctx), d)
+        n = CountingPyScript.ntests
+        self.assertEqual(self._script().calculate_estimated_duration(ctx), d)
+        self.assertEqual(CountingPyScript.ntests, n)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_ctx(self):
+        s = self._script()
+        a = s.calculate_estimated_duration(dict(duration=3))
+        b = s.calculate_estimated_duration(dict(duration=10))
+        self.assertGreater(b, a)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_syntax_ok(self):
+        ctx = dict(duration=3)
+        self._script().calculate_estimated_duration(ctx)
+
+        n = CountingPyScript.ntests
+        self.assertTrue(self._script().syntax_ok(ctx=ctx))
+        self.assertEqual(CountingPyScript.ntests, n)
+
+    def test_syntax_ok_gosub_changed(self):
+        ctx = dict(duration=3)
+        self._script().calculate_estimated_duration(ctx)
+
+        self._write("sub.py", "def main(:\n    sleep(1)\n")
+        n = CountingPyScript.ntests
+        self.assertFalse(self._script().syntax_ok(warn=False, ctx=ctx))
+        self.assertGreater(CountingPyScript.ntests, n)
+
+    def test_gosub_changed(self):
+        ctx = dict(duration=3)
+        a = self._script().calculate_estimated_duration(ctx)
+
+        self._write("sub.py", SUB.format(10))
+        s = self._script()
+        # the stale duration is returned and refreshed in the background
+        self.assertEqual(s.calculate_estimated_duration(ctx), a)
+        key = s._get_duration_key(ctx)
+        for i in range(100):
+            d, stale = self.cache.get(key)
+            if not stale:
+                break
+            time.sleep(0.05)
+        self.assertFalse(stale)
+
+        expected = self._script(cache=False).calculate_estimated_duration(ctx)
+        self.assertEqual(self._script().calculate_estimated_duration(ctx), expected)
+        self.assertNotEqual(expected, a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,7 +18,16 @@ from random import random
 
 import yaml
 from numpy import array
-from traits.api import Any, cached_property, List, TraitError, Str, Property, Bool
+from traits.api import (
+    Any,
+    cached_property,
+    List,
+    TraitError,
+    Str,
+    Property,
+    Bool,
+    on_trait_change,
+)
 from yaml import SafeLoader
 
 from pychron.core.helpers.filetools import glob_list_directory
@@ -32,6 +41,7 @@ from pychron.spectrometer import (
     set_spectrometer_config_name,
 )
 from pychron.spectrometer.base_detector import BaseDetector
+from pychron.spectrometer.intensity_layout import IntensityLayout
 from pychron.spectrometer.spectrometer_device import SpectrometerDevice
 
 
@@ -72,6 +82,7 @@ class BaseSpectrometer(SpectrometerDevice):
 
     _prev_signals = None
     _no_intensity_change_cnt = 0
+    _intensity_layout = None
     active_detectors = List
 
     def set_data_pump_mode(self, mode):
@@ -688,6 +699,11 @@ class BaseSpectrometer(SpectrometerDevice):
 
         self._check_intensity_no_change(signals)
 
+        if signals.dtype.kind == "f" and len(keys) == len(signals):
+            layout = self._get_intensity_layout(keys)
+            if layout is not None:
+                return keys, layout.update(signals), t, inc
+
         gsignals = []
         for k, v in zip(keys, signals):
             det = self.get_detector(k)
@@ -696,6 +712,24 @@ class BaseSpectrometer(SpectrometerDevice):
 
         return keys, array(gsignals), t, inc
 
+    @on_trait_change("detectors[], detectors:[name, software_gain, nstd]")
+    def clear_intensity_layout(self):
+        self._intensity_layout = None
+
+    def _get_intensity_layout(self, keys):
+        """
+        return the IntensityLayout of keys. the layout is rebuilt when the keys change,
+        or None if a key is not a detector
+        """
+        layout = self._intensity_layout
+        if layout is None or not layout.matches(keys):
+            dets = [self.get_detector(k) for k in keys]
+            if not all(dets):
+                return
+
+            layout = self._intensity_layout = IntensityLayout(keys, dets)
+        return layout
+
     def _handle_no_intensity_change(self):
         pass
 
@@ -0,0 +1,81 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import array, zeros
+
+# ============= local library imports  ==========================
+
+
+class IntensityLayout(object):
+    """
+    the detectors and software gains of the keys returned by read_intensities.
+
+    the last nstd + 1 intensities of all the detectors are kept in one (nstd + 1, n)
+    array so the intensities, std and intensity of the detectors are updated together,
+    the same values BaseDetector.set_intensity would set. the history is seeded from the
+    intensities of the detectors so rebuilding a layout does not reset the std
+    """
+
+    def __init__(self, keys, detectors):
+        self.keys = list(keys)
+        self.detectors = detectors
+        self.gains = array([d.software_gain for d in detectors], dtype=float)
+
+        # detectors with different nstd are updated one at a time
+        nstds = {d.nstd for d in detectors}
+        nstd = nstds.pop() if len(nstds) == 1 else 0
+        self.bulk = nstd > 0
+        if self.bulk:
+            self._history = h = zeros((nstd + 1, len(detectors)))
+
+            # the most recent value is the last row
+            n = min(len(d.intensities[-nstd:]) for d in detectors)
+            if n:
+                h[-n:] = array([d.intensities[-n:] for d in detectors]).T
+            self._n = n
+
+    def matches(self, keys):
+        return keys is self.keys or keys == self.keys
+
+    def update(self, signals):
+        """
+        set the intensities of the detectors and return the signals times the software
+        gains
+        """
+        if self.bulk:
+            h = self._history
+            h[:-1] = h[1:]
+            h[-1] = signals
+
+            self._n = n = min(self._n + 1, len(h))
+            window = h[-n:]
+            stds = window.std(axis=0)
+            for det, v, std, vs in zip(self.detectors, signals, stds, window.T.copy()):
+                det.trait_set(
+                    intensities=vs,
+                    std="{:0.5f}".format(std),
+                    intensity="{:0.5f}".format(v),
+                )
+        else:
+            for det, v in zip(self.detectors, signals):
+                det.set_intensity(v)
+
+        return signals * self.gains
+
+
+# ============= EOF =============================================
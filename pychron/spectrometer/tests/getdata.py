@@ -0,0 +1,146 @@
+import unittest
+
+from numpy import array
+from numpy.testing import assert_array_equal
+
+from pychron.spectrometer.base_detector import BaseDetector
+from pychron.spectrometer.intensity_layout import IntensityLayout
+from pychron.spectrometer.tests.getdata_benchmark import (
+    load_responses,
+    make_spectrometer,
+    loop_get_intensities,
+)
+from pychron.spectrometer.thermo.spectrometer.getdata import GetDataParser
+
+
+class GetDataParserTestCase(unittest.TestCase):
+    def test_tagged(self):
+        p = GetDataParser()
+        keys, signals = p.parse("H1,1.5,AX, 2e-3,CDD,-4")
+        self.assertEqual(keys, ["H1", "AX", "CDD"])
+        assert_array_equal(signals, [1.5, 0.002, -4])
+
+        p.parse("H1,1,AX,2,CDD,3")
+        self.assertEqual(p.nlayouts, 1)
+
+        keys, signals = p.parse("H1,1,AX,2")
+        self.assertEqual(keys, ["H1", "AX"])
+        self.assertEqual(p.nlayouts, 2)
+
+    def test_layouts(self):
+        p = GetDataParser()
+        keys, signals = p.parse("H1,1,AX,2")
+        keys2, signals2 = p.parse("H1,3,AX,4")
+        # the layout is parsed once and its array refilled
+        self.assertIs(keys2, keys)
+        self.assertIs(signals2, signals)
+        assert_array_equal(signals, [3, 4])
+
+        p.parse("L1,1")
+        keys3, _ = p.parse("H1,5,AX,6")
+        self.assertIs(keys3, keys)
+        self.assertEqual(p.nlayouts, 2)
+
+    def test_unpaired(self):
+        with self.assertRaises(ValueError):
+            GetDataParser().parse("H1,1,AX")
+
+    def test_untagged(self):
+        keys, signals = GetDataParser().parse("1,2,3,4,5,6", tagged=False)
+        self.assertEqual(keys, ["H2", "H1", "AX", "L1", "L2", "CDD"])
+        assert_array_equal(signals, [1, 2, 3, 4, 5, 6])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            GetDataParser().parse("H1,a")
+
+
+class IntensityLayoutTestCase(unittest.TestCase):
+    def _make_detectors(self, n=3, **kw):
+        return [BaseDetector(name="D{}".format(i), **kw) for i in range(n)]
+
+    def _assert_same(self, a, b):
+        for da, db in zip(a, b):
+            assert_array_equal(da.intensities, db.intensities)
+            self.assertEqual(da.intensity, db.intensity)
+            self.assertEqual(da.std, db.std)
+
+    def test_update(self):
+        dets = self._make_detectors(nstd=4)
+        dets[1].software_gain = 2
+        odets = self._make_detectors(nstd=4)
+        layout = IntensityLayout(["D0", "D1", "D2"], dets)
+        self.assertTrue(layout.bulk)
+
+        for i in range(10):
+            signals = array([i, i**2, 1.0 / (i + 1)])
+            gsignals = layout.update(signals)
+            for d, v in zip(odets, signals):
+                d.set_intensity(v)
+
+            self._assert_same(dets, odets)
+            assert_array_equal(gsignals, signals * [1, 2, 1])
+
+    def test_seed(self):
+        dets = self._make_detectors(nstd=4)
+        odets = self._make_detectors(nstd=4)
+        for i in range(3):
+            for d in dets + odets:
+                d.set_intensity(i)
+
+        # history is continued by a new layout
+        layout = IntensityLayout(["D0", "D1", "D2"], dets)
+        for i in range(3, 8):
+            signals = array([i, 2 * i, 3 * i])
+            layout.update(signals)
+            for d, v in zip(odets, signals):
+                d.set_intensity(v)
+            self._assert_same(dets, odets)
+
+    def test_mixed_nstd(self):
+        dets = self._make_detectors(nstd=4)
+        dets[0].nstd = 2
+        layout = IntensityLayout(["D0", "D1", "D2"], dets)
+        self.assertFalse(layout.bulk)
+        for i in range(5):
+            layout.update(array([i, i, i]))
+
+        self.assertEqual(len(dets[0].intensities), 3)
+        self.assertEqual(len(dets[1].intensities), 5)
+
+
+class SpectrometerIntensitiesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.responses = load_responses()[:30]
+        self.spec = make_spectrometer(self.responses)
+        self.ospec = make_spectrometer(self.responses)
+
+    def test_get_intensities(self):
+        for i in range(len(self.responses)):
+            keys, signals, _, _ = self.spec.get_intensities()
+            okeys, osignals, _, _ = loop_get_intensities(self.ospec)
+            self.assertEqual(keys, okeys)
+            assert_array_equal(signals, osignals)
+
+    def test_software_gain(self):
+        spec = self.spec
+        spec.get_intensities()
+        layout = spec._intensity_layout
+        self.assertIsNotNone(layout)
+        spec.get_intensities()
+        self.assertIs(spec._intensity_layout, layout)
+
+        spec.detectors[0].software_gain = 2
+        self.assertIsNone(spec._intensity_layout)
+
+        self.ospec.detectors[0].software_gain = 2
+        for i in range(2):
+            loop_get_intensities(self.ospec)
+
+        keys, signals, _, _ = spec.get_intensities()
+        okeys, osignals, _, _ = loop_get_intensities(self.ospec)
+        assert_array_equal(signals, osignals)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+replay GetData responses through ArgusSpectrometer.get_intensities and compare it with
+the original parse and per detector update
+
+    python -m pychron.spectrometer.tests.getdata_benchmark [path]
+
+path is a text file with one GetData response per line. defaults to data/getdata.txt
+"""
+
+# ============= standard library imports ========================
+import os
+import sys
+import time
+from itertools import cycle
+
+from numpy import array
+
+# ============= local library imports  ==========================
+from pychron.spectrometer.thermo.spectrometer.argus import ArgusSpectrometer
+
+DATA = os.path.join(os.path.dirname(__file__), "data", "getdata.txt")
+
+
+class ReplayMicrocontroller(object):
+    simulation = False
+
+    def __init__(self, responses):
+        self._responses = cycle(responses)
+
+    def ask(self, cmd, *args, **kw):
+        return next(self._responses)
+
+
+def load_responses(path=DATA):
+    with open(path, "r") as rfile:
+        return [line.strip() for line in rfile if line.strip()]
+
+
+def make_spectrometer(responses):
+    class ReplaySpectrometer(ArgusSpectrometer):
+        def _microcontroller_default(self):
+            return ReplayMicrocontroller(responses)
+
+    spec = ReplaySpectrometer()
+    for k in responses[0].split(",")[::2]:
+        spec.detectors.append(
+            spec.detector_klass(
+                name=k, spectrometer=spec, microcontroller=spec.microcontroller
+            )
+        )
+    return spec
+
+
+def loop_get_intensities(spec):
+    """
+    the original ThermoSpectrometer.read_intensities and BaseSpectrometer.get_intensities
+    """
+    datastr = spec.ask("GetData", verbose=False, quiet=True, use_error_mode=False)
+    data = datastr.split(",")
+    keys = data[::2]
+    signals = array([float(s) for s in data[1::2]])
+
+    spec._check_intensity_no_change(signals)
+
+    gsignals = []
+    for k, v in zip(keys, signals):
+        det = spec.get_detector(k)
+        det.set_intensity(v)
+        gsignals.append(v * det.software_gain)
+
+    return keys, array(gsignals), None, True
+
+
+def timeit(func, n):
+    st = time.perf_counter()
+    for i in range(n):
+        func()
+    return (time.perf_counter() - st) / n
+
+
+def main(path=DATA, n=5000):
+    responses = load_responses(path)
+    ospec = make_spectrometer(responses)
+    spec = make_spectrometer(responses)
+
+    # make sure both paths agree
+    for r in responses:
+        a = loop_get_intensities(ospec)
+        b = spec.get_intensities()
+        assert a[0] == b[0] and (a[1] == b[1]).all()
+        for da, db in zip(ospec.detectors, spec.detectors):
+            assert da.intensity == db.intensity and da.std == db.std
+
+    print(
+        "responses={} detectors={} cycles={}".format(
+            len(responses), len(spec.detectors), n
+        )
+    )
+    tl = timeit(lambda: loop_get_intensities(ospec), n)
+    tv = timeit(spec.get_intensities, n)
+    print(
+        "original {:0.1f} us  vectorized {:0.1f} us  speedup {:0.1f}x".format(
+            tl * 1e6, tv * 1e6, tl / tv
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
+
+# ============= EOF =============================================
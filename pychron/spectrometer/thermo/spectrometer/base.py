@@ -36,6 +36,7 @@ from pychron.pychron_constants import (
 from pychron.spectrometer import get_spectrometer_config_path
 from pychron.spectrometer.base_spectrometer import BaseSpectrometer
 from pychron.spectrometer.thermo.spectrometer import normalize_integration_time
+from pychron.spectrometer.thermo.spectrometer.getdata import GetDataParser
 
 
 class ThermoSpectrometer(BaseSpectrometer):
@@ -67,6 +68,7 @@ class ThermoSpectrometer(BaseSpectrometer):
     _debug_values = None
 
     _test_connect_command = "GetIntegrationTime"
+    _getdata_parser = None
 
     def hardware_names(self):
         return {
@@ -390,15 +392,11 @@ class ThermoSpectrometer(BaseSpectrometer):
         datastr = self.ask("GetData", verbose=False, quiet=True, use_error_mode=False)
         if datastr:
             if "ERROR" not in datastr:
-                data = datastr.split(",")
-                if tagged:
-                    keys = data[::2]
-                    signals = data[1::2]
-                else:
-                    keys = ["H2", "H1", "AX", "L1", "L2", "CDD"]
-                    signals = data
-
-            signals = [float(s) for s in signals]
+                parser = self._getdata_parser
+                if parser is None:
+                    parser = self._getdata_parser = GetDataParser()
+                # the parser reuses its signals array. get_intensities copies it
+                keys, signals = parser.parse(datastr, tagged)
 
         return keys, signals, None, True
 
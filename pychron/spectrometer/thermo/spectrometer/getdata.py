@@ -0,0 +1,95 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import empty
+
+# ============= local library imports  ==========================
+
+UNTAGGED_KEYS = ("H2", "H1", "AX", "L1", "L2", "CDD")
+
+
+class GetDataLayout(object):
+    """
+    the keys of a GetData response and a preallocated array for its signals
+    """
+
+    def __init__(self, tags, n=None):
+        self.tags = tags
+        self.keys = list(tags)
+        self.signals = empty(len(tags) if n is None else n)
+
+    def fill(self, values):
+        self.signals[:] = values
+        return self.keys, self.signals
+
+
+class GetDataParser(object):
+    """
+    parse the response to GetData, e.g. H2,1.0,H1,2.0,AX,3.0
+
+    the layout of a set of tags is built once. a response is split once, its tags are
+    checked against the current layout and the signals are written into the layout's
+    preallocated array. a change of tags switches to the layout of the new tags, which
+    is built if these tags have not been seen before
+    """
+
+    def __init__(self):
+        self.layout = None
+        self.nlayouts = 0
+        self._layouts = {}
+        self._untagged = None
+
+    @property
+    def keys(self):
+        if self.layout is not None:
+            return self.layout.keys
+
+    def parse(self, datastr, tagged=True):
+        """
+        return keys, signals. keys is a list of str and signals a float array.
+
+        the keys and signals of a layout are reused by the next parse. do not modify them
+        and copy signals to keep them
+        """
+        data = datastr.split(",")
+        if tagged:
+            if len(data) % 2:
+                raise ValueError("tags and signals do not pair up: {}".format(datastr))
+
+            layout = self.layout
+            if layout is None or data[::2] != layout.keys:
+                layout = self._get_layout(tuple(data[::2]))
+            return layout.fill(data[1::2])
+        else:
+            layout = self._untagged
+            if layout is None or layout.signals.size != len(data):
+                layout = self._untagged = GetDataLayout(UNTAGGED_KEYS, len(data))
+            return layout.fill(data)
+
+    def _get_layout(self, tags):
+        try:
+            layout = self._layouts[tags]
+        except KeyError:
+            layout = self._layouts[tags] = GetDataLayout(tags)
+            self.nlayouts += 1
+
+        self.layout = layout
+        return layout
+
+
+# ============= EOF =============================================
@@ -19,11 +19,20 @@ from __future__ import absolute_import
 
 import os
 
-from traits.api import HasTraits, Str, CFloat, Float, Property, List, Enum
+from traits.api import (
+    HasTraits,
+    Str,
+    CFloat,
+    Float,
+    Property,
+    List,
+    Enum,
+    on_trait_change,
+)
 
 from pychron.core.geometry.affine import transform_point, itransform_point
-from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.loggable import Loggable
+from pychron.stage.maps.hole_index import HoleIndex
 
 
 class SampleHole(HasTraits):
@@ -71,6 +80,8 @@ class BaseStageMap(Loggable):
     # should always be N,E,S,W,center
     calibration_holes = None
 
+    _hole_index = None
+
     # def __init__(self, *args, **kw):
     #     super(BaseStageMap, self).__init__(*args, **kw)
     #     self.load()
@@ -134,7 +145,7 @@ class BaseStageMap(Loggable):
 
             yield a
             if include_mid:
-                yield ri[len(ri) / 2]
+                yield ri[len(ri) // 2]
             yield b
 
     def circumference_holes(self):
@@ -195,13 +206,31 @@ class BaseStageMap(Loggable):
         return pt
 
     def get_hole(self, key):
-        return next((h for h in self.sample_holes if h.id == str(key)), None)
+        return self._get_hole_index().get(key)
 
     def get_hole_pos(self, key):
         """
         hole ids are str so convert key to str
         """
-        return next(((h.x, h.y) for h in self.sample_holes if h.id == str(key)), None)
+        h = self.get_hole(key)
+        if h is not None:
+            return h.x, h.y
+
+    def get_hole_positions(self, corrected=False):
+        """
+        return a (n, 2) array of the hole positions in the order of sample_holes
+        """
+        return self._get_hole_index().positions(corrected)
+
+    def get_holes_by_position(self, xs, ys, tol=None, corrected=False):
+        """
+        return the nearest hole to each x, y within tol, or None. tol defaults to the
+        hole dimension
+        """
+        if tol is None:
+            tol = self.g_dimension
+
+        return self._get_hole_index().query(xs, ys, tol, corrected)
 
     def check_valid_hole(self, key, autocenter_only=False, **kw):
         if autocenter_only and not key:
@@ -226,14 +255,13 @@ Check that the file is UTF-8 and Unix (LF) linefeed""".format(
             return True
 
     def get_corrected_hole_pos(self, key):
-        return next(
-            (
-                h.corrected_position if h.has_correction else h.nominal_position
-                for h in self.sample_holes
-                if h.id == key
-            ),
-            None,
-        )
+        """
+        return the corrected position of a hole. (0, 0) if the hole is not corrected.
+        StageManager maps the nominal position to the calibration in that case
+        """
+        h = self.get_hole(key)
+        if h is not None:
+            return h.corrected_position
 
     def clear_correction_file(self):
         pass
@@ -248,12 +276,13 @@ Check that the file is UTF-8 and Unix (LF) linefeed""".format(
 
     # private
     def _grouped_rows(self, reverse=True):
-        # def func(x):
-        #     return x.y
+        return self._get_hole_index().rows(reverse)
 
-        # holes = sorted(self.sample_holes, key=func, reverse=reverse)
-        # return groupby(holes, key=func)
-        return groupby_key(self.sample_holes, "y", reverse=reverse)
+    def _get_hole_index(self):
+        idx = self._hole_index
+        if idx is None:
+            idx = self._hole_index = HoleIndex(self.sample_holes)
+        return idx
 
     def _load_hook(self):
         pass
@@ -319,6 +348,15 @@ Check that the file is UTF-8 and Unix (LF) linefeed""".format(
         return cpos, rot, scale
 
     # handlers
+    @on_trait_change("sample_holes[], sample_holes:[id, x, y]")
+    def _handle_holes(self):
+        self._hole_index = None
+
+    @on_trait_change("sample_holes:[x_cor, y_cor]")
+    def _handle_corrections(self):
+        if self._hole_index is not None:
+            self._hole_index.clear_corrections()
+
     def _g_dimension_changed(self):
         for h in self.sample_holes:
             h.dimension = self.g_dimension
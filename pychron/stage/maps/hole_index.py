@@ -0,0 +1,120 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import array, column_stack, asarray, hypot, inf, argmin, zeros
+from scipy.spatial import cKDTree
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.iterfuncs import groupby_key
+
+
+class HoleIndex(object):
+    """
+    lookups of the sample holes of a stage map by id, position and row.
+
+    the holes are grouped into rows and the KD-trees of the nominal and corrected
+    positions are built on first use. the corrected tree is dropped by
+    clear_corrections and rebuilt on the next query
+    """
+
+    def __init__(self, holes):
+        self.holes = list(holes)
+        self.ids = {}
+        for h in self.holes:
+            # the first hole wins if an id is used twice
+            self.ids.setdefault(h.id, h)
+
+        self._rows = None
+        self._positions = {}
+        self._trees = {}
+
+    def get(self, key):
+        """
+        hole ids are str so convert key to str
+        """
+        return self.ids.get(str(key))
+
+    def rows(self, reverse=True):
+        """
+        return a list of (y, holes) sorted by y. the holes of a row are in file order
+        """
+        if self._rows is None:
+            self._rows = [
+                (y, list(g)) for y, g in groupby_key(self.holes, "y", reverse=True)
+            ]
+
+        return self._rows if reverse else self._rows[::-1]
+
+    def positions(self, corrected=False):
+        """
+        return a (n, 2) array of the nominal or corrected hole positions
+        """
+        try:
+            return self._positions[corrected]
+        except KeyError:
+            if self.holes:
+                attrs = ("x_cor", "y_cor") if corrected else ("x", "y")
+                pos = array([[getattr(h, a) for a in attrs] for h in self.holes])
+            else:
+                pos = zeros((0, 2))
+
+            self._positions[corrected] = pos
+            return pos
+
+    def query(self, xs, ys, tol, corrected=False):
+        """
+        return the nearest hole to each point whose x and y are both within tol of it,
+        or None
+        """
+        pts = column_stack((asarray(xs, dtype=float), asarray(ys, dtype=float)))
+        if not self.holes:
+            return [None] * len(pts)
+
+        pos = self.positions(corrected)
+        tree = self._get_tree(corrected)
+
+        holes = []
+        for pt, idxs in zip(pts, tree.query_ball_point(pts, tol, p=inf)):
+            hole = None
+            if idxs:
+                idxs = sorted(idxs)
+                d = pos[idxs] - pt
+                inside = (abs(d) < tol).all(axis=1)
+                if inside.any():
+                    dist = hypot(d[:, 0], d[:, 1])
+                    dist[~inside] = inf
+                    # ties go to the first hole in the file
+                    hole = self.holes[idxs[argmin(dist)]]
+            holes.append(hole)
+
+        return holes
+
+    def clear_corrections(self):
+        self._positions.pop(True, None)
+        self._trees.pop(True, None)
+
+    # private
+    def _get_tree(self, corrected):
+        try:
+            return self._trees[corrected]
+        except KeyError:
+            tree = self._trees[corrected] = cKDTree(self.positions(corrected))
+            return tree
+
+
+# ============= EOF =============================================
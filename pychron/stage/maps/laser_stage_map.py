@@ -119,14 +119,21 @@ class LaserStageMap(BaseStageMap):
 
     def generate_row_interpolated_corrections(self, dump_corrections=True):
         self.debug("generate row interpolated corrections")
-        rowdict = self.row_dict()
+        rowdict = {}
+        # index of each hole in its row
+        rowidx = {}
+        for y, row in self._grouped_rows():
+            rowdict[y] = row
+            for j, h in enumerate(row):
+                rowidx[id(h)] = j
+
         for i, h in enumerate(self.sample_holes):
             self.debug(
                 "{:03n} {} has correction ={}".format(i, h.id, h.has_correction())
             )
             if not h.has_correction():
                 row = rowdict[h.y]
-                args = get_interpolation_holes(row.index(h), row)
+                args = get_interpolation_holes(rowidx[id(h)], row)
                 if args:
                     a, b, p = args
                     self.debug(
@@ -177,7 +184,7 @@ class LaserStageMap(BaseStageMap):
     def set_hole_correction(self, hole, x_cor, y_cor):
         self.debug("set hole correction {}, x={}, y={}".format(hole, x_cor, y_cor))
         if not isinstance(hole, SampleHole):
-            hole = next((h for h in self.sample_holes if h.id == hole), None)
+            hole = self.get_hole(hole)
 
         if hole is not None:
             self.debug("setting correction {}".format(hole.id))
@@ -186,27 +193,10 @@ class LaserStageMap(BaseStageMap):
             hole.corrected = True
 
     def _get_hole_by_position(self, x, y, tol=None):
-        return self._get_hole_by_pos(x, y, "x", "y", tol)
+        return self.get_holes_by_position((x,), (y,), tol)[0]
 
     def _get_hole_by_corrected_position(self, x, y, tol=None):
-        return self._get_hole_by_pos(x, y, "x_cor", "y_cor", tol)
-
-    def _get_hole_by_pos(self, x, y, xkey, ykey, tol):
-        if tol is None:
-            tol = self.g_dimension  # * 0.75
-
-        def pythag(hi, xi, yi):
-            return ((hi.x - xi) ** 2 + (hi.y - yi) ** 2) ** 0.5
-
-        holes = [
-            (hole, pythag(hole, x, y))
-            for hole in self.sample_holes
-            if abs(getattr(hole, xkey) - x) < tol and abs(getattr(hole, ykey) - y) < tol
-        ]
-        if holes:
-            # sort holes by deviation
-            holes = sorted(holes, lambda a, b: (a[1] > b[1]) - (a[1] < b[1]))
-            return holes[0][0]
+        return self.get_holes_by_position((x,), (y,), tol, corrected=True)[0]
 
     def traits_view(self):
         from .stage_map_view import StageMapView
@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from numpy.random import RandomState
+
+from pychron.core.helpers.iterfuncs import groupby_key
+from pychron.lasers.stage_managers.stage_manager import StageManager
+from pychron.paths import paths
+from pychron.stage.maps.laser_stage_map import LaserStageMap
+from pychron.stage.stage_manager import BaseStageManager
+
+
+def load_map():
+    p = "pychron/stage/tests/data/221-hole.txt"
+    if not os.path.isfile(p):
+        base = os.path.dirname(os.path.abspath(__file__))
+        p = os.path.join(base, "data", "221-hole.txt")
+
+    sm = LaserStageMap(file_path=p)
+    sm.load()
+    return sm
+
+
+class Controller(object):
+    def __init__(self):
+        self.moves = []
+
+    def linear_move(self, x, y, **kw):
+        self.moves.append((x, y))
+
+
+class Stage(object):
+    _move_to_hole = StageManager._move_to_hole
+    get_calibrated_position = BaseStageManager.get_calibrated_position
+
+    temp_hole = None
+    temp_position = None
+
+    def __init__(self, stage_map, calibration):
+        self.stage_map = stage_map
+        self.canvas = SimpleNamespace(calibration_item=calibration)
+        self.stage_controller = Controller()
+
+    def info(self, *args, **kw):
+        pass
+
+    debug = info
+    warning = info
+
+    def _move_to_hole_hook(self, *args):
+        pass
+
+    def finish_move_to_hole(self, *args):
+        pass
+
+
+class HoleIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sm = load_map()
+
+    def _nearest(self, x, y, tol, corrected=False):
+        xkey, ykey = ("x_cor", "y_cor") if corrected else ("x", "y")
+        holes = [
+            (((getattr(h, xkey) - x) ** 2 + (getattr(h, ykey) - y) ** 2) ** 0.5, i, h)
+            for i, h in enumerate(self.sm.sample_holes)
+            if abs(getattr(h, xkey) - x) < tol and abs(getattr(h, ykey) - y) < tol
+        ]
+        if holes:
+            return min(holes, key=lambda x: x[:2])[2]
+
+    def test_get_hole(self):
+        sm = self.sm
+        self.assertEqual(sm.get_hole(10).id, "10")
+        self.assertEqual(sm.get_hole_pos("10"), (0, 13.9573))
+        self.assertIsNone(sm.get_hole("foo"))
+        self.assertIsNone(sm.get_hole_pos("foo"))
+
+    def test_holes_by_position(self):
+        sm = self.sm
+        rs = RandomState(18)
+        xs = rs.uniform(-20, 20, 500)
+        ys = rs.uniform(-20, 20, 500)
+        for tol in (0.5, 1, 3):
+            holes = sm.get_holes_by_position(xs, ys, tol)
+            expected = [self._nearest(x, y, tol) for x, y in zip(xs, ys)]
+            self.assertEqual(holes, expected)
+
+        h = sm.get_hole("7")
+        self.assertIs(sm._get_hole_by_position(h.x + 0.1, h.y - 0.1), h)
+        self.assertIsNone(sm._get_hole_by_position(100, 100))
+
+    def test_corrected_position(self):
+        sm = self.sm
+        h = sm.get_hole("7")
+        self.assertIsNone(sm._get_hole_by_corrected_position(50, 50))
+        self.assertEqual(sm.get_corrected_hole_pos("7"), (0, 0))
+
+        sm.set_hole_correction("7", 50, 50)
+        self.assertIs(sm._get_hole_by_corrected_position(50.1, 50), h)
+        self.assertEqual(sm.get_corrected_hole_pos("7"), (50, 50))
+
+        h.x_cor = 60
+        self.assertIsNone(sm._get_hole_by_corrected_position(50.1, 50))
+        self.assertIs(sm._get_hole_by_corrected_position(60, 50), h)
+
+    def test_rows(self):
+        sm = self.sm
+        for reverse in (True, False):
+            rows = [
+                (y, list(g))
+                for y, g in groupby_key(sm.sample_holes, "y", reverse=reverse)
+            ]
+            self.assertEqual(sm._grouped_rows(reverse), rows)
+
+    def test_hole_moved(self):
+        sm = self.sm
+        h = sm.get_hole("1")
+        rows = sm._grouped_rows()
+        h.y = 100
+        h.x = 100
+        self.assertIsNot(sm._grouped_rows(), rows)
+        self.assertEqual(sm._grouped_rows()[0][1], [h])
+        self.assertIs(sm._get_hole_by_position(100, 100), h)
+
+    def test_holes_replaced(self):
+        sm = self.sm
+        sm.sample_holes = sm.sample_holes[:3]
+        self.assertIsNone(sm.get_hole("4"))
+        self.assertEqual(len(sm.get_hole_positions()), 3)
+
+
+class MoveToHoleTestCase(unittest.TestCase):
+    def setUp(self):
+        self._hidden_dir = paths.hidden_dir
+        paths.hidden_dir = tempfile.mkdtemp()
+
+        self.sm = load_map()
+        calibration = SimpleNamespace(rotation=90, center=(1, 2), scale=1)
+        self.stage = Stage(self.sm, calibration)
+
+    def tearDown(self):
+        shutil.rmtree(paths.hidden_dir)
+        paths.hidden_dir = self._hidden_dir
+
+    def test_uncorrected_hole(self):
+        sm = self.sm
+        expected = sm.map_to_calibration(
+            sm.get_hole_pos("10"), cpos=(1, 2), rot=90, scale=1
+        )
+        self.assertNotEqual(tuple(expected), sm.get_hole_pos("10"))
+
+        self.stage._move_to_hole("10")
+        ((x, y),) = self.stage.stage_controller.moves
+        self.assertAlmostEqual(x, expected[0])
+        self.assertAlmostEqual(y, expected[1])
+
+    def test_corrected_hole(self):
+        self.sm.set_hole_correction("10", 5, 6)
+        self.stage._move_to_hole("10")
+        self.assertEqual(self.stage.stage_controller.moves, [(5, 6)])
+
+
+if __name__ == "__main__":
+    unittest.main()
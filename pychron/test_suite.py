@@ -4,6 +4,7 @@ import unittest
 from pychron.canvas.canvas2D.tests.calibration_item import CalibrationObjectTestCase
 from pychron.core.helpers.tests.floatfmt import SigFigStdFmtTestCase
 from pychron.core.stats.tests.mswd_tests import MSWDTestCase
+from pychron.core.stats.tests.monte_carlo_tests import MonteCarloTestCase
 
 # # Core
 from pychron.core.stats.tests.peak_detection_test import MultiPeakDetectionTestCase
@@ -12,6 +13,7 @@ from pychron.core.tests.filtering_tests import FilteringTestCase
 
 from pychron.core.helpers.tests.floatfmt import FloatfmtTestCase
 from pychron.core.helpers.tests.strtools import CamelCaseTestCase
+from pychron.core.helpers.tests.growable_buffer import GrowableBufferTestCase
 
 from pychron.core.xml.tests.xml_parser import XMLParserTestCase
 from pychron.core.regression.tests.regression import (
@@ -21,27 +23,69 @@ from pychron.core.regression.tests.regression import (
     OLSRegressionTest2,
     TruncateRegressionTest,
 )
+from pychron.core.regression.tests.batch_ols import BatchOLSTestCase
+from pychron.core.regression.tests.interpolation import (
+    InterpolationRegressorTestCase,
+)
+from pychron.core.regression.tests.streaming_ols import (
+    StreamingOLSTestCase,
+    MeasurementAppendTestCase,
+)
 from pychron.core.tests.alpha_tests import AlphaTestCase
+from pychron.dashboard.tests.server import DashboardServerTestCase
+from pychron.dvc.tests.test_columnar import ColumnarTestCase
+from pychron.dvc.tests.test_parallel import ParallelTestCase
+from pychron.dvc.tests.test_meta_index import MetaIndexTestCase, MetaRepoIndexTestCase
+from pychron.dvc.tests.test_cache import DVCCacheTestCase
+from pychron.dvc.tests.test_commit_queue import DVCCommitQueueTestCase
+from pychron.dvc.tests.test_offline_index import OfflineIndexTestCase
 from pychron.experiment.tests.backup import BackupTestCase
 from pychron.experiment.tests.comment_template import CommentTemplaterTestCase
 from pychron.experiment.tests.conditionals import (
+    CompiledConditionalsTestCase,
     ConditionalsTestCase,
     ParseConditionalsTestCase,
 )
+from pychron.experiment.tests.data_writer import DataWriterTestCase
 from pychron.experiment.tests.duration_tracker import DurationTrackerTestCase
 from pychron.experiment.tests.frequency_test import (
     FrequencyTestCase,
     FrequencyTemplateTestCase,
 )
 from pychron.experiment.tests.identifier import IdentifierTestCase
+from pychron.experiment.tests.live_plot import (
+    JitterMeterTestCase,
+    LivePlotQueueTestCase,
+    QueuedPlotTestCase,
+)
 from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase1, PeakHopTxtCase
 from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase2
 from pychron.experiment.tests.position_regex_test import XYTestCase
 from pychron.experiment.tests.renumber_aliquot_test import RenumberAliquotTestCase
+from pychron.experiment.tests.timeline import (
+    RunTimelineTestCase,
+    TimelineSummaryTestCase,
+    OverlappedSaveTimelineTestCase,
+)
 from pychron.external_pipette.tests.external_pipette import ExternalPipetteTestCase
+from pychron.graph.tests.live_data import (
+    MinMaxDecimatorTestCase,
+    GraphLiveDataTestCase,
+)
+from pychron.hardware.core.tests.ethernet_pool import EthernetPoolTestCase
+from pychron.hardware.core.tests.scan_scheduler import ScanSchedulerTestCase
+from pychron.mv.tests.locator import LocatorParallelSearchTestCase
+from pychron.mv.tests.threshold_prefetcher import ThresholdPrefetcherTestCase
 from pychron.processing.tests.age_converter import AgeConverterTestCase
-from pychron.processing.tests.plateau import PlateauTestCase
+from pychron.processing.tests.analysis_group import AnalysisGroupMemoTestCase
+from pychron.processing.tests.argon_batch import ArgonBatchTestCase
+from pychron.processing.tests.plateau import (
+    PlateauTestCase,
+    PlateauEngineTestCase,
+    MahonPlateauTestCase,
+)
 from pychron.processing.tests.ratio import RatioTestCase
+from pychron.pyscripts.tests.duration_cache import DurationCacheTestCase
 
 #
 # os.environ['MassSpecDBVersion'] = '16'
@@ -53,8 +97,14 @@ from pychron.processing.tests.ratio import RatioTestCase
 # use_logger = False
 #
 #
+from pychron.spectrometer.tests.getdata import (
+    GetDataParserTestCase,
+    IntensityLayoutTestCase,
+    SpectrometerIntensitiesTestCase,
+)
 from pychron.spectrometer.tests.integration_time import IntegrationTimeTestCase
 from pychron.spectrometer.tests.mftable import DiscreteMFTableTestCase
+from pychron.stage.tests.hole_index import HoleIndexTestCase, MoveToHoleTestCase
 from pychron.stage.tests.stage_map import StageMapTestCase, TransformTestCase
 
 
@@ -84,6 +134,7 @@ def suite():
         FloatfmtTestCase,
         SigFigStdFmtTestCase,
         CamelCaseTestCase,
+        GrowableBufferTestCase,
         RatioTestCase,
         XMLParserTestCase,
         OLSRegressionTest,
@@ -91,7 +142,12 @@ def suite():
         FilterOLSRegressionTest,
         OLSRegressionTest2,
         TruncateRegressionTest,
+        BatchOLSTestCase,
+        InterpolationRegressorTestCase,
+        StreamingOLSTestCase,
+        MeasurementAppendTestCase,
         MSWDTestCase,
+        MonteCarloTestCase,
         # old
         # ExpoRegressionTest,
         # ExpoRegressionTest2,
@@ -99,27 +155,59 @@ def suite():
         # USGSVSCFileSourceUnittest,
         # USGSVSCIrradiationSourceUnittest,
         # NMGRLLegacySourceUnittest,
+        # Dashboard
+        DashboardServerTestCase,
+        # DVC
+        ColumnarTestCase,
+        ParallelTestCase,
+        MetaIndexTestCase,
+        MetaRepoIndexTestCase,
+        DVCCacheTestCase,
+        DVCCommitQueueTestCase,
+        OfflineIndexTestCase,
         # Experiment
         PeakHopYamlCase1,
         PeakHopYamlCase2,
         BackupTestCase,
         PeakHopTxtCase,
+        DataWriterTestCase,
         DurationTrackerTestCase,
         FrequencyTestCase,
         FrequencyTemplateTestCase,
         XYTestCase,
         RenumberAliquotTestCase,
+        CompiledConditionalsTestCase,
         ConditionalsTestCase,
         ParseConditionalsTestCase,
         IdentifierTestCase,
         CommentTemplaterTestCase,
+        JitterMeterTestCase,
+        LivePlotQueueTestCase,
+        QueuedPlotTestCase,
+        RunTimelineTestCase,
+        TimelineSummaryTestCase,
+        OverlappedSaveTimelineTestCase,
         # ExternalPipette
         ExternalPipetteTestCase,
+        # Graph
+        MinMaxDecimatorTestCase,
+        GraphLiveDataTestCase,
+        # Hardware
+        EthernetPoolTestCase,
+        ScanSchedulerTestCase,
+        # MV
+        LocatorParallelSearchTestCase,
+        ThresholdPrefetcherTestCase,
         # Processing
         PlateauTestCase,
+        PlateauEngineTestCase,
+        MahonPlateauTestCase,
         RatioTestCase,
         AgeConverterTestCase,
+        ArgonBatchTestCase,
+        AnalysisGroupMemoTestCase,
         # Pyscripts
+        DurationCacheTestCase,
         # WaitForTestCase,
         # InterpolationTestCase,
         # DocstrContextTestCase,
@@ -127,8 +215,13 @@ def suite():
         # MFTableTestCase,
         DiscreteMFTableTestCase,
         IntegrationTimeTestCase,
+        GetDataParserTestCase,
+        IntensityLayoutTestCase,
+        SpectrometerIntensitiesTestCase,
         # Stage
         StageMapTestCase,
+        HoleIndexTestCase,
+        MoveToHoleTestCase,
         TransformTestCase,
     )
 